@@ -0,0 +1,319 @@
+import json
+import math
+import random
+import struct
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Literal
+from xml.sax.saxutils import quoteattr
+
+from map_admin.domain.geometry import DISTANCE_QUANTUM, haversine_distance
+from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.infrastructure.repositories import FileEdge, FileNode
+
+# bounding box around the Anam campus: (west, south, east, north)
+BOUNDS: tuple[float, float, float, float] = (127.020, 37.580, 127.040, 37.595)
+COORDINATE_PLACES = 7
+OSM_ID_OFFSET = 1_000_000
+
+DegreeDistribution = Literal["poisson", "geometric", "uniform"]
+
+_QUALITY_WEIGHTS: dict[RoadQuality, float] = {
+    RoadQuality.HIGH: 0.6,
+    RoadQuality.MEDIUM: 0.3,
+    RoadQuality.LOW: 0.1,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class GraphSpec:
+    node_count: int
+    mean_degree: float = 3.0
+    max_degree: int = 8
+    degree_distribution: DegreeDistribution = "poisson"
+    stair_ratio: float = 0.1
+    step_ratio: float = 0.05
+    seed: int = 0
+
+    @property
+    def key(self) -> str:
+        """기준값 파일에서 같은 모양의 그래프를 찾는 데 쓰는 키"""
+        return (
+            f"n{self.node_count}-{self.degree_distribution}{self.mean_degree:g}"
+            f"-s{self.seed}"
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class SyntheticGraph:
+    nodes: list[FileNode]
+    edges: list[FileEdge]
+
+
+@dataclass(frozen=True, kw_only=True)
+class GraphFiles:
+    node_file_path: str
+    edge_file_path: str
+    dem_file_path: str
+    osm_file_path: str
+
+
+def terrain_elevation(longitude: float, latitude: float) -> float:
+    """캠퍼스 가운데가 솟은 매끄러운 가상 지형의 고도(m)"""
+    west, south, east, north = BOUNDS
+    x: float = (longitude - west) / (east - west) - 0.5
+    y: float = (latitude - south) / (north - south) - 0.5
+    return 25.0 + 40.0 * math.exp(-8 * (x * x + y * y)) + 3.0 * math.sin(12 * x)
+
+
+def _degree_sampler(spec: GraphSpec, rng: random.Random) -> Callable[[], int]:
+    def poisson() -> int:
+        # Knuth's method is fine for the small means used here
+        limit: float = math.exp(-spec.mean_degree)
+        count: int = 0
+        product: float = rng.random()
+        while product > limit:
+            count += 1
+            product *= rng.random()
+        return count
+
+    def geometric() -> int:
+        probability: float = 1 / spec.mean_degree
+        return 1 + int(math.log(1 - rng.random()) / math.log(1 - probability))
+
+    def uniform() -> int:
+        return rng.randint(1, max(1, round(2 * spec.mean_degree) - 1))
+
+    sampler: Callable[[], int] = {
+        "poisson": poisson,
+        "geometric": geometric,
+        "uniform": uniform,
+    }[spec.degree_distribution]
+    return lambda: min(max(sampler(), 1), spec.max_degree)
+
+
+class _Grid:
+    """근접 노드를 찾기 위한 균일 격자"""
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[int]] = {}
+
+    def cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def add(self, index: int, x: float, y: float) -> None:
+        self.cells.setdefault(self.cell(x, y), []).append(index)
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        count: int,
+        accept: Callable[[int], bool],
+        coordinates: list[tuple[float, float]],
+        max_radius: int,
+    ) -> list[int]:
+        cx, cy = self.cell(x, y)
+        found: list[int] = []
+        radius: int = 0
+        # one extra ring guarantees the nearest candidates are all collected
+        while radius <= max_radius and (len(found) < count or radius < 2):
+            for gx in range(cx - radius, cx + radius + 1):
+                for gy in range(cy - radius, cy + radius + 1):
+                    if max(abs(gx - cx), abs(gy - cy)) != radius:
+                        continue
+                    found.extend(
+                        index for index in self.cells.get((gx, gy), ()) if accept(index)
+                    )
+            radius += 1
+        found.sort(key=lambda index: math.dist(coordinates[index], (x, y)))
+        return found[:count]
+
+
+def generate_campus_graph(spec: GraphSpec) -> SyntheticGraph:
+    """캠퍼스 크기의 연결된 보행 그래프를 시드에 따라 결정적으로 만듭니다.
+
+    노드를 영역 안에 고르게 흩뿌린 뒤, 먼저 가까운 노드끼리 신장 트리로 이어
+    연결성을 보장하고, 노드마다 뽑은 목표 차수까지 가까운 이웃과 간선을
+    더합니다.
+    """
+    rng = random.Random(spec.seed)
+    west, south, east, north = BOUNDS
+    coordinates: list[tuple[float, float]] = [
+        (
+            round(rng.uniform(west, east), COORDINATE_PLACES),
+            round(rng.uniform(south, north), COORDINATE_PLACES),
+        )
+        for _ in range(spec.node_count)
+    ]
+    nodes: list[FileNode] = [
+        FileNode(
+            id=index + 1,
+            name=f"Node {index + 1}",
+            longitude=f"{longitude:.{COORDINATE_PLACES}f}",
+            latitude=f"{latitude:.{COORDINATE_PLACES}f}",
+            elevation=str(
+                Decimal(terrain_elevation(longitude, latitude)).quantize(
+                    DISTANCE_QUANTUM
+                )
+            ),
+        )
+        for index, (longitude, latitude) in enumerate(coordinates)
+    ]
+
+    sample_degree: Callable[[], int] = _degree_sampler(spec, rng)
+    target_degrees: list[int] = [sample_degree() for _ in range(spec.node_count)]
+    degrees: list[int] = [0] * spec.node_count
+    neighbours: list[set[int]] = [set() for _ in range(spec.node_count)]
+    pairs: list[tuple[int, int]] = []
+
+    def connect(a: int, b: int) -> None:
+        neighbours[a].add(b)
+        neighbours[b].add(a)
+        degrees[a] += 1
+        degrees[b] += 1
+        pairs.append((a, b))
+
+    cell_size: float = math.sqrt((east - west) * (north - south) / spec.node_count)
+    max_radius: int = math.ceil(max(east - west, north - south) / cell_size) + 1
+
+    # spanning tree: every node joins the nearest node already placed
+    tree = _Grid(cell_size)
+    order: list[int] = list(range(spec.node_count))
+    rng.shuffle(order)
+    for position, index in enumerate(order):
+        if position:
+            (nearest,) = tree.nearest(
+                *coordinates[index],
+                count=1,
+                accept=lambda _: True,
+                coordinates=coordinates,
+                max_radius=max_radius,
+            )
+            connect(index, nearest)
+        tree.add(index, *coordinates[index])
+
+    # extra edges towards the sampled degrees, preferring close neighbours
+    grid = _Grid(cell_size)
+    for index, (x, y) in enumerate(coordinates):
+        grid.add(index, x, y)
+    for index in order:
+        missing: int = target_degrees[index] - degrees[index]
+        if missing <= 0:
+            continue
+        for neighbour in grid.nearest(
+            *coordinates[index],
+            count=missing,
+            accept=lambda other: other != index
+            and other not in neighbours[index]
+            and degrees[other] < target_degrees[other],
+            coordinates=coordinates,
+            max_radius=2,
+        ):
+            connect(index, neighbour)
+
+    qualities: list[RoadQuality] = list(_QUALITY_WEIGHTS)
+    weights: list[float] = list(_QUALITY_WEIGHTS.values())
+    points: list[Point] = [
+        Point(
+            longitude=Decimal(node["longitude"]),
+            latitude=Decimal(node["latitude"]),
+            elevation=Decimal(node["elevation"]),
+        )
+        for node in nodes
+    ]
+    edges: list[FileEdge] = []
+    for a, b in pairs:
+        elevation_a: Decimal | None = points[a].elevation
+        elevation_b: Decimal | None = points[b].elevation
+        assert elevation_a is not None and elevation_b is not None
+        edges.append(
+            FileEdge(
+                node_ids=(a + 1, b + 1),
+                vertical_distance=str(abs(elevation_a - elevation_b)),
+                horizontal_distance=str(haversine_distance(points[a], points[b])),
+                is_stair=rng.random() < spec.stair_ratio,
+                is_step=rng.random() < spec.step_ratio,
+                quality=rng.choices(qualities, weights)[0],
+            )
+        )
+    return SyntheticGraph(nodes=nodes, edges=edges)
+
+
+def write_graph(graph: SyntheticGraph, directory: Path) -> GraphFiles:
+    """그래프와 함께 고도 격자(DEM), OSM 추출본도 디렉터리에 씁니다."""
+    directory.mkdir(parents=True, exist_ok=True)
+    files = GraphFiles(
+        node_file_path=str(directory / "node.json"),
+        edge_file_path=str(directory / "edge.json"),
+        dem_file_path=str(directory / "dem.bil"),
+        osm_file_path=str(directory / "campus.osm"),
+    )
+    with open(files.node_file_path, "w") as file:
+        json.dump(graph.nodes, file, indent=4)
+    with open(files.edge_file_path, "w") as file:
+        json.dump(graph.edges, file, indent=4)
+    _write_dem(Path(files.dem_file_path))
+    _write_osm(graph, Path(files.osm_file_path))
+    return files
+
+
+def _write_dem(path: Path, size: int = 256) -> None:
+    """가상 지형을 ESRI .hdr이 딸린 32비트 float BIL 격자로 씁니다."""
+    west, south, east, north = BOUNDS
+    cell: float = max(east - west, north - south) / size
+    columns: int = math.ceil((east - west) / cell) + 1
+    rows: int = math.ceil((north - south) / cell) + 1
+    path.with_suffix(".hdr").write_text(
+        "\n".join(
+            [
+                "BYTEORDER I",
+                "LAYOUT BIL",
+                f"NROWS {rows}",
+                f"NCOLS {columns}",
+                "NBANDS 1",
+                "NBITS 32",
+                "PIXELTYPE FLOAT",
+                f"ULXMAP {west + cell / 2!r}",
+                f"ULYMAP {north + cell / 2 - cell!r}",
+                f"XDIM {cell!r}",
+                f"YDIM {cell!r}",
+            ]
+        )
+        + "\n"
+    )
+    with open(path, "wb") as file:
+        for row in range(rows):
+            latitude: float = north - cell / 2 - row * cell
+            file.write(
+                struct.pack(
+                    f"<{columns}f",
+                    *(
+                        terrain_elevation(west + cell / 2 + column * cell, latitude)
+                        for column in range(columns)
+                    ),
+                )
+            )
+
+
+def _write_osm(graph: SyntheticGraph, path: Path) -> None:
+    """간선마다 길 하나를 둔 OSM XML 추출본을 씁니다."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n<osm version="0.6">\n')
+        for node in graph.nodes:
+            file.write(
+                f'  <node id="{node["id"] + OSM_ID_OFFSET}" lat="{node["latitude"]}"'
+                f' lon="{node["longitude"]}">'
+                f'<tag k="name" v={quoteattr(node["name"])}/></node>\n'
+            )
+        for way_id, edge in enumerate(graph.edges, start=OSM_ID_OFFSET):
+            a, b = edge["node_ids"]
+            highway: str = "steps" if edge["is_stair"] else "footway"
+            file.write(
+                f'  <way id="{way_id}"><nd ref="{a + OSM_ID_OFFSET}"/>'
+                f'<nd ref="{b + OSM_ID_OFFSET}"/>'
+                f'<tag k="highway" v="{highway}"/></way>\n'
+            )
+        file.write("</osm>\n")
@@ -0,0 +1,139 @@
+import json
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_THRESHOLD = 2.0
+
+
+@dataclass(frozen=True, kw_only=True)
+class Case:
+    """측정할 작업 하나
+
+    `operation`은 반복 번호를 받으므로, 삭제처럼 대상을 소모하는 작업은 번호마다
+    다른 대상을 고를 수 있습니다.
+    """
+
+    name: str
+    operation: Callable[[int], object]
+    iterations: int | None = None  # caps the runner default for slow cases
+
+
+@dataclass(frozen=True, kw_only=True)
+class Result:
+    name: str
+    samples: list[float]  # seconds
+
+    @property
+    def median(self) -> float:
+        return percentile(self.samples, 50)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 횟수 (순차 실행 기준)"""
+        return len(self.samples) / sum(self.samples)
+
+
+@dataclass(frozen=True, kw_only=True)
+class Comparison:
+    result: Result
+    baseline_median: float | None
+    threshold: float
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline_median is None:
+            return None
+        return self.result.median / self.baseline_median
+
+    @property
+    def is_regression(self) -> bool:
+        return self.ratio is not None and self.ratio > self.threshold
+
+
+def percentile(samples: list[float], rank: float) -> float:
+    """최근접 순위 방식의 백분위수"""
+    ordered: list[float] = sorted(samples)
+    index: int = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def measure(case: Case, iterations: int, warmup: int) -> Result:
+    for iteration in range(warmup):
+        case.operation(iteration)
+    if case.iterations is not None:
+        iterations = min(iterations, case.iterations)
+    samples: list[float] = []
+    for iteration in range(warmup, warmup + iterations):
+        start: float = time.perf_counter()
+        case.operation(iteration)
+        samples.append(time.perf_counter() - start)
+    return Result(name=case.name, samples=samples)
+
+
+class BaselineStore:
+    """그래프 모양별 기준 중앙값과 케이스별 회귀 임계 배율을 담는 JSON 파일
+
+    ```
+    {"thresholds": {"default": 2.0, "<case>": 3.0},
+     "baselines": {"<graph key>": {"<case>": {"median": ..., "p95": ...}}}}
+    ```
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._data: dict[str, Any] = {"thresholds": {}, "baselines": {}}
+        if path.exists():
+            self._data = json.loads(path.read_text())
+
+    def threshold(self, name: str) -> float:
+        thresholds: dict[str, float] = self._data["thresholds"]
+        return thresholds.get(name, thresholds.get("default", DEFAULT_THRESHOLD))
+
+    def compare(self, graph_key: str, result: Result) -> Comparison:
+        baseline: dict[str, float] | None = (
+            self._data["baselines"].get(graph_key, {}).get(result.name)
+        )
+        return Comparison(
+            result=result,
+            baseline_median=None if baseline is None else baseline["median"],
+            threshold=self.threshold(result.name),
+        )
+
+    def update(self, graph_key: str, results: list[Result]) -> None:
+        baselines: dict[str, Any] = self._data["baselines"].setdefault(graph_key, {})
+        for result in results:
+            baselines[result.name] = {
+                "median": round(result.median, 7),
+                "p95": round(result.p95, 7),
+            }
+        self._data["thresholds"].setdefault("default", DEFAULT_THRESHOLD)
+        self.path.write_text(json.dumps(self._data, indent=4, sort_keys=True) + "\n")
+
+
+def format_report(comparisons: list[Comparison]) -> list[str]:
+    lines: list[str] = [
+        f"{'case':<44} {'median ms':>10} {'p95 ms':>10} {'ops/s':>10} "
+        f"{'base ms':>10} {'ratio':>7}"
+    ]
+    for comparison in comparisons:
+        result: Result = comparison.result
+        base: str = (
+            "-"
+            if comparison.baseline_median is None
+            else f"{comparison.baseline_median * 1000:.3f}"
+        )
+        ratio: str = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}"
+        flag: str = "  REGRESSION" if comparison.is_regression else ""
+        lines.append(
+            f"{result.name:<44} {result.median * 1000:>10.3f} "
+            f"{result.p95 * 1000:>10.3f} {result.throughput:>10.1f} "
+            f"{base:>10} {ratio:>7}{flag}"
+        )
+    return lines
@@ -0,0 +1,439 @@
+"""부하 생성기
+
+읽기와 쓰기를 섞은 요청을 여러 가상 사용자가 동시에 보내고, 요청 종류별
+지연 시간 백분위수(p50/p95/p99), 처리량, 오류율, 유실된 쓰기를 보고합니다.
+
+```shell
+# 가상 그래프를 올린 앱을 같은 프로세스에서 ASGI로 호출
+PYTHONPATH=src python -m benchmarks.load --nodes 2000 --users 50 --duration 30
+
+# 이미 떠 있는 서버 (예: uvicorn main:app --workers 4)
+PYTHONPATH=src python -m benchmarks.load --url http://127.0.0.1:8000
+```
+
+쓰기 요청은 모두 고유한 값을 쓰므로, 끝난 뒤 그래프를 다시 읽어 응답까지
+받은 쓰기가 다른 쓰기에 덮여 사라졌는지 판별할 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable
+
+import httpx
+
+from benchmarks.generator import GraphSpec, generate_campus_graph, write_graph
+from benchmarks.harness import percentile
+from benchmarks.suites import build_app, build_container
+
+DEFAULT_MIX: dict[str, int] = {
+    "list_nodes": 40,
+    "list_edges": 20,
+    "patch_node": 15,
+    "patch_edge": 15,
+    "create_node": 5,
+    "create_edge": 5,
+}
+QUALITIES: tuple[str, ...] = ("상", "중", "하")
+
+
+@dataclass(frozen=True, kw_only=True)
+class Write:
+    """응답까지 받은 쓰기 하나"""
+
+    target: Hashable  # node id, or the node id pair of an edge
+    value: Any
+    started: float
+    finished: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class LostUpdate:
+    write: Write
+    overwritten_by: Write | None  # None when no acknowledged write survived
+
+
+@dataclass(kw_only=True)
+class OperationStats:
+    name: str
+    latencies: list[float] = field(default_factory=list)  # seconds
+    errors: int = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoadReport:
+    operations: list[OperationStats]
+    elapsed: float
+    writes: int
+    lost_updates: list[LostUpdate]
+
+    @property
+    def request_count(self) -> int:
+        return sum(operation.count for operation in self.operations)
+
+    @property
+    def throughput(self) -> float:
+        return self.request_count / self.elapsed
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """`list_nodes=40,patch_node=10` 꼴의 요청 비율을 읽습니다."""
+    mix: dict[str, int] = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation: {name}")
+        mix[name] = int(weight)
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight: {name}")
+    if not any(mix.values()):
+        raise ValueError("Every weight is zero")
+    return mix
+
+
+def find_lost_updates(
+    writes: list[Write],
+    final_values: dict[Hashable, Any],
+) -> list[LostUpdate]:
+    """최종 값을 남긴 쓰기가 끝난 뒤에 시작해 응답까지 받은 쓰기를 찾습니다.
+
+    동시에 진행된 쓰기끼리는 어느 쪽이 남아도 정상이지만, 최종 값의 쓰기가
+    끝난 다음에 시작한 쓰기는 그 값을 덮었어야 합니다. 최종 값이 응답받은
+    어떤 쓰기의 값과도 같지 않으면 그 대상의 마지막 쓰기가 유실된 것으로
+    봅니다.
+    """
+    writes_by_target: dict[Hashable, list[Write]] = {}
+    for write in writes:
+        writes_by_target.setdefault(write.target, []).append(write)
+
+    lost_updates: list[LostUpdate] = []
+    for target, target_writes in writes_by_target.items():
+        survivor: Write | None = next(
+            (
+                write
+                for write in target_writes
+                if write.value == final_values.get(target)
+            ),
+            None,
+        )
+        if survivor is None:
+            last: Write = max(target_writes, key=lambda write: write.finished)
+            lost_updates.append(LostUpdate(write=last, overwritten_by=None))
+            continue
+        lost_updates.extend(
+            LostUpdate(write=write, overwritten_by=survivor)
+            for write in target_writes
+            if write.started > survivor.finished
+        )
+    return lost_updates
+
+
+class LoadGenerator:
+    """가상 사용자마다 요청 비율에 따라 무작위로 요청을 골라 보냅니다.
+
+    `POST /edges`는 직접 만든 노드와 기존 노드를 이으므로, 아직 만든 노드가
+    없으면 대신 `POST /nodes`를 보냅니다.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        mix: dict[str, int],
+        seed: int = 0,
+    ) -> None:
+        self.client = client
+        self.mix = mix
+        self.seed = seed
+        self.node_ids: list[int] = []
+        self.edge_node_ids: list[tuple[int, int]] = []
+        self.created_node_ids: list[int] = []
+        self.operations: dict[str, OperationStats] = {}
+        self.writes: list[Write] = []
+        self._sequence: int = 0
+        self._operations: dict[str, Callable[[random.Random], Awaitable[None]]] = {
+            "list_nodes": self._list_nodes,
+            "list_edges": self._list_edges,
+            "patch_node": self._patch_node,
+            "patch_edge": self._patch_edge,
+            "create_node": self._create_node,
+            "create_edge": self._create_edge,
+        }
+
+    async def run(
+        self,
+        users: int,
+        duration: float,
+        max_requests: int | None = None,
+    ) -> LoadReport:
+        await self._load_targets()
+        deadline: float = time.perf_counter() + duration
+        remaining: list[int | None] = [max_requests]
+
+        async def user(index: int) -> None:
+            rng = random.Random(f"{self.seed}-{index}")
+            names: list[str] = list(self.mix)
+            weights: list[int] = list(self.mix.values())
+            while time.perf_counter() < deadline:
+                if remaining[0] is not None:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                await self._operations[rng.choices(names, weights)[0]](rng)
+
+        started: float = time.perf_counter()
+        await asyncio.gather(*(user(index) for index in range(users)))
+        elapsed: float = time.perf_counter() - started
+        return LoadReport(
+            operations=list(self.operations.values()),
+            elapsed=elapsed,
+            writes=len(self.writes),
+            lost_updates=find_lost_updates(self.writes, await self._final_values()),
+        )
+
+    async def _load_targets(self) -> None:
+        nodes: list[dict[str, Any]] = await self._get_json("/nodes")
+        edges: list[dict[str, Any]] = await self._get_json("/edges")
+        self.node_ids = [node["id"] for node in nodes]
+        self.edge_node_ids = [
+            (edge["nodes"][0]["id"], edge["nodes"][1]["id"]) for edge in edges
+        ]
+
+    async def _final_values(self) -> dict[Hashable, Any]:
+        nodes: list[dict[str, Any]] = await self._get_json("/nodes")
+        edges: list[dict[str, Any]] = await self._get_json("/edges")
+        final_values: dict[Hashable, Any] = {node["id"]: node["name"] for node in nodes}
+        for edge in edges:
+            node_ids = frozenset(node["id"] for node in edge["nodes"])
+            final_values[node_ids] = round(edge["vertical_distance"] * 100)
+        return final_values
+
+    async def _get_json(self, url: str) -> Any:
+        response: httpx.Response = await self.client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    async def _send(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        expected_status: int,
+        **kwargs: Any,
+    ) -> tuple[httpx.Response | None, float, float]:
+        stats: OperationStats = self.operations.setdefault(
+            name, OperationStats(name=name)
+        )
+        started: float = time.perf_counter()
+        response: httpx.Response | None
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        finished: float = time.perf_counter()
+        stats.latencies.append(finished - started)
+        if response is None or response.status_code != expected_status:
+            stats.errors += 1
+            return None, started, finished
+        return response, started, finished
+
+    def _next_sequence(self) -> int:
+        self._sequence += 1
+        return self._sequence
+
+    async def _list_nodes(self, rng: random.Random) -> None:
+        await self._send("GET /nodes", "GET", "/nodes", 200)
+
+    async def _list_edges(self, rng: random.Random) -> None:
+        await self._send("GET /edges", "GET", "/edges", 200)
+
+    async def _patch_node(self, rng: random.Random) -> None:
+        node_id: int = rng.choice(self.node_ids)
+        name: str = f"Load {self._next_sequence()}"
+        response, started, finished = await self._send(
+            "PATCH /nodes/{node_id}",
+            "PATCH",
+            f"/nodes/{node_id}",
+            200,
+            json={"name": name},
+        )
+        if response is not None:
+            self.writes.append(
+                Write(target=node_id, value=name, started=started, finished=finished)
+            )
+
+    async def _patch_edge(self, rng: random.Random) -> None:
+        node_id_1, node_id_2 = rng.choice(self.edge_node_ids)
+        # a unique value in hundredths keeps the write recognisable after a float
+        # round trip
+        value: int = self._next_sequence()
+        response, started, finished = await self._send(
+            "PATCH /edges/{node_id_1}/{node_id_2}",
+            "PATCH",
+            f"/edges/{node_id_1}/{node_id_2}",
+            200,
+            json={"vertical_distance": value / 100},
+        )
+        if response is not None:
+            self.writes.append(
+                Write(
+                    target=frozenset((node_id_1, node_id_2)),
+                    value=value,
+                    started=started,
+                    finished=finished,
+                )
+            )
+
+    async def _create_node(self, rng: random.Random) -> None:
+        response, _, _ = await self._send(
+            "POST /nodes",
+            "POST",
+            "/nodes",
+            201,
+            json={
+                "name": f"Load {self._next_sequence()}",
+                "longitude": round(rng.uniform(127.020, 127.040), 7),
+                "latitude": round(rng.uniform(37.580, 37.595), 7),
+            },
+        )
+        if response is not None:
+            self.created_node_ids.append(response.json()["id"])
+
+    async def _create_edge(self, rng: random.Random) -> None:
+        if not self.created_node_ids:
+            await self._create_node(rng)
+            return
+        node_id: int = self.created_node_ids.pop()
+        await self._send(
+            "POST /edges",
+            "POST",
+            "/edges",
+            201,
+            json={
+                "node_ids": [node_id, rng.choice(self.node_ids)],
+                "vertical_distance": 0.5,
+                "is_stair": False,
+                "is_step": False,
+                "quality": rng.choice(QUALITIES),
+            },
+        )
+
+
+def format_load_report(report: LoadReport) -> list[str]:
+    lines: list[str] = [
+        f"{'request':<40} {'count':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9}"
+        f" {'p99 ms':>9}"
+    ]
+    for operation in sorted(report.operations, key=lambda operation: operation.name):
+        lines.append(
+            f"{operation.name:<40} {operation.count:>7}"
+            f" {operation.error_rate:>7.1%}"
+            f" {percentile(operation.latencies, 50) * 1000:>9.2f}"
+            f" {percentile(operation.latencies, 95) * 1000:>9.2f}"
+            f" {percentile(operation.latencies, 99) * 1000:>9.2f}"
+        )
+    errors: int = sum(operation.errors for operation in report.operations)
+    lines.append(
+        f"{report.request_count} requests in {report.elapsed:.1f}s,"
+        f" {report.throughput:.1f} req/s,"
+        f" error rate {errors / max(report.request_count, 1):.1%}"
+    )
+    lines.append(
+        f"{len(report.lost_updates)} of {report.writes} acknowledged writes lost"
+    )
+    for lost_update in report.lost_updates[:10]:
+        target: Hashable = lost_update.write.target
+        if isinstance(target, frozenset):
+            target = "-".join(map(str, sorted(target)))
+        lines.append(f"  lost write {lost_update.write.value!r} to {target}")
+    return lines
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load test the map admin API")
+    parser.add_argument(
+        "--url",
+        help="base URL of a running server (default: an in-process app)",
+    )
+    parser.add_argument(
+        "--nodes",
+        type=int,
+        default=1_000,
+        help="node count of the generated graph for the in-process app",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--users", type=int, default=20, help="concurrent users")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--requests", type=int, help="stop after this many requests")
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="request weights, e.g. list_nodes=40,patch_node=10",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds")
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        help="exit with 1 when the error rate is higher than this fraction",
+    )
+    return parser
+
+
+async def run_load(args: argparse.Namespace, client: httpx.AsyncClient) -> LoadReport:
+    return await LoadGenerator(client, mix=args.mix, seed=args.seed).run(
+        users=args.users,
+        duration=args.duration,
+        max_requests=args.requests,
+    )
+
+
+async def _main(args: argparse.Namespace) -> LoadReport:
+    timeout = httpx.Timeout(args.timeout)
+    if args.url is not None:
+        async with httpx.AsyncClient(base_url=args.url, timeout=timeout) as client:
+            return await run_load(args, client)
+
+    graph = generate_campus_graph(GraphSpec(node_count=args.nodes, seed=args.seed))
+    with tempfile.TemporaryDirectory() as directory:
+        app = build_app(build_container(write_graph(graph, Path(directory))))
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),  # type: ignore[arg-type]
+            base_url="http://load",
+            timeout=timeout,
+        ) as client:
+            return await run_load(args, client)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args: argparse.Namespace = build_parser().parse_args(argv)
+    report: LoadReport = asyncio.run(_main(args))
+    for line in format_load_report(report):
+        print(line)
+
+    errors: int = sum(operation.errors for operation in report.operations)
+    if report.lost_updates:
+        return 1
+    if (
+        args.max_error_rate is not None
+        and errors > args.max_error_rate * report.request_count
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
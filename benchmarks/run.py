@@ -0,0 +1,133 @@
+"""벤치마크 실행기
+
+저장소 루트에서 `PYTHONPATH=src python -m benchmarks`로 실행합니다.
+`--save-baseline`으로 현재 결과를 기준값으로 저장하고, `--check`를 주면 기준값
+대비 임계 배율을 넘은 케이스가 있을 때 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+from typing import get_args
+
+from benchmarks.generator import (
+    DegreeDistribution,
+    GraphSpec,
+    SyntheticGraph,
+    generate_campus_graph,
+    write_graph,
+)
+from benchmarks.harness import (
+    BaselineStore,
+    Case,
+    Comparison,
+    Result,
+    format_report,
+    measure,
+)
+from benchmarks.suites import SUITES, SuiteContext
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run the map admin benchmarks")
+    parser.add_argument("--nodes", type=int, default=1_000, help="node count")
+    parser.add_argument("--mean-degree", type=float, default=3.0)
+    parser.add_argument("--max-degree", type=int, default=8)
+    parser.add_argument(
+        "--degree-distribution",
+        choices=get_args(DegreeDistribution),
+        default="poisson",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--suite",
+        action="append",
+        choices=list(SUITES),
+        help="suites to run (default: all)",
+    )
+    parser.add_argument(
+        "--filter",
+        default="",
+        help="only run cases whose name contains this text",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the medians of this run as the new baseline",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with 1 when a case is slower than its regression threshold",
+    )
+    return parser
+
+
+def run_suites(
+    spec: GraphSpec,
+    suites: list[str],
+    name_filter: str,
+    iterations: int,
+    warmup: int,
+) -> list[Result]:
+    graph: SyntheticGraph = generate_campus_graph(spec)
+    results: list[Result] = []
+    with tempfile.TemporaryDirectory() as directory:
+        for suite in suites:
+            # every suite starts from an untouched copy of the graph
+            suite_directory = Path(directory) / suite
+            context = SuiteContext(
+                spec=spec,
+                graph=graph,
+                files=write_graph(graph, suite_directory),
+                directory=suite_directory,
+                runs=warmup + iterations,
+            )
+            cases: list[Case] = SUITES[suite](context)
+            for case in cases:
+                if name_filter not in case.name:
+                    continue
+                results.append(measure(case, iterations=iterations, warmup=warmup))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    args: argparse.Namespace = build_parser().parse_args(argv)
+    spec = GraphSpec(
+        node_count=args.nodes,
+        mean_degree=args.mean_degree,
+        max_degree=args.max_degree,
+        degree_distribution=args.degree_distribution,
+        seed=args.seed,
+    )
+    results: list[Result] = run_suites(
+        spec,
+        suites=args.suite or list(SUITES),
+        name_filter=args.filter,
+        iterations=args.iterations,
+        warmup=args.warmup,
+    )
+
+    store = BaselineStore(args.baseline)
+    comparisons: list[Comparison] = [
+        store.compare(spec.key, result) for result in results
+    ]
+    print(f"graph {spec.key}")
+    for line in format_report(comparisons):
+        print(line)
+    if args.save_baseline:
+        store.update(spec.key, results)
+        print(f"baseline saved to {args.baseline}")
+
+    regressions: list[Comparison] = [
+        comparison for comparison in comparisons if comparison.is_regression
+    ]
+    if args.check and regressions:
+        print(f"{len(regressions)} cases regressed")
+        return 1
+    return 0
@@ -0,0 +1,670 @@
+import csv
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from benchmarks.generator import GraphFiles, GraphSpec, SyntheticGraph
+from benchmarks.harness import Case
+from config import FilePathSettings, Settings
+from containers import Container
+from map_admin.application.dtos import (
+    ComputeRouteMatrixInputData,
+    CreateEdgeInputData,
+    CreateNodeInputData,
+    DeleteEdgeInputData,
+    DeleteNodeInputData,
+    ExportTablesInputData,
+    FindAlternativeRoutesInputData,
+    FindRouteInputData,
+    GetComponentsInputData,
+    GetReachabilityInputData,
+    ImportMapInputData,
+    ImportTablesInputData,
+    PartialUpdateEdgeInputData,
+    PartialUpdateNodeInputData,
+    ValidateGraphInputData,
+)
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.infrastructure.repositories import (
+    CachedGraphRepository,
+    FileNodeRepository,
+)
+from map_admin.presentation import apis as map_admin_apis
+from map_admin.presentation import metrics as map_admin_metrics
+from map_admin.presentation.history import AuthorMiddleware
+from map_admin.presentation.presenters import (
+    ComputeRouteMatrixPydanticPresenter,
+    CreateNodePydanticPresenter,
+    ExportTablesTextPresenter,
+    FindAlternativeRoutesPydanticPresenter,
+    FindRoutePydanticPresenter,
+    GetComponentsPydanticPresenter,
+    GetReachabilityPydanticPresenter,
+    GetRouteCacheStatsPydanticPresenter,
+    ImportMapTextPresenter,
+    ImportTablesTextPresenter,
+    ListEdgesPydanticPresenter,
+    ListNodesPydanticPresenter,
+    RecomputeEdgeDistancesPydanticPresenter,
+    SampleNodeElevationsPydanticPresenter,
+    ValidateGraphPydanticPresenter,
+)
+from map_admin.presentation.tracing import TracingMiddleware
+
+MATRIX_SIZE = 10
+REACHABILITY_COST = Decimal("300")
+SLOW_CASE_ITERATIONS = 3
+
+
+@dataclass(frozen=True, kw_only=True)
+class SuiteContext:
+    spec: GraphSpec
+    graph: SyntheticGraph
+    files: GraphFiles
+    directory: Path  # scratch space for the suite
+    runs: int  # warmup + iterations, the most targets a case may consume
+
+    def node_id(self, iteration: int, stride: int = 1) -> int:
+        """반복마다 그래프 전체에 흩어진 기존 노드 ID를 고릅니다."""
+        return self.graph.nodes[(iteration * stride) % len(self.graph.nodes)]["id"]
+
+    def pair(self, iteration: int) -> tuple[int, int]:
+        return self.node_id(iteration, 7919), self.node_id(iteration + 1, 104729)
+
+    @property
+    def first_new_id(self) -> int:
+        return max(node["id"] for node in self.graph.nodes) + 1
+
+
+def build_container(files: GraphFiles) -> Container:
+    container = Container()
+    container.config.from_dict(
+        Settings(
+            file_path=FilePathSettings(
+                node=Path(files.node_file_path),
+                edge=Path(files.edge_file_path),
+            ),
+            elevation_file_path=Path(files.dem_file_path),
+            history_directory=Path(files.node_file_path).parent / "history",
+        ).model_dump()
+    )
+    return container
+
+
+def build_app(container: Container) -> FastAPI:
+    """`main.app`과 같은 구성의 앱을 주어진 컨테이너로 만듭니다."""
+    container.wire(modules=[map_admin_apis, map_admin_metrics])
+    app = FastAPI()
+    app.add_middleware(AuthorMiddleware, author_scope=container.history_author_scope())
+    app.add_middleware(map_admin_metrics.MetricsMiddleware, metrics=container.metrics())
+    app.add_middleware(TracingMiddleware, tracer=container.tracer())
+    app.include_router(map_admin_apis.router)
+    app.include_router(map_admin_metrics.router)
+    return app
+
+
+def _new_node(node_id: int) -> Node:
+    return Node(
+        id=node_id,
+        name=f"Bench {node_id}",
+        point=Point(longitude=Decimal("127.03"), latitude=Decimal("37.5875")),
+    )
+
+
+def repository_cases(context: SuiteContext) -> list[Case]:
+    repo = FileNodeRepository(
+        node_file_path=context.files.node_file_path,
+        edge_file_path=context.files.edge_file_path,
+    )
+    cached_repo = CachedGraphRepository(node_repo=repo)
+    first_new_id: int = context.first_new_id
+    # bulk writes use an id range of their own, after the single creates
+    bulk_size: int = 100
+    bulk_first_id: int = first_new_id + context.runs
+
+    def update_node(iteration: int) -> None:
+        node: Node = repo.get_node_by_id(
+            context.node_id(iteration, 31), include_edges=False
+        )
+        node.update_name(f"Renamed {iteration}")
+        repo.update_node(node)
+
+    def update_edge(iteration: int) -> None:
+        a, b = context.graph.edges[(iteration * 31) % len(context.graph.edges)][
+            "node_ids"
+        ]
+        edge: Edge = next(
+            edge for edge in repo.get_node_by_id(a).edges if b in edge.node_ids
+        )
+        edge.update_is_step(iteration % 2 == 0)
+        repo.update_edge(edge)
+
+    def bulk_update_nodes(iteration: int) -> None:
+        nodes: list[Node] = repo.get_all_nodes()[:bulk_size]
+        for node in nodes:
+            node.update_name(f"Bulk {iteration}")
+        repo.bulk_update_nodes(nodes=nodes)
+
+    def bulk_update_edges(iteration: int) -> None:
+        edges: list[Edge] = [
+            edge for node in repo.get_all_nodes()[:bulk_size] for edge in node.edges
+        ]
+        for edge in edges:
+            edge.update_is_step(iteration % 2 == 0)
+        repo.bulk_update_edges(edges=edges)
+
+    def bulk_create(iteration: int) -> None:
+        first_id: int = bulk_first_id + iteration * bulk_size
+        nodes: list[Node] = [
+            _new_node(node_id) for node_id in range(first_id, first_id + bulk_size)
+        ]
+        repo.bulk_create_nodes(nodes=nodes)
+        repo.bulk_create_edges(
+            edges=[
+                Edge(
+                    node_ids=(a.id, b.id),
+                    vertical_distance=Decimal("0.00"),
+                    horizontal_distance=Decimal("1.00"),
+                    is_stair=False,
+                    is_step=False,
+                    quality=RoadQuality.HIGH,
+                )
+                for a, b in zip(nodes, nodes[1:])
+            ]
+        )
+
+    def cold_graph(iteration: int) -> None:
+        CachedGraphRepository(node_repo=repo).get_graph()
+
+    return [
+        Case(name="repository.get_version", operation=lambda _: repo.get_version()),
+        Case(name="repository.get_next_id", operation=lambda _: repo.get_next_id()),
+        Case(
+            name="repository.get_all_nodes",
+            operation=lambda _: repo.get_all_nodes(),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="repository.get_node_by_id",
+            operation=lambda iteration: repo.get_node_by_id(
+                context.node_id(iteration, 7919)
+            ),
+        ),
+        Case(
+            name="repository.get_nodes_by_ids",
+            operation=lambda iteration: repo.get_nodes_by_ids(
+                list(context.pair(iteration))
+            ),
+        ),
+        Case(
+            name="repository.get_graph.cold",
+            operation=cold_graph,
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="repository.get_graph.cached",
+            operation=lambda _: cached_repo.get_graph(),
+        ),
+        Case(name="repository.update_node", operation=update_node),
+        Case(name="repository.update_edge", operation=update_edge),
+        Case(
+            name="repository.bulk_update_nodes",
+            operation=bulk_update_nodes,
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="repository.bulk_update_edges",
+            operation=bulk_update_edges,
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="repository.create_node",
+            operation=lambda iteration: repo.create_node(
+                _new_node(first_new_id + iteration)
+            ),
+        ),
+        Case(
+            name="repository.delete_node",
+            operation=lambda iteration: repo.delete_node(
+                _new_node(first_new_id + iteration)
+            ),
+        ),
+        Case(name="repository.bulk_create", operation=bulk_create),
+    ]
+
+
+def use_case_cases(context: SuiteContext) -> list[Case]:
+    container: Container = build_container(context.files)
+    first_new_id: int = context.first_new_id
+    table_directory: Path = context.directory / "tables"
+    table_directory.mkdir()
+    # one node table per run, each with ids of its own
+    table_rows: int = 100
+    table_first_id: int = first_new_id + context.runs
+    for run in range(context.runs):
+        with open(table_directory / f"nodes-{run}.csv", "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "name", "longitude", "latitude"])
+            first_id: int = table_first_id + run * table_rows
+            writer.writerows(
+                [node_id, f"Table {node_id}", "127.03", "37.5875"]
+                for node_id in range(first_id, first_id + table_rows)
+            )
+
+    def new_edge_ids(iteration: int) -> tuple[int, int]:
+        return first_new_id + iteration, context.node_id(iteration, 7919)
+
+    def create_node(iteration: int) -> None:
+        container.create_node_use_case().execute(
+            input_data=CreateNodeInputData(
+                name=f"Bench {iteration}",
+                longitude=Decimal("127.03"),
+                latitude=Decimal("37.5875"),
+            ),
+            output_boundary=CreateNodePydanticPresenter(),
+        )
+
+    def create_edge(iteration: int) -> None:
+        container.create_edge_use_case().execute(
+            input_data=CreateEdgeInputData(
+                node_ids=new_edge_ids(iteration),
+                vertical_distance=Decimal("0.50"),
+                horizontal_distance=None,
+                is_stair=False,
+                is_step=False,
+                quality=RoadQuality.HIGH.value,
+            ),
+        )
+
+    def find_route(iteration: int, cached: bool = False) -> None:
+        source_id, target_id = context.pair(0 if cached else iteration)
+        container.find_route_use_case().execute(
+            input_data=FindRouteInputData(
+                source_id=source_id,
+                target_id=target_id,
+                profile="pedestrian",
+            ),
+            output_boundary=FindRoutePydanticPresenter(),
+        )
+
+    def find_alternative_routes(iteration: int) -> None:
+        source_id, target_id = context.pair(iteration)
+        container.find_alternative_routes_use_case().execute(
+            input_data=FindAlternativeRoutesInputData(
+                source_id=source_id,
+                target_id=target_id,
+                profile="pedestrian",
+                count=3,
+            ),
+            output_boundary=FindAlternativeRoutesPydanticPresenter(),
+        )
+
+    def compute_route_matrix(iteration: int) -> None:
+        node_ids: list[int] = [
+            context.node_id(iteration * MATRIX_SIZE + index, 7919)
+            for index in range(2 * MATRIX_SIZE)
+        ]
+        container.compute_route_matrix_use_case().execute(
+            input_data=ComputeRouteMatrixInputData(
+                source_ids=node_ids[:MATRIX_SIZE],
+                target_ids=node_ids[MATRIX_SIZE:],
+                profile="pedestrian",
+            ),
+            output_boundary=ComputeRouteMatrixPydanticPresenter(),
+        )
+
+    return [
+        Case(
+            name="use_case.list_nodes",
+            operation=lambda _: container.list_nodes_use_case().execute(
+                output_boundary=ListNodesPydanticPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="use_case.list_edges",
+            operation=lambda _: container.list_edges_use_case().execute(
+                output_boundary=ListEdgesPydanticPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="use_case.get_reachability",
+            operation=lambda iteration: container.get_reachability_use_case().execute(
+                input_data=GetReachabilityInputData(
+                    node_id=context.node_id(iteration, 7919),
+                    max_cost=REACHABILITY_COST,
+                    profile="pedestrian",
+                    include_hull=True,
+                ),
+                output_boundary=GetReachabilityPydanticPresenter(),
+            ),
+        ),
+        Case(name="use_case.compute_route_matrix", operation=compute_route_matrix),
+        Case(name="use_case.find_route", operation=find_route),
+        Case(
+            name="use_case.find_route.cached",
+            operation=lambda iteration: find_route(iteration, cached=True),
+        ),
+        Case(
+            name="use_case.find_alternative_routes",
+            operation=find_alternative_routes,
+        ),
+        Case(
+            name="use_case.get_route_cache_stats",
+            operation=lambda _: container.get_route_cache_stats_use_case().execute(
+                output_boundary=GetRouteCacheStatsPydanticPresenter(),
+            ),
+        ),
+        Case(
+            name="use_case.get_components",
+            operation=lambda _: container.get_components_use_case().execute(
+                input_data=GetComponentsInputData(profile="wheelchair"),
+                output_boundary=GetComponentsPydanticPresenter(),
+            ),
+        ),
+        Case(
+            name="use_case.validate_graph",
+            operation=lambda _: container.validate_graph_use_case().execute(
+                input_data=ValidateGraphInputData(repair=False),
+                output_boundary=ValidateGraphPydanticPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="use_case.export_tables",
+            operation=lambda iteration: container.export_tables_use_case().execute(
+                input_data=ExportTablesInputData(
+                    node_file_path=str(table_directory / f"export-{iteration}.csv"),
+                    edge_file_path=str(
+                        table_directory / f"export-edges-{iteration}.csv"
+                    ),
+                ),
+                output_boundary=ExportTablesTextPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(name="use_case.create_node", operation=create_node),
+        Case(
+            name="use_case.partial_update_node",
+            operation=lambda iteration: (
+                container.partial_update_node_use_case().execute(
+                    input_data=PartialUpdateNodeInputData(
+                        id=first_new_id + iteration,
+                        name=f"Renamed {iteration}",
+                        longitude=None,
+                        latitude=Decimal("37.5876"),
+                        version=None,
+                    ),
+                )
+            ),
+        ),
+        Case(name="use_case.create_edge", operation=create_edge),
+        Case(
+            name="use_case.partial_update_edge",
+            operation=lambda iteration: (
+                container.partial_update_edge_use_case().execute(
+                    input_data=PartialUpdateEdgeInputData(
+                        node_ids=new_edge_ids(iteration),
+                        vertical_distance=None,
+                        horizontal_distance=None,
+                        is_stair=True,
+                        is_step=None,
+                        quality=None,
+                        version=None,
+                    ),
+                )
+            ),
+        ),
+        Case(
+            name="use_case.delete_edge",
+            operation=lambda iteration: container.delete_edge_use_case().execute(
+                input_data=DeleteEdgeInputData(
+                    node_ids=new_edge_ids(iteration), version=None
+                ),
+            ),
+        ),
+        Case(
+            name="use_case.delete_node",
+            operation=lambda iteration: container.delete_node_use_case().execute(
+                input_data=DeleteNodeInputData(
+                    id=first_new_id + iteration, version=None
+                ),
+            ),
+        ),
+        Case(
+            name="use_case.recompute_edge_distances",
+            operation=lambda _: (
+                container.recompute_edge_distances_use_case().execute(
+                    output_boundary=RecomputeEdgeDistancesPydanticPresenter(),
+                )
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="use_case.sample_node_elevations",
+            operation=lambda _: container.sample_node_elevations_use_case().execute(
+                output_boundary=SampleNodeElevationsPydanticPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="use_case.import_tables",
+            operation=lambda iteration: container.import_tables_use_case().execute(
+                input_data=ImportTablesInputData(
+                    node_file_path=str(table_directory / f"nodes-{iteration}.csv"),
+                    edge_file_path=None,
+                ),
+                output_boundary=ImportTablesTextPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="use_case.import_map",
+            operation=lambda _: container.import_map_use_case().execute(
+                input_data=ImportMapInputData(
+                    file_path=context.files.osm_file_path,
+                    batch_size=5_000,
+                ),
+                output_boundary=ImportMapTextPresenter(),
+            ),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+    ]
+
+
+def _request(
+    client: TestClient,
+    method: str,
+    url: str,
+    expected_status: int = 200,
+    **kwargs: Any,
+) -> Callable[[int], None]:
+    def operation(_: int) -> None:
+        _check(client.request(method, url, **kwargs), expected_status)
+
+    return operation
+
+
+def _check(response: httpx.Response, expected_status: int) -> None:
+    if response.status_code != expected_status:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url} returned"
+            f" {response.status_code}: {response.text[:200]}"
+        )
+
+
+def http_cases(context: SuiteContext) -> list[Case]:
+    client = TestClient(build_app(build_container(context.files)))
+    first_new_id: int = context.first_new_id
+
+    def new_edge_ids(iteration: int) -> tuple[int, int]:
+        return first_new_id + iteration, context.node_id(iteration, 7919)
+
+    def new_edge_url(iteration: int) -> str:
+        return "/".join(map(str, new_edge_ids(iteration)))
+
+    def route_query(iteration: int) -> dict[str, Any]:
+        source_id, target_id = context.pair(iteration)
+        # the generated graph is connected, so pedestrian routes always exist
+        return {"from": source_id, "to": target_id}
+
+    def compute_route_matrix(iteration: int, binary: bool) -> None:
+        node_ids: list[int] = [
+            context.node_id(iteration * MATRIX_SIZE + index, 7919)
+            for index in range(2 * MATRIX_SIZE)
+        ]
+        _check(
+            client.post(
+                "/routes/matrix",
+                json={
+                    "sources": node_ids[:MATRIX_SIZE],
+                    "targets": node_ids[MATRIX_SIZE:],
+                },
+                headers={
+                    "Accept": "application/octet-stream" if binary else "*/*",
+                },
+            ),
+            200,
+        )
+
+    return [
+        Case(
+            name="http.GET /nodes",
+            operation=_request(client, "GET", "/nodes"),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="http.GET /edges",
+            operation=_request(client, "GET", "/edges"),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="http.GET /reachability",
+            operation=lambda iteration: _check(
+                client.get(
+                    "/reachability",
+                    params={
+                        "from": context.node_id(iteration, 7919),
+                        "max_cost": float(REACHABILITY_COST),
+                        "hull": True,
+                    },
+                ),
+                200,
+            ),
+        ),
+        Case(
+            name="http.POST /routes/matrix",
+            operation=lambda iteration: compute_route_matrix(iteration, False),
+        ),
+        Case(
+            name="http.POST /routes/matrix (binary)",
+            operation=lambda iteration: compute_route_matrix(iteration, True),
+        ),
+        Case(
+            name="http.GET /routes",
+            operation=lambda iteration: _check(
+                client.get("/routes", params=route_query(iteration)), 200
+            ),
+        ),
+        Case(
+            name="http.GET /routes/alternatives",
+            operation=lambda iteration: _check(
+                client.get("/routes/alternatives", params=route_query(iteration)),
+                200,
+            ),
+        ),
+        Case(
+            name="http.GET /admin/route-cache",
+            operation=_request(client, "GET", "/admin/route-cache"),
+        ),
+        Case(
+            name="http.GET /analysis/components",
+            operation=_request(client, "GET", "/analysis/components"),
+        ),
+        Case(
+            name="http.POST /admin/validate",
+            operation=_request(client, "POST", "/admin/validate"),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="http.POST /nodes",
+            operation=_request(
+                client,
+                "POST",
+                "/nodes",
+                201,
+                json={"name": "Bench", "longitude": 127.03, "latitude": 37.5875},
+            ),
+        ),
+        Case(
+            name="http.PATCH /nodes/{node_id}",
+            operation=lambda iteration: _check(
+                client.patch(
+                    f"/nodes/{first_new_id + iteration}",
+                    json={"name": f"Renamed {iteration}"},
+                ),
+                200,
+            ),
+        ),
+        Case(
+            name="http.POST /edges",
+            operation=lambda iteration: _check(
+                client.post(
+                    "/edges",
+                    json={
+                        "node_ids": new_edge_ids(iteration),
+                        "vertical_distance": 0.5,
+                        "is_stair": False,
+                        "is_step": False,
+                        "quality": RoadQuality.HIGH.value,
+                    },
+                ),
+                201,
+            ),
+        ),
+        Case(
+            name="http.PATCH /edges/{node_id_1}/{node_id_2}",
+            operation=lambda iteration: _check(
+                client.patch(
+                    f"/edges/{new_edge_url(iteration)}", json={"is_stair": True}
+                ),
+                200,
+            ),
+        ),
+        Case(
+            name="http.DELETE /edge/{node_id_1}/{node_id_2}",
+            operation=lambda iteration: _check(
+                client.delete(f"/edge/{new_edge_url(iteration)}"), 204
+            ),
+        ),
+        Case(
+            name="http.DELETE /nodes/{node_id}",
+            operation=lambda iteration: _check(
+                client.delete(f"/nodes/{first_new_id + iteration}"), 204
+            ),
+        ),
+        Case(
+            name="http.POST /admin/recompute-distances",
+            operation=_request(client, "POST", "/admin/recompute-distances"),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+        Case(
+            name="http.POST /admin/sample-elevations",
+            operation=_request(client, "POST", "/admin/sample-elevations"),
+            iterations=SLOW_CASE_ITERATIONS,
+        ),
+    ]
+
+
+SUITES: dict[str, Callable[[SuiteContext], list[Case]]] = {
+    "repository": repository_cases,
+    "use_case": use_case_cases,
+    "http": http_cases,
+}
@@ -0,0 +1,166 @@
+import argparse
+import sys
+
+from config import Settings
+from containers import Container
+from map_admin.application.boundaries import (
+    ExportTablesInputBoundary,
+    ImportMapInputBoundary,
+    ImportTablesInputBoundary,
+    ValidateGraphInputBoundary,
+)
+from map_admin.application.dtos import (
+    ExportTablesInputData,
+    ImportMapInputData,
+    ImportTablesInputData,
+    ValidateGraphInputData,
+)
+from map_admin.presentation.presenters import (
+    ExportTablesTextPresenter,
+    ImportMapTextPresenter,
+    ImportTablesTextPresenter,
+    ValidateGraphTextPresenter,
+)
+
+IMPORT_BATCH_SIZE = 5_000
+UNSUPPORTED_TABLE_FORMAT = (
+    "Unsupported table format (use .csv, or .parquet with pyarrow installed)"
+)
+
+
+def validate(container: Container, args: argparse.Namespace) -> int:
+    presenter = ValidateGraphTextPresenter()
+    try:
+        container.validate_graph_use_case().execute(
+            input_data=ValidateGraphInputData(repair=args.repair),
+            output_boundary=presenter,
+        )
+    except ValidateGraphInputBoundary.MalformedDataError:
+        print("Malformed data file", file=sys.stderr)
+        return 2
+    for line in presenter.get_view_model():
+        print(line)
+    return 0 if presenter.is_clean() else 1
+
+
+def import_osm(container: Container, args: argparse.Namespace) -> int:
+    presenter = ImportMapTextPresenter()
+    try:
+        container.import_map_use_case().execute(
+            input_data=ImportMapInputData(
+                file_path=args.path,
+                batch_size=args.batch_size,
+            ),
+            output_boundary=presenter,
+        )
+    except ImportMapInputBoundary.MapSourceUnavailableError:
+        print(f"Cannot read map file: {args.path}", file=sys.stderr)
+        return 2
+    print(presenter.get_view_model())
+    return 0
+
+
+def import_tables(container: Container, args: argparse.Namespace) -> int:
+    presenter = ImportTablesTextPresenter()
+    try:
+        container.import_tables_use_case().execute(
+            input_data=ImportTablesInputData(
+                node_file_path=args.nodes,
+                edge_file_path=args.edges,
+            ),
+            output_boundary=presenter,
+        )
+    except ImportTablesInputBoundary.UnsupportedFormatError:
+        print(UNSUPPORTED_TABLE_FORMAT, file=sys.stderr)
+        return 2
+    except ImportTablesInputBoundary.MalformedTableError:
+        print("Cannot read table file", file=sys.stderr)
+        return 2
+    for line in presenter.get_view_model():
+        print(line)
+    return 0 if presenter.is_imported() else 1
+
+
+def export_tables(container: Container, args: argparse.Namespace) -> int:
+    presenter = ExportTablesTextPresenter()
+    try:
+        container.export_tables_use_case().execute(
+            input_data=ExportTablesInputData(
+                node_file_path=args.nodes,
+                edge_file_path=args.edges,
+            ),
+            output_boundary=presenter,
+        )
+    except ExportTablesInputBoundary.UnsupportedFormatError:
+        print(UNSUPPORTED_TABLE_FORMAT, file=sys.stderr)
+        return 2
+    except ExportTablesInputBoundary.MalformedTableError:
+        print("Cannot write table file", file=sys.stderr)
+        return 2
+    print(presenter.get_view_model())
+    return 0
+
+
+def add_table_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--nodes", help="node table (.csv or .parquet)")
+    parser.add_argument("--edges", help="edge table (.csv or .parquet)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Map admin maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="check the node/edge files for integrity violations",
+    )
+    validate_parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="drop the offending records and rewrite the files",
+    )
+    validate_parser.set_defaults(handler=validate)
+
+    import_parser = subparsers.add_parser(
+        "import-osm",
+        help="import walkable ways from an OpenStreetMap extract (.osm/.osm.pbf)",
+    )
+    import_parser.add_argument("path", help="path to the .osm or .osm.pbf file")
+    import_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=IMPORT_BATCH_SIZE,
+        help="number of edges written to the repository at once",
+    )
+    import_parser.set_defaults(handler=import_osm)
+
+    import_tables_parser = subparsers.add_parser(
+        "import-tables",
+        help="append nodes/edges from CSV or Parquet tables, all or nothing",
+    )
+    add_table_arguments(import_tables_parser)
+    import_tables_parser.set_defaults(handler=import_tables)
+
+    export_tables_parser = subparsers.add_parser(
+        "export-tables",
+        help="write nodes/edges to CSV or Parquet tables",
+    )
+    add_table_arguments(export_tables_parser)
+    export_tables_parser.set_defaults(handler=export_tables)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser: argparse.ArgumentParser = build_parser()
+    args: argparse.Namespace = parser.parse_args(argv)
+    is_table_command: bool = args.handler in (import_tables, export_tables)
+    if is_table_command and not (args.nodes or args.edges):
+        parser.error("at least one of --nodes and --edges is required")
+    container = Container()
+    container.config.from_dict(Settings().model_dump())
+    exit_code: int = args.handler(container, args)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import Literal
+
 from pydantic import Field, FilePath
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,3 +16,23 @@ class Settings(BaseSettings):
     file_path: FilePathSettings = Field(
         default_factory=FilePathSettings,  # type: ignore
     )
+    elevation_file_path: FilePath | None = None
+    route_matrix_max_workers: int | None = None
+    route_cache_max_size: int = 10_000
+    route_cache_ttl: float = 600.0
+    # "shared_memory" lets every worker process map a single copy of the graph
+    graph_store: Literal["memory", "shared_memory"] = "memory"
+    shared_graph_name: str = "anam-earth-graph"
+    validate_on_startup: bool = False
+    # messages a change stream client may fall behind before it is cut off
+    change_stream_queue_size: int = 256
+    change_stream_replay_size: int = 1024
+    history_directory: Path = Path("history")
+    # entries replayed onto a checkpoint for a point-in-time read, at most
+    history_checkpoint_interval: int = 500
+    # requests carrying an X-Profile header are profiled into this directory
+    profile_requests: bool = False
+    profile_directory: Path = Path("profiles")
+    tracing_exporter: Literal["none", "file", "otlp"] = "none"
+    tracing_file_path: Path = Path("traces.jsonl")
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
@@ -1,16 +1,62 @@
 from dependency_injector import containers, providers
 
+from map_admin.application.repositories import GraphRepository
+from map_admin.application.subscribers import (
+    ChangeFeedPublisher,
+    ComponentIndexUpdater,
+    HistoryRecorder,
+    RouteCacheInvalidator,
+)
 from map_admin.application.use_cases import (
+    ComputeRouteMatrixUseCase,
     CreateEdgeUseCase,
     CreateNodeUseCase,
     DeleteEdgeUseCase,
     DeleteNodeUseCase,
+    ExportTablesUseCase,
+    FindAlternativeRoutesUseCase,
+    FindRouteUseCase,
+    GetComponentsUseCase,
+    GetReachabilityUseCase,
+    GetRouteCacheStatsUseCase,
+    ImportMapUseCase,
+    ImportTablesUseCase,
+    ListEdgesAsOfUseCase,
     ListEdgesUseCase,
+    ListHistoryUseCase,
+    ListNodesAsOfUseCase,
     ListNodesUseCase,
     PartialUpdateEdgeUseCase,
     PartialUpdateNodeUseCase,
+    RecomputeEdgeDistancesUseCase,
+    SampleNodeElevationsUseCase,
+    UndoChangeUseCase,
+    ValidateGraphUseCase,
+)
+from map_admin.infrastructure.caches import InMemoryRouteCache
+from map_admin.infrastructure.elevations import RasterElevationProvider
+from map_admin.infrastructure.events import InProcessEventBus
+from map_admin.infrastructure.history import FileGraphHistory, authored_by
+from map_admin.infrastructure.indexes import UnionFindComponentIndex
+from map_admin.infrastructure.metrics import MetricsRegistry
+from map_admin.infrastructure.osm import OsmMapSource
+from map_admin.infrastructure.repositories import (
+    CachedGraphRepository,
+    FileNodeRepository,
+    InstrumentedNodeRepository,
+)
+from map_admin.infrastructure.routing import ProcessPoolRouteMatrixCalculator
+from map_admin.infrastructure.shared_graphs import SharedMemoryGraphRepository
+from map_admin.infrastructure.snapshots import SnapshotNodeRepository
+from map_admin.infrastructure.tables import FileGraphTableStore
+from map_admin.infrastructure.tracing import (
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+    TracedUseCase,
+    Tracer,
 )
-from map_admin.infrastructure.repositories import FileNodeRepository
+from map_admin.infrastructure.validators import FileGraphValidator
+from map_admin.presentation.changes import ChangeBroadcaster
 
 
 class Container(containers.DeclarativeContainer):
@@ -18,40 +64,334 @@ class Container(containers.DeclarativeContainer):
         strict=True,
     )
 
+    metrics = providers.Singleton(
+        MetricsRegistry,
+    )
+    tracer = providers.Singleton(
+        Tracer,
+        exporter=providers.Selector(
+            config.tracing_exporter,
+            none=providers.Object(None),
+            file=providers.Singleton(
+                JsonLinesSpanExporter,
+                file_path=config.tracing_file_path,
+            ),
+            otlp=providers.Singleton(
+                OtlpHttpSpanExporter,
+                endpoint=config.tracing_otlp_endpoint,
+            ),
+        ),
+    )
     node_repository = providers.Factory(
-        FileNodeRepository,
+        InstrumentedNodeRepository,
+        node_repo=providers.Singleton(
+            SnapshotNodeRepository,
+            node_repo=providers.Factory(
+                FileNodeRepository,
+                node_file_path=config.file_path.node,
+                edge_file_path=config.file_path.edge,
+                metrics=metrics,
+                tracer=tracer,
+            ),
+            metrics=metrics,
+        ),
+        metrics=metrics,
+        tracer=tracer,
+    )
+    graph_repository: providers.Selector[GraphRepository] = providers.Selector(
+        config.graph_store,
+        memory=providers.Singleton(
+            CachedGraphRepository,
+            node_repo=node_repository,
+            metrics=metrics,
+        ),
+        shared_memory=providers.Singleton(
+            SharedMemoryGraphRepository,
+            node_repo=node_repository,
+            name=config.shared_graph_name,
+            metrics=metrics,
+        ),
+    )
+    route_matrix_calculator = providers.Singleton(
+        ProcessPoolRouteMatrixCalculator,
+        max_workers=config.route_matrix_max_workers,
+    )
+    elevation_provider = providers.Singleton(
+        RasterElevationProvider,
+        file_path=config.elevation_file_path,
+    )
+    route_cache = providers.Singleton(
+        InMemoryRouteCache,
+        node_repo=node_repository,
+        max_size=config.route_cache_max_size,
+        ttl=config.route_cache_ttl,
+        metrics=metrics,
+    )
+    graph_validator = providers.Factory(
+        FileGraphValidator,
         node_file_path=config.file_path.node,
         edge_file_path=config.file_path.edge,
     )
-    list_nodes_use_case = providers.Factory(
-        ListNodesUseCase,
+    component_index = providers.Singleton(
+        UnionFindComponentIndex,
+        graph_repo=graph_repository,
         node_repo=node_repository,
     )
+    change_broadcaster = providers.Singleton(
+        ChangeBroadcaster,
+        client_queue_size=config.change_stream_queue_size,
+        replay_size=config.change_stream_replay_size,
+    )
+    # sets the author recorded with the changes saved in its scope
+    history_author_scope = providers.Object(authored_by)
+    graph_history = providers.Singleton(
+        FileGraphHistory,
+        directory=config.history_directory,
+        node_file_path=config.file_path.node,
+        edge_file_path=config.file_path.edge,
+        checkpoint_interval=config.history_checkpoint_interval,
+        metrics=metrics,
+    )
+    event_bus = providers.Singleton(
+        InProcessEventBus,
+        subscribers=providers.List(
+            providers.Singleton(
+                RouteCacheInvalidator,
+                route_cache=route_cache,
+            ),
+            providers.Singleton(
+                ComponentIndexUpdater,
+                component_index=component_index,
+            ),
+            # last, so that a failing write of the history leaves the caches
+            # and the index up to date
+            providers.Singleton(
+                HistoryRecorder,
+                history=graph_history,
+            ),
+        ),
+        background_subscribers=providers.List(
+            providers.Singleton(
+                ChangeFeedPublisher,
+                output_boundary=change_broadcaster,
+            ),
+        ),
+        metrics=metrics,
+    )
+    table_store = providers.Factory(
+        FileGraphTableStore,
+        node_file_path=config.file_path.node,
+        edge_file_path=config.file_path.edge,
+    )
+    map_source = providers.Singleton(
+        OsmMapSource,
+    )
+    list_nodes_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ListNodesUseCase,
+            node_repo=node_repository,
+        ),
+        tracer=tracer,
+    )
+    list_nodes_as_of_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ListNodesAsOfUseCase,
+            history=graph_history,
+        ),
+        tracer=tracer,
+    )
     create_node_use_case = providers.Factory(
-        CreateNodeUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            CreateNodeUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
     )
     partial_update_node_use_case = providers.Factory(
-        PartialUpdateNodeUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            PartialUpdateNodeUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
     )
     delete_node_use_case = providers.Factory(
-        DeleteNodeUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            DeleteNodeUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
     )
     list_edges_use_case = providers.Factory(
-        ListEdgesUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            ListEdgesUseCase,
+            node_repo=node_repository,
+        ),
+        tracer=tracer,
+    )
+    list_edges_as_of_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ListEdgesAsOfUseCase,
+            history=graph_history,
+        ),
+        tracer=tracer,
     )
     create_edge_use_case = providers.Factory(
-        CreateEdgeUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            CreateEdgeUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
     )
     partial_update_edge_use_case = providers.Factory(
-        PartialUpdateEdgeUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            PartialUpdateEdgeUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
     )
     delete_edge_use_case = providers.Factory(
-        DeleteEdgeUseCase,
-        node_repo=node_repository,
+        TracedUseCase,
+        use_case=providers.Factory(
+            DeleteEdgeUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
+    )
+    recompute_edge_distances_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            RecomputeEdgeDistancesUseCase,
+            node_repo=node_repository,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
+    )
+    sample_node_elevations_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            SampleNodeElevationsUseCase,
+            node_repo=node_repository,
+            elevation_provider=elevation_provider,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
+    )
+    get_reachability_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            GetReachabilityUseCase,
+            graph_repo=graph_repository,
+        ),
+        tracer=tracer,
+    )
+    compute_route_matrix_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ComputeRouteMatrixUseCase,
+            graph_repo=graph_repository,
+            route_matrix_calculator=route_matrix_calculator,
+        ),
+        tracer=tracer,
+    )
+    find_route_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            FindRouteUseCase,
+            graph_repo=graph_repository,
+            route_cache=route_cache,
+        ),
+        tracer=tracer,
+    )
+    find_alternative_routes_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            FindAlternativeRoutesUseCase,
+            graph_repo=graph_repository,
+        ),
+        tracer=tracer,
+    )
+    get_route_cache_stats_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            GetRouteCacheStatsUseCase,
+            route_cache=route_cache,
+        ),
+        tracer=tracer,
+    )
+    get_components_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            GetComponentsUseCase,
+            component_index=component_index,
+        ),
+        tracer=tracer,
+    )
+    validate_graph_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ValidateGraphUseCase,
+            graph_validator=graph_validator,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
+    )
+    import_map_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ImportMapUseCase,
+            node_repo=node_repository,
+            map_source=map_source,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
+    )
+    import_tables_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ImportTablesUseCase,
+            table_store=table_store,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
+    )
+    export_tables_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ExportTablesUseCase,
+            table_store=table_store,
+        ),
+        tracer=tracer,
+    )
+    list_history_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            ListHistoryUseCase,
+            history=graph_history,
+        ),
+        tracer=tracer,
+    )
+    undo_change_use_case = providers.Factory(
+        TracedUseCase,
+        use_case=providers.Factory(
+            UndoChangeUseCase,
+            node_repo=node_repository,
+            history=graph_history,
+            event_bus=event_bus,
+        ),
+        tracer=tracer,
     )
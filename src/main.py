@@ -1,16 +1,53 @@
+import logging
+
 from fastapi import FastAPI
 
 from config import Settings
 from containers import Container
+from map_admin.application.boundaries import ValidateGraphInputBoundary
+from map_admin.application.dtos import ValidateGraphInputData
 from map_admin.presentation import apis as map_admin_apis
+from map_admin.presentation import metrics as map_admin_metrics
+from map_admin.presentation.history import AuthorMiddleware
+from map_admin.presentation.presenters import ValidateGraphTextPresenter
+from map_admin.presentation.profiling import ProfilerMiddleware
+from map_admin.presentation.tracing import TracingMiddleware
+
+logger = logging.getLogger(__name__)
 
+settings = Settings()
 container = Container()
-container.config.from_dict(Settings().model_dump())
+container.config.from_dict(settings.model_dump())
 container.wire(
     modules=[
         map_admin_apis,
+        map_admin_metrics,
     ],
 )
 
 app = FastAPI()
+app.add_middleware(AuthorMiddleware, author_scope=container.history_author_scope())
+app.add_middleware(map_admin_metrics.MetricsMiddleware, metrics=container.metrics())
+app.add_middleware(TracingMiddleware, tracer=container.tracer())
+if settings.profile_requests:
+    app.add_middleware(ProfilerMiddleware, directory=settings.profile_directory)
 app.include_router(map_admin_apis.router)
+app.include_router(map_admin_metrics.router)
+
+
+def validate_on_startup() -> None:
+    presenter = ValidateGraphTextPresenter()
+    try:
+        container.validate_graph_use_case().execute(
+            input_data=ValidateGraphInputData(repair=False),
+            output_boundary=presenter,
+        )
+    except ValidateGraphInputBoundary.MalformedDataError:
+        logger.error("Malformed data file")
+        return
+    for line in presenter.get_view_model():
+        logger.log(logging.INFO if presenter.is_clean() else logging.WARNING, line)
+
+
+if settings.validate_on_startup:
+    validate_on_startup()
@@ -1,15 +1,42 @@
 from abc import ABC, abstractmethod
 
 from map_admin.application.dtos import (
+    ChangeOutputData,
+    ComputeRouteMatrixInputData,
+    ComputeRouteMatrixOutputData,
     CreateEdgeInputData,
     CreateNodeInputData,
     CreateNodeOutputData,
     DeleteEdgeInputData,
     DeleteNodeInputData,
+    ExportTablesInputData,
+    ExportTablesOutputData,
+    FindAlternativeRoutesInputData,
+    FindAlternativeRoutesOutputData,
+    FindRouteInputData,
+    FindRouteOutputData,
+    GetComponentsInputData,
+    GetComponentsOutputData,
+    GetReachabilityInputData,
+    GetReachabilityOutputData,
+    GetRouteCacheStatsOutputData,
+    ImportMapInputData,
+    ImportMapOutputData,
+    ImportTablesInputData,
+    ImportTablesOutputData,
+    ListEdgesAsOfInputData,
     ListEdgesOutputData,
+    ListHistoryInputData,
+    ListHistoryOutputData,
+    ListNodesAsOfInputData,
     ListNodesOutputData,
     PartialUpdateEdgeInputData,
     PartialUpdateNodeInputData,
+    RecomputeEdgeDistancesOutputData,
+    SampleNodeElevationsOutputData,
+    UndoChangeInputData,
+    ValidateGraphInputData,
+    ValidateGraphOutputData,
 )
 
 
@@ -49,6 +76,9 @@ class PartialUpdateNodeInputBoundary(ABC):
     class NodeNotFoundError(Exception):
         """노드를 찾지 못할 때 발생하는 에러"""
 
+    class VersionConflictError(Exception):
+        """읽은 뒤 다른 쪽에서 먼저 저장해 버전이 맞지 않을 때 발생하는 에러"""
+
 
 class DeleteNodeInputBoundary(ABC):
     @abstractmethod
@@ -58,6 +88,9 @@ class DeleteNodeInputBoundary(ABC):
     class NodeNotFoundError(Exception):
         """노드를 찾지 못할 때 발생하는 에러"""
 
+    class VersionConflictError(Exception):
+        """읽은 뒤 다른 쪽에서 먼저 저장해 버전이 맞지 않을 때 발생하는 에러"""
+
 
 class ListEdgesOutputBoundary(ABC):
     @abstractmethod
@@ -85,6 +118,9 @@ class CreateEdgeInputBoundary(ABC):
     class AlreadyConnectedNodesError(Exception):
         """이미 연결된 노드끼리 간선으로 연결할 때 발생하는 에러"""
 
+    class VersionConflictError(Exception):
+        """읽은 뒤 다른 쪽에서 먼저 저장해 버전이 맞지 않을 때 발생하는 에러"""
+
 
 class PartialUpdateEdgeInputBoundary(ABC):
     @abstractmethod
@@ -100,6 +136,9 @@ class PartialUpdateEdgeInputBoundary(ABC):
     class EdgeNotFoundError(Exception):
         """간선을 찾지 못할 때 발생하는 에러"""
 
+    class VersionConflictError(Exception):
+        """읽은 뒤 다른 쪽에서 먼저 저장해 버전이 맞지 않을 때 발생하는 에러"""
+
 
 class DeleteEdgeInputBoundary(ABC):
     @abstractmethod
@@ -114,3 +153,289 @@ class DeleteEdgeInputBoundary(ABC):
 
     class EdgeNotFoundError(Exception):
         """간선을 찾지 못할 때 발생하는 에러"""
+
+    class VersionConflictError(Exception):
+        """읽은 뒤 다른 쪽에서 먼저 저장해 버전이 맞지 않을 때 발생하는 에러"""
+
+
+class RecomputeEdgeDistancesOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: RecomputeEdgeDistancesOutputData) -> None:
+        raise NotImplementedError
+
+
+class RecomputeEdgeDistancesInputBoundary(ABC):
+    @abstractmethod
+    def execute(self, output_boundary: RecomputeEdgeDistancesOutputBoundary) -> None:
+        raise NotImplementedError
+
+
+class SampleNodeElevationsOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: SampleNodeElevationsOutputData) -> None:
+        raise NotImplementedError
+
+
+class SampleNodeElevationsInputBoundary(ABC):
+    @abstractmethod
+    def execute(self, output_boundary: SampleNodeElevationsOutputBoundary) -> None:
+        raise NotImplementedError
+
+    class ElevationSourceUnavailableError(Exception):
+        """고도 데이터를 읽을 수 없을 때 발생하는 에러"""
+
+
+class GetReachabilityOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: GetReachabilityOutputData) -> None:
+        raise NotImplementedError
+
+
+class GetReachabilityInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: GetReachabilityInputData,
+        output_boundary: GetReachabilityOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class NodeNotFoundError(Exception):
+        """노드를 찾지 못할 때 발생하는 에러"""
+
+
+class ComputeRouteMatrixOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: ComputeRouteMatrixOutputData) -> None:
+        raise NotImplementedError
+
+
+class ComputeRouteMatrixInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ComputeRouteMatrixInputData,
+        output_boundary: ComputeRouteMatrixOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class NodeNotFoundError(Exception):
+        """노드를 찾지 못할 때 발생하는 에러"""
+
+
+class FindRouteOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: FindRouteOutputData) -> None:
+        raise NotImplementedError
+
+
+class FindRouteInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: FindRouteInputData,
+        output_boundary: FindRouteOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class NodeNotFoundError(Exception):
+        """노드를 찾지 못할 때 발생하는 에러"""
+
+    class RouteNotFoundError(Exception):
+        """두 노드를 잇는 경로가 없을 때 발생하는 에러"""
+
+
+class FindAlternativeRoutesOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: FindAlternativeRoutesOutputData) -> None:
+        raise NotImplementedError
+
+
+class FindAlternativeRoutesInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: FindAlternativeRoutesInputData,
+        output_boundary: FindAlternativeRoutesOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class NodeNotFoundError(Exception):
+        """노드를 찾지 못할 때 발생하는 에러"""
+
+    class RouteNotFoundError(Exception):
+        """두 노드를 잇는 경로가 없을 때 발생하는 에러"""
+
+
+class GetRouteCacheStatsOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: GetRouteCacheStatsOutputData) -> None:
+        raise NotImplementedError
+
+
+class GetRouteCacheStatsInputBoundary(ABC):
+    @abstractmethod
+    def execute(self, output_boundary: GetRouteCacheStatsOutputBoundary) -> None:
+        raise NotImplementedError
+
+
+class GetComponentsOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: GetComponentsOutputData) -> None:
+        raise NotImplementedError
+
+
+class GetComponentsInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: GetComponentsInputData,
+        output_boundary: GetComponentsOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+
+class ValidateGraphOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: ValidateGraphOutputData) -> None:
+        raise NotImplementedError
+
+
+class ValidateGraphInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ValidateGraphInputData,
+        output_boundary: ValidateGraphOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class MalformedDataError(Exception):
+        """데이터를 읽을 수 없을 때 발생하는 에러"""
+
+
+class ImportMapOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: ImportMapOutputData) -> None:
+        raise NotImplementedError
+
+
+class ImportMapInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ImportMapInputData,
+        output_boundary: ImportMapOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class MapSourceUnavailableError(Exception):
+        """지도 파일을 읽을 수 없을 때 발생하는 에러"""
+
+
+class ImportTablesOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: ImportTablesOutputData) -> None:
+        raise NotImplementedError
+
+
+class ImportTablesInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ImportTablesInputData,
+        output_boundary: ImportTablesOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class UnsupportedFormatError(Exception):
+        """표 파일 형식을 다룰 수 없을 때 발생하는 에러"""
+
+    class MalformedTableError(Exception):
+        """표 파일을 읽을 수 없을 때 발생하는 에러"""
+
+
+class ExportTablesOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: ExportTablesOutputData) -> None:
+        raise NotImplementedError
+
+
+class ExportTablesInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ExportTablesInputData,
+        output_boundary: ExportTablesOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class UnsupportedFormatError(Exception):
+        """표 파일 형식을 다룰 수 없을 때 발생하는 에러"""
+
+    class MalformedTableError(Exception):
+        """표 파일을 쓸 수 없을 때 발생하는 에러"""
+
+
+class ChangeFeedOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data: ChangeOutputData) -> None:
+        """저장이 끝난 변경 하나를 구독 중인 클라이언트에게 내보냅니다."""
+        raise NotImplementedError
+
+
+class ListNodesAsOfInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ListNodesAsOfInputData,
+        output_boundary: ListNodesOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class HistoryNotAvailableError(Exception):
+        """주어진 시각의 그래프를 되살릴 이력이 없을 때 발생하는 에러"""
+
+
+class ListEdgesAsOfInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ListEdgesAsOfInputData,
+        output_boundary: ListEdgesOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+    class HistoryNotAvailableError(Exception):
+        """주어진 시각의 그래프를 되살릴 이력이 없을 때 발생하는 에러"""
+
+
+class ListHistoryOutputBoundary(ABC):
+    @abstractmethod
+    def present(self, output_data_list: list[ListHistoryOutputData]) -> None:
+        raise NotImplementedError
+
+
+class ListHistoryInputBoundary(ABC):
+    @abstractmethod
+    def execute(
+        self,
+        input_data: ListHistoryInputData,
+        output_boundary: ListHistoryOutputBoundary,
+    ) -> None:
+        raise NotImplementedError
+
+
+class UndoChangeInputBoundary(ABC):
+    @abstractmethod
+    def execute(self, input_data: UndoChangeInputData) -> None:
+        raise NotImplementedError
+
+    class EntryNotFoundError(Exception):
+        """이력 기록을 찾지 못할 때 발생하는 에러"""
+
+    class VersionConflictError(Exception):
+        """그 뒤의 변경이 같은 노드나 간선을 바꿔 되돌릴 수 없을 때 발생하는 에러"""
+
+    class IrreversibleChangeError(Exception):
+        """가져오기처럼 하나씩 기록하지 않은 일괄 변경을 되돌리려 할 때 발생하는 에러"""
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 
 
@@ -8,6 +9,8 @@ class ListNodesOutputData:
     name: str
     longitude: Decimal
     latitude: Decimal
+    elevation: Decimal | None
+    version: int
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -28,11 +31,14 @@ class PartialUpdateNodeInputData:
     name: str | None
     longitude: Decimal | None
     latitude: Decimal | None
+    # the version the client last read; None skips the check
+    version: int | None
 
 
 @dataclass(frozen=True, kw_only=True)
 class DeleteNodeInputData:
     id: int
+    version: int | None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -48,13 +54,14 @@ class ListEdgesOutputData:
     is_stair: bool
     is_step: bool
     quality: str
+    version: int
 
 
 @dataclass(frozen=True, kw_only=True)
 class CreateEdgeInputData:
     node_ids: tuple[int, int]
     vertical_distance: Decimal
-    horizontal_distance: Decimal
+    horizontal_distance: Decimal | None
     is_stair: bool
     is_step: bool
     quality: str
@@ -68,8 +75,229 @@ class PartialUpdateEdgeInputData:
     is_stair: bool | None
     is_step: bool | None
     quality: str | None
+    version: int | None
 
 
 @dataclass(frozen=True, kw_only=True)
 class DeleteEdgeInputData:
     node_ids: tuple[int, int]
+    version: int | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class RecomputeEdgeDistancesOutputData:
+    updated_count: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class SampleNodeElevationsOutputData:
+    updated_node_count: int
+    updated_edge_count: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetReachabilityInputData:
+    node_id: int
+    max_cost: Decimal
+    profile: str
+    include_hull: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetReachabilityOutputData:
+    @dataclass(frozen=True, kw_only=True)
+    class Node:
+        id: int
+        cost: Decimal
+
+    @dataclass(frozen=True, kw_only=True)
+    class Coordinate:
+        longitude: Decimal
+        latitude: Decimal
+
+    nodes: list[Node]
+    hull: list[Coordinate] | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ComputeRouteMatrixInputData:
+    source_ids: list[int]
+    target_ids: list[int]
+    profile: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ComputeRouteMatrixOutputData:
+    source_ids: list[int]
+    target_ids: list[int]
+    # row-major costs; unreachable pairs are infinite
+    costs: list[list[float]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class FindRouteInputData:
+    source_id: int
+    target_id: int
+    profile: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class FindRouteOutputData:
+    node_ids: list[int]
+    cost: Decimal
+    stair_count: int
+    step_count: int
+    climb: Decimal
+    low_quality_length: Decimal
+
+
+@dataclass(frozen=True, kw_only=True)
+class FindAlternativeRoutesInputData:
+    source_id: int
+    target_id: int
+    profile: str
+    count: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class FindAlternativeRoutesOutputData:
+    routes: list[FindRouteOutputData]
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetRouteCacheStatsOutputData:
+    hits: int
+    misses: int
+    size: int
+    version: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetComponentsInputData:
+    profile: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class GetComponentsOutputData:
+    # node ids per component, largest component first
+    components: list[list[int]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class ValidateGraphInputData:
+    repair: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class ValidateGraphOutputData:
+    @dataclass(frozen=True, kw_only=True)
+    class Violation:
+        kind: str
+        index: int
+        message: str
+
+    node_count: int
+    edge_count: int
+    violations: list[Violation]
+    repaired: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportMapInputData:
+    file_path: str
+    batch_size: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportMapOutputData:
+    created_node_count: int
+    created_edge_count: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportTablesInputData:
+    node_file_path: str | None
+    edge_file_path: str | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportTablesOutputData:
+    @dataclass(frozen=True, kw_only=True)
+    class Violation:
+        kind: str
+        index: int
+        message: str
+
+    node_count: int
+    edge_count: int
+    violations: list[Violation]
+    imported: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class ExportTablesInputData:
+    node_file_path: str | None
+    edge_file_path: str | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ExportTablesOutputData:
+    node_count: int
+    edge_count: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChangeOutputData:
+    @dataclass(frozen=True, kw_only=True)
+    class Node:
+        id: int
+        name: str
+        longitude: Decimal
+        latitude: Decimal
+        elevation: Decimal | None
+        version: int
+
+    @dataclass(frozen=True, kw_only=True)
+    class Edge:
+        node_ids: tuple[int, int]
+        vertical_distance: Decimal
+        horizontal_distance: Decimal
+        is_stair: bool
+        is_step: bool
+        quality: str
+        version: int
+
+    kind: str  # e.g. "edge_updated"; "graph_replaced" carries neither
+    node: Node | None
+    edge: Edge | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListNodesAsOfInputData:
+    as_of: datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListEdgesAsOfInputData:
+    as_of: datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListHistoryInputData:
+    after_id: int
+    limit: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class ListHistoryOutputData:
+    id: int
+    recorded_at: datetime
+    author: str | None
+    kind: str
+    node_id: int | None  # set for node changes
+    node_ids: tuple[int, int] | None  # set for edge changes
+
+
+@dataclass(frozen=True, kw_only=True)
+class UndoChangeInputData:
+    entry_id: int
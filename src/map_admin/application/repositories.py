@@ -1,9 +1,34 @@
 from abc import ABC, abstractmethod
+from typing import ContextManager
 
-from map_admin.domain.entities import Node
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
 
 
 class NodeRepository(ABC):
+    @abstractmethod
+    def get_version(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def locked(self) -> ContextManager[None]:
+        """빠져나올 때까지 다른 스레드와 프로세스의 쓰기를 막습니다.
+
+        같은 스레드의 쓰기는 막지 않으므로, 쓰기와 그 결과의 버전을 사이에
+        다른 쓰기 없이 함께 읽을 때 씁니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_written_versions(self) -> tuple[str, str] | None:
+        """이 스레드가 마지막으로 잠금을 잡고 저장하기 직전과 직후의 버전
+
+        잠금 안에서 읽으므로 그 사이에는 다른 쓰기가 없습니다. 저장한 적이
+        없으면 `None`입니다. 변경을 하나씩 반영하는 캐시가 직전 버전이 자기가
+        알던 버전과 같은지 보고, 그사이 다른 쪽의 쓰기가 있었는지 가릴 때 씁니다.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_next_id(self) -> int:
         raise NotImplementedError
@@ -13,7 +38,20 @@ class NodeRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_node_by_id(self, node_id: int) -> Node:
+    def get_node_by_id(self, node_id: int, include_edges: bool = True) -> Node:
+        """노드를 읽습니다.
+
+        `include_edges`가 거짓이면 간선을 읽지 않고 `edges`를 비워 둡니다.
+        이름과 좌표만 다루는 작업에 씁니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_nodes_by_ids(self, node_ids: list[int]) -> list[Node]:
+        """여러 노드를 간선과 함께 한 번에 읽어 요청한 순서대로 돌려줍니다.
+
+        하나라도 없으면 `NodeNotFoundError`가 발생합니다.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -22,11 +60,76 @@ class NodeRepository(ABC):
 
     @abstractmethod
     def update_node(self, node: Node) -> None:
+        """노드의 이름과 좌표를 저장합니다. 간선은 건드리지 않습니다.
+
+        노드의 `version`은 읽어 온 값이어야 하며, 그사이 다른 쪽에서
+        저장했다면 `VersionConflictError`가 발생합니다. 바뀐 경우에만 버전이
+        하나 올라가고, 저장한 버전은 노드에 다시 적습니다.
+        """
         raise NotImplementedError
 
     @abstractmethod
     def delete_node(self, node: Node) -> None:
+        """노드를 지웁니다.
+
+        노드의 `version`이 저장된 값과 다르면 `VersionConflictError`가 발생합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_edge(self, edge: Edge) -> None:
+        """간선 하나를 추가합니다.
+
+        두 노드 중 하나라도 없으면 `NodeNotFoundError`가, 그사이 같은 간선이
+        추가됐다면 `VersionConflictError`가 발생합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_edge(self, edge: Edge) -> None:
+        """간선 하나의 속성을 저장합니다.
+
+        간선이 없으면 `EdgeNotFoundError`가, `version`이 저장된 값과 다르면
+        `VersionConflictError`가 발생합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_edge(self, edge: Edge) -> None:
+        """간선 하나를 지웁니다.
+
+        간선의 `version`이 저장된 값과 다르면 `VersionConflictError`가 발생합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_create_nodes(self, nodes: list[Node]) -> None:
+        """간선 없이 노드만 추가합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_create_edges(self, edges: list[Edge]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_update_nodes(self, nodes: list[Node]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_update_edges(self, edges: list[Edge]) -> None:
         raise NotImplementedError
 
     class NodeNotFoundError(Exception):
         """노드를 찾지 못할 때 발생하는 에러"""
+
+    class EdgeNotFoundError(Exception):
+        """간선을 찾지 못할 때 발생하는 에러"""
+
+    class VersionConflictError(Exception):
+        """읽은 뒤 다른 쪽에서 먼저 저장해 버전이 맞지 않을 때 발생하는 에러"""
+
+
+class GraphRepository(ABC):
+    @abstractmethod
+    def get_graph(self) -> AccessibilityGraph:
+        raise NotImplementedError
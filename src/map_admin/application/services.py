@@ -0,0 +1,292 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import StrEnum
+from typing import Iterator
+
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import GraphEvent
+from map_admin.domain.graphs import AccessibilityGraph, Route
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
+
+
+class ElevationProvider(ABC):
+    @abstractmethod
+    def get_elevations(self, points: list[Point]) -> list[Decimal | None]:
+        raise NotImplementedError
+
+    class ElevationSourceUnavailableError(Exception):
+        """고도 데이터를 읽을 수 없을 때 발생하는 에러"""
+
+
+class RouteMatrixCalculator(ABC):
+    @abstractmethod
+    def compute(
+        self,
+        graph: AccessibilityGraph,
+        source_ids: list[int],
+        target_ids: list[int],
+        profile: AccessibilityProfile,
+    ) -> list[list[float]]:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, kw_only=True)
+class RouteCacheStats:
+    hits: int
+    misses: int
+    size: int
+    version: int
+
+
+class RouteCache(ABC):
+    @abstractmethod
+    def get(
+        self,
+        source_id: int,
+        target_id: int,
+        profile: AccessibilityProfile,
+    ) -> Route | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(
+        self,
+        source_id: int,
+        target_id: int,
+        profile: AccessibilityProfile,
+        route: Route,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_edge(self, node_ids: tuple[int, int]) -> None:
+        """주어진 간선을 지나는 경로만 무효화합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_node(self, node_id: int) -> None:
+        """주어진 노드를 지나는 경로만 무효화합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_all(self) -> None:
+        """그래프 버전을 올려 모든 경로를 무효화합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> RouteCacheStats:
+        raise NotImplementedError
+
+
+class ComponentIndex(ABC):
+    """프로필별 연결 요소를 편집에 맞춰 갱신하는 색인"""
+
+    @abstractmethod
+    def get_components(self, profile: AccessibilityProfile) -> list[list[int]]:
+        """연결 요소별 노드 ID 목록 (큰 요소부터)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_node(self, node_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_node(self, node: Node) -> None:
+        """간선과 함께 읽은 노드를, 그 노드에 닿는 간선과 함께 지웁니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_edge(self, edge: Edge) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_edge(self, before: Edge, after: Edge) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_edge(self, edge: Edge) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_all(self) -> None:
+        raise NotImplementedError
+
+
+class GraphEventSubscriber(ABC):
+    @abstractmethod
+    def handle(self, event: GraphEvent) -> None:
+        """저장이 끝난 변경 하나를 반영합니다. 관심 없는 이벤트는 무시합니다."""
+        raise NotImplementedError
+
+
+class GraphEventBus(ABC):
+    """그래프 변경을 캐시, 색인 같은 구독자에게 알리는 포트"""
+
+    @abstractmethod
+    def publish(self, event: GraphEvent) -> None:
+        """저장이 끝난 변경을 구독자에게 알립니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def subscribe(
+        self,
+        subscriber: GraphEventSubscriber,
+        background: bool = False,
+    ) -> None:
+        """구독자를 등록합니다.
+
+        `background`가 거짓이면 `publish`가 돌아오기 전에 처리하고, 참이면
+        발행한 쪽을 기다리게 하지 않고 따로 처리합니다.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def unsubscribe(self, subscriber: GraphEventSubscriber) -> None:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, kw_only=True)
+class HistoryEntry:
+    id: int  # increases by one per recorded change
+    recorded_at: datetime
+    author: str | None
+    event: GraphEvent
+
+
+class GraphHistory(ABC):
+    """저장된 그래프 변경을 순서대로 쌓아 과거 시점의 그래프를 되살리는 저장소"""
+
+    @abstractmethod
+    def record(self, event: GraphEvent) -> HistoryEntry:
+        """저장이 끝난 변경 하나를 기록 시각, 작성자와 함께 남깁니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_entry(self, entry_id: int) -> HistoryEntry:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_entries(self, after_id: int, limit: int) -> list[HistoryEntry]:
+        """`after_id` 다음 기록부터 오래된 순으로 `limit`개까지 돌려줍니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_nodes_as_of(self, as_of: datetime) -> list[Node]:
+        """`as_of` 시각에 저장돼 있던 노드를 간선과 함께 돌려줍니다.
+
+        기록이 시작되기 전 시각이면 `HistoryNotAvailableError`가 발생합니다.
+        """
+        raise NotImplementedError
+
+    class EntryNotFoundError(Exception):
+        """이력 기록을 찾지 못할 때 발생하는 에러"""
+
+    class HistoryNotAvailableError(Exception):
+        """주어진 시각의 그래프를 되살릴 이력이 없을 때 발생하는 에러"""
+
+
+class ViolationKind(StrEnum):
+    MALFORMED_NODE = "malformed_node"
+    DUPLICATE_NODE_ID = "duplicate_node_id"
+    MALFORMED_EDGE = "malformed_edge"
+    SELF_LOOP = "self_loop"
+    MISSING_NODE = "missing_node"
+    DUPLICATE_EDGE = "duplicate_edge"
+
+
+@dataclass(frozen=True, kw_only=True)
+class IntegrityViolation:
+    kind: ViolationKind
+    index: int  # position of the offending record in its file
+    message: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class IntegrityReport:
+    node_count: int
+    edge_count: int
+    violations: list[IntegrityViolation]
+    repaired: bool
+
+
+class GraphValidator(ABC):
+    @abstractmethod
+    def validate(self, repair: bool) -> IntegrityReport:
+        """저장된 노드/간선 데이터의 무결성을 검사합니다.
+
+        `repair`가 참이면 위반한 레코드를 버린 데이터로 저장소를 고칩니다.
+        """
+        raise NotImplementedError
+
+    class MalformedDataError(Exception):
+        """데이터를 레코드 단위로 읽을 수조차 없을 때 발생하는 에러"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class MapWay:
+    """보행 가능한 길 하나 (외부 지도 데이터의 노드 참조 목록)"""
+
+    node_refs: list[int]
+    is_stair: bool
+    quality: RoadQuality
+
+
+@dataclass(frozen=True, kw_only=True)
+class MapNode:
+    ref: int
+    name: str | None
+    point: Point
+    is_step: bool  # e.g. a raised kerb on the way
+
+
+class MapSource(ABC):
+    """OSM 추출본 같은 외부 지도 파일을 스트리밍으로 읽는 포트"""
+
+    @abstractmethod
+    def read_ways(self, file_path: str) -> Iterator[MapWay]:
+        """보행 가능한 길만 골라 읽습니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_nodes(self, file_path: str, refs: set[int]) -> Iterator[MapNode]:
+        """주어진 참조 번호의 노드만 읽습니다."""
+        raise NotImplementedError
+
+    class MapSourceUnavailableError(Exception):
+        """지도 파일을 읽을 수 없을 때 발생하는 에러"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class TableImportReport:
+    node_count: int
+    edge_count: int
+    violations: list[IntegrityViolation]  # nothing is written unless empty
+
+
+class GraphTableStore(ABC):
+    """노드/간선을 CSV, Parquet 같은 표 파일로 주고받는 포트"""
+
+    @abstractmethod
+    def import_tables(
+        self,
+        node_file_path: str | None,
+        edge_file_path: str | None,
+    ) -> TableImportReport:
+        """표 파일의 행을 검사해, 모든 행이 통과할 때만 한꺼번에 추가합니다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_nodes(self, file_path: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_edges(self, file_path: str) -> int:
+        raise NotImplementedError
+
+    class UnsupportedFormatError(Exception):
+        """표 파일 형식을 다룰 수 없을 때 발생하는 에러"""
+
+    class MalformedTableError(Exception):
+        """표 파일을 읽거나 쓸 수 없을 때 발생하는 에러"""
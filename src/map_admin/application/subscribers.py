@@ -0,0 +1,152 @@
+from map_admin.application.boundaries import ChangeFeedOutputBoundary
+from map_admin.application.dtos import ChangeOutputData
+from map_admin.application.services import (
+    ComponentIndex,
+    GraphEventSubscriber,
+    GraphHistory,
+    RouteCache,
+)
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeDeleted,
+    EdgeUpdated,
+    GraphEvent,
+    GraphReplaced,
+    NodeCreated,
+    NodeDeleted,
+    NodeUpdated,
+)
+from map_admin.domain.graphs import edge_cost, edge_flags
+from map_admin.domain.value_objects import AccessibilityProfile
+
+
+class RouteCacheInvalidator(GraphEventSubscriber):
+    """변경이 닿는 경로만 캐시에서 지웁니다."""
+
+    def __init__(self, route_cache: RouteCache) -> None:
+        self.route_cache = route_cache
+
+    def handle(self, event: GraphEvent) -> None:
+        if isinstance(event, NodeDeleted):
+            # every route over one of its edges passes through the node
+            self.route_cache.invalidate_node(node_id=event.node.id)
+        elif isinstance(event, EdgeCreated):
+            # a new edge can shorten any cached route
+            self.route_cache.invalidate_all()
+        elif isinstance(event, EdgeUpdated):
+            if _may_shorten_routes(before=event.before, after=event.after):
+                self.route_cache.invalidate_all()
+            else:
+                self.route_cache.invalidate_edge(node_ids=event.after.node_ids)
+        elif isinstance(event, EdgeDeleted):
+            self.route_cache.invalidate_edge(node_ids=event.edge.node_ids)
+        elif isinstance(event, GraphReplaced):
+            self.route_cache.invalidate_all()
+
+
+class ComponentIndexUpdater(GraphEventSubscriber):
+    """연결 요소 색인에 노드와 간선 변경을 하나씩 반영합니다."""
+
+    def __init__(self, component_index: ComponentIndex) -> None:
+        self.component_index = component_index
+
+    def handle(self, event: GraphEvent) -> None:
+        if isinstance(event, NodeCreated):
+            self.component_index.add_node(node_id=event.node.id)
+        elif isinstance(event, NodeDeleted):
+            self.component_index.remove_node(node=event.node)
+        elif isinstance(event, EdgeCreated):
+            self.component_index.add_edge(edge=event.edge)
+        elif isinstance(event, EdgeUpdated):
+            self.component_index.update_edge(before=event.before, after=event.after)
+        elif isinstance(event, EdgeDeleted):
+            self.component_index.remove_edge(edge=event.edge)
+        elif isinstance(event, GraphReplaced):
+            self.component_index.invalidate_all()
+
+
+class ChangeFeedPublisher(GraphEventSubscriber):
+    """변경을 클라이언트에게 내보낼 출력 데이터로 바꿔 넘깁니다."""
+
+    def __init__(self, output_boundary: ChangeFeedOutputBoundary) -> None:
+        self.output_boundary = output_boundary
+
+    def handle(self, event: GraphEvent) -> None:
+        node: Node | None = None
+        edge: Edge | None = None
+        if isinstance(event, (NodeCreated, NodeDeleted)):
+            node = event.node
+        elif isinstance(event, NodeUpdated):
+            node = event.after
+        elif isinstance(event, (EdgeCreated, EdgeDeleted)):
+            edge = event.edge
+        elif isinstance(event, EdgeUpdated):
+            edge = event.after
+        elif not isinstance(event, GraphReplaced):
+            return
+        self.output_boundary.present(
+            output_data=ChangeOutputData(
+                kind=event.kind,
+                node=(
+                    None
+                    if node is None
+                    else ChangeOutputData.Node(
+                        id=node.id,
+                        name=node.name,
+                        longitude=node.point.longitude,
+                        latitude=node.point.latitude,
+                        elevation=node.point.elevation,
+                        version=node.version,
+                    )
+                ),
+                edge=(
+                    None
+                    if edge is None
+                    else ChangeOutputData.Edge(
+                        node_ids=edge.node_ids,
+                        vertical_distance=edge.vertical_distance,
+                        horizontal_distance=edge.horizontal_distance,
+                        is_stair=edge.is_stair,
+                        is_step=edge.is_step,
+                        quality=edge.quality.value,
+                        version=edge.version,
+                    )
+                ),
+            ),
+        )
+
+
+class HistoryRecorder(GraphEventSubscriber):
+    """변경을 하나도 빠짐없이 이력에 남깁니다.
+
+    작성자를 요청에서 읽을 수 있도록 발행한 쪽과 같은 스레드에서 처리해야
+    합니다.
+    """
+
+    def __init__(self, history: GraphHistory) -> None:
+        self.history = history
+
+    def handle(self, event: GraphEvent) -> None:
+        self.history.record(event=event)
+
+
+def _may_shorten_routes(before: Edge, after: Edge) -> bool:
+    """간선 비용이 어느 프로필에서든 줄었는지 확인합니다.
+
+    비용이 줄면 그 간선을 지나지 않던 경로도 더 짧아질 수 있으므로, 캐시된
+    경로를 선택적으로 무효화할 수 없습니다.
+    """
+
+    def cost(edge: Edge, profile: AccessibilityProfile) -> float:
+        return edge_cost(
+            profile=profile,
+            horizontal_distance=float(edge.horizontal_distance),
+            vertical_distance=float(edge.vertical_distance),
+            flags=edge_flags(edge),
+            quality=edge.quality,
+        )
+
+    return any(
+        cost(after, profile) < cost(before, profile) for profile in AccessibilityProfile
+    )
@@ -1,35 +1,129 @@
+from collections import Counter
+from dataclasses import replace
+from decimal import Decimal
+
 from map_admin.application.boundaries import (
+    ComputeRouteMatrixInputBoundary,
+    ComputeRouteMatrixOutputBoundary,
     CreateEdgeInputBoundary,
     CreateNodeInputBoundary,
     CreateNodeOutputBoundary,
     DeleteEdgeInputBoundary,
     DeleteNodeInputBoundary,
+    ExportTablesInputBoundary,
+    ExportTablesOutputBoundary,
+    FindAlternativeRoutesInputBoundary,
+    FindAlternativeRoutesOutputBoundary,
+    FindRouteInputBoundary,
+    FindRouteOutputBoundary,
+    GetComponentsInputBoundary,
+    GetComponentsOutputBoundary,
+    GetReachabilityInputBoundary,
+    GetReachabilityOutputBoundary,
+    GetRouteCacheStatsInputBoundary,
+    GetRouteCacheStatsOutputBoundary,
+    ImportMapInputBoundary,
+    ImportMapOutputBoundary,
+    ImportTablesInputBoundary,
+    ImportTablesOutputBoundary,
+    ListEdgesAsOfInputBoundary,
     ListEdgesInputBoundary,
     ListEdgesOutputBoundary,
+    ListHistoryInputBoundary,
+    ListHistoryOutputBoundary,
+    ListNodesAsOfInputBoundary,
     ListNodesInputBoundary,
     ListNodesOutputBoundary,
     PartialUpdateEdgeInputBoundary,
     PartialUpdateNodeInputBoundary,
+    RecomputeEdgeDistancesInputBoundary,
+    RecomputeEdgeDistancesOutputBoundary,
+    SampleNodeElevationsInputBoundary,
+    SampleNodeElevationsOutputBoundary,
+    UndoChangeInputBoundary,
+    ValidateGraphInputBoundary,
+    ValidateGraphOutputBoundary,
 )
 from map_admin.application.dtos import (
+    ComputeRouteMatrixInputData,
+    ComputeRouteMatrixOutputData,
     CreateEdgeInputData,
     CreateNodeInputData,
     CreateNodeOutputData,
     DeleteEdgeInputData,
     DeleteNodeInputData,
+    ExportTablesInputData,
+    ExportTablesOutputData,
+    FindAlternativeRoutesInputData,
+    FindAlternativeRoutesOutputData,
+    FindRouteInputData,
+    FindRouteOutputData,
+    GetComponentsInputData,
+    GetComponentsOutputData,
+    GetReachabilityInputData,
+    GetReachabilityOutputData,
+    GetRouteCacheStatsOutputData,
+    ImportMapInputData,
+    ImportMapOutputData,
+    ImportTablesInputData,
+    ImportTablesOutputData,
+    ListEdgesAsOfInputData,
     ListEdgesOutputData,
+    ListHistoryInputData,
+    ListHistoryOutputData,
+    ListNodesAsOfInputData,
     ListNodesOutputData,
     PartialUpdateEdgeInputData,
     PartialUpdateNodeInputData,
+    RecomputeEdgeDistancesOutputData,
+    SampleNodeElevationsOutputData,
+    UndoChangeInputData,
+    ValidateGraphInputData,
+    ValidateGraphOutputData,
+)
+from map_admin.application.repositories import GraphRepository, NodeRepository
+from map_admin.application.services import (
+    ComponentIndex,
+    ElevationProvider,
+    GraphEventBus,
+    GraphHistory,
+    GraphTableStore,
+    GraphValidator,
+    IntegrityReport,
+    MapNode,
+    MapSource,
+    MapWay,
+    RouteCache,
+    RouteCacheStats,
+    RouteMatrixCalculator,
+    TableImportReport,
 )
-from map_admin.application.repositories import NodeRepository
 from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeDeleted,
+    EdgeUpdated,
+    GraphEvent,
+    GraphReplaced,
+    NodeCreated,
+    NodeDeleted,
+    NodeUpdated,
+)
 from map_admin.domain.exceptions import (
     AlreadyConnectedNodesError,
     ConnectingSameNodeError,
+    NodeNotInGraphError,
     NoEdgeExistsBetweenNodesError,
 )
-from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.domain.geometry import (
+    DISTANCE_QUANTUM,
+    concave_hull,
+    elevation_difference,
+    haversine_distance,
+    haversine_distances,
+)
+from map_admin.domain.graphs import AccessibilityGraph, Route
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
 
 
 class ListNodesUseCase(ListNodesInputBoundary):
@@ -38,21 +132,47 @@ class ListNodesUseCase(ListNodesInputBoundary):
 
     def execute(self, output_boundary: ListNodesOutputBoundary) -> None:
         nodes: list[Node] = self.node_repo.get_all_nodes()
-        output_data_list: list[ListNodesOutputData] = [
-            ListNodesOutputData(
-                id=node.id,
-                name=node.name,
-                longitude=node.point.longitude,
-                latitude=node.point.latitude,
-            )
-            for node in nodes
-        ]
-        output_boundary.present(output_data_list=output_data_list)
+        output_boundary.present(output_data_list=_to_list_nodes_output_data(nodes))
+
+
+class ListNodesAsOfUseCase(ListNodesAsOfInputBoundary):
+    def __init__(self, history: GraphHistory) -> None:
+        self.history = history
+
+    def execute(
+        self,
+        input_data: ListNodesAsOfInputData,
+        output_boundary: ListNodesOutputBoundary,
+    ) -> None:
+        try:
+            nodes: list[Node] = self.history.get_nodes_as_of(as_of=input_data.as_of)
+        except GraphHistory.HistoryNotAvailableError:
+            raise super().HistoryNotAvailableError
+        output_boundary.present(output_data_list=_to_list_nodes_output_data(nodes))
+
+
+def _to_list_nodes_output_data(nodes: list[Node]) -> list[ListNodesOutputData]:
+    return [
+        ListNodesOutputData(
+            id=node.id,
+            name=node.name,
+            longitude=node.point.longitude,
+            latitude=node.point.latitude,
+            elevation=node.point.elevation,
+            version=node.version,
+        )
+        for node in nodes
+    ]
 
 
 class CreateNodeUseCase(CreateNodeInputBoundary):
-    def __init__(self, node_repo: NodeRepository) -> None:
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
         self.node_repo = node_repo
+        self.event_bus = event_bus
 
     def execute(
         self,
@@ -69,6 +189,8 @@ class CreateNodeUseCase(CreateNodeInputBoundary):
             ),
         )
         self.node_repo.create_node(node=node)
+        if self.event_bus is not None:
+            self.event_bus.publish(NodeCreated(node=node))
         output_data = CreateNodeOutputData(
             id=node_id,
         )
@@ -76,38 +198,75 @@ class CreateNodeUseCase(CreateNodeInputBoundary):
 
 
 class PartialUpdateNodeUseCase(PartialUpdateNodeInputBoundary):
-    def __init__(self, node_repo: NodeRepository) -> None:
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
         self.node_repo = node_repo
+        self.event_bus = event_bus
 
     def execute(self, input_data: PartialUpdateNodeInputData) -> None:
         try:
-            node: Node = self.node_repo.get_node_by_id(node_id=input_data.id)
+            node: Node = self.node_repo.get_node_by_id(
+                node_id=input_data.id, include_edges=False
+            )
         except NodeRepository.NodeNotFoundError:
             raise super().NodeNotFoundError
+        if input_data.version is not None and input_data.version != node.version:
+            raise super().VersionConflictError
 
+        previous_node: Node = replace(node)
         if input_data.name is not None:
             node.update_name(name=input_data.name)
         if input_data.longitude is not None or input_data.latitude is not None:
             node.update_point(
                 point=Point(
-                    longitude=input_data.longitude or node.point.longitude,
-                    latitude=input_data.latitude or node.point.latitude,
+                    longitude=(
+                        node.point.longitude
+                        if input_data.longitude is None
+                        else input_data.longitude
+                    ),
+                    latitude=(
+                        node.point.latitude
+                        if input_data.latitude is None
+                        else input_data.latitude
+                    ),
+                    elevation=node.point.elevation,
                 ),
             )
-        self.node_repo.update_node(node=node)
+        try:
+            self.node_repo.update_node(node=node)
+        except NodeRepository.VersionConflictError:
+            raise super().VersionConflictError
+        if self.event_bus is not None and node != previous_node:
+            self.event_bus.publish(NodeUpdated(before=previous_node, after=node))
 
 
 class DeleteNodeUseCase(DeleteNodeInputBoundary):
-    def __init__(self, node_repo: NodeRepository) -> None:
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
         self.node_repo = node_repo
+        self.event_bus = event_bus
 
     def execute(self, input_data: DeleteNodeInputData) -> None:
         try:
+            # the incident edges tell subscribers what was deleted along with it
             node: Node = self.node_repo.get_node_by_id(node_id=input_data.id)
         except NodeRepository.NodeNotFoundError:
             raise super().NodeNotFoundError
+        if input_data.version is not None and input_data.version != node.version:
+            raise super().VersionConflictError
 
-        self.node_repo.delete_node(node=node)
+        try:
+            self.node_repo.delete_node(node=node)
+        except NodeRepository.VersionConflictError:
+            raise super().VersionConflictError
+        if self.event_bus is not None:
+            self.event_bus.publish(NodeDeleted(node=node))
 
 
 class ListEdgesUseCase(ListEdgesInputBoundary):
@@ -116,51 +275,80 @@ class ListEdgesUseCase(ListEdgesInputBoundary):
 
     def execute(self, output_boundary: ListEdgesOutputBoundary) -> None:
         nodes: list[Node] = self.node_repo.get_all_nodes()
-        node_dict: dict[int, Node] = {node.id: node for node in nodes}
-        edge_dict: dict[tuple[int, ...], Edge] = {
-            tuple(sorted(edge.node_ids)): edge for node in nodes for edge in node.edges
-        }
-        output_data_list: list[ListEdgesOutputData] = [
-            ListEdgesOutputData(
-                nodes=(
-                    ListEdgesOutputData.Node(
-                        id=node_dict[node_ids[0]].id,
-                        name=node_dict[node_ids[0]].name,
-                    ),
-                    ListEdgesOutputData.Node(
-                        id=node_dict[node_ids[1]].id,
-                        name=node_dict[node_ids[1]].name,
-                    ),
+        output_boundary.present(output_data_list=_to_list_edges_output_data(nodes))
+
+
+class ListEdgesAsOfUseCase(ListEdgesAsOfInputBoundary):
+    def __init__(self, history: GraphHistory) -> None:
+        self.history = history
+
+    def execute(
+        self,
+        input_data: ListEdgesAsOfInputData,
+        output_boundary: ListEdgesOutputBoundary,
+    ) -> None:
+        try:
+            nodes: list[Node] = self.history.get_nodes_as_of(as_of=input_data.as_of)
+        except GraphHistory.HistoryNotAvailableError:
+            raise super().HistoryNotAvailableError
+        output_boundary.present(output_data_list=_to_list_edges_output_data(nodes))
+
+
+def _to_list_edges_output_data(nodes: list[Node]) -> list[ListEdgesOutputData]:
+    node_dict: dict[int, Node] = {node.id: node for node in nodes}
+    edge_dict: dict[tuple[int, ...], Edge] = {
+        tuple(sorted(edge.node_ids)): edge for node in nodes for edge in node.edges
+    }
+    return [
+        ListEdgesOutputData(
+            nodes=(
+                ListEdgesOutputData.Node(
+                    id=node_dict[node_ids[0]].id,
+                    name=node_dict[node_ids[0]].name,
                 ),
-                vertical_distance=edge.vertical_distance,
-                horizontal_distance=edge.horizontal_distance,
-                is_stair=edge.is_stair,
-                is_step=edge.is_step,
-                quality=edge.quality.value,
-            )
-            for node_ids, edge in edge_dict.items()
-        ]
-        output_boundary.present(output_data_list=output_data_list)
+                ListEdgesOutputData.Node(
+                    id=node_dict[node_ids[1]].id,
+                    name=node_dict[node_ids[1]].name,
+                ),
+            ),
+            vertical_distance=edge.vertical_distance,
+            horizontal_distance=edge.horizontal_distance,
+            is_stair=edge.is_stair,
+            is_step=edge.is_step,
+            quality=edge.quality.value,
+            version=edge.version,
+        )
+        for node_ids, edge in edge_dict.items()
+    ]
 
 
 class CreateEdgeUseCase(CreateEdgeInputBoundary):
-    def __init__(self, node_repo: NodeRepository) -> None:
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
         self.node_repo = node_repo
+        self.event_bus = event_bus
 
     def execute(self, input_data: CreateEdgeInputData) -> None:
         try:
-            nodes: tuple[Node, Node] = (
-                self.node_repo.get_node_by_id(node_id=input_data.node_ids[0]),
-                self.node_repo.get_node_by_id(node_id=input_data.node_ids[1]),
+            nodes: list[Node] = self.node_repo.get_nodes_by_ids(
+                node_ids=list(input_data.node_ids)
             )
         except NodeRepository.NodeNotFoundError:
             raise super().NodeNotFoundError
 
+        horizontal_distance: Decimal = (
+            haversine_distance(nodes[0].point, nodes[1].point)
+            if input_data.horizontal_distance is None
+            else input_data.horizontal_distance
+        )
         try:
             nodes[0].add_edge(
                 other_node=nodes[1],
                 vertical_distance=input_data.vertical_distance,
-                horizontal_distance=input_data.horizontal_distance,
+                horizontal_distance=horizontal_distance,
                 is_stair=input_data.is_stair,
                 is_step=input_data.is_step,
                 quality=RoadQuality(input_data.quality),
@@ -170,22 +358,45 @@ class CreateEdgeUseCase(CreateEdgeInputBoundary):
         except AlreadyConnectedNodesError:
             raise super().AlreadyConnectedNodesError
 
-        self.node_repo.update_node(node=nodes[0])
+        edge: Edge = nodes[0].edges[-1]
+        try:
+            self.node_repo.add_edge(edge=edge)
+        except NodeRepository.NodeNotFoundError:
+            raise super().NodeNotFoundError
+        except NodeRepository.VersionConflictError:
+            raise super().VersionConflictError
+        if self.event_bus is not None:
+            self.event_bus.publish(EdgeCreated(edge=edge))
 
 
 class PartialUpdateEdgeUseCase(PartialUpdateEdgeInputBoundary):
-    def __init__(self, node_repo: NodeRepository) -> None:
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
         self.node_repo = node_repo
+        self.event_bus = event_bus
 
     def execute(self, input_data: PartialUpdateEdgeInputData) -> None:
         try:
-            nodes: tuple[Node, Node] = (
-                self.node_repo.get_node_by_id(node_id=input_data.node_ids[0]),
-                self.node_repo.get_node_by_id(node_id=input_data.node_ids[1]),
+            nodes: list[Node] = self.node_repo.get_nodes_by_ids(
+                node_ids=list(input_data.node_ids)
             )
         except NodeRepository.NodeNotFoundError:
             raise super().NodeNotFoundError
 
+        # keep the old values so that subscribers can tell what changed
+        previous_edge: Edge | None = next(
+            (replace(edge) for edge in nodes[0].edges if nodes[1].id in edge.node_ids),
+            None,
+        )
+        if (
+            input_data.version is not None
+            and previous_edge is not None
+            and input_data.version != previous_edge.version
+        ):
+            raise super().VersionConflictError
         try:
             nodes[0].update_edge(
                 other_node=nodes[1],
@@ -204,22 +415,47 @@ class PartialUpdateEdgeUseCase(PartialUpdateEdgeInputBoundary):
         except NoEdgeExistsBetweenNodesError:
             raise super().EdgeNotFoundError
 
-        self.node_repo.update_node(node=nodes[0])
+        # update_edge raised above unless the nodes were connected
+        assert previous_edge is not None
+        edge: Edge = next(
+            edge for edge in nodes[0].edges if nodes[1].id in edge.node_ids
+        )
+        try:
+            self.node_repo.update_edge(edge=edge)
+        except NodeRepository.EdgeNotFoundError:
+            raise super().EdgeNotFoundError
+        except NodeRepository.VersionConflictError:
+            raise super().VersionConflictError
+        if self.event_bus is not None:
+            self.event_bus.publish(EdgeUpdated(before=previous_edge, after=edge))
 
 
 class DeleteEdgeUseCase(DeleteEdgeInputBoundary):
-    def __init__(self, node_repo: NodeRepository) -> None:
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
         self.node_repo = node_repo
+        self.event_bus = event_bus
 
     def execute(self, input_data: DeleteEdgeInputData) -> None:
         try:
-            nodes: tuple[Node, Node] = (
-                self.node_repo.get_node_by_id(node_id=input_data.node_ids[0]),
-                self.node_repo.get_node_by_id(node_id=input_data.node_ids[1]),
+            nodes: list[Node] = self.node_repo.get_nodes_by_ids(
+                node_ids=list(input_data.node_ids)
             )
         except NodeRepository.NodeNotFoundError:
             raise super().NodeNotFoundError
 
+        edge: Edge | None = next(
+            (edge for edge in nodes[0].edges if nodes[1].id in edge.node_ids), None
+        )
+        if (
+            input_data.version is not None
+            and edge is not None
+            and input_data.version != edge.version
+        ):
+            raise super().VersionConflictError
         try:
             nodes[0].delete_edge(other_node=nodes[1])
         except ConnectingSameNodeError:
@@ -227,4 +463,746 @@ class DeleteEdgeUseCase(DeleteEdgeInputBoundary):
         except NoEdgeExistsBetweenNodesError:
             raise super().EdgeNotFoundError
 
-        self.node_repo.update_node(node=nodes[0])
+        # delete_edge raised above unless the nodes were connected
+        assert edge is not None
+        try:
+            self.node_repo.remove_edge(edge=edge)
+        except NodeRepository.VersionConflictError:
+            raise super().VersionConflictError
+        if self.event_bus is not None:
+            self.event_bus.publish(EdgeDeleted(edge=edge))
+
+
+class RecomputeEdgeDistancesUseCase(RecomputeEdgeDistancesInputBoundary):
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.event_bus = event_bus
+
+    def execute(self, output_boundary: RecomputeEdgeDistancesOutputBoundary) -> None:
+        # every edge is written back, so an edit landing after the read would
+        # be reverted
+        with self.node_repo.locked():
+            nodes: list[Node] = self.node_repo.get_all_nodes()
+            node_dict: dict[int, Node] = {node.id: node for node in nodes}
+            edge_dict: dict[tuple[int, ...], Edge] = {
+                tuple(sorted(edge.node_ids)): edge
+                for node in nodes
+                for edge in node.edges
+            }
+            edges: list[Edge] = list(edge_dict.values())
+            horizontal_distances: list[Decimal] = haversine_distances(
+                [
+                    (
+                        node_dict[edge.node_ids[0]].point,
+                        node_dict[edge.node_ids[1]].point,
+                    )
+                    for edge in edges
+                ]
+            )
+            for edge, horizontal_distance in zip(edges, horizontal_distances):
+                edge.update_horizontal_distance(horizontal_distance)
+                vertical_distance: Decimal | None = elevation_difference(
+                    node_dict[edge.node_ids[0]].point,
+                    node_dict[edge.node_ids[1]].point,
+                )
+                if vertical_distance is not None:
+                    edge.update_vertical_distance(vertical_distance)
+
+            self.node_repo.bulk_update_edges(edges=edges)
+            if self.event_bus is not None:
+                self.event_bus.publish(GraphReplaced())
+        output_boundary.present(
+            output_data=RecomputeEdgeDistancesOutputData(updated_count=len(edges)),
+        )
+
+
+class SampleNodeElevationsUseCase(SampleNodeElevationsInputBoundary):
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        elevation_provider: ElevationProvider,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.elevation_provider = elevation_provider
+        self.event_bus = event_bus
+
+    def execute(self, output_boundary: SampleNodeElevationsOutputBoundary) -> None:
+        nodes: list[Node] = self.node_repo.get_all_nodes()
+        try:
+            elevations: list[Decimal | None] = self.elevation_provider.get_elevations(
+                points=[node.point for node in nodes],
+            )
+        except ElevationProvider.ElevationSourceUnavailableError:
+            raise super().ElevationSourceUnavailableError
+
+        updated_nodes: list[Node] = []
+        for node, elevation in zip(nodes, elevations):
+            if elevation is None or elevation == node.point.elevation:
+                continue
+            node.update_point(point=replace(node.point, elevation=elevation))
+            updated_nodes.append(node)
+
+        node_dict: dict[int, Node] = {node.id: node for node in nodes}
+        edge_dict: dict[tuple[int, ...], Edge] = {
+            tuple(sorted(edge.node_ids)): edge for node in nodes for edge in node.edges
+        }
+        updated_edges: list[Edge] = []
+        for edge in edge_dict.values():
+            vertical_distance: Decimal | None = elevation_difference(
+                node_dict[edge.node_ids[0]].point,
+                node_dict[edge.node_ids[1]].point,
+            )
+            if vertical_distance is None or vertical_distance == edge.vertical_distance:
+                continue
+            edge.update_vertical_distance(vertical_distance)
+            updated_edges.append(edge)
+
+        if updated_nodes:
+            self.node_repo.bulk_update_nodes(nodes=updated_nodes)
+        if updated_edges:
+            self.node_repo.bulk_update_edges(edges=updated_edges)
+        if self.event_bus is not None and (updated_nodes or updated_edges):
+            self.event_bus.publish(GraphReplaced())
+        output_boundary.present(
+            output_data=SampleNodeElevationsOutputData(
+                updated_node_count=len(updated_nodes),
+                updated_edge_count=len(updated_edges),
+            ),
+        )
+
+
+class GetReachabilityUseCase(GetReachabilityInputBoundary):
+    def __init__(self, graph_repo: GraphRepository) -> None:
+        self.graph_repo = graph_repo
+
+    def execute(
+        self,
+        input_data: GetReachabilityInputData,
+        output_boundary: GetReachabilityOutputBoundary,
+    ) -> None:
+        graph: AccessibilityGraph = self.graph_repo.get_graph()
+        try:
+            costs: dict[int, float] = graph.reachable(
+                source_id=input_data.node_id,
+                max_cost=float(input_data.max_cost),
+                profile=AccessibilityProfile(input_data.profile),
+            )
+        except NodeNotInGraphError:
+            raise super().NodeNotFoundError
+
+        hull: list[GetReachabilityOutputData.Coordinate] | None = None
+        if input_data.include_hull:
+            indices: list[int] = [graph.index_of(node_id) for node_id in costs]
+            hull = [
+                GetReachabilityOutputData.Coordinate(
+                    longitude=Decimal(str(longitude)),
+                    latitude=Decimal(str(latitude)),
+                )
+                for longitude, latitude in concave_hull(
+                    [(graph.longitudes[i], graph.latitudes[i]) for i in indices]
+                )
+            ]
+
+        output_boundary.present(
+            output_data=GetReachabilityOutputData(
+                nodes=[
+                    GetReachabilityOutputData.Node(
+                        id=node_id,
+                        cost=Decimal(cost).quantize(DISTANCE_QUANTUM),
+                    )
+                    for node_id, cost in sorted(
+                        costs.items(), key=lambda item: (item[1], item[0])
+                    )
+                ],
+                hull=hull,
+            ),
+        )
+
+
+class ComputeRouteMatrixUseCase(ComputeRouteMatrixInputBoundary):
+    def __init__(
+        self,
+        graph_repo: GraphRepository,
+        route_matrix_calculator: RouteMatrixCalculator,
+    ) -> None:
+        self.graph_repo = graph_repo
+        self.route_matrix_calculator = route_matrix_calculator
+
+    def execute(
+        self,
+        input_data: ComputeRouteMatrixInputData,
+        output_boundary: ComputeRouteMatrixOutputBoundary,
+    ) -> None:
+        graph: AccessibilityGraph = self.graph_repo.get_graph()
+        try:
+            for node_id in [*input_data.source_ids, *input_data.target_ids]:
+                graph.index_of(node_id)
+        except NodeNotInGraphError:
+            raise super().NodeNotFoundError
+
+        costs: list[list[float]] = self.route_matrix_calculator.compute(
+            graph=graph,
+            source_ids=input_data.source_ids,
+            target_ids=input_data.target_ids,
+            profile=AccessibilityProfile(input_data.profile),
+        )
+        output_boundary.present(
+            output_data=ComputeRouteMatrixOutputData(
+                source_ids=input_data.source_ids,
+                target_ids=input_data.target_ids,
+                costs=costs,
+            ),
+        )
+
+
+class FindRouteUseCase(FindRouteInputBoundary):
+    def __init__(self, graph_repo: GraphRepository, route_cache: RouteCache) -> None:
+        self.graph_repo = graph_repo
+        self.route_cache = route_cache
+
+    def execute(
+        self,
+        input_data: FindRouteInputData,
+        output_boundary: FindRouteOutputBoundary,
+    ) -> None:
+        profile = AccessibilityProfile(input_data.profile)
+        route: Route | None = self.route_cache.get(
+            source_id=input_data.source_id,
+            target_id=input_data.target_id,
+            profile=profile,
+        )
+        if route is None:
+            graph: AccessibilityGraph = self.graph_repo.get_graph()
+            try:
+                route = graph.shortest_path(
+                    source_id=input_data.source_id,
+                    target_id=input_data.target_id,
+                    profile=profile,
+                )
+            except NodeNotInGraphError:
+                raise super().NodeNotFoundError
+            if route is None:
+                raise super().RouteNotFoundError
+            self.route_cache.put(
+                source_id=input_data.source_id,
+                target_id=input_data.target_id,
+                profile=profile,
+                route=route,
+            )
+
+        output_boundary.present(output_data=_to_route_output_data(route))
+
+
+def _to_route_output_data(route: Route) -> FindRouteOutputData:
+    return FindRouteOutputData(
+        node_ids=list(route.node_ids),
+        cost=Decimal(route.cost).quantize(DISTANCE_QUANTUM),
+        stair_count=route.stair_count,
+        step_count=route.step_count,
+        climb=Decimal(route.climb).quantize(DISTANCE_QUANTUM),
+        low_quality_length=Decimal(route.low_quality_length).quantize(DISTANCE_QUANTUM),
+    )
+
+
+class FindAlternativeRoutesUseCase(FindAlternativeRoutesInputBoundary):
+    def __init__(self, graph_repo: GraphRepository) -> None:
+        self.graph_repo = graph_repo
+
+    def execute(
+        self,
+        input_data: FindAlternativeRoutesInputData,
+        output_boundary: FindAlternativeRoutesOutputBoundary,
+    ) -> None:
+        graph: AccessibilityGraph = self.graph_repo.get_graph()
+        try:
+            routes: list[Route] = graph.alternative_routes(
+                source_id=input_data.source_id,
+                target_id=input_data.target_id,
+                profile=AccessibilityProfile(input_data.profile),
+                count=input_data.count,
+            )
+        except NodeNotInGraphError:
+            raise super().NodeNotFoundError
+        if not routes:
+            raise super().RouteNotFoundError
+
+        output_boundary.present(
+            output_data=FindAlternativeRoutesOutputData(
+                routes=[_to_route_output_data(route) for route in routes],
+            ),
+        )
+
+
+class GetRouteCacheStatsUseCase(GetRouteCacheStatsInputBoundary):
+    def __init__(self, route_cache: RouteCache) -> None:
+        self.route_cache = route_cache
+
+    def execute(self, output_boundary: GetRouteCacheStatsOutputBoundary) -> None:
+        stats: RouteCacheStats = self.route_cache.get_stats()
+        output_boundary.present(
+            output_data=GetRouteCacheStatsOutputData(
+                hits=stats.hits,
+                misses=stats.misses,
+                size=stats.size,
+                version=stats.version,
+            ),
+        )
+
+
+class GetComponentsUseCase(GetComponentsInputBoundary):
+    def __init__(self, component_index: ComponentIndex) -> None:
+        self.component_index = component_index
+
+    def execute(
+        self,
+        input_data: GetComponentsInputData,
+        output_boundary: GetComponentsOutputBoundary,
+    ) -> None:
+        output_boundary.present(
+            output_data=GetComponentsOutputData(
+                components=self.component_index.get_components(
+                    profile=AccessibilityProfile(input_data.profile),
+                ),
+            ),
+        )
+
+
+class ValidateGraphUseCase(ValidateGraphInputBoundary):
+    def __init__(
+        self,
+        graph_validator: GraphValidator,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
+        self.graph_validator = graph_validator
+        self.event_bus = event_bus
+
+    def execute(
+        self,
+        input_data: ValidateGraphInputData,
+        output_boundary: ValidateGraphOutputBoundary,
+    ) -> None:
+        try:
+            report: IntegrityReport = self.graph_validator.validate(
+                repair=input_data.repair,
+            )
+        except GraphValidator.MalformedDataError:
+            raise super().MalformedDataError
+
+        if report.repaired and self.event_bus is not None:
+            self.event_bus.publish(GraphReplaced())
+        output_boundary.present(
+            output_data=ValidateGraphOutputData(
+                node_count=report.node_count,
+                edge_count=report.edge_count,
+                violations=[
+                    ValidateGraphOutputData.Violation(
+                        kind=violation.kind.value,
+                        index=violation.index,
+                        message=violation.message,
+                    )
+                    for violation in report.violations
+                ],
+                repaired=report.repaired,
+            ),
+        )
+
+
+class ImportMapUseCase(ImportMapInputBoundary):
+    """외부 지도 파일의 보행로를 노드/간선으로 가져옵니다.
+
+    길이 서로 만나는 지점과 길의 양 끝만 노드로 만들고, 그 사이의 중간 점들은
+    간선의 수평 거리로 합칩니다. 저장은 `batch_size`개 간선마다 나눠서 합니다.
+    """
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        map_source: MapSource,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.map_source = map_source
+        self.event_bus = event_bus
+
+    def execute(
+        self,
+        input_data: ImportMapInputData,
+        output_boundary: ImportMapOutputBoundary,
+    ) -> None:
+        try:
+            ways: list[MapWay] = list(
+                self.map_source.read_ways(file_path=input_data.file_path)
+            )
+            usage: Counter[int] = Counter(ref for way in ways for ref in way.node_refs)
+            map_nodes: dict[int, MapNode] = {
+                map_node.ref: map_node
+                for map_node in self.map_source.read_nodes(
+                    file_path=input_data.file_path, refs=set(usage)
+                )
+            }
+        except MapSource.MapSourceUnavailableError:
+            raise super().MapSourceUnavailableError
+
+        junctions: set[int] = {ref for ref, count in usage.items() if count > 1}
+        junctions.update(way.node_refs[0] for way in ways)
+        junctions.update(way.node_refs[-1] for way in ways)
+
+        next_id: int = self.node_repo.get_next_id()
+        node_ids: dict[int, int] = {}
+        pending_nodes: list[Node] = []
+        pending_edges: list[Edge] = []
+        edge_node_ids: set[tuple[int, int]] = set()
+        node_count: int = 0
+        edge_count: int = 0
+
+        def node_id(ref: int) -> int:
+            nonlocal next_id
+            if ref not in node_ids:
+                map_node: MapNode = map_nodes[ref]
+                node_ids[ref] = next_id
+                pending_nodes.append(
+                    Node(
+                        id=next_id,
+                        name=map_node.name or f"OSM {ref}",
+                        point=map_node.point,
+                    )
+                )
+                next_id += 1
+            return node_ids[ref]
+
+        def flush() -> None:
+            nonlocal pending_nodes, pending_edges, node_count, edge_count
+            # nodes first so that no stored edge references a missing node
+            if pending_nodes:
+                self.node_repo.bulk_create_nodes(nodes=pending_nodes)
+                node_count += len(pending_nodes)
+                pending_nodes = []
+            if pending_edges:
+                self.node_repo.bulk_create_edges(edges=pending_edges)
+                edge_count += len(pending_edges)
+                pending_edges = []
+
+        def add_edge(way: MapWay, segment: list[int]) -> None:
+            # a closed way may start and end on the same node
+            if segment[0] == segment[-1]:
+                return
+            start, end = node_id(segment[0]), node_id(segment[-1])
+            key: tuple[int, int] = (min(start, end), max(start, end))
+            if key in edge_node_ids:
+                return
+            edge_node_ids.add(key)
+            points: list[Point] = [map_nodes[ref].point for ref in segment]
+            pending_edges.append(
+                Edge(
+                    node_ids=(start, end),
+                    vertical_distance=Decimal("0.00"),
+                    horizontal_distance=sum(
+                        haversine_distances(list(zip(points, points[1:]))),
+                        Decimal("0.00"),
+                    ),
+                    is_stair=way.is_stair,
+                    is_step=any(map_nodes[ref].is_step for ref in segment),
+                    quality=way.quality,
+                )
+            )
+            if len(pending_edges) >= input_data.batch_size:
+                flush()
+
+        for way in ways:
+            segment: list[int] = []
+            for ref in way.node_refs:
+                if ref not in map_nodes:
+                    # the extract is clipped here, so drop the unfinished segment
+                    segment = []
+                    continue
+                if segment or ref in junctions:
+                    segment.append(ref)
+                if len(segment) >= 2 and ref in junctions:
+                    add_edge(way, segment)
+                    segment = [ref]
+        flush()
+
+        if (node_count or edge_count) and self.event_bus is not None:
+            self.event_bus.publish(GraphReplaced())
+        output_boundary.present(
+            output_data=ImportMapOutputData(
+                created_node_count=node_count,
+                created_edge_count=edge_count,
+            ),
+        )
+
+
+class ImportTablesUseCase(ImportTablesInputBoundary):
+    def __init__(
+        self,
+        table_store: GraphTableStore,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
+        self.table_store = table_store
+        self.event_bus = event_bus
+
+    def execute(
+        self,
+        input_data: ImportTablesInputData,
+        output_boundary: ImportTablesOutputBoundary,
+    ) -> None:
+        try:
+            report: TableImportReport = self.table_store.import_tables(
+                node_file_path=input_data.node_file_path,
+                edge_file_path=input_data.edge_file_path,
+            )
+        except GraphTableStore.UnsupportedFormatError:
+            raise super().UnsupportedFormatError
+        except GraphTableStore.MalformedTableError:
+            raise super().MalformedTableError
+
+        imported: bool = not report.violations
+        if (
+            imported
+            and (report.node_count or report.edge_count)
+            and self.event_bus is not None
+        ):
+            self.event_bus.publish(GraphReplaced())
+        output_boundary.present(
+            output_data=ImportTablesOutputData(
+                node_count=report.node_count,
+                edge_count=report.edge_count,
+                violations=[
+                    ImportTablesOutputData.Violation(
+                        kind=violation.kind.value,
+                        index=violation.index,
+                        message=violation.message,
+                    )
+                    for violation in report.violations
+                ],
+                imported=imported,
+            ),
+        )
+
+
+class ExportTablesUseCase(ExportTablesInputBoundary):
+    def __init__(self, table_store: GraphTableStore) -> None:
+        self.table_store = table_store
+
+    def execute(
+        self,
+        input_data: ExportTablesInputData,
+        output_boundary: ExportTablesOutputBoundary,
+    ) -> None:
+        try:
+            node_count: int = (
+                0
+                if input_data.node_file_path is None
+                else self.table_store.export_nodes(
+                    file_path=input_data.node_file_path,
+                )
+            )
+            edge_count: int = (
+                0
+                if input_data.edge_file_path is None
+                else self.table_store.export_edges(
+                    file_path=input_data.edge_file_path,
+                )
+            )
+        except GraphTableStore.UnsupportedFormatError:
+            raise super().UnsupportedFormatError
+        except GraphTableStore.MalformedTableError:
+            raise super().MalformedTableError
+
+        output_boundary.present(
+            output_data=ExportTablesOutputData(
+                node_count=node_count,
+                edge_count=edge_count,
+            ),
+        )
+
+
+class ListHistoryUseCase(ListHistoryInputBoundary):
+    def __init__(self, history: GraphHistory) -> None:
+        self.history = history
+
+    def execute(
+        self,
+        input_data: ListHistoryInputData,
+        output_boundary: ListHistoryOutputBoundary,
+    ) -> None:
+        output_data_list: list[ListHistoryOutputData] = []
+        for entry in self.history.list_entries(
+            after_id=input_data.after_id,
+            limit=input_data.limit,
+        ):
+            event: GraphEvent = entry.event
+            node: Node | None = None
+            edge: Edge | None = None
+            if isinstance(event, (NodeCreated, NodeDeleted)):
+                node = event.node
+            elif isinstance(event, NodeUpdated):
+                node = event.after
+            elif isinstance(event, (EdgeCreated, EdgeDeleted)):
+                edge = event.edge
+            elif isinstance(event, EdgeUpdated):
+                edge = event.after
+            output_data_list.append(
+                ListHistoryOutputData(
+                    id=entry.id,
+                    recorded_at=entry.recorded_at,
+                    author=entry.author,
+                    kind=event.kind,
+                    node_id=None if node is None else node.id,
+                    node_ids=None if edge is None else edge.node_ids,
+                )
+            )
+        output_boundary.present(output_data_list=output_data_list)
+
+
+class UndoChangeUseCase(UndoChangeInputBoundary):
+    """기록된 변경 하나를 되돌리는 변경을 새로 저장합니다.
+
+    되돌린 결과도 보통의 변경처럼 발행되어 이력에 남으므로 되돌리기도 다시
+    되돌릴 수 있습니다. 그 뒤에 같은 노드나 간선이 또 바뀌었다면 그 변경을
+    덮어쓰지 않고 `VersionConflictError`를 일으킵니다.
+    """
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        history: GraphHistory,
+        event_bus: GraphEventBus | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.history = history
+        self.event_bus = event_bus
+
+    def execute(self, input_data: UndoChangeInputData) -> None:
+        try:
+            event: GraphEvent = self.history.get_entry(
+                entry_id=input_data.entry_id
+            ).event
+        except GraphHistory.EntryNotFoundError:
+            raise super().EntryNotFoundError
+
+        undo_events: list[GraphEvent]
+        try:
+            if isinstance(event, NodeCreated):
+                undo_events = self._delete_node(created=event.node)
+            elif isinstance(event, NodeUpdated):
+                undo_events = self._restore_node(
+                    current=event.after, restored=event.before
+                )
+            elif isinstance(event, NodeDeleted):
+                undo_events = self._recreate_node(deleted=event.node)
+            elif isinstance(event, EdgeCreated):
+                undo_events = self._remove_edge(created=event.edge)
+            elif isinstance(event, EdgeUpdated):
+                undo_events = self._restore_edge(
+                    current=event.after, restored=event.before
+                )
+            elif isinstance(event, EdgeDeleted):
+                undo_events = self._recreate_edge(deleted=event.edge)
+            else:
+                raise super().IrreversibleChangeError
+        # the node or edge is gone or was changed since
+        except (
+            NodeRepository.NodeNotFoundError,
+            NodeRepository.EdgeNotFoundError,
+            NodeRepository.VersionConflictError,
+        ):
+            raise super().VersionConflictError
+        if self.event_bus is not None:
+            for undo_event in undo_events:
+                self.event_bus.publish(undo_event)
+
+    def _delete_node(self, created: Node) -> list[GraphEvent]:
+        node: Node = self.node_repo.get_node_by_id(node_id=created.id)
+        # edges added to it later would be deleted along with it
+        if node.version != created.version or node.edges:
+            raise super().VersionConflictError
+        self.node_repo.delete_node(node=node)
+        return [NodeDeleted(node=node)]
+
+    def _restore_node(self, current: Node, restored: Node) -> list[GraphEvent]:
+        node: Node = self.node_repo.get_node_by_id(
+            node_id=current.id, include_edges=False
+        )
+        if node.version != current.version:
+            raise super().VersionConflictError
+        previous_node: Node = replace(node)
+        node.update_name(name=restored.name)
+        node.update_point(point=restored.point)
+        self.node_repo.update_node(node=node)
+        if node == previous_node:
+            return []
+        return [NodeUpdated(before=previous_node, after=node)]
+
+    def _recreate_node(self, deleted: Node) -> list[GraphEvent]:
+        try:
+            self.node_repo.get_node_by_id(node_id=deleted.id, include_edges=False)
+        except NodeRepository.NodeNotFoundError:
+            pass
+        else:
+            # the id was taken by a node created since
+            raise super().VersionConflictError
+        other_ids: list[int] = [
+            node_id
+            for edge in deleted.edges
+            for node_id in edge.node_ids
+            if node_id != deleted.id
+        ]
+        if other_ids:
+            self.node_repo.get_nodes_by_ids(node_ids=other_ids)
+
+        node = Node(
+            id=deleted.id,
+            name=deleted.name,
+            point=deleted.point,
+            version=deleted.version,
+        )
+        edges: list[Edge] = [replace(edge) for edge in deleted.edges]
+        self.node_repo.create_node(node=node)
+        if edges:
+            self.node_repo.bulk_create_edges(edges=edges)
+        return [NodeCreated(node=node), *(EdgeCreated(edge=edge) for edge in edges)]
+
+    def _remove_edge(self, created: Edge) -> list[GraphEvent]:
+        edge: Edge = self._get_edge(node_ids=created.node_ids)
+        if edge.version != created.version:
+            raise super().VersionConflictError
+        self.node_repo.remove_edge(edge=edge)
+        return [EdgeDeleted(edge=edge)]
+
+    def _restore_edge(self, current: Edge, restored: Edge) -> list[GraphEvent]:
+        edge: Edge = self._get_edge(node_ids=current.node_ids)
+        if edge.version != current.version:
+            raise super().VersionConflictError
+        previous_edge: Edge = replace(edge)
+        edge.update_vertical_distance(restored.vertical_distance)
+        edge.update_horizontal_distance(restored.horizontal_distance)
+        edge.update_is_stair(restored.is_stair)
+        edge.update_is_step(restored.is_step)
+        edge.update_quality(restored.quality)
+        self.node_repo.update_edge(edge=edge)
+        if edge == previous_edge:
+            return []
+        return [EdgeUpdated(before=previous_edge, after=edge)]
+
+    def _recreate_edge(self, deleted: Edge) -> list[GraphEvent]:
+        nodes: list[Node] = self.node_repo.get_nodes_by_ids(
+            node_ids=list(deleted.node_ids)
+        )
+        if any(nodes[1].id in edge.node_ids for edge in nodes[0].edges):
+            raise super().VersionConflictError
+        edge: Edge = replace(deleted)
+        self.node_repo.add_edge(edge=edge)
+        return [EdgeCreated(edge=edge)]
+
+    def _get_edge(self, node_ids: tuple[int, int]) -> Edge:
+        node: Node = self.node_repo.get_node_by_id(node_id=node_ids[0])
+        try:
+            return next(edge for edge in node.edges if node_ids[1] in edge.node_ids)
+        except StopIteration:
+            raise super().VersionConflictError
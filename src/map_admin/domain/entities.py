@@ -16,6 +16,8 @@ class Node:
     name: str
     point: Point
     edges: list["Edge"] = field(default_factory=list)
+    # bumped by the repository whenever the name or point is saved changed
+    version: int = 1
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Node):
@@ -118,6 +120,8 @@ class Edge:
     is_stair: bool
     is_step: bool
     quality: RoadQuality
+    # bumped by the repository whenever the edge is saved changed
+    version: int = 1
 
     def __post_init__(self) -> None:
         if self.node_ids[0] == self.node_ids[1]:
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from map_admin.domain.entities import Edge, Node
+
+
+@dataclass(frozen=True, kw_only=True)
+class GraphEvent:
+    """저장이 끝난 그래프 변경 하나"""
+
+    # names the change in the change feed and the history
+    kind: ClassVar[str]
+
+
+@dataclass(frozen=True, kw_only=True)
+class NodeCreated(GraphEvent):
+    kind = "node_created"
+
+    node: Node
+
+
+@dataclass(frozen=True, kw_only=True)
+class NodeUpdated(GraphEvent):
+    kind = "node_updated"
+
+    before: Node
+    after: Node
+
+
+@dataclass(frozen=True, kw_only=True)
+class NodeDeleted(GraphEvent):
+    kind = "node_deleted"
+
+    node: Node  # read with its edges, which were deleted along with it
+
+
+@dataclass(frozen=True, kw_only=True)
+class EdgeCreated(GraphEvent):
+    kind = "edge_created"
+
+    edge: Edge
+
+
+@dataclass(frozen=True, kw_only=True)
+class EdgeUpdated(GraphEvent):
+    kind = "edge_updated"
+
+    before: Edge
+    after: Edge
+
+
+@dataclass(frozen=True, kw_only=True)
+class EdgeDeleted(GraphEvent):
+    kind = "edge_deleted"
+
+    edge: Edge
+
+
+@dataclass(frozen=True, kw_only=True)
+class GraphReplaced(GraphEvent):
+    """가져오기, 일괄 재계산, 복구처럼 변경을 하나씩 알리지 않는 일괄 변경"""
+
+    kind = "graph_replaced"
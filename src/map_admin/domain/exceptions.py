@@ -8,3 +8,7 @@ class AlreadyConnectedNodesError(Exception):
 
 class NoEdgeExistsBetweenNodesError(Exception):
     """주어진 노드 사이에 간선이 존재하지 않을 때 발생하는 에러"""
+
+
+class NodeNotInGraphError(Exception):
+    """그래프에 존재하지 않는 노드를 참조할 때 발생하는 에러"""
@@ -0,0 +1,201 @@
+import heapq
+import math
+from decimal import Decimal
+from typing import Iterable, Sequence, TypeAlias
+
+from map_admin.domain.value_objects import Point
+
+EARTH_RADIUS = 6_371_008.8  # mean earth radius in meters
+DISTANCE_QUANTUM = Decimal("0.01")
+
+
+def haversine_distances(point_pairs: Sequence[tuple[Point, Point]]) -> list[Decimal]:
+    """점 쌍 사이의 대원 거리(m)를 한 번에 계산합니다.
+
+    좌표를 라디안 배열로 먼저 변환한 뒤 같은 식을 배열 단위로 적용하므로,
+    간선마다 Decimal 연산을 반복하는 것보다 훨씬 빠릅니다.
+    """
+    radians = math.radians
+    lon1 = [radians(float(a.longitude)) for a, _ in point_pairs]
+    lat1 = [radians(float(a.latitude)) for a, _ in point_pairs]
+    lon2 = [radians(float(b.longitude)) for _, b in point_pairs]
+    lat2 = [radians(float(b.latitude)) for _, b in point_pairs]
+
+    sin, cos, asin, sqrt = math.sin, math.cos, math.asin, math.sqrt
+    hav = [
+        sin((y2 - y1) / 2) ** 2 + cos(y1) * cos(y2) * sin((x2 - x1) / 2) ** 2
+        for x1, y1, x2, y2 in zip(lon1, lat1, lon2, lat2)
+    ]
+    return [
+        Decimal(2 * EARTH_RADIUS * asin(sqrt(min(h, 1.0)))).quantize(DISTANCE_QUANTUM)
+        for h in hav
+    ]
+
+
+def haversine_distance(a: Point, b: Point) -> Decimal:
+    return haversine_distances([(a, b)])[0]
+
+
+def elevation_difference(a: Point, b: Point) -> Decimal | None:
+    """두 지점의 고도 차(m)를 계산합니다. 고도를 모르면 None을 반환합니다."""
+    if a.elevation is None or b.elevation is None:
+        return None
+    return abs(a.elevation - b.elevation).quantize(DISTANCE_QUANTUM)
+
+
+Coordinate: TypeAlias = tuple[float, float]
+
+
+def convex_hull(coordinates: Sequence[Coordinate]) -> list[Coordinate]:
+    """반시계 방향 볼록 껍질 (Andrew's monotone chain)"""
+    points: list[Coordinate] = sorted(set(coordinates))
+    if len(points) < 3:
+        return points
+
+    def build(sequence: Iterable[Coordinate]) -> list[Coordinate]:
+        chain: list[Coordinate] = []
+        for point in sequence:
+            while len(chain) >= 2 and _cross(chain[-2], chain[-1], point) <= 0:
+                chain.pop()
+            chain.append(point)
+        return chain
+
+    lower: list[Coordinate] = build(points)
+    upper: list[Coordinate] = build(reversed(points))
+    return lower[:-1] + upper[:-1]
+
+
+def concave_hull(
+    coordinates: Sequence[Coordinate],
+    k: int = 3,
+    max_k: int = 24,
+) -> list[Coordinate]:
+    """k-최근접 이웃 기반 오목 껍질 (Moreira & Santos, 2007)
+
+    경도/위도를 평면 좌표로 보고 반시계 방향으로 껍질을 따라갑니다. k를 늘려도
+    모든 점을 감싸는 단순 다각형을 찾지 못하면 볼록 껍질을 반환합니다.
+    """
+    points: list[Coordinate] = sorted(set(coordinates))
+    if len(points) <= 3:
+        return convex_hull(points)
+
+    # scale longitudes so that angles and nearest neighbours are isotropic
+    scale: float = math.cos(math.radians(sum(y for _, y in points) / len(points)))
+    planar: list[Coordinate] = [(x * scale, y) for x, y in points]
+    neighbour_count: int = max(k, 3)
+    while neighbour_count <= min(max_k, len(points) - 1):
+        hull: list[int] | None = _concave_hull_indices(planar, neighbour_count)
+        if hull is not None:
+            return [points[index] for index in hull]
+        # grow k geometrically so that large point sets need only a few retries
+        neighbour_count = max(neighbour_count + 1, neighbour_count * 3 // 2)
+    return convex_hull(points)
+
+
+def _concave_hull_indices(points: list[Coordinate], k: int) -> list[int] | None:
+    first: int = min(range(len(points)), key=lambda index: (points[index][1], index))
+    hull: list[int] = [first]
+    remaining: set[int] = set(range(len(points))) - {first}
+    current: int = first
+    heading: float = 0.0
+    step: int = 2
+    while (current != first or step == 2) and remaining:
+        if step == 5:
+            remaining.add(first)
+        cx, cy = points[current]
+        neighbours: list[int] = heapq.nsmallest(
+            k,
+            remaining,
+            key=lambda index: math.dist(points[index], (cx, cy)),
+        )
+        # prefer the sharpest right-hand turn relative to the current heading
+        neighbours.sort(
+            key=lambda index: _normalize_angle(
+                math.atan2(points[index][1] - cy, points[index][0] - cx) - heading
+            )
+        )
+
+        candidate: int | None = None
+        for neighbour in neighbours:
+            closes: bool = neighbour == first
+            if not any(
+                _segments_intersect(
+                    points[current],
+                    points[neighbour],
+                    points[hull[position]],
+                    points[hull[position + 1]],
+                )
+                for position in range(1 if closes else 0, len(hull) - 2)
+            ):
+                candidate = neighbour
+                break
+        if candidate is None:
+            return None
+
+        heading = math.atan2(
+            points[candidate][1] - cy,
+            points[candidate][0] - cx,
+        )
+        current = candidate
+        if current != first:
+            hull.append(current)
+        remaining.discard(current)
+        step += 1
+
+    if current != first:
+        return None
+    polygon: list[Coordinate] = [points[index] for index in hull]
+    if not all(_covers(polygon, point) for point in points):
+        return None
+    return hull
+
+
+def _cross(o: Coordinate, a: Coordinate, b: Coordinate) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _normalize_angle(angle: float) -> float:
+    """각도를 (-π, π] 범위로 옮깁니다."""
+    angle = math.fmod(angle, 2 * math.pi)
+    if angle <= -math.pi:
+        angle += 2 * math.pi
+    elif angle > math.pi:
+        angle -= 2 * math.pi
+    return angle
+
+
+def _on_segment(a: Coordinate, b: Coordinate, point: Coordinate) -> bool:
+    return (
+        _cross(a, b, point) == 0
+        and min(a[0], b[0]) <= point[0] <= max(a[0], b[0])
+        and min(a[1], b[1]) <= point[1] <= max(a[1], b[1])
+    )
+
+
+def _segments_intersect(
+    a: Coordinate, b: Coordinate, c: Coordinate, d: Coordinate
+) -> bool:
+    d1, d2 = _cross(c, d, a), _cross(c, d, b)
+    d3, d4 = _cross(a, b, c), _cross(a, b, d)
+    if ((d1 > 0) != (d2 > 0) and d1 and d2) and ((d3 > 0) != (d4 > 0) and d3 and d4):
+        return True
+    return any(
+        [
+            _on_segment(c, d, a) and a not in (c, d),
+            _on_segment(c, d, b) and b not in (c, d),
+            _on_segment(a, b, c) and c not in (a, b),
+            _on_segment(a, b, d) and d not in (a, b),
+        ]
+    )
+
+
+def _covers(polygon: list[Coordinate], point: Coordinate) -> bool:
+    """점이 다각형 내부 또는 경계 위에 있는지 확인합니다."""
+    inside: bool = False
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+        if _on_segment((x1, y1), (x2, y2), point):
+            return True
+        if (y1 > point[1]) != (y2 > point[1]):
+            if point[0] < x1 + (point[1] - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+    return inside
@@ -0,0 +1,541 @@
+import bisect
+import heapq
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Sequence
+
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.exceptions import NodeNotInGraphError
+from map_admin.domain.value_objects import AccessibilityProfile, RoadQuality
+
+INFINITY = math.inf
+
+STAIR = 1
+STEP = 2
+
+WHEELCHAIR_QUALITY_FACTORS: dict[RoadQuality, float] = {
+    RoadQuality.HIGH: 1.0,
+    RoadQuality.MEDIUM: 1.2,
+    RoadQuality.LOW: 1.5,
+}
+# a 1:12 ramp costs about twice as much as flat ground of the same length
+WHEELCHAIR_SLOPE_PENALTY = 12.0
+# `AccessibilityGraph.qualities` stores indices into this tuple
+ROAD_QUALITIES: tuple[RoadQuality, ...] = tuple(RoadQuality)
+
+# column name -> array typecode of every `AccessibilityGraph` column
+GRAPH_COLUMNS: dict[str, str] = {
+    "node_ids": "q",
+    "longitudes": "d",
+    "latitudes": "d",
+    "edge_node_indices": "l",
+    "horizontal_distances": "d",
+    "vertical_distances": "d",
+    "flags": "B",
+    "qualities": "B",
+    "offsets": "l",
+    "targets": "l",
+    "edge_indices": "l",
+}
+
+
+def edge_cost(
+    profile: AccessibilityProfile,
+    horizontal_distance: float,
+    vertical_distance: float,
+    flags: int,
+    quality: RoadQuality,
+) -> float:
+    """프로필별 간선 통행 비용을 계산합니다. 지날 수 없으면 무한대입니다."""
+    if profile == AccessibilityProfile.PEDESTRIAN:
+        return horizontal_distance
+
+    if flags & (STAIR | STEP):
+        return INFINITY
+    slope: float = (
+        abs(vertical_distance) / horizontal_distance if horizontal_distance else 0.0
+    )
+    return (
+        horizontal_distance
+        * WHEELCHAIR_QUALITY_FACTORS[quality]
+        * (1 + WHEELCHAIR_SLOPE_PENALTY * slope)
+    )
+
+
+def edge_flags(edge: Edge) -> int:
+    return (STAIR if edge.is_stair else 0) | (STEP if edge.is_step else 0)
+
+
+def is_traversable(edge: Edge, profile: AccessibilityProfile) -> bool:
+    return not math.isinf(
+        edge_cost(
+            profile=profile,
+            horizontal_distance=float(edge.horizontal_distance),
+            vertical_distance=float(edge.vertical_distance),
+            flags=edge_flags(edge),
+            quality=edge.quality,
+        )
+    )
+
+
+class DisjointSet:
+    """노드 ID에 대한 union-find (경로 압축 + 크기 기준 합치기)"""
+
+    def __init__(self, items: Iterable[int] = ()) -> None:
+        self._parents: dict[int, int] = {}
+        self._sizes: dict[int, int] = {}
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: int) -> bool:
+        return item in self._parents
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def add(self, item: int) -> None:
+        if item not in self._parents:
+            self._parents[item] = item
+            self._sizes[item] = 1
+
+    def find(self, item: int) -> int:
+        parents = self._parents
+        root: int = item
+        while parents[root] != root:
+            root = parents[root]
+        while parents[item] != root:
+            parents[item], item = root, parents[item]
+        return root
+
+    def discard(self, item: int) -> bool:
+        """혼자 집합을 이루는 원소를 지웁니다.
+
+        다른 원소와 합쳐진 원소는 집합을 나눌 수 없어 지우지 않고 False를
+        반환합니다. 없는 원소는 지운 것으로 봅니다.
+        """
+        if item not in self._parents:
+            return True
+        if self._parents[item] != item or self._sizes[item] != 1:
+            return False
+        del self._parents[item]
+        del self._sizes[item]
+        return True
+
+    def union(self, a: int, b: int) -> bool:
+        """두 원소의 집합을 합칩니다. 이미 같은 집합이면 False를 반환합니다."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self._sizes[root_a] < self._sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parents[root_b] = root_a
+        self._sizes[root_a] += self._sizes.pop(root_b)
+        return True
+
+    def groups(self) -> list[list[int]]:
+        """집합들을 크기 내림차순, 같은 크기면 가장 작은 원소 순으로 반환합니다."""
+        groups: dict[int, list[int]] = {}
+        for item in sorted(self._parents):
+            groups.setdefault(self.find(item), []).append(item)
+        return sorted(groups.values(), key=lambda group: (-len(group), group[0]))
+
+
+@dataclass(frozen=True, kw_only=True)
+class Route:
+    node_ids: tuple[int, ...]
+    cost: float
+    stair_count: int = 0
+    step_count: int = 0
+    climb: float = 0.0  # sum of vertical distances along the route
+    low_quality_length: float = 0.0
+
+    @property
+    def edge_node_ids(self) -> list[tuple[int, int]]:
+        return list(zip(self.node_ids, self.node_ids[1:]))
+
+
+class AccessibilityGraph:
+    """노드와 간선을 CSR(compressed sparse row) 배열로 압축한 읽기 전용 그래프
+
+    노드는 0부터 시작하는 인덱스로, 인접 간선은 `offsets[i]`부터
+    `offsets[i + 1]` 직전까지의 슬롯으로 표현합니다. 각 슬롯은 이웃 노드
+    인덱스(`targets`)와 간선 인덱스(`edge_indices`)를 가리키며, 프로필별 비용
+    배열은 처음 요청될 때 한 번만 계산합니다.
+
+    모든 열은 `GRAPH_COLUMNS`에 적힌 타입의 수치 배열이므로, `columns`로 꺼내
+    한 버퍼에 늘어놓았다가 `from_columns`로 복사 없이 다시 읽을 수 있습니다.
+    """
+
+    node_ids: Sequence[int]
+    longitudes: Sequence[float]
+    latitudes: Sequence[float]
+    edge_node_indices: Sequence[int]
+    horizontal_distances: Sequence[float]
+    vertical_distances: Sequence[float]
+    flags: Sequence[int]
+    qualities: Sequence[int]
+    offsets: Sequence[int]
+    targets: Sequence[int]
+    edge_indices: Sequence[int]
+
+    def __init__(self, nodes: Iterable[Node], version: str = "") -> None:
+        self.version = version
+
+        node_list: list[Node] = sorted(nodes, key=lambda node: node.id)
+        self.node_ids = array("q", (node.id for node in node_list))
+        self.longitudes = array(
+            "d", (float(node.point.longitude) for node in node_list)
+        )
+        self.latitudes = array("d", (float(node.point.latitude) for node in node_list))
+        index_by_id: dict[int, int] = {
+            node_id: index for index, node_id in enumerate(self.node_ids)
+        }
+
+        edges: dict[tuple[int, int], Edge] = {}
+        for node in node_list:
+            for edge in node.edges:
+                a, b = edge.node_ids
+                if a in index_by_id and b in index_by_id:
+                    edges.setdefault((min(a, b), max(a, b)), edge)
+
+        edge_node_indices: array[int] = array("l")
+        horizontal_distances: array[float] = array("d")
+        vertical_distances: array[float] = array("d")
+        flags: array[int] = array("B")
+        qualities: array[int] = array("B")
+        degrees: list[int] = [0] * len(node_list)
+        for (a, b), edge in edges.items():
+            index_a, index_b = index_by_id[a], index_by_id[b]
+            edge_node_indices.extend((index_a, index_b))
+            horizontal_distances.append(float(edge.horizontal_distance))
+            vertical_distances.append(float(edge.vertical_distance))
+            flags.append(edge_flags(edge))
+            qualities.append(ROAD_QUALITIES.index(edge.quality))
+            degrees[index_a] += 1
+            degrees[index_b] += 1
+
+        offsets: array[int] = array("l", [0] * (len(node_list) + 1))
+        for index, degree in enumerate(degrees):
+            offsets[index + 1] = offsets[index] + degree
+        targets: array[int] = array("l", [0] * offsets[-1])
+        edge_indices: array[int] = array("l", [0] * offsets[-1])
+        cursor: list[int] = list(offsets[:-1])
+        for edge_index in range(len(qualities)):
+            index_a = edge_node_indices[2 * edge_index]
+            index_b = edge_node_indices[2 * edge_index + 1]
+            for source, target in ((index_a, index_b), (index_b, index_a)):
+                targets[cursor[source]] = target
+                edge_indices[cursor[source]] = edge_index
+                cursor[source] += 1
+
+        self.edge_node_indices = edge_node_indices
+        self.horizontal_distances = horizontal_distances
+        self.vertical_distances = vertical_distances
+        self.flags = flags
+        self.qualities = qualities
+        self.offsets = offsets
+        self.targets = targets
+        self.edge_indices = edge_indices
+        self._costs: dict[AccessibilityProfile, Sequence[float]] = {}
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Mapping[str, Sequence[float]],
+        version: str = "",
+        costs: Mapping[AccessibilityProfile, Sequence[float]] | None = None,
+    ) -> "AccessibilityGraph":
+        """`columns`가 돌려준 열로 그래프를 만듭니다.
+
+        열을 복사하지 않으므로 공유 메모리 위의 `memoryview`도 그대로 쓸 수
+        있습니다. 미리 계산한 프로필별 비용 배열을 함께 넘길 수 있습니다.
+        """
+        graph: AccessibilityGraph = cls.__new__(cls)
+        graph.version = version
+        for name in GRAPH_COLUMNS:
+            setattr(graph, name, columns[name])
+        graph._costs = dict(costs or {})
+        return graph
+
+    def columns(self) -> dict[str, Sequence[float]]:
+        return {name: getattr(self, name) for name in GRAPH_COLUMNS}
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.qualities)
+
+    def index_of(self, node_id: int) -> int:
+        # node_ids are sorted; unlike a dict, the search needs no per-process
+        # memory when the columns live in shared memory
+        index: int = bisect.bisect_left(self.node_ids, node_id)
+        if index == len(self.node_ids) or self.node_ids[index] != node_id:
+            raise NodeNotInGraphError
+        return index
+
+    def costs(self, profile: AccessibilityProfile) -> Sequence[float]:
+        """인접 슬롯별 통행 비용 배열 (`targets`와 같은 순서)"""
+        costs: Sequence[float] | None = self._costs.get(profile)
+        if costs is None:
+            edge_costs: list[float] = [
+                edge_cost(
+                    profile=profile,
+                    horizontal_distance=self.horizontal_distances[edge_index],
+                    vertical_distance=self.vertical_distances[edge_index],
+                    flags=self.flags[edge_index],
+                    quality=ROAD_QUALITIES[self.qualities[edge_index]],
+                )
+                for edge_index in range(self.edge_count)
+            ]
+            costs = array("d", (edge_costs[index] for index in self.edge_indices))
+            self._costs[profile] = costs
+        return costs
+
+    def reachable(
+        self,
+        source_id: int,
+        max_cost: float,
+        profile: AccessibilityProfile,
+    ) -> dict[int, float]:
+        """출발 노드에서 최대 비용 이내로 도달할 수 있는 노드별 최소 비용"""
+        source: int = self.index_of(source_id)
+        offsets, targets = self.offsets, self.targets
+        costs: Sequence[float] = self.costs(profile)
+
+        best: dict[int, float] = {source: 0.0}
+        settled: dict[int, float] = {}
+        heap: list[tuple[float, int]] = [(0.0, source)]
+        while heap:
+            cost, index = heapq.heappop(heap)
+            if index in settled:
+                continue
+            settled[index] = cost
+            for slot in range(offsets[index], offsets[index + 1]):
+                next_cost: float = cost + costs[slot]
+                if next_cost > max_cost:
+                    continue
+                target: int = targets[slot]
+                if next_cost < best.get(target, INFINITY):
+                    best[target] = next_cost
+                    heapq.heappush(heap, (next_cost, target))
+
+        node_ids = self.node_ids
+        return {node_ids[index]: cost for index, cost in settled.items()}
+
+    def distances(
+        self,
+        source_id: int,
+        target_ids: list[int],
+        profile: AccessibilityProfile,
+    ) -> list[float]:
+        """출발 노드에서 각 도착 노드까지의 최소 비용 (도달할 수 없으면 무한대)
+
+        모든 도착 노드가 확정되면 탐색을 멈춥니다.
+        """
+        source: int = self.index_of(source_id)
+        target_indices: list[int] = [self.index_of(node_id) for node_id in target_ids]
+        offsets, targets = self.offsets, self.targets
+        costs: Sequence[float] = self.costs(profile)
+
+        remaining: set[int] = set(target_indices)
+        best: dict[int, float] = {source: 0.0}
+        settled: dict[int, float] = {}
+        heap: list[tuple[float, int]] = [(0.0, source)]
+        while heap and remaining:
+            cost, index = heapq.heappop(heap)
+            if index in settled:
+                continue
+            settled[index] = cost
+            remaining.discard(index)
+            for slot in range(offsets[index], offsets[index + 1]):
+                next_cost: float = cost + costs[slot]
+                target: int = targets[slot]
+                if next_cost < best.get(target, INFINITY):
+                    best[target] = next_cost
+                    heapq.heappush(heap, (next_cost, target))
+
+        return [settled.get(index, INFINITY) for index in target_indices]
+
+    def components(self, profile: AccessibilityProfile) -> DisjointSet:
+        """프로필로 지날 수 있는 간선만으로 이어진 연결 요소"""
+        components = DisjointSet(self.node_ids)
+        node_ids = self.node_ids
+        for edge_index in range(self.edge_count):
+            cost: float = edge_cost(
+                profile=profile,
+                horizontal_distance=self.horizontal_distances[edge_index],
+                vertical_distance=self.vertical_distances[edge_index],
+                flags=self.flags[edge_index],
+                quality=ROAD_QUALITIES[self.qualities[edge_index]],
+            )
+            if not math.isinf(cost):
+                components.union(
+                    node_ids[self.edge_node_indices[2 * edge_index]],
+                    node_ids[self.edge_node_indices[2 * edge_index + 1]],
+                )
+        return components
+
+    def shortest_path(
+        self,
+        source_id: int,
+        target_id: int,
+        profile: AccessibilityProfile,
+    ) -> Route | None:
+        """두 노드 사이의 최소 비용 경로 (도달할 수 없으면 None)"""
+        source: int = self.index_of(source_id)
+        target: int = self.index_of(target_id)
+        costs: Sequence[float] = self.costs(profile)
+        found: tuple[float, list[int], list[int]] | None = self._search(
+            source, target, costs
+        )
+        if found is None:
+            return None
+        cost, path, edge_path = found
+        return self._route(path, edge_path, cost)
+
+    def alternative_routes(
+        self,
+        source_id: int,
+        target_id: int,
+        profile: AccessibilityProfile,
+        count: int = 3,
+        penalty: float = 1.5,
+        max_stretch: float = 1.5,
+    ) -> list[Route]:
+        """최소 비용 경로와 대안 경로들을 비용 순으로 반환합니다 (penalty method)
+
+        찾은 경로가 지나는 간선의 비용을 `penalty`배로 올려 가며 다시 탐색하므로,
+        다음 경로는 앞선 경로와 되도록 겹치지 않게 됩니다. 실제 비용이 최소
+        비용의 `max_stretch`배를 넘는 경로는 버립니다.
+        """
+        source: int = self.index_of(source_id)
+        target: int = self.index_of(target_id)
+        costs: Sequence[float] = self.costs(profile)
+        penalized: array[float] = array("d", costs)
+
+        routes: list[Route] = []
+        seen: set[tuple[int, ...]] = set()
+        for _ in range(count * 3):
+            found: tuple[float, list[int], list[int]] | None = self._search(
+                source, target, penalized
+            )
+            if found is None:
+                break
+            _, path, edge_path = found
+            for index, edge_index in zip(path, edge_path):
+                for slot in range(self.offsets[index], self.offsets[index + 1]):
+                    if self.edge_indices[slot] == edge_index:
+                        penalized[slot] *= penalty
+                # the reverse slot lives in the other endpoint's adjacency
+                other: int = self._other_end(edge_index, index)
+                for slot in range(self.offsets[other], self.offsets[other + 1]):
+                    if self.edge_indices[slot] == edge_index:
+                        penalized[slot] *= penalty
+
+            key: tuple[int, ...] = tuple(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            cost: float = sum(self._slot_cost(costs, edge) for edge in edge_path)
+            if routes and cost > routes[0].cost * max_stretch:
+                continue
+            routes.append(self._route(path, edge_path, cost))
+            if len(routes) == count:
+                break
+
+        return sorted(routes, key=lambda route: route.cost)
+
+    def _search(
+        self,
+        source: int,
+        target: int,
+        costs: Sequence[float],
+    ) -> tuple[float, list[int], list[int]] | None:
+        """양방향 다익스트라로 (비용, 노드 인덱스 경로, 간선 인덱스 경로)를 구합니다.
+
+        간선 비용은 방향과 무관하므로 두 방향 모두 같은 비용 배열을 씁니다.
+        양쪽 큐의 최솟값 합이 지금까지 찾은 경로 비용 이상이 되면 멈춥니다.
+        """
+        if source == target:
+            return 0.0, [source], []
+
+        offsets, targets, edge_indices = self.offsets, self.targets, self.edge_indices
+        best: tuple[dict[int, float], dict[int, float]] = ({source: 0.0}, {target: 0.0})
+        parents: tuple[dict[int, tuple[int, int]], dict[int, tuple[int, int]]] = (
+            {},
+            {},
+        )
+        settled: tuple[set[int], set[int]] = (set(), set())
+        heaps: tuple[list[tuple[float, int]], list[tuple[float, int]]] = (
+            [(0.0, source)],
+            [(0.0, target)],
+        )
+        route_cost: float = INFINITY
+        meeting: int | None = None
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= route_cost:
+                break
+            side: int = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            cost, index = heapq.heappop(heaps[side])
+            if index in settled[side]:
+                continue
+            settled[side].add(index)
+            side_best, other_best = best[side], best[1 - side]
+            for slot in range(offsets[index], offsets[index + 1]):
+                next_cost: float = cost + costs[slot]
+                neighbour: int = targets[slot]
+                if next_cost < side_best.get(neighbour, INFINITY):
+                    side_best[neighbour] = next_cost
+                    parents[side][neighbour] = (index, edge_indices[slot])
+                    heapq.heappush(heaps[side], (next_cost, neighbour))
+                    total: float = next_cost + other_best.get(neighbour, INFINITY)
+                    if total < route_cost:
+                        route_cost, meeting = total, neighbour
+
+        if meeting is None:
+            return None
+        path: list[int] = [meeting]
+        edge_path: list[int] = []
+        while path[0] in parents[0]:
+            previous, edge_index = parents[0][path[0]]
+            path.insert(0, previous)
+            edge_path.insert(0, edge_index)
+        while path[-1] in parents[1]:
+            following, edge_index = parents[1][path[-1]]
+            path.append(following)
+            edge_path.append(edge_index)
+        return route_cost, path, edge_path
+
+    def _other_end(self, edge_index: int, index: int) -> int:
+        index_a: int = self.edge_node_indices[2 * edge_index]
+        index_b: int = self.edge_node_indices[2 * edge_index + 1]
+        return index_b if index == index_a else index_a
+
+    def _slot_cost(self, costs: Sequence[float], edge_index: int) -> float:
+        index: int = self.edge_node_indices[2 * edge_index]
+        for slot in range(self.offsets[index], self.offsets[index + 1]):
+            if self.edge_indices[slot] == edge_index:
+                return costs[slot]
+        return INFINITY
+
+    def _route(self, path: list[int], edge_path: list[int], cost: float) -> Route:
+        return Route(
+            node_ids=tuple(self.node_ids[index] for index in path),
+            cost=cost,
+            stair_count=sum(
+                1 for edge_index in edge_path if self.flags[edge_index] & STAIR
+            ),
+            step_count=sum(
+                1 for edge_index in edge_path if self.flags[edge_index] & STEP
+            ),
+            climb=sum(self.vertical_distances[edge_index] for edge_index in edge_path),
+            low_quality_length=sum(
+                self.horizontal_distances[edge_index]
+                for edge_index in edge_path
+                if ROAD_QUALITIES[self.qualities[edge_index]] == RoadQuality.LOW
+            ),
+        )
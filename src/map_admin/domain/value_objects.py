@@ -7,9 +7,15 @@ from enum import StrEnum
 class Point:
     longitude: Decimal
     latitude: Decimal
+    elevation: Decimal | None = None
 
 
 class RoadQuality(StrEnum):
     HIGH = "상"
     MEDIUM = "중"
     LOW = "하"
+
+
+class AccessibilityProfile(StrEnum):
+    PEDESTRIAN = "pedestrian"
+    WHEELCHAIR = "wheelchair"
@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, TypeAlias
+
+from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import RouteCache, RouteCacheStats
+from map_admin.domain.graphs import Route
+from map_admin.domain.value_objects import AccessibilityProfile
+from map_admin.infrastructure.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    cache_metrics,
+)
+
+_RouteKey: TypeAlias = tuple[int, int, AccessibilityProfile]
+
+
+class InMemoryRouteCache(RouteCache):
+    """LRU + TTL 경로 캐시
+
+    키는 (출발, 도착, 프로필)이고, 캐시한 경로는 모두 저장소 버전 하나에
+    묶입니다. 조회할 때 저장소 버전이 다르면 CLI나 다른 워커가 그래프를 바꾼
+    것이므로 전부 버립니다. 경로가 지나는 노드별로 키를 색인해 두어, 이
+    프로세스에서 간선이나 노드를 바꾸면 그 요소를 지나는 경로만 지우고 바뀐
+    버전을 따라갑니다. 경로를 짧게 만들 수 있는 변경은 전체를 무효화합니다.
+    """
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        max_size: int = 10_000,
+        ttl: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._version: int = 0
+        # the repository version the cached routes were found on
+        self._graph_version: str | None = None
+        # this process changed the graph and invalidated what it touched
+        self._followed_write: bool = False
+        self._entries: OrderedDict[_RouteKey, tuple[Route, float]] = OrderedDict()
+        self._keys_by_node: dict[int, set[_RouteKey]] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        if metrics is not None:
+            metrics.register_collector("route_cache", self._collect_metrics)
+
+    def get(
+        self,
+        source_id: int,
+        target_id: int,
+        profile: AccessibilityProfile,
+    ) -> Route | None:
+        key: _RouteKey = (source_id, target_id, profile)
+        with self._lock:
+            self._check_graph_version()
+            entry: tuple[Route, float] | None = self._entries.get(key)
+            if entry is None or entry[1] <= self.clock():
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(
+        self,
+        source_id: int,
+        target_id: int,
+        profile: AccessibilityProfile,
+        route: Route,
+    ) -> None:
+        key: _RouteKey = (source_id, target_id, profile)
+        with self._lock:
+            if not self._check_graph_version():
+                # the route may have been found on the graph before the change
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (route, self.clock() + self.ttl)
+            for node_id in route.node_ids:
+                self._keys_by_node.setdefault(node_id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_edge(self, node_ids: tuple[int, int]) -> None:
+        edge: set[int] = set(node_ids)
+        with self._lock:
+            for key in list(self._keys_by_node.get(node_ids[0], ())):
+                route: Route = self._entries[key][0]
+                if any(set(pair) == edge for pair in route.edge_node_ids):
+                    self._remove(key)
+            self._follow_own_write()
+
+    def invalidate_node(self, node_id: int) -> None:
+        with self._lock:
+            for key in list(self._keys_by_node.get(node_id, ())):
+                self._remove(key)
+            self._follow_own_write()
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._clear()
+            self._follow_own_write()
+
+    def get_stats(self) -> RouteCacheStats:
+        with self._lock:
+            return RouteCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                version=self._version,
+            )
+
+    def _collect_metrics(self) -> list[Counter | Gauge | Histogram]:
+        stats: RouteCacheStats = self.get_stats()
+        entries = Gauge("route_cache_entries", "Routes held in the route cache")
+        entries.set(stats.size)
+        return [
+            *cache_metrics("route_cache", "Route cache", stats.hits, stats.misses),
+            entries,
+        ]
+
+    def _check_graph_version(self) -> bool:
+        """캐시한 경로가 지금 저장소 버전에서 찾은 것인지 확인하고, 아니면 비웁니다."""
+        # the lock is held
+        version: str = self.node_repo.get_version()
+        followed_write: bool = self._followed_write
+        self._followed_write = False
+        if version == self._graph_version:
+            return True
+        # nothing is cached before the first check, and this process's own
+        # change is already invalidated; a write from elsewhere that landed
+        # since the last check is taken along with it, and bounded by the TTL
+        unchanged: bool = self._graph_version is None or followed_write
+        if not unchanged:
+            self._clear()
+        self._graph_version = version
+        return unchanged
+
+    def _follow_own_write(self) -> None:
+        # the version is read on the next check rather than here, where
+        # reading it would load the graph the write just replaced
+        self._followed_write = True
+
+    def _clear(self) -> None:
+        self._version += 1
+        self._entries.clear()
+        self._keys_by_node.clear()
+
+    def _remove(self, key: _RouteKey) -> None:
+        route, _ = self._entries.pop(key)
+        for node_id in route.node_ids:
+            keys: set[_RouteKey] | None = self._keys_by_node.get(node_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_node[node_id]
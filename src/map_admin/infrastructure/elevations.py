@@ -0,0 +1,324 @@
+import math
+import mmap
+import struct
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, TypeAlias
+
+from map_admin.application.services import ElevationProvider
+from map_admin.domain.value_objects import Point
+
+ELEVATION_QUANTUM = Decimal("0.01")
+
+_Block: TypeAlias = "array[Any]"
+
+# (SampleFormat, BitsPerSample) -> array typecode
+_TYPECODES: dict[tuple[int, int], str] = {
+    (1, 8): "B",
+    (2, 8): "b",
+    (1, 16): "H",
+    (2, 16): "h",
+    (1, 32): "I",
+    (2, 32): "i",
+    (3, 32): "f",
+    (3, 64): "d",
+}
+
+
+class _Raster(ABC):
+    """북쪽이 위인 단일 밴드 래스터를 블록 단위로 읽는 리더"""
+
+    width: int
+    height: int
+    block_width: int
+    block_height: int
+    origin_x: float  # western edge of the raster
+    origin_y: float  # northern edge of the raster
+    pixel_width: float
+    pixel_height: float
+    nodata: float | None
+
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @abstractmethod
+    def read_block(self, block_row: int, block_col: int) -> _Block:
+        raise NotImplementedError
+
+    def _decode(self, offset: int, size: int, typecode: str, little: bool) -> _Block:
+        values: _Block = array(typecode)
+        values.frombytes(self._mmap[offset : offset + size])
+        if little != (sys.byteorder == "little"):
+            values.byteswap()
+        return values
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+
+class _GeoTiffRaster(_Raster):
+    """압축되지 않은 단일 밴드 GeoTIFF (스트립/타일 모두 지원)"""
+
+    _TYPE_FORMATS: dict[int, str] = {
+        1: "B",
+        2: "s",
+        3: "H",
+        4: "I",
+        5: "II",
+        11: "f",
+        12: "d",
+        16: "Q",
+    }
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        byte_order: bytes = self._mmap[:2]
+        if byte_order not in (b"II", b"MM"):
+            raise ValueError("Not a TIFF file")
+        self._little: bool = byte_order == b"II"
+        self._prefix: str = "<" if self._little else ">"
+        magic, ifd_offset = struct.unpack_from(self._prefix + "HI", self._mmap, 2)
+        if magic != 42:
+            raise ValueError("Only classic TIFF is supported")
+        tags: dict[int, tuple[Any, ...]] = self._read_ifd(ifd_offset)
+
+        if tags.get(259, (1,))[0] != 1:
+            raise ValueError("Compressed GeoTIFF is not supported")
+        if tags.get(277, (1,))[0] != 1:
+            raise ValueError("Only single band GeoTIFF is supported")
+        self.width = tags[256][0]
+        self.height = tags[257][0]
+        self._typecode: str = _TYPECODES[(tags.get(339, (1,))[0], tags[258][0])]
+
+        if 324 in tags:
+            self.block_width = tags[322][0]
+            self.block_height = tags[323][0]
+            self._offsets: tuple[int, ...] = tags[324]
+            self._byte_counts: tuple[int, ...] = tags[325]
+        else:
+            self.block_width = self.width
+            self.block_height = tags.get(278, (self.height,))[0]
+            self._offsets = tags[273]
+            self._byte_counts = tags[279]
+        self._blocks_across: int = -(-self.width // self.block_width)
+
+        scale_x, scale_y, _ = tags[33550]
+        pixel_i, pixel_j, _, model_x, model_y, _ = tags[33922][:6]
+        self.pixel_width = scale_x
+        self.pixel_height = scale_y
+        self.origin_x = model_x - pixel_i * scale_x
+        self.origin_y = model_y + pixel_j * scale_y
+
+        nodata: tuple[Any, ...] | None = tags.get(42113)
+        self.nodata = None if nodata is None else float(nodata[0])
+
+    def _read_ifd(self, offset: int) -> dict[int, tuple[Any, ...]]:
+        (entry_count,) = struct.unpack_from(self._prefix + "H", self._mmap, offset)
+        tags: dict[int, tuple[Any, ...]] = {}
+        for index in range(entry_count):
+            tag, field_type, count, value_offset = struct.unpack_from(
+                self._prefix + "HHI4s", self._mmap, offset + 2 + index * 12
+            )
+            item_format: str | None = self._TYPE_FORMATS.get(field_type)
+            if item_format is None:
+                continue
+            if item_format == "s":
+                size = count
+            else:
+                size = struct.calcsize(self._prefix + item_format) * count
+            if size <= 4:
+                data: bytes = value_offset[:size]
+            else:
+                (data_offset,) = struct.unpack(self._prefix + "I", value_offset)
+                data = self._mmap[data_offset : data_offset + size]
+
+            if item_format == "s":
+                tags[tag] = (data.rstrip(b"\x00").decode("ascii"),)
+            elif item_format == "II":
+                pairs = struct.unpack(self._prefix + "I" * 2 * count, data)
+                tags[tag] = tuple(
+                    pairs[i] / pairs[i + 1] for i in range(0, len(pairs), 2)
+                )
+            else:
+                tags[tag] = struct.unpack(self._prefix + item_format * count, data)
+        return tags
+
+    def read_block(self, block_row: int, block_col: int) -> _Block:
+        index: int = block_row * self._blocks_across + block_col
+        return self._decode(
+            self._offsets[index],
+            self._byte_counts[index],
+            self._typecode,
+            self._little,
+        )
+
+
+class _RawRaster(_Raster):
+    """ESRI .hdr 헤더가 딸린 raw 격자 (.bil, .flt 등)"""
+
+    BLOCK_HEIGHT = 64
+
+    def __init__(self, path: Path) -> None:
+        header: dict[str, str] = {}
+        with open(path.with_suffix(".hdr"), "r") as file:
+            for line in file:
+                if parts := line.split():
+                    header[parts[0].lower()] = parts[1] if len(parts) > 1 else ""
+        super().__init__(path)
+
+        self.width = int(header["ncols"])
+        self.height = int(header["nrows"])
+        self.block_width = self.width
+        self.block_height = min(self.BLOCK_HEIGHT, self.height)
+        self.pixel_width = float(header.get("cellsize") or header["xdim"])
+        self.pixel_height = float(header.get("cellsize") or header["ydim"])
+        if "ulxmap" in header:
+            # ulxmap/ulymap point at the center of the upper left cell
+            self.origin_x = float(header["ulxmap"]) - self.pixel_width / 2
+            self.origin_y = float(header["ulymap"]) + self.pixel_height / 2
+        else:
+            lower_x: float = float(header.get("xllcorner") or header["xllcenter"])
+            lower_y: float = float(header.get("yllcorner") or header["yllcenter"])
+            if "xllcorner" not in header:
+                lower_x -= self.pixel_width / 2
+                lower_y -= self.pixel_height / 2
+            self.origin_x = lower_x
+            self.origin_y = lower_y + self.height * self.pixel_height
+
+        is_float: bool = header.get("pixeltype", "").lower() == "float" or (
+            path.suffix.lower() == ".flt" and "pixeltype" not in header
+        )
+        bits: int = int(header.get("nbits", 32 if is_float else 16))
+        if is_float:
+            sample_format = 3
+        elif header.get("pixeltype", "signedint").lower() == "signedint":
+            sample_format = 2
+        else:
+            sample_format = 1
+        self._typecode: str = _TYPECODES[(sample_format, bits)]
+        self._little: bool = header.get("byteorder", "lsbfirst").lower() in (
+            "lsbfirst",
+            "i",
+        )
+        nodata: str | None = header.get("nodata_value") or header.get("nodata")
+        self.nodata = None if nodata is None else float(nodata)
+
+    def read_block(self, block_row: int, block_col: int) -> _Block:
+        itemsize: int = array(self._typecode).itemsize
+        row_size: int = self.width * itemsize
+        first_row: int = block_row * self.block_height
+        row_count: int = min(self.block_height, self.height - first_row)
+        return self._decode(
+            first_row * row_size,
+            row_count * row_size,
+            self._typecode,
+            self._little,
+        )
+
+
+class RasterElevationProvider(ElevationProvider):
+    """로컬 DEM 파일을 메모리 매핑해 쌍선형 보간으로 고도를 구합니다.
+
+    디코딩한 블록(스트립/타일)은 LRU 캐시에 보관하므로, 일괄 처리에서
+    인접한 노드들이 같은 블록을 다시 읽지 않습니다.
+    """
+
+    def __init__(self, file_path: str | None, block_cache_size: int = 256) -> None:
+        self.file_path = file_path
+        self.block_cache_size = block_cache_size
+        self._raster: _Raster | None = None
+        self._blocks: OrderedDict[tuple[int, int], _Block] = OrderedDict()
+
+    def get_elevations(self, points: list[Point]) -> list[Decimal | None]:
+        raster: _Raster = self._open()
+        elevations: list[Decimal | None] = []
+        for point in points:
+            elevation: float | None = self._sample(
+                raster, float(point.longitude), float(point.latitude)
+            )
+            elevations.append(
+                None
+                if elevation is None
+                else Decimal(elevation).quantize(ELEVATION_QUANTUM)
+            )
+        return elevations
+
+    def close(self) -> None:
+        if self._raster is not None:
+            self._raster.close()
+            self._raster = None
+        self._blocks.clear()
+
+    def _open(self) -> _Raster:
+        if self._raster is not None:
+            return self._raster
+        if not self.file_path:
+            raise super().ElevationSourceUnavailableError
+        path = Path(self.file_path)
+        try:
+            if path.suffix.lower() in (".tif", ".tiff"):
+                self._raster = _GeoTiffRaster(path)
+            else:
+                self._raster = _RawRaster(path)
+        except (OSError, KeyError, ValueError, struct.error):
+            raise super().ElevationSourceUnavailableError
+        return self._raster
+
+    def _sample(self, raster: _Raster, x: float, y: float) -> float | None:
+        # fractional pixel coordinates relative to pixel centers
+        col: float = (x - raster.origin_x) / raster.pixel_width - 0.5
+        row: float = (raster.origin_y - y) / raster.pixel_height - 0.5
+        if not (
+            -0.5 <= col <= raster.width - 0.5 and -0.5 <= row <= raster.height - 0.5
+        ):
+            return None
+
+        col0: int = min(max(math.floor(col), 0), raster.width - 1)
+        row0: int = min(max(math.floor(row), 0), raster.height - 1)
+        col1: int = min(col0 + 1, raster.width - 1)
+        row1: int = min(row0 + 1, raster.height - 1)
+        dx: float = min(max(col - col0, 0.0), 1.0)
+        dy: float = min(max(row - row0, 0.0), 1.0)
+
+        total: float = 0.0
+        total_weight: float = 0.0
+        for sample_row, sample_col, weight in (
+            (row0, col0, (1 - dx) * (1 - dy)),
+            (row0, col1, dx * (1 - dy)),
+            (row1, col0, (1 - dx) * dy),
+            (row1, col1, dx * dy),
+        ):
+            if weight == 0:
+                continue
+            value: float = self._value(raster, sample_row, sample_col)
+            if value == raster.nodata or math.isnan(value):
+                continue
+            total += value * weight
+            total_weight += weight
+
+        if total_weight == 0:
+            return None
+        return total / total_weight
+
+    def _value(self, raster: _Raster, row: int, col: int) -> float:
+        key: tuple[int, int] = (row // raster.block_height, col // raster.block_width)
+        block: _Block | None = self._blocks.get(key)
+        if block is None:
+            block = raster.read_block(*key)
+            self._blocks[key] = block
+            if len(self._blocks) > self.block_cache_size:
+                self._blocks.popitem(last=False)
+        else:
+            self._blocks.move_to_end(key)
+        return float(
+            block[
+                (row % raster.block_height) * raster.block_width
+                + col % raster.block_width
+            ]
+        )
@@ -0,0 +1,116 @@
+import logging
+import queue
+import threading
+
+from map_admin.application.services import GraphEventBus, GraphEventSubscriber
+from map_admin.domain.events import GraphEvent
+from map_admin.infrastructure.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessEventBus(GraphEventBus):
+    """한 프로세스 안에서 그래프 변경을 구독자에게 나눠 주는 버스
+
+    동기 구독자는 `publish`를 부른 스레드에서 등록 순서대로 처리하므로, 쓰기
+    요청이 응답하기 전에 캐시와 색인이 변경을 반영합니다. 비동기 구독자는 전용
+    스레드 하나가 큐에서 꺼내 발행 순서대로 처리합니다. 변경은 이미 저장된
+    뒤이므로, 어느 쪽이든 구독자의 에러는 기록만 하고 다음 구독자로 넘어갑니다.
+
+    다른 워커 프로세스의 쓰기는 알리지 않습니다. 그쪽 변경은 지금처럼 저장소
+    버전으로 알아챕니다.
+    """
+
+    def __init__(
+        self,
+        subscribers: list[GraphEventSubscriber] | None = None,
+        background_subscribers: list[GraphEventSubscriber] | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        # replaced, never mutated, so that publish reads them without the lock
+        self._subscribers: tuple[GraphEventSubscriber, ...] = ()
+        self._background_subscribers: tuple[GraphEventSubscriber, ...] = ()
+        self._queue: queue.Queue[GraphEvent] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._published: Counter | None = None
+        self._failures: Counter | None = None
+        if metrics is not None:
+            self._published = metrics.counter(
+                "graph_events_published_total",
+                "Graph change events published in this process",
+                ("event",),
+            )
+            self._failures = metrics.counter(
+                "graph_event_subscriber_failures_total",
+                "Events a subscriber failed to handle",
+            )
+            metrics.register_collector("graph_events", self._collect_metrics)
+        for subscriber in subscribers or []:
+            self.subscribe(subscriber)
+        for subscriber in background_subscribers or []:
+            self.subscribe(subscriber, background=True)
+
+    def publish(self, event: GraphEvent) -> None:
+        if self._published is not None:
+            self._published.labels(type(event).__name__).inc()
+        for subscriber in self._subscribers:
+            self._deliver(subscriber, event)
+        if self._background_subscribers:
+            self._queue.put(event)
+
+    def subscribe(
+        self,
+        subscriber: GraphEventSubscriber,
+        background: bool = False,
+    ) -> None:
+        with self._lock:
+            if not background:
+                self._subscribers += (subscriber,)
+                return
+            self._background_subscribers += (subscriber,)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="graph-event-bus", daemon=True
+                )
+                self._worker.start()
+
+    def unsubscribe(self, subscriber: GraphEventSubscriber) -> None:
+        with self._lock:
+            self._subscribers = tuple(
+                other for other in self._subscribers if other is not subscriber
+            )
+            self._background_subscribers = tuple(
+                other
+                for other in self._background_subscribers
+                if other is not subscriber
+            )
+
+    def join(self) -> None:
+        """비동기 구독자가 지금까지 발행된 이벤트를 다 처리할 때까지 기다립니다."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            event: GraphEvent = self._queue.get()
+            try:
+                for subscriber in self._background_subscribers:
+                    self._deliver(subscriber, event)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, subscriber: GraphEventSubscriber, event: GraphEvent) -> None:
+        try:
+            subscriber.handle(event)
+        except Exception:
+            if self._failures is not None:
+                self._failures.inc()
+            logger.exception("%r failed to handle %r", subscriber, event)
+
+    def _collect_metrics(self) -> list[Counter | Gauge | Histogram]:
+        pending = Gauge(
+            "graph_event_queue_depth",
+            "Events waiting for the background subscribers",
+        )
+        pending.set(self._queue.qsize())
+        return [pending]
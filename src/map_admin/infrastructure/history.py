@@ -0,0 +1,378 @@
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from bisect import bisect_right
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from map_admin.application.services import GraphHistory, HistoryEntry
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeDeleted,
+    EdgeUpdated,
+    GraphEvent,
+    GraphReplaced,
+    NodeCreated,
+    NodeDeleted,
+    NodeUpdated,
+)
+from map_admin.infrastructure.metrics import Counter, MetricsRegistry
+from map_admin.infrastructure.repositories import (
+    FileEdge,
+    FileNode,
+    _edge_key,
+    _to_edge,
+    _to_file_edge,
+    _to_file_node,
+    _to_point,
+)
+
+_current_author: ContextVar[str | None] = ContextVar("current_author", default=None)
+
+# a checkpoint: nodes by id and edges by sorted node ids, in file order
+_State = tuple[dict[int, FileNode], dict[tuple[int, ...], FileEdge]]
+
+
+@contextmanager
+def authored_by(author: str | None) -> Iterator[None]:
+    """이 안에서 기록하는 변경의 작성자를 정합니다."""
+    token = _current_author.set(author)
+    try:
+        yield
+    finally:
+        _current_author.reset(token)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _to_node(node_dict: FileNode, edges: list[Edge] | None = None) -> Node:
+    return Node(
+        id=node_dict["id"],
+        name=node_dict["name"],
+        point=_to_point(node_dict),
+        edges=edges or [],
+        version=node_dict.get("version", 1),
+    )
+
+
+def _to_record(entry: HistoryEntry) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "id": entry.id,
+        "recorded_at": entry.recorded_at.isoformat(),
+        "author": entry.author,
+        "kind": entry.event.kind,
+    }
+    event: GraphEvent = entry.event
+    if isinstance(event, NodeCreated):
+        record["node"] = _to_file_node(event.node)
+    elif isinstance(event, NodeUpdated):
+        record["before"] = _to_file_node(event.before)
+        record["after"] = _to_file_node(event.after)
+    elif isinstance(event, NodeDeleted):
+        record["node"] = _to_file_node(event.node)
+        record["edges"] = [_to_file_edge(edge) for edge in event.node.edges]
+    elif isinstance(event, (EdgeCreated, EdgeDeleted)):
+        record["edge"] = _to_file_edge(event.edge)
+    elif isinstance(event, EdgeUpdated):
+        record["before"] = _to_file_edge(event.before)
+        record["after"] = _to_file_edge(event.after)
+    return record
+
+
+def _to_entry(record: dict[str, Any]) -> HistoryEntry:
+    kind: str = record["kind"]
+    event: GraphEvent
+    if kind == NodeCreated.kind:
+        event = NodeCreated(node=_to_node(record["node"]))
+    elif kind == NodeUpdated.kind:
+        event = NodeUpdated(
+            before=_to_node(record["before"]),
+            after=_to_node(record["after"]),
+        )
+    elif kind == NodeDeleted.kind:
+        event = NodeDeleted(
+            node=_to_node(record["node"], [_to_edge(edge) for edge in record["edges"]]),
+        )
+    elif kind == EdgeCreated.kind:
+        event = EdgeCreated(edge=_to_edge(record["edge"]))
+    elif kind == EdgeUpdated.kind:
+        event = EdgeUpdated(
+            before=_to_edge(record["before"]),
+            after=_to_edge(record["after"]),
+        )
+    elif kind == EdgeDeleted.kind:
+        event = EdgeDeleted(edge=_to_edge(record["edge"]))
+    else:
+        event = GraphReplaced()
+    return HistoryEntry(
+        id=record["id"],
+        recorded_at=datetime.fromisoformat(record["recorded_at"]),
+        author=record["author"],
+        event=event,
+    )
+
+
+def _apply(state: _State, record: dict[str, Any]) -> None:
+    """기록 하나를 상태에 다시 적용합니다.
+
+    바뀐 뒤의 값을 그대로 덮어쓰므로 같은 기록을 두 번 적용해도 결과가 같습니다.
+    """
+    nodes, edges = state
+    kind: str = record["kind"]
+    if kind == NodeCreated.kind:
+        nodes[record["node"]["id"]] = record["node"]
+    elif kind == NodeUpdated.kind:
+        nodes[record["after"]["id"]] = record["after"]
+    elif kind == NodeDeleted.kind:
+        nodes.pop(record["node"]["id"], None)
+        for edge_dict in record["edges"]:
+            edges.pop(_edge_key(edge_dict["node_ids"]), None)
+    elif kind == EdgeCreated.kind:
+        edges[_edge_key(record["edge"]["node_ids"])] = record["edge"]
+    elif kind == EdgeUpdated.kind:
+        edges[_edge_key(record["after"]["node_ids"])] = record["after"]
+    elif kind == EdgeDeleted.kind:
+        edges.pop(_edge_key(record["edge"]["node_ids"]), None)
+    # a graph replacement always has a checkpoint of its own, so replay never
+    # starts before one
+
+
+class FileGraphHistory(GraphHistory):
+    """변경을 JSON Lines 파일에 덧붙이고 주기적으로 그래프 전체를 남기는 이력
+
+    `entries.jsonl`의 한 줄이 변경 하나이며, 노드와 간선의 바뀌기 전후 값을
+    담습니다. `checkpoint_interval`개를 기록할 때마다, 그리고 하나씩 기록하지
+    않는 일괄 변경 직후마다 그 시점의 노드와 간선 파일을 `checkpoints/<ID>.json`
+    하나로 복사해 둡니다. 과거 시점을 읽을 때는 직전 체크포인트에 그 뒤의 기록만 다시
+    적용하므로, 다시 적용하는 기록은 `checkpoint_interval`개를 넘지 않습니다.
+
+    기록마다 파일 안의 위치와 시각을 메모리에 색인해 두어 시각이나 ID로 찾을 때
+    파일을 처음부터 훑지 않습니다. 다른 워커가 덧붙인 기록은 파일 잠금을 잡을
+    때 이어 읽어 색인에 더합니다. 기록은 처음 변경을 저장한 뒤부터 시작하므로
+    그 전 시각의 그래프는 되살릴 수 없습니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        node_file_path: str,
+        edge_file_path: str,
+        checkpoint_interval: int = 500,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.directory = Path(directory)
+        self.node_file_path = node_file_path
+        self.edge_file_path = edge_file_path
+        self.checkpoint_interval = checkpoint_interval
+        self.clock = clock
+        self._entries_path: Path = self.directory / "entries.jsonl"
+        self._checkpoint_directory: Path = self.directory / "checkpoints"
+        self._lock = threading.Lock()
+        # entry `id` starts at byte `_offsets[id - 1]` and was recorded at
+        # `_recorded_at[id - 1]`
+        self._offsets: list[int] = []
+        self._recorded_at: list[datetime] = []
+        self._indexed_size: int = 0
+        self._checkpoint_ids: list[int] = []
+        # the directory is listed once; after that, checkpoints are added as
+        # their entries are indexed
+        self._checkpoints_listed: bool = False
+        self._cached_checkpoint: tuple[int, _State] | None = None
+        self._recorded: Counter | None = None
+        self._replayed: Counter | None = None
+        self._checkpoints: Counter | None = None
+        if metrics is not None:
+            self._recorded = metrics.counter(
+                "graph_history_entries_total",
+                "Changes recorded in the history by this process",
+            )
+            self._replayed = metrics.counter(
+                "graph_history_replayed_entries_total",
+                "History entries replayed onto checkpoints for point-in-time reads",
+            )
+            self._checkpoints = metrics.counter(
+                "graph_history_checkpoints_total",
+                "Full graph checkpoints written by this process",
+            )
+
+    def record(self, event: GraphEvent) -> HistoryEntry:
+        with self._locked(writing=True):
+            entry_id: int = len(self._offsets) + 1
+            recorded_at: datetime = self.clock()
+            if self._recorded_at:
+                # kept ordered, so that entries are looked up by time in order
+                recorded_at = max(recorded_at, self._recorded_at[-1])
+            entry = HistoryEntry(
+                id=entry_id,
+                recorded_at=recorded_at,
+                author=_current_author.get(),
+                event=event,
+            )
+            line: bytes = (json.dumps(_to_record(entry)) + "\n").encode()
+            with open(self._entries_path, "ab") as file:
+                file.write(line)
+            self._offsets.append(self._indexed_size)
+            self._recorded_at.append(recorded_at)
+            self._indexed_size += len(line)
+            if self._recorded is not None:
+                self._recorded.inc()
+
+            if (
+                isinstance(event, GraphReplaced)
+                or not self._checkpoint_ids
+                or entry_id - self._checkpoint_ids[-1] >= self.checkpoint_interval
+            ):
+                self._write_checkpoint(entry_id)
+        return entry
+
+    def get_entry(self, entry_id: int) -> HistoryEntry:
+        with self._locked():
+            if not 1 <= entry_id <= len(self._offsets):
+                raise super().EntryNotFoundError
+        return _to_entry(self._read_records(entry_id, entry_id)[0])
+
+    def list_entries(self, after_id: int, limit: int) -> list[HistoryEntry]:
+        with self._locked():
+            last_id: int = min(after_id + limit, len(self._offsets))
+        first_id: int = max(after_id, 0) + 1
+        if first_id > last_id:
+            return []
+        return [_to_entry(record) for record in self._read_records(first_id, last_id)]
+
+    def get_nodes_as_of(self, as_of: datetime) -> list[Node]:
+        if as_of.tzinfo is None:
+            as_of = as_of.replace(tzinfo=timezone.utc)
+        with self._locked():
+            last_id: int = bisect_right(self._recorded_at, as_of)
+            index: int = bisect_right(self._checkpoint_ids, last_id)
+            if index == 0:
+                raise super().HistoryNotAvailableError
+            checkpoint_id: int = self._checkpoint_ids[index - 1]
+
+        nodes, edges = self._read_checkpoint(checkpoint_id)
+        state: _State = (dict(nodes), dict(edges))
+        if checkpoint_id < last_id:
+            records: list[dict[str, Any]] = self._read_records(
+                checkpoint_id + 1, last_id
+            )
+            for record in records:
+                _apply(state, record)
+            if self._replayed is not None:
+                self._replayed.inc(len(records))
+
+        edges_by_node_id: dict[int, list[Edge]] = {}
+        for edge_dict in state[1].values():
+            edge: Edge = _to_edge(edge_dict)
+            for node_id in dict.fromkeys(edge.node_ids):
+                edges_by_node_id.setdefault(node_id, []).append(edge)
+        return [
+            _to_node(node_dict, edges_by_node_id.get(node_id))
+            for node_id, node_dict in state[0].items()
+        ]
+
+    @contextmanager
+    def _locked(self, writing: bool = False) -> Iterator[None]:
+        # the file lock orders the appends of every worker; the index is
+        # brought up to date with theirs once it is held
+        with self._lock:
+            if writing:
+                # made on the first write, so that reads alone leave no files
+                self._checkpoint_directory.mkdir(parents=True, exist_ok=True)
+            elif not self.directory.exists():
+                # no worker has recorded anything yet
+                yield
+                return
+            with open(self.directory / "lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    self._catch_up()
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _catch_up(self) -> None:
+        try:
+            with open(self._entries_path, "rb") as file:
+                file.seek(self._indexed_size)
+                appended: bytes = file.read()
+        except FileNotFoundError:
+            appended = b""
+        for line in appended.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            record: dict[str, Any] = json.loads(line)
+            self._offsets.append(self._indexed_size)
+            self._recorded_at.append(datetime.fromisoformat(record["recorded_at"]))
+            self._indexed_size += len(line)
+            # a worker writes an entry's checkpoint before releasing the lock
+            checkpoint_path: Path = self._checkpoint_directory / f"{record['id']}.json"
+            if self._checkpoints_listed and checkpoint_path.exists():
+                self._checkpoint_ids.append(record["id"])
+        if not self._checkpoints_listed:
+            self._checkpoint_ids = sorted(
+                int(path.stem) for path in self._checkpoint_directory.glob("*.json")
+            )
+            self._checkpoints_listed = True
+
+    def _read_records(self, first_id: int, last_id: int) -> list[dict[str, Any]]:
+        start: int = self._offsets[first_id - 1]
+        end: int = (
+            self._offsets[last_id]
+            if last_id < len(self._offsets)
+            else self._indexed_size
+        )
+        with open(self._entries_path, "rb") as file:
+            file.seek(start)
+            payload: bytes = file.read(end - start)
+        return [json.loads(line) for line in payload.splitlines()]
+
+    def _write_checkpoint(self, entry_id: int) -> None:
+        # the records are copied as they are; parsing waits for a read.
+        # FileNodeRepository's lock keeps a write from landing between the files
+        with open(f"{self.node_file_path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                with open(self.node_file_path, "rb") as node_file:
+                    nodes: bytes = node_file.read()
+                with open(self.edge_file_path, "rb") as edge_file:
+                    edges: bytes = edge_file.read()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        # replaced in one step, so readers never see half of it
+        with tempfile.NamedTemporaryFile(
+            "wb",
+            dir=self._checkpoint_directory,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            file.write(b'{"nodes": ' + nodes + b', "edges": ' + edges + b"}")
+        os.replace(file.name, self._checkpoint_directory / f"{entry_id}.json")
+        self._checkpoint_ids.append(entry_id)
+        if self._checkpoints is not None:
+            self._checkpoints.inc()
+
+    def _read_checkpoint(self, checkpoint_id: int) -> _State:
+        # consecutive reads tend to land after the same checkpoint
+        cached: tuple[int, _State] | None = self._cached_checkpoint
+        if cached is not None and cached[0] == checkpoint_id:
+            return cached[1]
+        with open(self._checkpoint_directory / f"{checkpoint_id}.json", "rb") as file:
+            checkpoint: dict[str, Any] = json.load(file)
+        state: _State = (
+            {node_dict["id"]: node_dict for node_dict in checkpoint["nodes"]},
+            {
+                _edge_key(edge_dict["node_ids"]): edge_dict
+                for edge_dict in checkpoint["edges"]
+            },
+        )
+        self._cached_checkpoint = (checkpoint_id, state)
+        return state
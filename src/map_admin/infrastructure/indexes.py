@@ -0,0 +1,104 @@
+import threading
+
+from map_admin.application.repositories import GraphRepository, NodeRepository
+from map_admin.application.services import ComponentIndex
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import DisjointSet, is_traversable
+from map_admin.domain.value_objects import AccessibilityProfile
+
+
+class UnionFindComponentIndex(ComponentIndex):
+    """프로필별 union-find로 연결 요소를 유지합니다.
+
+    노드와 간선 추가는 union 한 번으로 반영합니다. union-find는 집합을 나눌 수
+    없으므로, 간선이 빠지면 그 간선을 지날 수 있던 프로필만 무효로 표시해
+    두었다가 다음 조회 때 그래프에서 선형 시간에 다시 만듭니다. 노드를 지울
+    때는 그 노드의 간선만 살펴, 지날 수 있는 간선이 없던 프로필에서는 노드만
+    빼고 나머지 프로필만 무효로 표시합니다.
+
+    CLI나 다른 워커가 바꾼 파일은 이 색인을 거치지 않으므로, 만들 때의 저장소
+    버전을 기억해 두었다가 조회할 때 버전이 다르면 전부 다시 만듭니다. 이
+    프로세스의 쓰기를 반영할 때는 저장소가 잠금 안에서 읽은 쓰기 직전 버전이
+    기억한 버전과 같을 때만 직후 버전을 따라가고, 다르면 그사이 다른 쪽의
+    쓰기가 있었던 것이므로 전부 버립니다.
+    """
+
+    def __init__(self, graph_repo: GraphRepository, node_repo: NodeRepository) -> None:
+        self.graph_repo = graph_repo
+        self.node_repo = node_repo
+        self._lock = threading.Lock()
+        self._components: dict[AccessibilityProfile, DisjointSet] = {}
+        self._version: str | None = None
+
+    def get_components(self, profile: AccessibilityProfile) -> list[list[int]]:
+        with self._lock:
+            # read before the graph, so that a write in between only costs
+            # another rebuild
+            version: str = self.node_repo.get_version()
+            if version != self._version:
+                self._components.clear()
+                self._version = version
+            components: DisjointSet | None = self._components.get(profile)
+            if components is None:
+                components = self.graph_repo.get_graph().components(profile)
+                self._components[profile] = components
+            return components.groups()
+
+    def add_node(self, node_id: int) -> None:
+        with self._lock:
+            for components in self._components.values():
+                components.add(node_id)
+            self._follow_own_write()
+
+    def remove_node(self, node: Node) -> None:
+        with self._lock:
+            for profile, components in list(self._components.items()):
+                if any(is_traversable(edge, profile) for edge in node.edges):
+                    # the node may have been the only link between its neighbours
+                    del self._components[profile]
+                elif not components.discard(node.id):
+                    del self._components[profile]
+            self._follow_own_write()
+
+    def add_edge(self, edge: Edge) -> None:
+        with self._lock:
+            for profile, components in self._components.items():
+                if is_traversable(edge, profile):
+                    self._union(components, edge)
+            self._follow_own_write()
+
+    def update_edge(self, before: Edge, after: Edge) -> None:
+        with self._lock:
+            for profile, components in list(self._components.items()):
+                was_traversable: bool = is_traversable(before, profile)
+                if was_traversable and not is_traversable(after, profile):
+                    del self._components[profile]
+                elif not was_traversable and is_traversable(after, profile):
+                    self._union(components, after)
+            self._follow_own_write()
+
+    def remove_edge(self, edge: Edge) -> None:
+        with self._lock:
+            for profile in list(self._components):
+                if is_traversable(edge, profile):
+                    del self._components[profile]
+            self._follow_own_write()
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._components.clear()
+
+    def _follow_own_write(self) -> None:
+        # the change is applied on top of what was built; that is the saved
+        # version only when nothing else was written before this process
+        written: tuple[str, str] | None = self.node_repo.get_written_versions()
+        if written is not None and written[0] == self._version:
+            self._version = written[1]
+        else:
+            self._components.clear()
+            self._version = None
+
+    def _union(self, components: DisjointSet, edge: Edge) -> None:
+        for node_id in edge.node_ids:
+            components.add(node_id)
+        components.union(*edge.node_ids)
@@ -0,0 +1,287 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Generic, Iterator, TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# seconds, from sub-millisecond cache hits to full-file rewrites
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = dict[str, str]
+Sample = tuple[str, Labels, float]  # (suffix, labels, value)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+class _CounterChild:
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value: float = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value: float = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _HistogramChild:
+    def __init__(self, lock: threading.Lock, buckets: tuple[float, ...]) -> None:
+        self._lock = lock
+        self._buckets = buckets
+        self.counts: list[int] = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        index: int = bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+_Child = TypeVar("_Child", _CounterChild, _GaugeChild, _HistogramChild)
+
+
+class _Metric(Generic[_Child]):
+    type_name: str
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], _Child] = {}
+
+    def labels(self, *values: str) -> _Child:
+        """레이블 값에 해당하는 시계열을 돌려줍니다.
+
+        자주 쓰는 조합은 반환값을 붙잡아 두면 매번 사전을 찾지 않아도 됩니다.
+        """
+        if len(values) != len(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}")
+        child: _Child | None = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {_escape(self.documentation)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for values, child in list(self._children.items()):
+            labels: Labels = dict(zip(self.label_names, values))
+            for suffix, sample_labels, value in self._samples(child, labels):
+                yield (
+                    f"{self.name}{suffix}{_format_labels(sample_labels)}"
+                    f" {_format_value(value)}"
+                )
+
+    def _new_child(self) -> _Child:
+        raise NotImplementedError
+
+    def _samples(self, child: _Child, labels: Labels) -> list[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric[_CounterChild]):
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+    def _samples(self, child: _CounterChild, labels: Labels) -> list[Sample]:
+        return [("", labels, child.value)]
+
+
+class Gauge(_Metric[_GaugeChild]):
+    type_name = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+    def _samples(self, child: _GaugeChild, labels: Labels) -> list[Sample]:
+        return [("", labels, child.value)]
+
+
+class Histogram(_Metric[_HistogramChild]):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._lock, self.buckets)
+
+    def _samples(self, child: _HistogramChild, labels: Labels) -> list[Sample]:
+        with self._lock:
+            counts: list[int] = list(child.counts)
+            total: float = child.sum
+        samples: list[Sample] = []
+        cumulative: int = 0
+        for bound, count in zip((*self.buckets, math.inf), counts):
+            cumulative += count
+            samples.append(
+                ("_bucket", {**labels, "le": _format_value(bound)}, cumulative)
+            )
+        samples.append(("_sum", labels, total))
+        samples.append(("_count", labels, cumulative))
+        return samples
+
+
+_Metric_T = TypeVar("_Metric_T", Counter, Gauge, Histogram)
+Collector = Callable[[], list[Counter | Gauge | Histogram]]
+
+
+def cache_metrics(
+    name: str,
+    description: str,
+    hits: int,
+    misses: int,
+) -> list[Counter | Gauge | Histogram]:
+    """캐시의 적중/실패 횟수와 적중률 지표를 만듭니다."""
+    hit_counter = Counter(f"{name}_hits_total", f"{description} hits")
+    hit_counter.inc(hits)
+    miss_counter = Counter(f"{name}_misses_total", f"{description} misses")
+    miss_counter.inc(misses)
+    hit_ratio = Gauge(f"{name}_hit_ratio", f"{description} hits per lookup")
+    hit_ratio.set(hits / (hits + misses) if hits + misses else 0.0)
+    return [hit_counter, miss_counter, hit_ratio]
+
+
+class MetricsRegistry:
+    """프로세스 하나의 지표를 모아 Prometheus 텍스트 형식으로 내보냅니다.
+
+    같은 이름으로 다시 요청하면 이미 만든 지표를 돌려주므로, 요청마다 새로
+    만들어지는 객체도 생성자에서 지표를 얻어 쓸 수 있습니다. 캐시 통계처럼
+    수집 시점에 읽는 값은 수집기(collector)로 등록합니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+        self._collectors: dict[str, Collector] = {}
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+    ) -> Counter:
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+    ) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, label_names)
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """같은 이름의 수집기가 있으면 바꿔 끼웁니다."""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def render(self) -> str:
+        with self._lock:
+            metrics: list[Counter | Gauge | Histogram] = list(self._metrics.values())
+            collectors: list[Collector] = list(self._collectors.values())
+        for collector in collectors:
+            metrics.extend(collector())
+        return "".join(
+            line + "\n"
+            for metric in sorted(metrics, key=lambda metric: metric.name)
+            for line in metric.render()
+        )
+
+    def _get_or_create(
+        self,
+        metric_type: type[_Metric_T],
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...],
+    ) -> _Metric_T:
+        with self._lock:
+            metric: Counter | Gauge | Histogram | None = self._metrics.get(name)
+            if metric is None:
+                metric = metric_type(name, documentation, label_names)
+                self._metrics[name] = metric
+        if not isinstance(metric, metric_type) or metric.label_names != label_names:
+            raise ValueError(f"{name} is already registered differently")
+        return metric
@@ -0,0 +1,351 @@
+import struct
+import xml.etree.ElementTree as ElementTree
+import zlib
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Iterator
+
+from map_admin.application.services import MapNode, MapSource, MapWay
+from map_admin.domain.value_objects import Point, RoadQuality
+
+COORDINATE_QUANTUM = Decimal("0.0000001")
+
+WALKABLE_HIGHWAYS: frozenset[str] = frozenset(
+    {
+        "footway",
+        "path",
+        "pedestrian",
+        "steps",
+        "corridor",
+        "living_street",
+        "residential",
+        "service",
+        "track",
+        "unclassified",
+    }
+)
+_FOOT_ALLOWED: frozenset[str] = frozenset({"yes", "designated", "permissive"})
+
+SMOOTHNESS_QUALITIES: dict[str, RoadQuality] = {
+    "excellent": RoadQuality.HIGH,
+    "good": RoadQuality.HIGH,
+    "intermediate": RoadQuality.MEDIUM,
+    "bad": RoadQuality.LOW,
+    "very_bad": RoadQuality.LOW,
+    "horrible": RoadQuality.LOW,
+    "very_horrible": RoadQuality.LOW,
+    "impassable": RoadQuality.LOW,
+}
+SURFACE_QUALITIES: dict[str, RoadQuality] = {
+    "paved": RoadQuality.HIGH,
+    "asphalt": RoadQuality.HIGH,
+    "concrete": RoadQuality.HIGH,
+    "concrete:plates": RoadQuality.HIGH,
+    "paving_stones": RoadQuality.HIGH,
+    "chipseal": RoadQuality.HIGH,
+    "sett": RoadQuality.MEDIUM,
+    "bricks": RoadQuality.MEDIUM,
+    "wood": RoadQuality.MEDIUM,
+    "metal": RoadQuality.MEDIUM,
+    "compacted": RoadQuality.MEDIUM,
+    "fine_gravel": RoadQuality.MEDIUM,
+    "rubber": RoadQuality.MEDIUM,
+    "unpaved": RoadQuality.LOW,
+    "cobblestone": RoadQuality.LOW,
+    "unhewn_cobblestone": RoadQuality.LOW,
+    "gravel": RoadQuality.LOW,
+    "pebblestone": RoadQuality.LOW,
+    "ground": RoadQuality.LOW,
+    "dirt": RoadQuality.LOW,
+    "earth": RoadQuality.LOW,
+    "grass": RoadQuality.LOW,
+    "sand": RoadQuality.LOW,
+    "mud": RoadQuality.LOW,
+}
+
+
+def is_walkable(tags: dict[str, str]) -> bool:
+    if tags.get("area") == "yes":
+        return False
+    foot: str | None = tags.get("foot")
+    if foot in ("no", "private"):
+        return False
+    if tags.get("access") in ("no", "private") and foot not in _FOOT_ALLOWED:
+        return False
+    highway: str | None = tags.get("highway")
+    if highway is None:
+        return False
+    return highway in WALKABLE_HIGHWAYS or foot in _FOOT_ALLOWED
+
+
+def road_quality(tags: dict[str, str]) -> RoadQuality:
+    """`smoothness`를 우선 보고, 없으면 `surface`로 노면 품질을 정합니다."""
+    smoothness: str | None = tags.get("smoothness")
+    if smoothness in SMOOTHNESS_QUALITIES:
+        return SMOOTHNESS_QUALITIES[smoothness]
+    surface: str | None = tags.get("surface")
+    if surface in SURFACE_QUALITIES:
+        return SURFACE_QUALITIES[surface]
+    return RoadQuality.MEDIUM
+
+
+def is_step(tags: dict[str, str]) -> bool:
+    """턱이 있는 연석이나 단차 노드인지 확인합니다."""
+    kerb: str | None = tags.get("kerb")
+    if kerb == "raised":
+        return True
+    barrier: str | None = tags.get("barrier")
+    return barrier == "step" or (
+        barrier == "kerb" and kerb not in ("flush", "lowered", "no")
+    )
+
+
+@dataclass(kw_only=True)
+class _OsmElement:
+    id: int
+    tags: dict[str, str]
+    refs: list[int] = field(default_factory=list)
+    latitude: Decimal | None = None
+    longitude: Decimal | None = None
+
+
+def _read_xml(file_path: str, kind: str) -> Iterator[_OsmElement]:
+    """.osm XML을 iterparse로 훑으며, 처리한 원소는 바로 버립니다."""
+    context = iter(ElementTree.iterparse(file_path, events=("start", "end")))
+    _, root = next(context)
+    for event, element in context:
+        if event != "end" or element.tag not in ("node", "way", "relation"):
+            continue
+        if element.tag == kind:
+            tags: dict[str, str] = {
+                tag.get("k", ""): tag.get("v", "") for tag in element.iter("tag")
+            }
+            if kind == "node":
+                yield _OsmElement(
+                    id=int(element.get("id", "")),
+                    tags=tags,
+                    latitude=Decimal(element.get("lat", "")),
+                    longitude=Decimal(element.get("lon", "")),
+                )
+            else:
+                yield _OsmElement(
+                    id=int(element.get("id", "")),
+                    tags=tags,
+                    refs=[int(nd.get("ref", "")) for nd in element.iter("nd")],
+                )
+        root.clear()
+
+
+_Buffer = bytes | memoryview
+
+
+def _varint(buffer: _Buffer, position: int) -> tuple[int, int]:
+    result: int = 0
+    shift: int = 0
+    while True:
+        byte: int = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _varints(buffer: _Buffer) -> list[int]:
+    values: list[int] = []
+    position: int = 0
+    while position < len(buffer):
+        value, position = _varint(buffer, position)
+        values.append(value)
+    return values
+
+
+def _zigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _int64(value: int) -> int:
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _message(buffer: _Buffer) -> dict[int, list[Any]]:
+    """protobuf 메시지를 필드 번호별 값 목록으로 풉니다 (중첩 메시지는 바이트 그대로)."""
+    buffer = memoryview(buffer)
+    fields: dict[int, list[Any]] = {}
+    position: int = 0
+    while position < len(buffer):
+        key, position = _varint(buffer, position)
+        wire_type: int = key & 7
+        value: Any
+        if wire_type == 0:
+            value, position = _varint(buffer, position)
+        elif wire_type == 2:
+            length, position = _varint(buffer, position)
+            value = buffer[position : position + length]
+            position += length
+        elif wire_type in (1, 5):
+            size: int = 8 if wire_type == 1 else 4
+            value = buffer[position : position + size]
+            position += size
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire_type}")
+        fields.setdefault(key >> 3, []).append(value)
+    return fields
+
+
+def _packed(values: list[Any]) -> list[int]:
+    """packed/비packed 반복 정수 필드를 모두 정수 목록으로 만듭니다."""
+    result: list[int] = []
+    for value in values:
+        if isinstance(value, int):
+            result.append(value)
+        else:
+            result.extend(_varints(value))
+    return result
+
+
+def _deltas(values: list[int]) -> list[int]:
+    total: int = 0
+    result: list[int] = []
+    for value in values:
+        total += _zigzag(value)
+        result.append(total)
+    return result
+
+
+def _read_pbf(file_path: str, kind: str) -> Iterator[_OsmElement]:
+    """.osm.pbf를 블록 단위로 읽습니다 (압축은 raw/zlib만 지원합니다)."""
+    with open(file_path, "rb") as file:
+        while size_bytes := file.read(4):
+            if len(size_bytes) != 4:
+                raise ValueError("Truncated PBF file")
+            (header_size,) = struct.unpack(">I", size_bytes)
+            header: dict[int, list[Any]] = _message(file.read(header_size))
+            blob_type: str = bytes(header[1][0]).decode()
+            blob_bytes: bytes = file.read(header[3][0])
+            if blob_type != "OSMData":
+                continue
+            blob: dict[int, list[Any]] = _message(blob_bytes)
+            if 1 in blob:
+                data: bytes = bytes(blob[1][0])
+            elif 3 in blob:
+                data = zlib.decompress(blob[3][0])
+            else:
+                raise ValueError("Unsupported PBF blob compression")
+            yield from _read_block(_message(data), kind)
+
+
+def _read_block(block: dict[int, list[Any]], kind: str) -> Iterator[_OsmElement]:
+    strings: list[str] = [
+        bytes(string).decode("utf-8") for string in _message(block[1][0]).get(1, [])
+    ]
+    granularity: int = block.get(17, [100])[0]
+    lat_offset: int = _int64(block.get(19, [0])[0])
+    lon_offset: int = _int64(block.get(20, [0])[0])
+
+    def coordinate(offset: int, value: int) -> Decimal:
+        return (
+            Decimal(offset + granularity * value)
+            .scaleb(-9)
+            .quantize(COORDINATE_QUANTUM)
+        )
+
+    def tags(keys: list[int], values: list[int]) -> dict[str, str]:
+        return {strings[key]: strings[value] for key, value in zip(keys, values)}
+
+    for group_bytes in block.get(2, []):
+        group: dict[int, list[Any]] = _message(group_bytes)
+        if kind == "node":
+            for node_bytes in group.get(1, []):
+                node: dict[int, list[Any]] = _message(node_bytes)
+                yield _OsmElement(
+                    id=_zigzag(node[1][0]),
+                    tags=tags(_packed(node.get(2, [])), _packed(node.get(3, []))),
+                    latitude=coordinate(lat_offset, _zigzag(node[8][0])),
+                    longitude=coordinate(lon_offset, _zigzag(node[9][0])),
+                )
+            for dense_bytes in group.get(2, []):
+                yield from _read_dense_nodes(
+                    _message(dense_bytes), strings, coordinate, lat_offset, lon_offset
+                )
+        elif kind == "way":
+            for way_bytes in group.get(3, []):
+                way: dict[int, list[Any]] = _message(way_bytes)
+                yield _OsmElement(
+                    id=_int64(way[1][0]),
+                    tags=tags(_packed(way.get(2, [])), _packed(way.get(3, []))),
+                    refs=_deltas(_packed(way.get(8, []))),
+                )
+
+
+def _read_dense_nodes(
+    dense: dict[int, list[Any]],
+    strings: list[str],
+    coordinate: Any,
+    lat_offset: int,
+    lon_offset: int,
+) -> Iterator[_OsmElement]:
+    ids: list[int] = _deltas(_packed(dense.get(1, [])))
+    latitudes: list[int] = _deltas(_packed(dense.get(8, [])))
+    longitudes: list[int] = _deltas(_packed(dense.get(9, [])))
+    keys_values: list[int] = _packed(dense.get(10, []))
+    cursor: int = 0
+    for node_id, latitude, longitude in zip(ids, latitudes, longitudes):
+        # keys_vals holds "k v k v ... 0" per node, or nothing for the block
+        node_tags: dict[str, str] = {}
+        while cursor < len(keys_values) and keys_values[cursor] != 0:
+            node_tags[strings[keys_values[cursor]]] = strings[keys_values[cursor + 1]]
+            cursor += 2
+        cursor += 1
+        yield _OsmElement(
+            id=node_id,
+            tags=node_tags,
+            latitude=coordinate(lat_offset, latitude),
+            longitude=coordinate(lon_offset, longitude),
+        )
+
+
+class OsmMapSource(MapSource):
+    """로컬 OSM 추출본(.osm XML 또는 .osm.pbf)을 스트리밍으로 읽습니다.
+
+    길과 노드를 따로 훑으므로, 전체 노드를 메모리에 올리지 않고 보행 가능한
+    길이 참조하는 노드만 골라 읽을 수 있습니다.
+    """
+
+    def read_ways(self, file_path: str) -> Iterator[MapWay]:
+        for element in self._read(file_path, "way"):
+            if len(element.refs) < 2 or not is_walkable(element.tags):
+                continue
+            yield MapWay(
+                node_refs=element.refs,
+                is_stair=element.tags.get("highway") == "steps",
+                quality=road_quality(element.tags),
+            )
+
+    def read_nodes(self, file_path: str, refs: set[int]) -> Iterator[MapNode]:
+        for element in self._read(file_path, "node"):
+            if element.id not in refs:
+                continue
+            assert element.latitude is not None and element.longitude is not None
+            yield MapNode(
+                ref=element.id,
+                name=element.tags.get("name"),
+                point=Point(longitude=element.longitude, latitude=element.latitude),
+                is_step=is_step(element.tags),
+            )
+
+    def _read(self, file_path: str, kind: str) -> Iterator[_OsmElement]:
+        try:
+            if file_path.endswith(".pbf"):
+                yield from _read_pbf(file_path, kind)
+            else:
+                yield from _read_xml(file_path, kind)
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            IndexError,
+            ElementTree.ParseError,
+            zlib.error,
+        ):
+            raise super().MapSourceUnavailableError
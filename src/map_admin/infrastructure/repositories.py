@@ -1,13 +1,62 @@
+import fcntl
 import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
 from decimal import Decimal
-from typing import TypedDict
+from typing import Any, ContextManager, Iterator, NotRequired, Sequence, TypedDict
 
-from map_admin.application.repositories import NodeRepository
+from map_admin.application.repositories import GraphRepository, NodeRepository
 from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
 from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.infrastructure.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    cache_metrics,
+)
+from map_admin.infrastructure.tracing import Span, Tracer
+
+_held_locks = threading.local()
+
+
+@contextmanager
+def graph_file_lock(node_file_path: str) -> Iterator[None]:
+    """노드/간선 파일의 쓰기 잠금을 잡습니다.
+
+    노드 파일 옆의 잠금 파일에 거는 `flock`이라 다른 프로세스의 쓰기도
+    막습니다. 이미 잡은 스레드는 다시 잡을 수 있으므로, 저장소의 쓰기와 파일을
+    직접 다루는 작업을 한 잠금 안에 묶을 수 있습니다.
+    """
+    lock_path: str = os.path.abspath(f"{node_file_path}.lock")
+    held: set[str] = _held_locks.__dict__.setdefault("paths", set())
+    if lock_path in held:
+        yield
+        return
+    with open(lock_path, "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        held.add(lock_path)
+        try:
+            yield
+        finally:
+            held.discard(lock_path)
+            fcntl.flock(file, fcntl.LOCK_UN)
 
 
 class FakeNodeRepository(NodeRepository):
+    def get_version(self) -> str:
+        return "fake"
+
+    def locked(self) -> ContextManager[None]:
+        return nullcontext()
+
+    def get_written_versions(self) -> tuple[str, str] | None:
+        return ("fake", "fake")
+
     def get_next_id(self) -> int:
         return 3
 
@@ -25,7 +74,7 @@ class FakeNodeRepository(NodeRepository):
             ),
         ]
 
-    def get_node_by_id(self, node_id: int) -> Node:
+    def get_node_by_id(self, node_id: int, include_edges: bool = True) -> Node:
         if node_id == 1:
             return Node(
                 id=1,
@@ -41,6 +90,9 @@ class FakeNodeRepository(NodeRepository):
         else:
             raise super().NodeNotFoundError
 
+    def get_nodes_by_ids(self, node_ids: list[int]) -> list[Node]:
+        return [self.get_node_by_id(node_id) for node_id in node_ids]
+
     def create_node(self, node: Node) -> None:
         print(f"Create node: {node}")
 
@@ -50,12 +102,35 @@ class FakeNodeRepository(NodeRepository):
     def delete_node(self, node: Node) -> None:
         print(f"Delete node: {node}")
 
+    def add_edge(self, edge: Edge) -> None:
+        print(f"Add edge: {edge}")
+
+    def update_edge(self, edge: Edge) -> None:
+        print(f"Update edge: {edge}")
+
+    def remove_edge(self, edge: Edge) -> None:
+        print(f"Remove edge: {edge}")
+
+    def bulk_create_nodes(self, nodes: list[Node]) -> None:
+        print(f"Bulk create nodes: {nodes}")
+
+    def bulk_create_edges(self, edges: list[Edge]) -> None:
+        print(f"Bulk create edges: {edges}")
+
+    def bulk_update_nodes(self, nodes: list[Node]) -> None:
+        print(f"Bulk update nodes: {nodes}")
+
+    def bulk_update_edges(self, edges: list[Edge]) -> None:
+        print(f"Bulk update edges: {edges}")
+
 
 class FileNode(TypedDict):
     id: int
     name: str
     longitude: str
     latitude: str
+    elevation: NotRequired[str]
+    version: NotRequired[int]
 
 
 class FileEdge(TypedDict):
@@ -65,6 +140,81 @@ class FileEdge(TypedDict):
     is_stair: bool
     is_step: bool
     quality: str
+    version: NotRequired[int]
+
+
+def _to_point(node_dict: FileNode) -> Point:
+    elevation: str | None = node_dict.get("elevation")
+    return Point(
+        longitude=Decimal(node_dict["longitude"]),
+        latitude=Decimal(node_dict["latitude"]),
+        elevation=None if elevation is None else Decimal(elevation),
+    )
+
+
+def _to_edge(edge_dict: FileEdge) -> Edge:
+    return Edge(
+        node_ids=edge_dict["node_ids"],
+        vertical_distance=Decimal(edge_dict["vertical_distance"]),
+        horizontal_distance=Decimal(edge_dict["horizontal_distance"]),
+        is_stair=edge_dict["is_stair"],
+        is_step=edge_dict["is_step"],
+        quality=RoadQuality(edge_dict["quality"]),
+        version=edge_dict.get("version", 1),
+    )
+
+
+def _to_file_node(node: Node) -> FileNode:
+    node_dict = FileNode(
+        id=node.id,
+        name=node.name,
+        longitude=str(node.point.longitude),
+        latitude=str(node.point.latitude),
+    )
+    if node.point.elevation is not None:
+        node_dict["elevation"] = str(node.point.elevation)
+    # records never saved changed are left in the original format
+    if node.version > 1:
+        node_dict["version"] = node.version
+    return node_dict
+
+
+def _to_file_edge(edge: Edge) -> FileEdge:
+    edge_dict = FileEdge(
+        node_ids=edge.node_ids,
+        vertical_distance=str(edge.vertical_distance),
+        horizontal_distance=str(edge.horizontal_distance),
+        is_stair=edge.is_stair,
+        is_step=edge.is_step,
+        quality=edge.quality,
+    )
+    if edge.version > 1:
+        edge_dict["version"] = edge.version
+    return edge_dict
+
+
+def _edge_key(node_ids: Sequence[int]) -> tuple[int, ...]:
+    return tuple(sorted(node_ids))
+
+
+def _saved_version(
+    stored: FileNode | FileEdge | None,
+    saving: FileNode | FileEdge,
+) -> int:
+    """저장할 레코드의 버전을 정합니다. 내용이 바뀐 경우에만 하나 올립니다."""
+    if stored is None:
+        return saving.get("version", 1)
+
+    def fields(record: FileNode | FileEdge) -> dict[str, Any]:
+        fields: dict[str, Any] = {
+            key: value for key, value in record.items() if key != "version"
+        }
+        if "node_ids" in fields:
+            fields["node_ids"] = _edge_key(fields["node_ids"])
+        return fields
+
+    version: int = stored.get("version", 1)
+    return version if fields(stored) == fields(saving) else version + 1
 
 
 class FileNodeRepository(NodeRepository):
@@ -72,50 +222,81 @@ class FileNodeRepository(NodeRepository):
         self,
         node_file_path: str,
         edge_file_path: str,
+        metrics: MetricsRegistry | None = None,
+        tracer: Tracer | None = None,
     ) -> None:
         self.node_file_path = node_file_path
         self.edge_file_path = edge_file_path
+        self.metrics = metrics
+        self.tracer = tracer
+        self._held = threading.local()
+        if metrics is not None:
+            self._read_bytes = metrics.counter(
+                "node_repository_file_read_bytes_total",
+                "Bytes read from the node and edge files",
+                ("file",),
+            )
+            self._written_bytes = metrics.counter(
+                "node_repository_file_written_bytes_total",
+                "Bytes written to the node and edge files",
+                ("file",),
+            )
+            self._parse_seconds = metrics.histogram(
+                "node_repository_json_parse_seconds",
+                "Time spent parsing the node and edge files",
+                ("file",),
+            )
+            self._serialize_seconds = metrics.histogram(
+                "node_repository_json_serialize_seconds",
+                "Time spent serializing the node and edge files",
+                ("file",),
+            )
+            self._record_count = metrics.gauge(
+                "graph_records",
+                "Records in the node and edge files when last read or written",
+                ("file",),
+            )
+
+    def get_version(self) -> str:
+        return ":".join(
+            f"{stat.st_ino}-{stat.st_mtime_ns}-{stat.st_size}"
+            for stat in (os.stat(self.node_file_path), os.stat(self.edge_file_path))
+        )
+
+    def locked(self) -> ContextManager[None]:
+        return self._write_lock()
+
+    def get_written_versions(self) -> tuple[str, str] | None:
+        written: tuple[str, str] | None = getattr(self._held, "written", None)
+        return written
 
     def get_next_id(self) -> int:
-        with open(self.node_file_path, "r") as file:
-            nodes: list[FileNode] = json.load(file)
+        nodes: list[FileNode] = self._read_nodes()
 
         return max((node_dict["id"] for node_dict in nodes), default=0) + 1
 
     def get_all_nodes(self) -> list[Node]:
-        with open(self.node_file_path, "r") as file:
-            nodes: list[FileNode] = json.load(file)
+        nodes: list[FileNode] = self._read_nodes()
 
-        with open(self.edge_file_path, "r") as file:
-            edges: list[FileEdge] = json.load(file)
+        edges: list[FileEdge] = self._read_edges()
 
         return [
             Node(
                 id=node_dict["id"],
                 name=node_dict["name"],
-                point=Point(
-                    longitude=Decimal(node_dict["longitude"]),
-                    latitude=Decimal(node_dict["latitude"]),
-                ),
+                point=_to_point(node_dict),
                 edges=[
-                    Edge(
-                        node_ids=edge_dict["node_ids"],
-                        vertical_distance=Decimal(edge_dict["vertical_distance"]),
-                        horizontal_distance=Decimal(edge_dict["horizontal_distance"]),
-                        is_stair=edge_dict["is_stair"],
-                        is_step=edge_dict["is_step"],
-                        quality=RoadQuality(edge_dict["quality"]),
-                    )
+                    _to_edge(edge_dict)
                     for edge_dict in edges
                     if node_dict["id"] in edge_dict["node_ids"]
                 ],
+                version=node_dict.get("version", 1),
             )
             for node_dict in nodes
         ]
 
-    def get_node_by_id(self, node_id: int) -> Node:
-        with open(self.node_file_path, "r") as file:
-            nodes: list[FileNode] = json.load(file)
+    def get_node_by_id(self, node_id: int, include_edges: bool = True) -> Node:
+        nodes: list[FileNode] = self._read_nodes()
 
         try:
             node: FileNode = next(
@@ -124,95 +305,422 @@ class FileNodeRepository(NodeRepository):
         except StopIteration:
             raise super().NodeNotFoundError
 
-        with open(self.edge_file_path, "r") as file:
-            edges: list[FileEdge] = json.load(file)
+        # the edge file is not even opened for node-only reads
+        edges: list[FileEdge] = self._read_edges() if include_edges else []
 
         return Node(
             id=node["id"],
             name=node["name"],
-            point=Point(
-                longitude=Decimal(node["longitude"]),
-                latitude=Decimal(node["latitude"]),
-            ),
-            edges=[
-                Edge(
-                    node_ids=edge["node_ids"],
-                    vertical_distance=Decimal(edge["vertical_distance"]),
-                    horizontal_distance=Decimal(edge["horizontal_distance"]),
-                    is_stair=edge["is_stair"],
-                    is_step=edge["is_step"],
-                    quality=RoadQuality(edge["quality"]),
-                )
-                for edge in edges
-                if node["id"] in edge["node_ids"]
-            ],
+            point=_to_point(node),
+            edges=[_to_edge(edge) for edge in edges if node["id"] in edge["node_ids"]],
+            version=node.get("version", 1),
         )
 
+    def get_nodes_by_ids(self, node_ids: list[int]) -> list[Node]:
+        nodes: list[FileNode] = self._read_nodes()
+
+        wanted: set[int] = set(node_ids)
+        node_by_id: dict[int, FileNode] = {
+            node_dict["id"]: node_dict
+            for node_dict in nodes
+            if node_dict["id"] in wanted
+        }
+        if len(node_by_id) < len(wanted):
+            raise super().NodeNotFoundError
+
+        edges: list[FileEdge] = self._read_edges()
+
+        edges_by_node_id: dict[int, list[FileEdge]] = {}
+        for edge_dict in edges:
+            for node_id in dict.fromkeys(edge_dict["node_ids"]):
+                if node_id in node_by_id:
+                    edges_by_node_id.setdefault(node_id, []).append(edge_dict)
+
+        return [
+            Node(
+                id=node_id,
+                name=node_by_id[node_id]["name"],
+                point=_to_point(node_by_id[node_id]),
+                edges=[
+                    _to_edge(edge_dict)
+                    for edge_dict in edges_by_node_id.get(node_id, [])
+                ],
+                version=node_by_id[node_id].get("version", 1),
+            )
+            for node_id in node_ids
+        ]
+
     def create_node(self, node: Node) -> None:
-        with open(self.node_file_path, "r") as file:
-            nodes: list[FileNode] = json.load(file)
-
-        nodes.append(
-            {
-                "id": node.id,
-                "name": node.name,
-                "longitude": str(node.point.longitude),
-                "latitude": str(node.point.latitude),
+        with self._write_lock():
+            nodes: list[FileNode] = self._read_nodes()
+
+            nodes.append(_to_file_node(node))
+
+            self._write_nodes(nodes)
+
+    def update_node(self, node: Node) -> None:
+        with self._write_lock():
+            nodes: list[FileNode] = self._read_nodes()
+
+            index, stored_node = self._find_node(nodes, node.id)
+            if stored_node is None or stored_node.get("version", 1) != node.version:
+                raise super().VersionConflictError
+
+            node.version = _saved_version(stored_node, _to_file_node(node))
+            nodes[index] = _to_file_node(node)
+
+            self._write_nodes(nodes)
+
+    def delete_node(self, node: Node) -> None:
+        with self._write_lock():
+            nodes: list[FileNode] = self._read_nodes()
+
+            _, stored_node = self._find_node(nodes, node.id)
+            if stored_node is None:
+                return
+            if stored_node.get("version", 1) != node.version:
+                raise super().VersionConflictError
+
+            nodes = [node_dict for node_dict in nodes if node_dict["id"] != node.id]
+
+            self._write_nodes(nodes)
+
+            edges: list[FileEdge] = self._read_edges()
+
+            kept_edges: list[FileEdge] = [
+                edge_dict for edge_dict in edges if node.id not in edge_dict["node_ids"]
+            ]
+
+            # an isolated node leaves the edge file as it is
+            if len(kept_edges) != len(edges):
+                self._write_edges(kept_edges)
+
+    def add_edge(self, edge: Edge) -> None:
+        with self._write_lock():
+            nodes: list[FileNode] = self._read_nodes()
+
+            if any(
+                self._find_node(nodes, node_id)[1] is None for node_id in edge.node_ids
+            ):
+                raise super().NodeNotFoundError
+
+            edges: list[FileEdge] = self._read_edges()
+
+            if self._find_edge(edges, edge.node_ids)[1] is not None:
+                raise super().VersionConflictError
+
+            edges.append(_to_file_edge(edge))
+
+            self._write_edges(edges)
+
+    def update_edge(self, edge: Edge) -> None:
+        with self._write_lock():
+            edges: list[FileEdge] = self._read_edges()
+
+            index, stored_edge = self._find_edge(edges, edge.node_ids)
+            if stored_edge is None:
+                raise super().EdgeNotFoundError
+            if stored_edge.get("version", 1) != edge.version:
+                raise super().VersionConflictError
+
+            edge.version = _saved_version(stored_edge, _to_file_edge(edge))
+            edges[index] = _to_file_edge(edge)
+            # the stored orientation is kept
+            edges[index]["node_ids"] = stored_edge["node_ids"]
+
+            self._write_edges(edges)
+
+    def remove_edge(self, edge: Edge) -> None:
+        with self._write_lock():
+            edges: list[FileEdge] = self._read_edges()
+
+            index, stored_edge = self._find_edge(edges, edge.node_ids)
+            if stored_edge is None:
+                return
+            if stored_edge.get("version", 1) != edge.version:
+                raise super().VersionConflictError
+
+            del edges[index]
+
+            self._write_edges(edges)
+
+    def bulk_create_nodes(self, nodes: list[Node]) -> None:
+        with self._write_lock():
+            node_dicts: list[FileNode] = self._read_nodes()
+
+            node_dicts.extend(_to_file_node(node) for node in nodes)
+
+            self._write_nodes(node_dicts)
+
+    def bulk_create_edges(self, edges: list[Edge]) -> None:
+        with self._write_lock():
+            edge_dicts: list[FileEdge] = self._read_edges()
+
+            edge_dicts.extend(_to_file_edge(edge) for edge in edges)
+
+            self._write_edges(edge_dicts)
+
+    def bulk_update_nodes(self, nodes: list[Node]) -> None:
+        with self._write_lock():
+            node_dicts: list[FileNode] = self._read_nodes()
+
+            node_by_id: dict[int, Node] = {node.id: node for node in nodes}
+            for index, node_dict in enumerate(node_dicts):
+                node: Node | None = node_by_id.get(node_dict["id"])
+                if node is None:
+                    continue
+                node.version = _saved_version(node_dict, _to_file_node(node))
+                node_dicts[index] = _to_file_node(node)
+
+            self._write_nodes(node_dicts)
+
+    def bulk_update_edges(self, edges: list[Edge]) -> None:
+        with self._write_lock():
+            edge_dicts: list[FileEdge] = self._read_edges()
+
+            edge_by_node_ids: dict[tuple[int, ...], Edge] = {
+                _edge_key(edge.node_ids): edge for edge in edges
             }
+            for edge_dict in edge_dicts:
+                edge: Edge | None = edge_by_node_ids.get(
+                    _edge_key(edge_dict["node_ids"])
+                )
+                if edge is None:
+                    continue
+                edge.version = _saved_version(edge_dict, _to_file_edge(edge))
+                edge_dict["vertical_distance"] = str(edge.vertical_distance)
+                edge_dict["horizontal_distance"] = str(edge.horizontal_distance)
+                edge_dict["is_stair"] = edge.is_stair
+                edge_dict["is_step"] = edge.is_step
+                edge_dict["quality"] = edge.quality
+                if edge.version > 1:
+                    edge_dict["version"] = edge.version
+
+            self._write_edges(edge_dicts)
+
+    @staticmethod
+    def _find_node(
+        nodes: list[FileNode],
+        node_id: int,
+    ) -> tuple[int, FileNode | None]:
+        for index, node_dict in enumerate(nodes):
+            if node_dict["id"] == node_id:
+                return index, node_dict
+        return -1, None
+
+    @staticmethod
+    def _find_edge(
+        edges: list[FileEdge],
+        node_ids: Sequence[int],
+    ) -> tuple[int, FileEdge | None]:
+        key: tuple[int, ...] = _edge_key(node_ids)
+        for index, edge_dict in enumerate(edges):
+            if _edge_key(edge_dict["node_ids"]) == key:
+                return index, edge_dict
+        return -1, None
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        # held over each read-modify-write, so that the version checks of
+        # writers in other workers see each other's writes
+        with graph_file_lock(self.node_file_path):
+            if getattr(self._held, "locked", False):
+                # already held by this thread through `locked`
+                yield
+                return
+            self._held.locked = True
+            # the writes made while it is held count as one
+            self._held.before = None
+            self._held.written = None
+            try:
+                yield
+            finally:
+                self._held.locked = False
+
+    def _read_nodes(self) -> list[FileNode]:
+        nodes: list[FileNode] = self._read(self.node_file_path, "node")
+        return nodes
+
+    def _read_edges(self) -> list[FileEdge]:
+        edges: list[FileEdge] = self._read(self.edge_file_path, "edge")
+        return edges
+
+    def _write_nodes(self, nodes: list[FileNode]) -> None:
+        self._write(self.node_file_path, "node", nodes)
+
+    def _write_edges(self, edges: list[FileEdge]) -> None:
+        self._write(self.edge_file_path, "edge", edges)
+
+    def _read(self, path: str, label: str) -> Any:
+        with self._span("file.read", label) as span:
+            with open(path, "rb") as file:
+                payload: bytes = file.read()
+            if span is not None:
+                span.set_attribute("file.bytes", len(payload))
+        with self._span("json.parse", label):
+            started: float = time.perf_counter()
+            records: list[Any] = json.loads(payload)
+            elapsed: float = time.perf_counter() - started
+        if self.metrics is not None:
+            self._parse_seconds.labels(label).observe(elapsed)
+            self._read_bytes.labels(label).inc(len(payload))
+            self._record_count.labels(label).set(len(records))
+        return records
+
+    def _write(self, path: str, label: str, records: list[Any]) -> None:
+        with self._span("json.serialize", label):
+            started: float = time.perf_counter()
+            payload: bytes = json.dumps(records, indent=4).encode()
+            elapsed: float = time.perf_counter() - started
+        if self.metrics is not None:
+            self._serialize_seconds.labels(label).observe(elapsed)
+            self._written_bytes.labels(label).inc(len(payload))
+            self._record_count.labels(label).set(len(records))
+        with self._span("file.write", label) as span:
+            if span is not None:
+                span.set_attribute("file.bytes", len(payload))
+            # replaced in one step, so readers in other workers never parse a
+            # half-written file
+            with tempfile.NamedTemporaryFile(
+                "wb",
+                dir=os.path.dirname(os.path.abspath(path)),
+                suffix=".tmp",
+                delete=False,
+            ) as file:
+                file.write(payload)
+            if self._held.before is None:
+                self._held.before = self.get_version()
+            os.replace(file.name, path)
+            self._held.written = (self._held.before, self.get_version())
+
+    def _span(self, name: str, label: str) -> ContextManager[Span | None]:
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, {"file": label})
+
+
+class InstrumentedNodeRepository(NodeRepository):
+    """감싼 노드 저장소의 메서드별 실행 시간을 기록하고 스팬으로 남깁니다."""
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        metrics: MetricsRegistry,
+        tracer: Tracer | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.tracer = tracer
+        self._seconds: Histogram = metrics.histogram(
+            "node_repository_operation_seconds",
+            "Time spent in each NodeRepository method",
+            ("method",),
         )
 
-        with open(self.node_file_path, "w") as file:
-            json.dump(nodes, file, indent=4)
+    @contextmanager
+    def _timed(self, method: str) -> Iterator[None]:
+        started: float = time.perf_counter()
+        try:
+            if self.tracer is None:
+                yield
+            else:
+                with self.tracer.span(f"NodeRepository.{method}"):
+                    yield
+        finally:
+            self._seconds.labels(method).observe(time.perf_counter() - started)
 
-    def update_node(self, node: Node) -> None:
-        with open(self.node_file_path, "r") as file:
-            nodes: list[FileNode] = json.load(file)
-
-        for node_dict in nodes:
-            if node_dict["id"] == node.id:
-                node_dict["name"] = node.name
-                node_dict["longitude"] = str(node.point.longitude)
-                node_dict["latitude"] = str(node.point.latitude)
-                break
-
-        with open(self.node_file_path, "w") as file:
-            json.dump(nodes, file, indent=4)
-
-        with open(self.edge_file_path, "r") as file:
-            edges: list[FileEdge] = json.load(file)
-
-        edges = [
-            edge_dict for edge_dict in edges if node.id not in edge_dict["node_ids"]
-        ] + [
-            FileEdge(
-                node_ids=edge.node_ids,
-                vertical_distance=str(edge.vertical_distance),
-                horizontal_distance=str(edge.horizontal_distance),
-                is_stair=edge.is_stair,
-                is_step=edge.is_step,
-                quality=edge.quality,
-            )
-            for edge in node.edges
-        ]
+    def get_version(self) -> str:
+        with self._timed("get_version"):
+            return self.node_repo.get_version()
+
+    def locked(self) -> ContextManager[None]:
+        return self.node_repo.locked()
+
+    def get_written_versions(self) -> tuple[str, str] | None:
+        return self.node_repo.get_written_versions()
+
+    def get_next_id(self) -> int:
+        with self._timed("get_next_id"):
+            return self.node_repo.get_next_id()
+
+    def get_all_nodes(self) -> list[Node]:
+        with self._timed("get_all_nodes"):
+            return self.node_repo.get_all_nodes()
+
+    def get_node_by_id(self, node_id: int, include_edges: bool = True) -> Node:
+        with self._timed("get_node_by_id"):
+            return self.node_repo.get_node_by_id(node_id, include_edges)
 
-        with open(self.edge_file_path, "w") as file:
-            json.dump(edges, file, indent=4)
+    def get_nodes_by_ids(self, node_ids: list[int]) -> list[Node]:
+        with self._timed("get_nodes_by_ids"):
+            return self.node_repo.get_nodes_by_ids(node_ids)
+
+    def create_node(self, node: Node) -> None:
+        with self._timed("create_node"):
+            self.node_repo.create_node(node)
+
+    def update_node(self, node: Node) -> None:
+        with self._timed("update_node"):
+            self.node_repo.update_node(node)
 
     def delete_node(self, node: Node) -> None:
-        with open(self.node_file_path, "r") as file:
-            nodes: list[FileNode] = json.load(file)
+        with self._timed("delete_node"):
+            self.node_repo.delete_node(node)
 
-        nodes = [node_dict for node_dict in nodes if node_dict["id"] != node.id]
+    def add_edge(self, edge: Edge) -> None:
+        with self._timed("add_edge"):
+            self.node_repo.add_edge(edge)
 
-        with open(self.node_file_path, "w") as file:
-            json.dump(nodes, file, indent=4)
+    def update_edge(self, edge: Edge) -> None:
+        with self._timed("update_edge"):
+            self.node_repo.update_edge(edge)
 
-        with open(self.edge_file_path, "r") as file:
-            edges: list[FileEdge] = json.load(file)
+    def remove_edge(self, edge: Edge) -> None:
+        with self._timed("remove_edge"):
+            self.node_repo.remove_edge(edge)
 
-        edges = [
-            edge_dict for edge_dict in edges if node.id not in edge_dict["node_ids"]
-        ]
+    def bulk_create_nodes(self, nodes: list[Node]) -> None:
+        with self._timed("bulk_create_nodes"):
+            self.node_repo.bulk_create_nodes(nodes)
+
+    def bulk_create_edges(self, edges: list[Edge]) -> None:
+        with self._timed("bulk_create_edges"):
+            self.node_repo.bulk_create_edges(edges)
+
+    def bulk_update_nodes(self, nodes: list[Node]) -> None:
+        with self._timed("bulk_update_nodes"):
+            self.node_repo.bulk_update_nodes(nodes)
+
+    def bulk_update_edges(self, edges: list[Edge]) -> None:
+        with self._timed("bulk_update_edges"):
+            self.node_repo.bulk_update_edges(edges)
+
+
+class CachedGraphRepository(GraphRepository):
+    """노드 저장소의 버전이 바뀔 때만 그래프를 다시 만드는 저장소"""
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self._graph: AccessibilityGraph | None = None
+        self._hits: int = 0
+        self._misses: int = 0
+        if metrics is not None:
+            metrics.register_collector("graph_cache", self._collect_metrics)
+
+    def get_graph(self) -> AccessibilityGraph:
+        version: str = self.node_repo.get_version()
+        if self._graph is None or self._graph.version != version:
+            self._misses += 1
+            self._graph = AccessibilityGraph(
+                nodes=self.node_repo.get_all_nodes(),
+                version=version,
+            )
+        else:
+            self._hits += 1
+        return self._graph
 
-        with open(self.edge_file_path, "w") as file:
-            json.dump(edges, file, indent=4)
+    def _collect_metrics(self) -> list[Counter | Gauge | Histogram]:
+        return cache_metrics("graph_cache", "Graph cache", self._hits, self._misses)
@@ -0,0 +1,120 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Iterator
+
+from map_admin.application.services import RouteMatrixCalculator
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import AccessibilityProfile
+
+_worker_graph: AccessibilityGraph | None = None
+
+# forking a threaded server can copy a lock held by another thread into the
+# worker; forkserver starts workers from a clean single-threaded process
+_mp_context = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _initialize_worker(graph: AccessibilityGraph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _compute_rows(
+    source_ids: list[int],
+    target_ids: list[int],
+    profile: AccessibilityProfile,
+) -> list[list[float]]:
+    assert _worker_graph is not None
+    return [
+        _worker_graph.distances(source_id, target_ids, profile)
+        for source_id in source_ids
+    ]
+
+
+class ProcessPoolRouteMatrixCalculator(RouteMatrixCalculator):
+    """출발 노드를 나누어 프로세스 풀에서 행렬의 행을 병렬로 계산합니다.
+
+    그래프는 풀을 만들 때 워커마다 한 번만 전달하고, 그래프가 바뀌기 전까지
+    같은 풀을 재사용합니다. 그래프가 바뀌어 새로 만든 풀로 넘어가도, 이전 풀은
+    그 풀에서 계산 중인 요청이 모두 끝난 뒤에 닫습니다. 출발 노드가 적으면 현재
+    프로세스에서 계산합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        min_parallel_sources: int = 32,
+    ) -> None:
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.min_parallel_sources = min_parallel_sources
+        self._lock = threading.Lock()
+        self._executor: Executor | None = None
+        self._graph: AccessibilityGraph | None = None
+        # computations still mapping rows on each pool
+        self._users: dict[Executor, int] = {}
+
+    def compute(
+        self,
+        graph: AccessibilityGraph,
+        source_ids: list[int],
+        target_ids: list[int],
+        profile: AccessibilityProfile,
+    ) -> list[list[float]]:
+        if self.max_workers == 1 or len(source_ids) < self.min_parallel_sources:
+            return [
+                graph.distances(source_id, target_ids, profile)
+                for source_id in source_ids
+            ]
+
+        # a few chunks per worker keeps the pool busy when rows differ in cost
+        chunk_size: int = max(1, -(-len(source_ids) // (self.max_workers * 4)))
+        chunks: list[list[int]] = [
+            source_ids[start : start + chunk_size]
+            for start in range(0, len(source_ids), chunk_size)
+        ]
+        with self._using(graph) as executor:
+            return [
+                row
+                for rows in executor.map(
+                    _compute_rows, chunks, repeat(target_ids), repeat(profile)
+                )
+                for row in rows
+            ]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._graph = None
+
+    @contextmanager
+    def _using(self, graph: AccessibilityGraph) -> Iterator[Executor]:
+        with self._lock:
+            if self._executor is None or self._graph is not graph:
+                if self._executor is not None and self._executor not in self._users:
+                    self._executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=_mp_context,
+                    initializer=_initialize_worker,
+                    initargs=(graph,),
+                )
+                self._graph = graph
+            executor: Executor = self._executor
+            self._users[executor] = self._users.get(executor, 0) + 1
+        try:
+            yield executor
+        finally:
+            with self._lock:
+                self._users[executor] -= 1
+                if not self._users[executor]:
+                    del self._users[executor]
+                    if executor is not self._executor:
+                        # replaced while in use; the last user closes it
+                        executor.shutdown(wait=False)
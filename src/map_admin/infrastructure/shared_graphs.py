@@ -0,0 +1,267 @@
+import fcntl
+import json
+import struct
+import tempfile
+import threading
+from array import array
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from map_admin.application.repositories import GraphRepository, NodeRepository
+from map_admin.domain.graphs import GRAPH_COLUMNS, AccessibilityGraph
+from map_admin.domain.value_objects import AccessibilityProfile
+from map_admin.infrastructure.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    cache_metrics,
+)
+
+# control block: the generation of the segment currently published
+_GENERATION = struct.Struct("<Q")
+# segment: header length, JSON header, then the 8-byte aligned columns
+_HEADER_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+_COSTS_PREFIX = "costs:"
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _untrack(segment: shared_memory.SharedMemory) -> None:
+    # the resource tracker unlinks every segment a process touched when it
+    # exits, which would pull the graph out from under the other workers;
+    # it tracks POSIX names with the leading slash that `name` leaves out
+    resource_tracker.unregister(f"/{segment.name}", "shared_memory")
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    with open(path, "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def _open(name: str, size: int = 0) -> shared_memory.SharedMemory:
+    segment = shared_memory.SharedMemory(name=name, create=size > 0, size=size)
+    _untrack(segment)
+    return segment
+
+
+class SharedAccessibilityGraph(AccessibilityGraph):
+    """공유 메모리 세그먼트 위의 열을 읽기 전용으로 가리키는 그래프
+
+    세그먼트는 그래프가 사라질 때 닫으므로, 열을 그래프보다 오래 붙잡아 두면
+    안 됩니다. 다른 프로세스로 넘길 때는 열을 복사한 일반 그래프가 됩니다.
+    """
+
+    _segment: shared_memory.SharedMemory
+
+    def __del__(self) -> None:
+        segment: shared_memory.SharedMemory | None = self.__dict__.get("_segment")
+        # the columns are views of the mapping, which cannot be closed while
+        # any of them is alive
+        self.__dict__.clear()
+        if segment is not None:
+            segment.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            AccessibilityGraph.from_columns,
+            (
+                {
+                    name: array(GRAPH_COLUMNS[name], column)
+                    for name, column in self.columns().items()
+                },
+                self.version,
+            ),
+        )
+
+
+def write_segment(
+    graph: AccessibilityGraph,
+    name: str,
+) -> shared_memory.SharedMemory:
+    """그래프의 열과 프로필별 비용 배열을 새 세그먼트 하나에 씁니다."""
+    columns: list[tuple[str, str, Sequence[float]]] = [
+        (column_name, GRAPH_COLUMNS[column_name], column)
+        for column_name, column in graph.columns().items()
+    ] + [
+        (f"{_COSTS_PREFIX}{profile.value}", "d", graph.costs(profile))
+        for profile in AccessibilityProfile
+    ]
+
+    entries: list[tuple[str, str, int, int]] = []
+    offset: int = 0
+    for column_name, typecode, column in columns:
+        entries.append((column_name, typecode, offset, len(column)))
+        offset = _align(offset + len(column) * array(typecode).itemsize)
+    header: bytes = json.dumps({"version": graph.version, "columns": entries}).encode()
+    data_offset: int = _align(_HEADER_LENGTH.size + len(header))
+
+    segment = _open(name, size=max(1, data_offset + offset))
+    _HEADER_LENGTH.pack_into(segment.buf, 0, len(header))
+    segment.buf[_HEADER_LENGTH.size : _HEADER_LENGTH.size + len(header)] = header
+    for (_, typecode, column), (_, _, column_offset, _) in zip(columns, entries):
+        data: bytes = array(typecode, column).tobytes()
+        start: int = data_offset + column_offset
+        segment.buf[start : start + len(data)] = data
+    return segment
+
+
+def read_segment(segment: shared_memory.SharedMemory) -> SharedAccessibilityGraph:
+    """세그먼트를 복사하지 않고 그래프로 읽습니다. 세그먼트는 그래프가 닫습니다."""
+    buf: memoryview = segment.buf.toreadonly()
+    (header_length,) = _HEADER_LENGTH.unpack_from(buf, 0)
+    header: dict[str, Any] = json.loads(
+        bytes(buf[_HEADER_LENGTH.size : _HEADER_LENGTH.size + header_length])
+    )
+    data_offset: int = _align(_HEADER_LENGTH.size + header_length)
+
+    views: dict[str, memoryview] = {}
+    for column_name, typecode, offset, length in header["columns"]:
+        start: int = data_offset + offset
+        end: int = start + length * array(typecode).itemsize
+        views[column_name] = buf[start:end].cast(typecode)
+
+    graph = SharedAccessibilityGraph.from_columns(
+        columns=views,
+        version=header["version"],
+        costs={
+            profile: views[f"{_COSTS_PREFIX}{profile.value}"]
+            for profile in AccessibilityProfile
+        },
+    )
+    assert isinstance(graph, SharedAccessibilityGraph)
+    graph._segment = segment
+    return graph
+
+
+class SharedMemoryGraphRepository(GraphRepository):
+    """여러 워커 프로세스가 공유 메모리에 올린 그래프 하나를 함께 읽는 저장소
+
+    그래프는 세대(generation)마다 새 세그먼트(`{name}-{세대}`)에 쓰고, 작은
+    제어 블록(`{name}`)의 세대 번호를 바꿔 원자적으로 교체합니다. 워커는
+    세그먼트를 복사 없이 읽기 전용으로 매핑하므로 워커를 늘려도 그래프가
+    차지하는 메모리는 하나뿐이고, 요청마다 파일을 파싱하지 않습니다.
+
+    노드 저장소의 버전이 게시된 그래프와 다르면 파일 잠금을 먼저 잡은
+    프로세스가 리더가 되어 그래프를 다시 만들어 게시하고, 나머지는 잠금을
+    기다렸다가 새 세그먼트를 매핑합니다. 이전 세그먼트는 교체 직후 이름만
+    지우므로, 이미 매핑한 워커는 처리 중인 요청을 그대로 마칩니다. 마지막
+    세그먼트는 프로세스가 끝나도 남아, 파일이 그대로면 다음 기동 때 재사용됩니다.
+    """
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        name: str,
+        lock_file_path: Path | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self.name = name
+        self.lock_file_path: Path = lock_file_path or (
+            Path(tempfile.gettempdir()) / f"{name}.lock"
+        )
+        self._lock = threading.Lock()
+        self._control: shared_memory.SharedMemory | None = None
+        self._graph: SharedAccessibilityGraph | None = None
+        self._generation: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._rebuilds: int = 0
+        if metrics is not None:
+            metrics.register_collector("graph_cache", self._collect_metrics)
+
+    def get_graph(self) -> AccessibilityGraph:
+        version: str = self.node_repo.get_version()
+        graph: SharedAccessibilityGraph | None = self._graph
+        if graph is not None and graph.version == version:
+            self._hits += 1
+            return graph
+
+        with self._lock:
+            self._misses += 1
+            found: tuple[int, SharedAccessibilityGraph] | None = self._attach(version)
+            if found is None:
+                with _file_lock(self.lock_file_path):
+                    # another worker may have published while we waited
+                    found = self._attach(version) or self._publish(version)
+            self._generation, self._graph = found
+            return self._graph
+
+    def _attach(self, version: str) -> tuple[int, SharedAccessibilityGraph] | None:
+        generation: int = self._published_generation()
+        if generation == 0:
+            return None
+        if self._graph is not None and self._generation == generation:
+            graph: SharedAccessibilityGraph = self._graph
+        else:
+            try:
+                graph = read_segment(_open(self._segment_name(generation)))
+            except FileNotFoundError:
+                # replaced and unlinked between reading the control block
+                # and opening the segment
+                return None
+        return (generation, graph) if graph.version == version else None
+
+    def _publish(self, version: str) -> tuple[int, SharedAccessibilityGraph]:
+        graph = AccessibilityGraph(
+            nodes=self.node_repo.get_all_nodes(),
+            version=version,
+        )
+        generation: int = self._published_generation() + 1
+        segment = write_segment(graph, self._segment_name(generation))
+        _GENERATION.pack_into(self._get_control().buf, 0, generation)
+        self._unlink(generation - 1)
+        self._rebuilds += 1
+        return generation, read_segment(segment)
+
+    def _published_generation(self) -> int:
+        (generation,) = _GENERATION.unpack_from(self._get_control().buf, 0)
+        return int(generation)
+
+    def _get_control(self) -> shared_memory.SharedMemory:
+        if self._control is None:
+            with _file_lock(self.lock_file_path):
+                try:
+                    self._control = _open(self.name)
+                except FileNotFoundError:
+                    self._control = _open(self.name, size=_GENERATION.size)
+        return self._control
+
+    def _segment_name(self, generation: int) -> str:
+        return f"{self.name}-{generation}"
+
+    def _unlink(self, generation: int) -> None:
+        try:
+            # tracked, so that unlink() leaves the resource tracker balanced
+            segment = shared_memory.SharedMemory(name=self._segment_name(generation))
+        except FileNotFoundError:
+            return
+        segment.close()
+        segment.unlink()
+
+    def _collect_metrics(self) -> list[Counter | Gauge | Histogram]:
+        generation = Gauge(
+            "shared_graph_generation", "Generation of the shared graph segment"
+        )
+        generation.set(self._generation)
+        rebuilds = Counter(
+            "shared_graph_rebuilds_total",
+            "Shared graph segments built and published by this process",
+        )
+        rebuilds.inc(self._rebuilds)
+        return [
+            *cache_metrics("graph_cache", "Graph cache", self._hits, self._misses),
+            generation,
+            rebuilds,
+        ]
@@ -0,0 +1,381 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import ContextManager, Iterable, Iterator, Mapping
+
+from map_admin.application.repositories import NodeRepository
+from map_admin.domain.entities import Edge, Node
+from map_admin.infrastructure.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    cache_metrics,
+)
+
+# node ids per bucket; a write copies only the buckets it touches
+BUCKET_SIZE = 256
+
+
+def _bucket_of(node_id: int) -> int:
+    return node_id // BUCKET_SIZE
+
+
+def _copy_edge(edge: Edge) -> Edge:
+    return Edge(
+        node_ids=(edge.node_ids[0], edge.node_ids[1]),
+        vertical_distance=edge.vertical_distance,
+        horizontal_distance=edge.horizontal_distance,
+        is_stair=edge.is_stair,
+        is_step=edge.is_step,
+        quality=edge.quality,
+        version=edge.version,
+    )
+
+
+def _copy_node(node: Node, edges: Iterable[Edge] | None = None) -> Node:
+    return Node(
+        id=node.id,
+        name=node.name,
+        point=node.point,
+        edges=[_copy_edge(edge) for edge in (node.edges if edges is None else edges)],
+        version=node.version,
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class GraphSnapshot:
+    """한 버전의 노드와 간선을 담은 불변 스냅숏
+
+    노드는 ID를 `BUCKET_SIZE`개씩 나눈 버킷에 담습니다. 다음 스냅숏은 바뀐
+    노드가 속한 버킷만 복사하고 나머지 버킷은 그대로 공유합니다. 스냅숏에
+    담긴 노드는 밖으로 내보내지 않고 항상 복사본을 돌려줍니다.
+    """
+
+    version: str
+    buckets: Mapping[int, Mapping[int, Node]]
+
+    @classmethod
+    def from_nodes(cls, nodes: Iterable[Node], version: str) -> "GraphSnapshot":
+        buckets: dict[int, dict[int, Node]] = {}
+        for node in nodes:
+            buckets.setdefault(_bucket_of(node.id), {})[node.id] = _copy_node(node)
+        return cls(
+            version=version,
+            buckets=MappingProxyType(
+                {key: MappingProxyType(bucket) for key, bucket in buckets.items()}
+            ),
+        )
+
+    @property
+    def max_node_id(self) -> int:
+        if not self.buckets:
+            return 0
+        return max(self.buckets[max(self.buckets)])
+
+    def get(self, node_id: int) -> Node | None:
+        return self.buckets.get(_bucket_of(node_id), {}).get(node_id)
+
+    def nodes(self) -> Iterator[Node]:
+        """노드를 ID 순서로 돌려줍니다."""
+        for key in sorted(self.buckets):
+            bucket: Mapping[int, Node] = self.buckets[key]
+            for node_id in sorted(bucket):
+                yield bucket[node_id]
+
+
+class _SnapshotBuilder:
+    """스냅숏에 쓰기를 반영해 다음 스냅숏을 만듭니다 (copy-on-write).
+
+    `FileNodeRepository`가 파일에 반영하는 것과 같은 결과가 되도록 노드마다
+    그 노드에 닿는 간선을 파일 순서대로 유지합니다. 버전은 감싼 저장소가
+    저장하면서 노드와 간선에 적어 준 값을 그대로 씁니다.
+    """
+
+    def __init__(self, snapshot: GraphSnapshot) -> None:
+        self._buckets: dict[int, Mapping[int, Node]] = dict(snapshot.buckets)
+        self._copied: dict[int, dict[int, Node]] = {}
+
+    def build(self, version: str) -> GraphSnapshot:
+        return GraphSnapshot(
+            version=version,
+            buckets=MappingProxyType(
+                {
+                    key: MappingProxyType(bucket) if key in self._copied else bucket
+                    for key, bucket in self._buckets.items()
+                    if bucket
+                }
+            ),
+        )
+
+    def create_node(self, node: Node) -> None:
+        self._put(_copy_node(node, edges=[]))
+
+    def delete_node(self, node: Node) -> None:
+        previous: Node | None = self._get(node.id)
+        if previous is None:
+            return
+        for edge in previous.edges:
+            for node_id in edge.node_ids:
+                neighbour: Node | None = self._get(node_id)
+                if node_id != node.id and neighbour is not None:
+                    self._put(
+                        _copy_node(
+                            neighbour,
+                            edges=[
+                                other_edge
+                                for other_edge in neighbour.edges
+                                if node.id not in other_edge.node_ids
+                            ],
+                        )
+                    )
+        self._bucket(node.id).pop(node.id)
+
+    def create_edge(self, edge: Edge) -> None:
+        for node_id in dict.fromkeys(edge.node_ids):
+            node: Node | None = self._get(node_id)
+            if node is not None:
+                self._put(_copy_node(node, edges=[*node.edges, edge]))
+
+    def remove_edge(self, edge: Edge) -> None:
+        key: list[int] = sorted(edge.node_ids)
+        for node_id in dict.fromkeys(edge.node_ids):
+            node: Node | None = self._get(node_id)
+            if node is not None:
+                self._put(
+                    _copy_node(
+                        node,
+                        edges=[
+                            previous
+                            for previous in node.edges
+                            if sorted(previous.node_ids) != key
+                        ],
+                    )
+                )
+
+    def update_node_fields(self, node: Node) -> None:
+        previous: Node | None = self._get(node.id)
+        if previous is not None:
+            self._put(
+                Node(
+                    id=node.id,
+                    name=node.name,
+                    point=node.point,
+                    edges=previous.edges,
+                    version=node.version,
+                )
+            )
+
+    def update_edge(self, edge: Edge) -> None:
+        key: list[int] = sorted(edge.node_ids)
+        for node_id in dict.fromkeys(edge.node_ids):
+            node: Node | None = self._get(node_id)
+            if node is None:
+                continue
+            self._put(
+                _copy_node(
+                    node,
+                    edges=[
+                        (
+                            Edge(
+                                node_ids=previous.node_ids,
+                                vertical_distance=edge.vertical_distance,
+                                horizontal_distance=edge.horizontal_distance,
+                                is_stair=edge.is_stair,
+                                is_step=edge.is_step,
+                                quality=edge.quality,
+                                version=edge.version,
+                            )
+                            if sorted(previous.node_ids) == key
+                            else previous
+                        )
+                        for previous in node.edges
+                    ],
+                )
+            )
+
+    def _get(self, node_id: int) -> Node | None:
+        return self._buckets.get(_bucket_of(node_id), {}).get(node_id)
+
+    def _put(self, node: Node) -> None:
+        self._bucket(node.id)[node.id] = node
+
+    def _bucket(self, node_id: int) -> dict[int, Node]:
+        key: int = _bucket_of(node_id)
+        bucket: dict[int, Node] | None = self._copied.get(key)
+        if bucket is None:
+            bucket = dict(self._buckets.get(key, {}))
+            self._copied[key] = bucket
+            self._buckets[key] = bucket
+        return bucket
+
+
+class SnapshotNodeRepository(NodeRepository):
+    """노드 저장소 앞에서 읽기를 불변 스냅숏으로 처리하는 저장소
+
+    읽기는 그 시점에 게시된 스냅숏 하나를 고정해서 쓰므로 잠금을 잡지 않고,
+    쓰기가 반쯤 반영된 상태를 보지 않습니다. 쓰기는 한 번에 하나씩 감싼
+    저장소에 먼저 쓴 뒤, 바뀐 버킷만 복사한 다음 스냅숏을 만들어 참조 하나를
+    바꾸는 것으로 게시합니다. 쓰기가 진행되는 동안의 읽기는 기다리지 않고
+    직전 스냅숏을 읽습니다.
+
+    다른 프로세스가 파일을 바꿔 감싼 저장소의 버전이 달라지면 전체를 다시
+    읽습니다. 노드는 ID 순서로 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        node_repo: NodeRepository,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.node_repo = node_repo
+        self._lock = threading.Lock()
+        # how deeply this thread holds `locked`
+        self._held = threading.local()
+        self._snapshot: GraphSnapshot | None = None
+        self._hits: int = 0
+        self._misses: int = 0
+        if metrics is not None:
+            metrics.register_collector("node_snapshot", self._collect_metrics)
+
+    def snapshot(self) -> GraphSnapshot:
+        """지금 게시된 스냅숏을 돌려줍니다. 여러 번 읽을 때 고정해서 씁니다."""
+        snapshot: GraphSnapshot | None = self._snapshot
+        if snapshot is not None and snapshot.version == self.node_repo.get_version():
+            self._hits += 1
+            return snapshot
+        # under the write lock no write can be in progress, only another
+        # reader's refresh, and a read that is written back must be current
+        if not self._lock.acquire(
+            blocking=snapshot is None or getattr(self._held, "depth", 0) > 0
+        ):
+            # a write is being applied; keep serving the last published one
+            assert snapshot is not None
+            self._hits += 1
+            return snapshot
+        try:
+            return self._refresh()
+        finally:
+            self._lock.release()
+
+    def get_version(self) -> str:
+        return self.snapshot().version
+
+    def locked(self) -> ContextManager[None]:
+        return self._locked()
+
+    def get_written_versions(self) -> tuple[str, str] | None:
+        return self.node_repo.get_written_versions()
+
+    def get_next_id(self) -> int:
+        return self.snapshot().max_node_id + 1
+
+    def get_all_nodes(self) -> list[Node]:
+        return [_copy_node(node) for node in self.snapshot().nodes()]
+
+    def get_node_by_id(self, node_id: int, include_edges: bool = True) -> Node:
+        node: Node | None = self.snapshot().get(node_id)
+        if node is None:
+            raise super().NodeNotFoundError
+        return _copy_node(node, edges=None if include_edges else [])
+
+    def get_nodes_by_ids(self, node_ids: list[int]) -> list[Node]:
+        snapshot: GraphSnapshot = self.snapshot()
+        nodes: list[Node] = []
+        for node_id in node_ids:
+            node: Node | None = snapshot.get(node_id)
+            if node is None:
+                raise super().NodeNotFoundError
+            nodes.append(_copy_node(node))
+        return nodes
+
+    def create_node(self, node: Node) -> None:
+        with self._writing() as builder:
+            self.node_repo.create_node(node)
+            builder.create_node(node)
+
+    def update_node(self, node: Node) -> None:
+        with self._writing() as builder:
+            self.node_repo.update_node(node)
+            builder.update_node_fields(node)
+
+    def delete_node(self, node: Node) -> None:
+        with self._writing() as builder:
+            self.node_repo.delete_node(node)
+            builder.delete_node(node)
+
+    def add_edge(self, edge: Edge) -> None:
+        with self._writing() as builder:
+            self.node_repo.add_edge(edge)
+            builder.create_edge(edge)
+
+    def update_edge(self, edge: Edge) -> None:
+        with self._writing() as builder:
+            self.node_repo.update_edge(edge)
+            builder.update_edge(edge)
+
+    def remove_edge(self, edge: Edge) -> None:
+        with self._writing() as builder:
+            self.node_repo.remove_edge(edge)
+            builder.remove_edge(edge)
+
+    def bulk_create_nodes(self, nodes: list[Node]) -> None:
+        with self._writing() as builder:
+            self.node_repo.bulk_create_nodes(nodes)
+            for node in nodes:
+                builder.create_node(node)
+
+    def bulk_create_edges(self, edges: list[Edge]) -> None:
+        with self._writing() as builder:
+            self.node_repo.bulk_create_edges(edges)
+            for edge in edges:
+                builder.create_edge(edge)
+
+    def bulk_update_nodes(self, nodes: list[Node]) -> None:
+        with self._writing() as builder:
+            self.node_repo.bulk_update_nodes(nodes)
+            for node in nodes:
+                builder.update_node_fields(node)
+
+    def bulk_update_edges(self, edges: list[Edge]) -> None:
+        with self._writing() as builder:
+            self.node_repo.bulk_update_edges(edges)
+            for edge in edges:
+                builder.update_edge(edge)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self.node_repo.locked():
+            depth: int = getattr(self._held, "depth", 0)
+            self._held.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._held.depth = depth
+
+    @contextmanager
+    def _writing(self) -> Iterator[_SnapshotBuilder]:
+        # other processes cannot write until the snapshot is published, so it
+        # starts from and is versioned as exactly what this write saved. The
+        # file lock comes first, as for a use case that holds it across writes
+        with self.node_repo.locked(), self._lock:
+            builder = _SnapshotBuilder(self._refresh())
+            yield builder
+            self._snapshot = builder.build(self.node_repo.get_version())
+
+    def _refresh(self) -> GraphSnapshot:
+        # the lock is held; the version is read first so that a write landing
+        # during the load makes the next read load again
+        version: str = self.node_repo.get_version()
+        snapshot: GraphSnapshot | None = self._snapshot
+        if snapshot is None or snapshot.version != version:
+            self._misses += 1
+            snapshot = GraphSnapshot.from_nodes(self.node_repo.get_all_nodes(), version)
+            self._snapshot = snapshot
+        else:
+            self._hits += 1
+        return snapshot
+
+    def _collect_metrics(self) -> list[Counter | Gauge | Histogram]:
+        return cache_metrics("node_snapshot", "Node snapshot", self._hits, self._misses)
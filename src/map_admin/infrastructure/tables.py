@@ -0,0 +1,373 @@
+import csv
+import importlib
+import os
+import tempfile
+from decimal import Decimal
+from typing import Any, Callable, Iterator
+
+from map_admin.application.services import (
+    GraphTableStore,
+    IntegrityViolation,
+    TableImportReport,
+)
+from map_admin.infrastructure.repositories import graph_file_lock
+from map_admin.infrastructure.validators import (
+    JsonArrayWriter,
+    check_edge,
+    check_node,
+    iter_json_array,
+)
+
+CHUNK_SIZE = 10_000
+
+# column name -> column type, in file order
+NODE_COLUMNS: dict[str, str] = {
+    "id": "int",
+    "name": "str",
+    "longitude": "str",
+    "latitude": "str",
+    "elevation": "str",
+}
+EDGE_COLUMNS: dict[str, str] = {
+    "node_id_1": "int",
+    "node_id_2": "int",
+    "vertical_distance": "str",
+    "horizontal_distance": "str",
+    "is_stair": "bool",
+    "is_step": "bool",
+    "quality": "str",
+}
+_OPTIONAL_COLUMNS: frozenset[str] = frozenset({"elevation"})
+_ARROW_TYPES: dict[str, str] = {"int": "int64", "str": "string", "bool": "bool_"}
+_BOOLEANS: dict[str, bool] = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    "yes": True,
+    "no": False,
+}
+
+Row = dict[str, Any]
+
+
+def _to_int(value: Any) -> Any:
+    """정수로 읽을 수 있으면 바꾸고, 아니면 검사에서 걸리도록 그대로 둡니다."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return value
+    return value
+
+
+def _to_decimal(value: Any) -> Any:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def _to_bool(value: Any) -> Any:
+    if isinstance(value, str):
+        return _BOOLEANS.get(value.strip().lower(), value)
+    if isinstance(value, int) and not isinstance(value, bool) and value in (0, 1):
+        return bool(value)
+    return value
+
+
+def _row_to_node(row: Row) -> dict[str, Any]:
+    node_dict: dict[str, Any] = {
+        "id": _to_int(row.get("id")),
+        "name": row.get("name"),
+        "longitude": _to_decimal(row.get("longitude")),
+        "latitude": _to_decimal(row.get("latitude")),
+    }
+    if (elevation := _to_decimal(row.get("elevation"))) is not None:
+        node_dict["elevation"] = elevation
+    return node_dict
+
+
+def _row_to_edge(row: Row) -> dict[str, Any]:
+    return {
+        "node_ids": [_to_int(row.get("node_id_1")), _to_int(row.get("node_id_2"))],
+        "vertical_distance": _to_decimal(row.get("vertical_distance")),
+        "horizontal_distance": _to_decimal(row.get("horizontal_distance")),
+        "is_stair": _to_bool(row.get("is_stair")),
+        "is_step": _to_bool(row.get("is_step")),
+        "quality": row.get("quality"),
+    }
+
+
+def _node_to_row(node_dict: Any) -> Row:
+    return {column: node_dict.get(column) for column in NODE_COLUMNS}
+
+
+def _edge_to_row(edge_dict: Any) -> Row:
+    node_id_1, node_id_2 = edge_dict["node_ids"]
+    return {
+        "node_id_1": node_id_1,
+        "node_id_2": node_id_2,
+        **{column: edge_dict.get(column) for column in list(EDGE_COLUMNS)[2:]},
+    }
+
+
+def _check_columns(names: list[str], columns: dict[str, str]) -> None:
+    missing: set[str] = set(columns) - _OPTIONAL_COLUMNS - set(names)
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+
+
+class _CsvTableWriter:
+    def __init__(self, path: str, columns: dict[str, str]) -> None:
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=list(columns))
+        self._writer.writeheader()
+
+    def write(self, row: Row) -> None:
+        self._writer.writerow(row)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetTableWriter:
+    """행을 `chunk_size`개씩 모아 row group 단위로 씁니다."""
+
+    def __init__(
+        self,
+        path: str,
+        columns: dict[str, str],
+        arrow: Any,
+        parquet: Any,
+        chunk_size: int,
+    ) -> None:
+        self._arrow = arrow
+        self._schema = arrow.schema(
+            [
+                (column, getattr(arrow, _ARROW_TYPES[column_type])())
+                for column, column_type in columns.items()
+            ]
+        )
+        self._writer = parquet.ParquetWriter(path, self._schema)
+        self._chunk_size = chunk_size
+        self._rows: list[Row] = []
+
+    def write(self, row: Row) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self._chunk_size:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        if self._rows:
+            self._writer.write_table(
+                self._arrow.Table.from_pylist(self._rows, schema=self._schema)
+            )
+            self._rows = []
+
+
+class FileGraphTableStore(GraphTableStore):
+    """노드/간선 JSON 파일과 CSV/Parquet 표 파일 사이에서 데이터를 옮깁니다.
+
+    모든 파일을 `chunk_size`행씩 스트리밍으로 다루므로 메모리에는 ID 집합만
+    남습니다. 가져오기는 기존 레코드와 새 행을 임시 파일에 이어 쓰고, 위반이
+    하나도 없을 때만 원래 파일과 바꿉니다. 기존 레코드를 읽을 때부터 두 파일을
+    바꿀 때까지 저장소의 쓰기 잠금을 잡습니다. Parquet은 pyarrow가 설치되어 있을
+    때만 지원합니다.
+    """
+
+    def __init__(
+        self,
+        node_file_path: str,
+        edge_file_path: str,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.node_file_path = node_file_path
+        self.edge_file_path = edge_file_path
+        self.chunk_size = chunk_size
+
+    def import_tables(
+        self,
+        node_file_path: str | None,
+        edge_file_path: str | None,
+    ) -> TableImportReport:
+        for table_path in (node_file_path, edge_file_path):
+            if table_path is not None:
+                self._get_format(table_path)
+
+        violations: list[IntegrityViolation] = []
+        node_ids: set[int] = set()
+        edge_node_ids: set[tuple[int, int]] = set()
+        replacements: list[tuple[str, str]] = []
+        # held from reading the existing records until both files are replaced,
+        # so that no write lands in between and is overwritten
+        with graph_file_lock(self.node_file_path):
+            try:
+                node_count: int = self._append(
+                    self.node_file_path,
+                    node_file_path,
+                    NODE_COLUMNS,
+                    _row_to_node,
+                    lambda index, node_dict: check_node(
+                        index, node_dict, node_ids, violations
+                    ),
+                    lambda node_dict: node_ids.add(node_dict["id"]),
+                    replacements,
+                )
+                edge_count: int = self._append(
+                    self.edge_file_path,
+                    edge_file_path,
+                    EDGE_COLUMNS,
+                    _row_to_edge,
+                    lambda index, edge_dict: check_edge(
+                        index, edge_dict, node_ids, edge_node_ids, violations
+                    ),
+                    lambda edge_dict: edge_node_ids.add(
+                        (min(edge_dict["node_ids"]), max(edge_dict["node_ids"]))
+                    ),
+                    replacements,
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                for temporary_path, _ in replacements:
+                    os.unlink(temporary_path)
+                raise super().MalformedTableError
+
+            if violations:
+                for temporary_path, _ in replacements:
+                    os.unlink(temporary_path)
+            else:
+                # nodes first, so that an interruption never leaves dangling edges
+                for temporary_path, path in replacements:
+                    os.replace(temporary_path, path)
+        return TableImportReport(
+            node_count=node_count,
+            edge_count=edge_count,
+            violations=violations,
+        )
+
+    def export_nodes(self, file_path: str) -> int:
+        return self._export(self.node_file_path, file_path, NODE_COLUMNS, _node_to_row)
+
+    def export_edges(self, file_path: str) -> int:
+        return self._export(self.edge_file_path, file_path, EDGE_COLUMNS, _edge_to_row)
+
+    def _get_format(self, file_path: str) -> str:
+        extension: str = os.path.splitext(file_path)[1].lower()
+        if extension == ".csv":
+            return "csv"
+        if extension == ".parquet" and self._import_arrow() is not None:
+            return "parquet"
+        raise super().UnsupportedFormatError
+
+    def _import_arrow(self) -> tuple[Any, Any] | None:
+        try:
+            return (
+                importlib.import_module("pyarrow"),
+                importlib.import_module("pyarrow.parquet"),
+            )
+        except ImportError:
+            return None
+
+    def _append(
+        self,
+        path: str,
+        table_path: str | None,
+        columns: dict[str, str],
+        to_record: Callable[[Row], dict[str, Any]],
+        check: Callable[[int, dict[str, Any]], bool],
+        collect: Callable[[Any], None],
+        replacements: list[tuple[str, str]],
+    ) -> int:
+        """기존 레코드 뒤에 검사를 통과한 새 행을 이어 쓴 임시 파일을 만듭니다.
+
+        표 파일이 없으면 기존 레코드의 키만 모으고 아무것도 쓰지 않습니다.
+        """
+        if table_path is None:
+            with open(path, "r", encoding="utf-8") as file:
+                for item in iter_json_array(file):
+                    collect(item)
+            return 0
+
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=os.path.dirname(os.path.abspath(path)),
+            suffix=".tmp",
+            delete=False,
+            encoding="utf-8",
+        ) as temporary:
+            replacements.append((temporary.name, path))
+            writer = JsonArrayWriter(temporary)
+            with open(path, "r", encoding="utf-8") as file:
+                for item in iter_json_array(file):
+                    collect(item)
+                    writer.write(item)
+            count: int = 0
+            for index, row in enumerate(self._read_rows(table_path, columns)):
+                count += 1
+                record: dict[str, Any] = to_record(row)
+                if check(index, record):
+                    writer.write(record)
+            writer.close()
+        return count
+
+    def _read_rows(self, table_path: str, columns: dict[str, str]) -> Iterator[Row]:
+        if self._get_format(table_path) == "csv":
+            # utf-8-sig strips the BOM that spreadsheet programs prepend
+            with open(table_path, "r", newline="", encoding="utf-8-sig") as file:
+                reader = csv.DictReader(file)
+                _check_columns(list(reader.fieldnames or []), columns)
+                yield from reader
+            return
+
+        arrow_modules = self._import_arrow()
+        assert arrow_modules is not None
+        _, parquet = arrow_modules
+        parquet_file: Any = parquet.ParquetFile(table_path)
+        _check_columns(parquet_file.schema_arrow.names, columns)
+        for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+            yield from batch.to_pylist()
+
+    def _export(
+        self,
+        source_path: str,
+        file_path: str,
+        columns: dict[str, str],
+        to_row: Callable[[Any], Row],
+    ) -> int:
+        table_format: str = self._get_format(file_path)
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp"
+        )
+        os.close(descriptor)
+        try:
+            writer: _CsvTableWriter | _ParquetTableWriter
+            if table_format == "csv":
+                writer = _CsvTableWriter(temporary_path, columns)
+            else:
+                arrow_modules = self._import_arrow()
+                assert arrow_modules is not None
+                writer = _ParquetTableWriter(
+                    temporary_path, columns, *arrow_modules, self.chunk_size
+                )
+            count: int = 0
+            try:
+                with open(source_path, "r", encoding="utf-8") as file:
+                    for item in iter_json_array(file):
+                        writer.write(to_row(item))
+                        count += 1
+            finally:
+                writer.close()
+        except (OSError, ValueError, KeyError, TypeError):
+            os.unlink(temporary_path)
+            raise super().MalformedTableError
+        os.replace(temporary_path, file_path)
+        return count
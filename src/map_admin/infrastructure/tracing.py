@@ -0,0 +1,244 @@
+import json
+import os
+import queue
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+SERVICE_NAME = "anam-earth-be"
+SCOPE_NAME = "map_admin"
+
+AttributeValue = str | int | float | bool
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+# OTLP status codes
+STATUS_ERROR = 2
+
+
+@dataclass(kw_only=True)
+class Span:
+    name: str
+    trace_id: str  # 32 hex digits
+    span_id: str  # 16 hex digits
+    parent_span_id: str | None
+    kind: int
+    start_time: int  # unix nanoseconds
+    end_time: int = 0
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    error: bool = False
+    trace: list["Span"] = field(default_factory=list, repr=False)
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value}
+
+
+def to_otlp(spans: list[Span], service_name: str = SERVICE_NAME) -> dict[str, Any]:
+    """스팬 목록을 OTLP/JSON `ExportTraceServiceRequest` 본문으로 바꿉니다."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": _otlp_value(service_name)}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": SCOPE_NAME},
+                        "spans": [
+                            {
+                                "traceId": span.trace_id,
+                                "spanId": span.span_id,
+                                **(
+                                    {}
+                                    if span.parent_span_id is None
+                                    else {"parentSpanId": span.parent_span_id}
+                                ),
+                                "name": span.name,
+                                "kind": span.kind,
+                                "startTimeUnixNano": str(span.start_time),
+                                "endTimeUnixNano": str(span.end_time),
+                                "attributes": [
+                                    {"key": key, "value": _otlp_value(value)}
+                                    for key, value in span.attributes.items()
+                                ],
+                                "status": {"code": STATUS_ERROR} if span.error else {},
+                            }
+                            for span in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, spans: list[Span]) -> None:
+        """끝난 트레이스 하나의 스팬을 모두 내보냅니다."""
+        pass
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """트레이스마다 OTLP/JSON 한 줄을 파일에 덧붙입니다.
+
+    OpenTelemetry Collector의 `otlpjsonfile` 수신기가 그대로 읽는 형식입니다.
+    """
+
+    def __init__(self, file_path: Path, service_name: str = SERVICE_NAME) -> None:
+        self.file_path = file_path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: list[Span]) -> None:
+        line: str = json.dumps(to_otlp(spans, self.service_name), ensure_ascii=False)
+        with self._lock:
+            with open(self.file_path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """로컬 수집기의 OTLP/HTTP 엔드포인트로 트레이스를 보냅니다.
+
+    요청 처리가 수집기를 기다리지 않도록 백그라운드 스레드가 큐에서 꺼내
+    보내며, 큐가 차거나 수집기에 닿지 않으면 트레이스를 버립니다.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = SERVICE_NAME,
+        timeout: float = 5.0,
+        max_queue_size: int = 1_000,
+    ) -> None:
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        self.dropped: int = 0
+        self._queue: queue.Queue[list[Span]] = queue.Queue(max_queue_size)
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def export(self, spans: list[Span]) -> None:
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            spans: list[Span] = self._queue.get()
+            try:
+                self._post(spans)
+            except OSError:
+                self.dropped += 1
+            finally:
+                self._queue.task_done()
+
+    def _post(self, spans: list[Span]) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(to_otlp(spans, self.service_name)).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class Tracer:
+    """계층별 처리 시간을 스팬으로 기록합니다.
+
+    현재 스팬은 `contextvars`로 전달되므로 한 요청 안의 비동기 핸들러와
+    동기 유스케이스, 저장소 호출이 같은 트레이스의 부모-자식 스팬이 됩니다.
+    루트 스팬이 끝나면 트레이스 전체를 한 번에 내보냅니다. 내보낼 곳이
+    없으면 스팬을 만들지 않습니다.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: dict[str, AttributeValue] | None = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Iterator[Span | None]:
+        if self.exporter is None:
+            yield None
+            return
+
+        parent: Span | None = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=os.urandom(16).hex() if parent is None else parent.trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_span_id=None if parent is None else parent.span_id,
+            kind=kind,
+            start_time=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        span.trace = [span] if parent is None else parent.trace
+        if parent is not None:
+            span.trace.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException:
+            span.error = True
+            raise
+        finally:
+            span.end_time = time.time_ns()
+            _current_span.reset(token)
+            if parent is None:
+                self.exporter.export(span.trace)
+
+
+class TracedUseCase:
+    """유스케이스의 `execute`를 스팬으로 감쌉니다.
+
+    컨테이너에서 유스케이스를 감싸는 데 쓰며, 나머지 속성은 감싼 유스케이스에
+    그대로 넘깁니다.
+    """
+
+    def __init__(self, use_case: Any, tracer: Tracer) -> None:
+        self.use_case = use_case
+        self.tracer = tracer
+        self._span_name: str = f"{type(use_case).__name__}.execute"
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        with self.tracer.span(self._span_name):
+            return self.use_case.execute(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.use_case, name)
@@ -0,0 +1,315 @@
+import json
+import os
+import tempfile
+from contextlib import nullcontext
+from decimal import Decimal, InvalidOperation
+from typing import IO, Any, Callable, Iterator, TextIO
+
+from map_admin.application.services import (
+    GraphValidator,
+    IntegrityReport,
+    IntegrityViolation,
+    ViolationKind,
+)
+from map_admin.domain.value_objects import RoadQuality
+from map_admin.infrastructure.repositories import graph_file_lock
+
+CHUNK_SIZE = 1 << 16
+_DELIMITERS = frozenset(" \t\r\n,]")
+
+_QUALITIES: frozenset[str] = frozenset(quality.value for quality in RoadQuality)
+
+
+def iter_json_array(file: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """JSON 배열 파일의 원소를 하나씩 읽습니다.
+
+    파일 전체를 메모리에 올리지 않고 `chunk_size`씩 읽으면서, 완성된 원소만
+    `JSONDecoder.raw_decode`로 해석합니다.
+    """
+    decoder = json.JSONDecoder()
+    buffer: str = ""
+    position: int = 0
+    eof: bool = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        chunk: str = file.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def next_token() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not fill():
+                raise ValueError("Unexpected end of JSON array")
+
+    if next_token() != "[":
+        raise ValueError("Expected a JSON array")
+    position += 1
+    if next_token() == "]":
+        return
+
+    while True:
+        next_token()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if fill():
+                    continue
+                raise ValueError("Malformed JSON array item")
+            # a number cut at the chunk boundary (e.g. "1." of "1.5") still
+            # decodes, so make sure the delimiter after the item has been read
+            if (end == len(buffer) or buffer[end] not in _DELIMITERS) and fill():
+                continue
+            break
+        position = end
+        yield item
+
+        delimiter: str = next_token()
+        position += 1
+        if delimiter == "]":
+            return
+        if delimiter != ",":
+            raise ValueError("Expected ',' or ']' in JSON array")
+
+
+class JsonArrayWriter:
+    """`json.dump(..., indent=4)`와 같은 모양으로 배열을 한 원소씩 씁니다."""
+
+    def __init__(self, file: IO[str]) -> None:
+        self._file = file
+        self._count: int = 0
+
+    def write(self, item: Any) -> None:
+        self._file.write("[\n" if self._count == 0 else ",\n")
+        self._file.write(
+            "\n".join("    " + line for line in json.dumps(item, indent=4).splitlines())
+        )
+        self._count += 1
+
+    def close(self) -> None:
+        self._file.write("[]" if self._count == 0 else "\n]")
+
+
+def _is_decimal(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        return Decimal(value).is_finite()
+    except InvalidOperation:
+        return False
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def check_node(
+    index: int,
+    node_dict: Any,
+    node_ids: set[int],
+    violations: list[IntegrityViolation],
+) -> bool:
+    """노드 레코드를 검사하고, 통과하면 ID를 `node_ids`에 더합니다."""
+
+    def reject(kind: ViolationKind, message: str) -> bool:
+        violations.append(IntegrityViolation(kind=kind, index=index, message=message))
+        return False
+
+    if not isinstance(node_dict, dict):
+        return reject(ViolationKind.MALFORMED_NODE, "Node is not an object")
+    node_id: Any = node_dict.get("id")
+    if not _is_int(node_id):
+        return reject(ViolationKind.MALFORMED_NODE, "Node id is not an integer")
+    if not isinstance(node_dict.get("name"), str):
+        return reject(ViolationKind.MALFORMED_NODE, f"Node {node_id} has no name")
+    for field, bound in (("longitude", 180), ("latitude", 90)):
+        value: Any = node_dict.get(field)
+        if not _is_decimal(value) or abs(Decimal(value)) > bound:
+            return reject(
+                ViolationKind.MALFORMED_NODE,
+                f"Node {node_id} has an invalid {field}",
+            )
+    if "elevation" in node_dict and not _is_decimal(node_dict["elevation"]):
+        return reject(
+            ViolationKind.MALFORMED_NODE,
+            f"Node {node_id} has an invalid elevation",
+        )
+    if node_id in node_ids:
+        return reject(
+            ViolationKind.DUPLICATE_NODE_ID,
+            f"Node id {node_id} is already used",
+        )
+    node_ids.add(node_id)
+    return True
+
+
+def check_edge(
+    index: int,
+    edge_dict: Any,
+    node_ids: set[int],
+    edge_node_ids: set[tuple[int, int]],
+    violations: list[IntegrityViolation],
+) -> bool:
+    """간선 레코드를 검사하고, 통과하면 정렬한 노드 쌍을 `edge_node_ids`에 더합니다."""
+
+    def reject(kind: ViolationKind, message: str) -> bool:
+        violations.append(IntegrityViolation(kind=kind, index=index, message=message))
+        return False
+
+    if not isinstance(edge_dict, dict):
+        return reject(ViolationKind.MALFORMED_EDGE, "Edge is not an object")
+    pair: Any = edge_dict.get("node_ids")
+    if not (isinstance(pair, list) and len(pair) == 2 and all(map(_is_int, pair))):
+        return reject(
+            ViolationKind.MALFORMED_EDGE,
+            "Edge node_ids is not a pair of integers",
+        )
+    a, b = pair
+    if (
+        not all(
+            _is_decimal(edge_dict.get(field))
+            for field in ("vertical_distance", "horizontal_distance")
+        )
+        or Decimal(edge_dict["horizontal_distance"]) < 0
+    ):
+        return reject(
+            ViolationKind.MALFORMED_EDGE,
+            f"Edge ({a}, {b}) has an invalid distance",
+        )
+    if not all(
+        isinstance(edge_dict.get(field), bool) for field in ("is_stair", "is_step")
+    ):
+        return reject(
+            ViolationKind.MALFORMED_EDGE,
+            f"Edge ({a}, {b}) has an invalid stair/step flag",
+        )
+    if edge_dict.get("quality") not in _QUALITIES:
+        return reject(
+            ViolationKind.MALFORMED_EDGE,
+            f"Edge ({a}, {b}) has an invalid quality",
+        )
+    if a == b:
+        return reject(ViolationKind.SELF_LOOP, f"Edge ({a}, {b}) is a self-loop")
+    missing: list[int] = [node_id for node_id in pair if node_id not in node_ids]
+    if missing:
+        return reject(
+            ViolationKind.MISSING_NODE,
+            f"Edge ({a}, {b}) references missing node {missing[0]}",
+        )
+    key: tuple[int, int] = (min(a, b), max(a, b))
+    if key in edge_node_ids:
+        return reject(
+            ViolationKind.DUPLICATE_EDGE,
+            f"Edge ({a}, {b}) duplicates an earlier edge",
+        )
+    edge_node_ids.add(key)
+    return True
+
+
+class FileGraphValidator(GraphValidator):
+    """노드/간선 JSON 파일을 한 번씩만 훑으며 검사합니다.
+
+    노드 ID와 정렬한 간선 노드 쌍을 해시 집합에 모아 중복과 누락을 찾으므로
+    파일 크기에 선형인 시간이 걸립니다. 고칠 때는 위반한 레코드를 뺀 내용을
+    임시 파일에 쓴 뒤 원래 파일과 원자적으로 바꿉니다. 읽기부터 두 파일을
+    바꾸기까지 저장소의 쓰기 잠금을 잡으므로 그사이의 쓰기를 잃지 않습니다.
+    """
+
+    def __init__(self, node_file_path: str, edge_file_path: str) -> None:
+        self.node_file_path = node_file_path
+        self.edge_file_path = edge_file_path
+
+    def validate(self, repair: bool) -> IntegrityReport:
+        violations: list[IntegrityViolation] = []
+        node_ids: set[int] = set()
+        edge_node_ids: set[tuple[int, int]] = set()
+        replacements: list[tuple[str, str]] = []
+        with graph_file_lock(self.node_file_path) if repair else nullcontext():
+            try:
+                node_count: int = self._rewrite(
+                    self.node_file_path,
+                    lambda index, node_dict: check_node(
+                        index, node_dict, node_ids, violations
+                    ),
+                    repair,
+                    replacements,
+                )
+                edge_count: int = self._rewrite(
+                    self.edge_file_path,
+                    lambda index, edge_dict: check_edge(
+                        index, edge_dict, node_ids, edge_node_ids, violations
+                    ),
+                    repair,
+                    replacements,
+                )
+            except super().MalformedDataError:
+                for temporary_path, _ in replacements:
+                    os.unlink(temporary_path)
+                raise
+            # both files are checked before either is replaced
+            for temporary_path, path in replacements:
+                os.replace(temporary_path, path)
+        return IntegrityReport(
+            node_count=node_count,
+            edge_count=edge_count,
+            violations=violations,
+            repaired=repair and bool(violations),
+        )
+
+    def _rewrite(
+        self,
+        path: str,
+        check: Callable[[int, Any], bool],
+        repair: bool,
+        replacements: list[tuple[str, str]],
+    ) -> int:
+        """파일의 레코드를 검사하고 레코드 수를 반환합니다.
+
+        `repair`가 참이고 위반이 있으면 통과한 레코드만 쓴 임시 파일과 원래
+        파일을 `replacements`에 더합니다.
+        """
+        directory: str = os.path.dirname(os.path.abspath(path))
+        temporary = (
+            tempfile.NamedTemporaryFile(
+                "w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8"
+            )
+            if repair
+            else None
+        )
+        writer = None if temporary is None else JsonArrayWriter(temporary)
+        count: int = 0
+        dropped: int = 0
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for index, item in enumerate(iter_json_array(file)):
+                    count += 1
+                    if not check(index, item):
+                        dropped += 1
+                    elif writer is not None:
+                        writer.write(item)
+        except (OSError, ValueError):
+            if temporary is not None:
+                temporary.close()
+                os.unlink(temporary.name)
+            raise super().MalformedDataError
+
+        if temporary is not None and writer is not None:
+            writer.close()
+            temporary.close()
+            if dropped:
+                replacements.append((temporary.name, path))
+            else:
+                os.unlink(temporary.name)
+        return count
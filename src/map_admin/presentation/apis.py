@@ -1,48 +1,156 @@
+import asyncio
+from datetime import datetime
 from decimal import Decimal
-from typing import Literal
+from typing import AsyncIterator, Callable, Literal
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
 from containers import Container
 from map_admin.application.boundaries import (
+    ComputeRouteMatrixInputBoundary,
     CreateEdgeInputBoundary,
     CreateNodeInputBoundary,
     DeleteEdgeInputBoundary,
     DeleteNodeInputBoundary,
+    FindAlternativeRoutesInputBoundary,
+    FindRouteInputBoundary,
+    GetComponentsInputBoundary,
+    GetReachabilityInputBoundary,
+    GetRouteCacheStatsInputBoundary,
+    ListEdgesAsOfInputBoundary,
     ListEdgesInputBoundary,
+    ListHistoryInputBoundary,
+    ListNodesAsOfInputBoundary,
     ListNodesInputBoundary,
     PartialUpdateEdgeInputBoundary,
     PartialUpdateNodeInputBoundary,
+    RecomputeEdgeDistancesInputBoundary,
+    SampleNodeElevationsInputBoundary,
+    UndoChangeInputBoundary,
+    ValidateGraphInputBoundary,
 )
 from map_admin.application.dtos import (
+    ComputeRouteMatrixInputData,
     CreateEdgeInputData,
     CreateNodeInputData,
     DeleteEdgeInputData,
     DeleteNodeInputData,
+    FindAlternativeRoutesInputData,
+    FindRouteInputData,
+    GetComponentsInputData,
+    GetReachabilityInputData,
+    ListEdgesAsOfInputData,
+    ListHistoryInputData,
+    ListNodesAsOfInputData,
     PartialUpdateEdgeInputData,
     PartialUpdateNodeInputData,
+    UndoChangeInputData,
+    ValidateGraphInputData,
+)
+from map_admin.presentation.changes import (
+    ChangeBroadcaster,
+    ChangeMessage,
+    ChangeStream,
 )
 from map_admin.presentation.presenters import (
+    ComputeRouteMatrixBinaryPresenter,
+    ComputeRouteMatrixPydanticPresenter,
+    ComputeRouteMatrixPydanticViewModel,
     CreateNodePydanticPresenter,
     CreateNodePydanticViewModel,
+    FindAlternativeRoutesPydanticPresenter,
+    FindAlternativeRoutesPydanticViewModel,
+    FindRoutePydanticPresenter,
+    FindRoutePydanticViewModel,
+    GetComponentsPydanticPresenter,
+    GetComponentsPydanticViewModel,
+    GetReachabilityPydanticPresenter,
+    GetReachabilityPydanticViewModel,
+    GetRouteCacheStatsPydanticPresenter,
+    GetRouteCacheStatsPydanticViewModel,
     ListEdgesPydanticPresenter,
     ListEdgesPydanticViewModel,
+    ListHistoryPydanticPresenter,
+    ListHistoryPydanticViewModel,
     ListNodesPydanticPresenter,
     ListNodesPydanticViewModel,
+    RecomputeEdgeDistancesPydanticPresenter,
+    RecomputeEdgeDistancesPydanticViewModel,
+    SampleNodeElevationsPydanticPresenter,
+    SampleNodeElevationsPydanticViewModel,
+    ValidateGraphPydanticPresenter,
+    ValidateGraphPydanticViewModel,
 )
 
 router = APIRouter()
 
+# comment lines keep idle change streams open through proxies
+CHANGE_STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+def _parse_if_match(if_match: str | None) -> int | None:
+    """`If-Match` 헤더의 ETag를 버전으로 읽습니다. 없거나 `*`이면 `None`입니다."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid If-Match header",
+        )
+
 
-@router.get("/nodes")
+@router.get(
+    "/nodes",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "No history at that time"},
+                },
+            },
+        },
+    },
+)
 @inject
 async def list_nodes(
+    # without a timezone, UTC
+    as_of: datetime | None = None,
     use_case: ListNodesInputBoundary = Depends(Provide[Container.list_nodes_use_case]),
+    # resolved only for an `as_of` read, so that plain reads leave the history
+    # alone
+    as_of_use_case: Callable[[], ListNodesAsOfInputBoundary] = Depends(
+        Provide[Container.list_nodes_as_of_use_case.provider]
+    ),
 ) -> ListNodesPydanticViewModel:
     presenter = ListNodesPydanticPresenter()
-    use_case.execute(output_boundary=presenter)
+    if as_of is None:
+        use_case.execute(output_boundary=presenter)
+        return presenter.get_view_model()
+    try:
+        as_of_use_case().execute(
+            input_data=ListNodesAsOfInputData(as_of=as_of),
+            output_boundary=presenter,
+        )
+    except ListNodesAsOfInputBoundary.HistoryNotAvailableError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No history at that time",
+        )
     return presenter.get_view_model()
 
 
@@ -89,12 +197,20 @@ class PartialUpdateNodeRequest(BaseModel):
                 },
             },
         },
+        status.HTTP_409_CONFLICT: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Version conflict"},
+                },
+            },
+        },
     },
 )
 @inject
 async def partial_update_node(
     node_id: int,
     node: PartialUpdateNodeRequest,
+    if_match: str | None = Header(default=None),
     use_case: PartialUpdateNodeInputBoundary = Depends(
         Provide[Container.partial_update_node_use_case]
     ),
@@ -110,6 +226,7 @@ async def partial_update_node(
                 latitude=(
                     None if node.latitude is None else Decimal(str(node.latitude))
                 ),
+                version=_parse_if_match(if_match),
             ),
         )
     # TODO: Use custom exception handler
@@ -118,6 +235,11 @@ async def partial_update_node(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Node not found",
         )
+    except PartialUpdateNodeInputBoundary.VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version conflict",
+        )
 
 
 @router.delete(
@@ -132,11 +254,19 @@ async def partial_update_node(
                 },
             },
         },
+        status.HTTP_409_CONFLICT: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Version conflict"},
+                },
+            },
+        },
     },
 )
 @inject
 async def delete_node(
     node_id: int,
+    if_match: str | None = Header(default=None),
     use_case: DeleteNodeInputBoundary = Depends(
         Provide[Container.delete_node_use_case]
     ),
@@ -145,6 +275,7 @@ async def delete_node(
         use_case.execute(
             input_data=DeleteNodeInputData(
                 id=node_id,
+                version=_parse_if_match(if_match),
             ),
         )
     except DeleteNodeInputBoundary.NodeNotFoundError:
@@ -152,22 +283,58 @@ async def delete_node(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Node not found",
         )
+    except DeleteNodeInputBoundary.VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version conflict",
+        )
 
 
-@router.get("/edges")
+@router.get(
+    "/edges",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "No history at that time"},
+                },
+            },
+        },
+    },
+)
 @inject
 async def list_edges(
+    # without a timezone, UTC
+    as_of: datetime | None = None,
     use_case: ListEdgesInputBoundary = Depends(Provide[Container.list_edges_use_case]),
+    # resolved only for an `as_of` read, so that plain reads leave the history
+    # alone
+    as_of_use_case: Callable[[], ListEdgesAsOfInputBoundary] = Depends(
+        Provide[Container.list_edges_as_of_use_case.provider]
+    ),
 ) -> ListEdgesPydanticViewModel:
     presenter = ListEdgesPydanticPresenter()
-    use_case.execute(output_boundary=presenter)
+    if as_of is None:
+        use_case.execute(output_boundary=presenter)
+        return presenter.get_view_model()
+    try:
+        as_of_use_case().execute(
+            input_data=ListEdgesAsOfInputData(as_of=as_of),
+            output_boundary=presenter,
+        )
+    except ListEdgesAsOfInputBoundary.HistoryNotAvailableError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No history at that time",
+        )
     return presenter.get_view_model()
 
 
 class CreateEdgeRequest(BaseModel):
     node_ids: tuple[int, int]
     vertical_distance: float
-    horizontal_distance: float
+    # Derived from the coordinates of both nodes when omitted
+    horizontal_distance: float | None = None
     is_stair: bool
     is_step: bool
     quality: Literal["상", "중", "하"]
@@ -186,7 +353,11 @@ async def create_edge(
             input_data=CreateEdgeInputData(
                 node_ids=edge.node_ids,
                 vertical_distance=Decimal(str(edge.vertical_distance)),
-                horizontal_distance=Decimal(str(edge.horizontal_distance)),
+                horizontal_distance=(
+                    None
+                    if edge.horizontal_distance is None
+                    else Decimal(str(edge.horizontal_distance))
+                ),
                 is_stair=edge.is_stair,
                 is_step=edge.is_step,
                 quality=edge.quality,
@@ -207,6 +378,11 @@ async def create_edge(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already exsiting edge",
         )
+    except CreateEdgeInputBoundary.VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version conflict",
+        )
     return "OK"
 
 
@@ -233,6 +409,13 @@ class PartialUpdateEdgeRequest(BaseModel):
                 },
             },
         },
+        status.HTTP_409_CONFLICT: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Version conflict"},
+                },
+            },
+        },
     },
 )
 @inject
@@ -240,6 +423,7 @@ async def partial_update_edge(
     node_id_1: int,
     node_id_2: int,
     edge: PartialUpdateEdgeRequest,
+    if_match: str | None = Header(default=None),
     use_case: PartialUpdateEdgeInputBoundary = Depends(
         Provide[Container.partial_update_edge_use_case]
     ),
@@ -261,6 +445,7 @@ async def partial_update_edge(
                 is_stair=edge.is_stair,
                 is_step=edge.is_step,
                 quality=edge.quality,
+                version=_parse_if_match(if_match),
             ),
         )
     except PartialUpdateEdgeInputBoundary.NodeNotFoundError:
@@ -278,6 +463,11 @@ async def partial_update_edge(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Edge not found",
         )
+    except PartialUpdateEdgeInputBoundary.VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version conflict",
+        )
 
 
 @router.delete(
@@ -296,12 +486,20 @@ async def partial_update_edge(
                 },
             },
         },
+        status.HTTP_409_CONFLICT: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Version conflict"},
+                },
+            },
+        },
     },
 )
 @inject
 async def delete_edge(
     node_id_1: int,
     node_id_2: int,
+    if_match: str | None = Header(default=None),
     use_case: DeleteEdgeInputBoundary = Depends(
         Provide[Container.delete_edge_use_case]
     ),
@@ -310,6 +508,7 @@ async def delete_edge(
         use_case.execute(
             input_data=DeleteEdgeInputData(
                 node_ids=(node_id_1, node_id_2),
+                version=_parse_if_match(if_match),
             ),
         )
     except DeleteEdgeInputBoundary.NodeNotFoundError:
@@ -327,3 +526,470 @@ async def delete_edge(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Edge not found",
         )
+    except DeleteEdgeInputBoundary.VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version conflict",
+        )
+
+
+@router.post("/admin/recompute-distances")
+@inject
+async def recompute_edge_distances(
+    use_case: RecomputeEdgeDistancesInputBoundary = Depends(
+        Provide[Container.recompute_edge_distances_use_case]
+    ),
+) -> RecomputeEdgeDistancesPydanticViewModel:
+    presenter = RecomputeEdgeDistancesPydanticPresenter()
+    use_case.execute(output_boundary=presenter)
+    return presenter.get_view_model()
+
+
+@router.post(
+    "/admin/sample-elevations",
+    responses={
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Elevation source unavailable"},
+                },
+            },
+        },
+    },
+)
+@inject
+async def sample_node_elevations(
+    use_case: SampleNodeElevationsInputBoundary = Depends(
+        Provide[Container.sample_node_elevations_use_case]
+    ),
+) -> SampleNodeElevationsPydanticViewModel:
+    presenter = SampleNodeElevationsPydanticPresenter()
+    try:
+        use_case.execute(output_boundary=presenter)
+    except SampleNodeElevationsInputBoundary.ElevationSourceUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Elevation source unavailable",
+        )
+    return presenter.get_view_model()
+
+
+@router.post(
+    "/admin/validate",
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Malformed data file"},
+                },
+            },
+        },
+    },
+)
+@inject
+async def validate_graph(
+    repair: bool = False,
+    use_case: ValidateGraphInputBoundary = Depends(
+        Provide[Container.validate_graph_use_case]
+    ),
+) -> ValidateGraphPydanticViewModel:
+    presenter = ValidateGraphPydanticPresenter()
+    try:
+        use_case.execute(
+            input_data=ValidateGraphInputData(repair=repair),
+            output_boundary=presenter,
+        )
+    except ValidateGraphInputBoundary.MalformedDataError:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Malformed data file",
+        )
+    return presenter.get_view_model()
+
+
+@router.get(
+    "/reachability",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Node not found"},
+                },
+            },
+        },
+    },
+)
+@inject
+async def get_reachability(
+    node_id: int = Query(alias="from"),
+    max_cost: float = Query(gt=0),
+    profile: Literal["pedestrian", "wheelchair"] = "pedestrian",
+    hull: bool = False,
+    use_case: GetReachabilityInputBoundary = Depends(
+        Provide[Container.get_reachability_use_case]
+    ),
+) -> GetReachabilityPydanticViewModel:
+    presenter = GetReachabilityPydanticPresenter()
+    try:
+        use_case.execute(
+            input_data=GetReachabilityInputData(
+                node_id=node_id,
+                max_cost=Decimal(str(max_cost)),
+                profile=profile,
+                include_hull=hull,
+            ),
+            output_boundary=presenter,
+        )
+    except GetReachabilityInputBoundary.NodeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Node not found",
+        )
+    return presenter.get_view_model()
+
+
+MAX_ROUTE_MATRIX_NODES = 1000
+
+
+class ComputeRouteMatrixRequest(BaseModel):
+    sources: list[int] = Field(min_length=1, max_length=MAX_ROUTE_MATRIX_NODES)
+    targets: list[int] = Field(min_length=1, max_length=MAX_ROUTE_MATRIX_NODES)
+    profile: Literal["pedestrian", "wheelchair"] = "pedestrian"
+
+
+@router.post(
+    "/routes/matrix",
+    response_model=ComputeRouteMatrixPydanticViewModel,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"},
+                },
+            },
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid Node ID"},
+                },
+            },
+        },
+    },
+)
+@inject
+async def compute_route_matrix(
+    matrix: ComputeRouteMatrixRequest,
+    accept: str = Header(default="application/json"),
+    use_case: ComputeRouteMatrixInputBoundary = Depends(
+        Provide[Container.compute_route_matrix_use_case]
+    ),
+) -> ComputeRouteMatrixPydanticViewModel | Response:
+    input_data = ComputeRouteMatrixInputData(
+        source_ids=matrix.sources,
+        target_ids=matrix.targets,
+        profile=matrix.profile,
+    )
+    try:
+        if "application/octet-stream" in accept:
+            binary_presenter = ComputeRouteMatrixBinaryPresenter()
+            use_case.execute(input_data=input_data, output_boundary=binary_presenter)
+            rows, columns = binary_presenter.get_shape()
+            return Response(
+                content=binary_presenter.get_view_model(),
+                media_type="application/octet-stream",
+                headers={"X-Matrix-Shape": f"{rows}x{columns}"},
+            )
+
+        presenter = ComputeRouteMatrixPydanticPresenter()
+        use_case.execute(input_data=input_data, output_boundary=presenter)
+        return presenter.get_view_model()
+    except ComputeRouteMatrixInputBoundary.NodeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid Node ID",
+        )
+
+
+@router.get(
+    "/routes",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "Node not found": {
+                            "value": {"detail": "Node not found"},
+                        },
+                        "Route not found": {
+                            "value": {"detail": "Route not found"},
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+@inject
+async def find_route(
+    source_id: int = Query(alias="from"),
+    target_id: int = Query(alias="to"),
+    profile: Literal["pedestrian", "wheelchair"] = "pedestrian",
+    use_case: FindRouteInputBoundary = Depends(Provide[Container.find_route_use_case]),
+) -> FindRoutePydanticViewModel:
+    presenter = FindRoutePydanticPresenter()
+    try:
+        use_case.execute(
+            input_data=FindRouteInputData(
+                source_id=source_id,
+                target_id=target_id,
+                profile=profile,
+            ),
+            output_boundary=presenter,
+        )
+    except FindRouteInputBoundary.NodeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Node not found",
+        )
+    except FindRouteInputBoundary.RouteNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Route not found",
+        )
+    return presenter.get_view_model()
+
+
+MAX_ALTERNATIVE_ROUTES = 5
+
+
+@router.get(
+    "/routes/alternatives",
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "Node not found": {
+                            "value": {"detail": "Node not found"},
+                        },
+                        "Route not found": {
+                            "value": {"detail": "Route not found"},
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+@inject
+async def find_alternative_routes(
+    source_id: int = Query(alias="from"),
+    target_id: int = Query(alias="to"),
+    profile: Literal["pedestrian", "wheelchair"] = "pedestrian",
+    count: int = Query(default=3, ge=1, le=MAX_ALTERNATIVE_ROUTES),
+    use_case: FindAlternativeRoutesInputBoundary = Depends(
+        Provide[Container.find_alternative_routes_use_case]
+    ),
+) -> FindAlternativeRoutesPydanticViewModel:
+    presenter = FindAlternativeRoutesPydanticPresenter()
+    try:
+        use_case.execute(
+            input_data=FindAlternativeRoutesInputData(
+                source_id=source_id,
+                target_id=target_id,
+                profile=profile,
+                count=count,
+            ),
+            output_boundary=presenter,
+        )
+    except FindAlternativeRoutesInputBoundary.NodeNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Node not found",
+        )
+    except FindAlternativeRoutesInputBoundary.RouteNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Route not found",
+        )
+    return presenter.get_view_model()
+
+
+@router.get("/admin/route-cache")
+@inject
+async def get_route_cache_stats(
+    use_case: GetRouteCacheStatsInputBoundary = Depends(
+        Provide[Container.get_route_cache_stats_use_case]
+    ),
+) -> GetRouteCacheStatsPydanticViewModel:
+    presenter = GetRouteCacheStatsPydanticPresenter()
+    use_case.execute(output_boundary=presenter)
+    return presenter.get_view_model()
+
+
+@router.get("/analysis/components")
+@inject
+async def get_components(
+    profile: Literal["pedestrian", "wheelchair"] = "pedestrian",
+    use_case: GetComponentsInputBoundary = Depends(
+        Provide[Container.get_components_use_case]
+    ),
+) -> GetComponentsPydanticViewModel:
+    presenter = GetComponentsPydanticPresenter()
+    use_case.execute(
+        input_data=GetComponentsInputData(profile=profile),
+        output_boundary=presenter,
+    )
+    return presenter.get_view_model()
+
+
+@router.get("/history")
+@inject
+async def list_history(
+    after_id: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    use_case: ListHistoryInputBoundary = Depends(
+        Provide[Container.list_history_use_case]
+    ),
+) -> ListHistoryPydanticViewModel:
+    """저장된 변경 기록을 오래된 순으로 돌려줍니다.
+
+    다음 쪽은 받은 마지막 기록의 `id`를 `after_id`로 보내 이어 받습니다.
+    """
+    presenter = ListHistoryPydanticPresenter()
+    use_case.execute(
+        input_data=ListHistoryInputData(after_id=after_id, limit=limit),
+        output_boundary=presenter,
+    )
+    return presenter.get_view_model()
+
+
+@router.post(
+    "/history/{entry_id}/undo",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "content": {
+                "application/json": {
+                    "example": {"detail": "History entry not found"},
+                },
+            },
+        },
+        status.HTTP_409_CONFLICT: {
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "Changed since": {
+                            "summary": "Changed again after the entry",
+                            "value": {"detail": "Version conflict"},
+                        },
+                        "Bulk change": {
+                            "summary": "Recorded without the changed values",
+                            "value": {"detail": "Change cannot be undone"},
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+@inject
+async def undo_change(
+    entry_id: int,
+    use_case: UndoChangeInputBoundary = Depends(
+        Provide[Container.undo_change_use_case]
+    ),
+) -> None:
+    """기록된 변경 하나를 되돌립니다. 되돌린 결과도 새 기록으로 남습니다."""
+    try:
+        use_case.execute(input_data=UndoChangeInputData(entry_id=entry_id))
+    except UndoChangeInputBoundary.EntryNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="History entry not found",
+        )
+    except UndoChangeInputBoundary.VersionConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version conflict",
+        )
+    except UndoChangeInputBoundary.IrreversibleChangeError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Change cannot be undone",
+        )
+
+
+@router.get("/changes/stream", response_class=StreamingResponse)
+@inject
+async def stream_changes(
+    last_event_id: int | None = Header(default=None),
+    broadcaster: ChangeBroadcaster = Depends(Provide[Container.change_broadcaster]),
+) -> StreamingResponse:
+    """저장된 노드/간선 변경을 Server-Sent Events로 보냅니다.
+
+    다시 연결할 때 `Last-Event-ID`를 보내면 놓친 변경부터 이어 받습니다.
+    """
+    stream: ChangeStream = broadcaster.connect(last_event_id=last_event_id)
+
+    async def frames() -> AsyncIterator[str]:
+        try:
+            while True:
+                try:
+                    message: ChangeMessage | None = await asyncio.wait_for(
+                        stream.get(), timeout=CHANGE_STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    return
+                yield message.event_stream_frame
+        finally:
+            broadcaster.disconnect(stream)
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/changes/ws")
+@inject
+async def stream_changes_over_websocket(
+    websocket: WebSocket,
+    last_event_id: int | None = None,
+    broadcaster: ChangeBroadcaster = Depends(Provide[Container.change_broadcaster]),
+) -> None:
+    """저장된 노드/간선 변경을 WebSocket 텍스트 메시지(JSON)로 보냅니다."""
+    await websocket.accept()
+    stream: ChangeStream = broadcaster.connect(last_event_id=last_event_id)
+    # the client sends nothing, but reading is how its disconnect shows up
+    receiving: asyncio.Task[None] = asyncio.create_task(_wait_for_disconnect(websocket))
+    try:
+        while True:
+            getting = asyncio.create_task(stream.get())
+            await asyncio.wait(
+                {getting, receiving}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if receiving.done():
+                getting.cancel()
+                return
+            message: ChangeMessage | None = getting.result()
+            if message is None:
+                # cut off for lagging; the client resumes from its last id
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                return
+            await websocket.send_text(message.data)
+    except WebSocketDisconnect:
+        return
+    finally:
+        receiving.cancel()
+        broadcaster.disconnect(stream)
+
+
+async def _wait_for_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
@@ -0,0 +1,228 @@
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from pydantic import BaseModel
+
+from map_admin.application.boundaries import ChangeFeedOutputBoundary
+from map_admin.application.dtos import ChangeOutputData
+
+
+class NodeChangePydanticViewModel(BaseModel):
+    id: int
+    name: str
+    longitude: float
+    latitude: float
+    elevation: float | None
+    version: int
+
+
+class EdgeChangePydanticViewModel(BaseModel):
+    node_ids: tuple[int, int]
+    vertical_distance: float
+    horizontal_distance: float
+    is_stair: bool
+    is_step: bool
+    quality: str
+    version: int
+
+
+class ChangePydanticViewModel(BaseModel):
+    id: int
+    # "reset" asks the client to reload, as the changes it missed are gone
+    type: Literal[
+        "node_created",
+        "node_updated",
+        "node_deleted",
+        "edge_created",
+        "edge_updated",
+        "edge_deleted",
+        "graph_replaced",
+        "reset",
+    ]
+    node: NodeChangePydanticViewModel | None = None
+    edge: EdgeChangePydanticViewModel | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class ChangeMessage:
+    """한 번 직렬화해 모든 클라이언트가 함께 쓰는 메시지"""
+
+    id: int
+    type: str
+    data: str  # JSON, sent as is over WebSocket
+
+    @property
+    def event_stream_frame(self) -> str:
+        return f"id: {self.id}\nevent: {self.type}\ndata: {self.data}\n\n"
+
+
+class ChangeStream:
+    """클라이언트 하나가 받을 메시지를 담는 크기 제한 대기열
+
+    이벤트 루프 스레드에서만 다룹니다. 대기열이 차면 느린 클라이언트 하나
+    때문에 다른 클라이언트나 발행 쪽이 기다리지 않도록 남은 메시지를 버리고
+    스트림을 끝냅니다. 클라이언트는 마지막으로 받은 ID로 다시 연결해 이어
+    받습니다.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._queue: asyncio.Queue[ChangeMessage | None] = asyncio.Queue(max_size + 1)
+        self.max_size = max_size
+        self.lagged: bool = False
+
+    async def get(self) -> ChangeMessage | None:
+        """다음 메시지를 기다립니다. 스트림이 끝나면 `None`을 돌려줍니다."""
+        return await self._queue.get()
+
+    def put(self, message: ChangeMessage) -> None:
+        if self.lagged:
+            return
+        if self._queue.qsize() >= self.max_size:
+            self.lagged = True
+            self.close()
+            return
+        self._queue.put_nowait(message)
+
+    def close(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class ChangeBroadcaster(ChangeFeedOutputBoundary):
+    """변경을 연결된 모든 클라이언트에게 나눠 주는 발행기
+
+    변경마다 JSON 직렬화는 한 번만 하고, 클라이언트가 연결된 이벤트 루프마다
+    한 번씩 깨워 그 루프의 모든 스트림에 같은 메시지를 넣습니다. 최근
+    메시지는 `replay_size`개까지 남겨 두어, 끊겼다가 `Last-Event-ID`로 다시
+    연결한 클라이언트에게 놓친 메시지를 보내 줍니다. 놓친 메시지가 이미
+    버려졌거나 대기열에 다 담을 수 없으면 `reset`을 보내 지도를 다시 읽게
+    합니다.
+
+    이 프로세스에서 저장한 변경만 알 수 있으므로, 워커 프로세스가 여럿이면
+    클라이언트는 연결된 워커에서 일어난 변경만 받습니다.
+    """
+
+    def __init__(self, client_queue_size: int = 256, replay_size: int = 1024) -> None:
+        self.client_queue_size = client_queue_size
+        self._lock = threading.Lock()
+        self._last_id: int = 0
+        self._replay: deque[ChangeMessage] = deque(maxlen=replay_size)
+        self._streams: dict[asyncio.AbstractEventLoop, set[ChangeStream]] = {}
+
+    @property
+    def client_count(self) -> int:
+        with self._lock:
+            return sum(len(streams) for streams in self._streams.values())
+
+    def present(self, output_data: ChangeOutputData) -> None:
+        with self._lock:
+            self._last_id += 1
+            message: ChangeMessage = self._serialize(self._last_id, output_data)
+            self._replay.append(message)
+            loops: list[asyncio.AbstractEventLoop] = list(self._streams)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._deliver, loop, message)
+            except RuntimeError:
+                # the loop was closed without its streams being disconnected
+                with self._lock:
+                    self._streams.pop(loop, None)
+
+    def connect(self, last_event_id: int | None) -> ChangeStream:
+        """실행 중인 이벤트 루프에서 새 스트림을 엽니다."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        stream = ChangeStream(max_size=self.client_queue_size)
+        with self._lock:
+            if last_event_id is not None and last_event_id != self._last_id:
+                oldest_id: int = self._replay[0].id if self._replay else 1
+                missed: int = self._last_id - last_event_id
+                if oldest_id <= last_event_id + 1 and 0 < missed <= stream.max_size:
+                    for message in self._replay:
+                        if message.id > last_event_id:
+                            stream.put(message)
+                else:
+                    stream.put(self._reset_message())
+            self._streams.setdefault(loop, set()).add(stream)
+        return stream
+
+    def disconnect(self, stream: ChangeStream) -> None:
+        with self._lock:
+            for loop, streams in list(self._streams.items()):
+                streams.discard(stream)
+                if not streams:
+                    del self._streams[loop]
+
+    def close(self) -> None:
+        """열린 스트림을 모두 끝냅니다."""
+        with self._lock:
+            streams: dict[asyncio.AbstractEventLoop, set[ChangeStream]] = self._streams
+            self._streams = {}
+        for loop, loop_streams in streams.items():
+            for stream in loop_streams:
+                try:
+                    loop.call_soon_threadsafe(stream.close)
+                except RuntimeError:
+                    pass
+
+    def _deliver(self, loop: asyncio.AbstractEventLoop, message: ChangeMessage) -> None:
+        # runs on the loop; a copy, as a lagging stream disconnects itself
+        for stream in list(self._streams.get(loop, ())):
+            stream.put(message)
+            if stream.lagged:
+                self.disconnect(stream)
+
+    def _reset_message(self) -> ChangeMessage:
+        return ChangeMessage(
+            id=self._last_id,
+            type="reset",
+            data=ChangePydanticViewModel(
+                id=self._last_id, type="reset"
+            ).model_dump_json(),
+        )
+
+    @staticmethod
+    def _serialize(message_id: int, output_data: ChangeOutputData) -> ChangeMessage:
+        node: ChangeOutputData.Node | None = output_data.node
+        edge: ChangeOutputData.Edge | None = output_data.edge
+        view_model = ChangePydanticViewModel.model_validate(
+            {
+                "id": message_id,
+                "type": output_data.kind,
+                "node": (
+                    None
+                    if node is None
+                    else NodeChangePydanticViewModel(
+                        id=node.id,
+                        name=node.name,
+                        longitude=float(node.longitude),
+                        latitude=float(node.latitude),
+                        elevation=(
+                            None if node.elevation is None else float(node.elevation)
+                        ),
+                        version=node.version,
+                    )
+                ),
+                "edge": (
+                    None
+                    if edge is None
+                    else EdgeChangePydanticViewModel(
+                        node_ids=edge.node_ids,
+                        vertical_distance=float(edge.vertical_distance),
+                        horizontal_distance=float(edge.horizontal_distance),
+                        is_stair=edge.is_stair,
+                        is_step=edge.is_step,
+                        quality=edge.quality,
+                        version=edge.version,
+                    )
+                ),
+            }
+        )
+        return ChangeMessage(
+            id=message_id,
+            type=view_model.type,
+            data=view_model.model_dump_json(),
+        )
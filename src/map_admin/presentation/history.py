@@ -0,0 +1,38 @@
+from typing import Callable, ContextManager
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+AUTHOR_HEADER = b"x-author"
+
+
+class AuthorMiddleware:
+    """`X-Author` 헤더를 요청 안에서 저장한 변경의 작성자로 남기는 ASGI 미들웨어
+
+    `author_scope`는 작성자를 받아, 그 안에서 기록하는 변경의 작성자를 정하는
+    컨텍스트 매니저를 돌려줍니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        author_scope: Callable[[str | None], ContextManager[None]],
+    ) -> None:
+        self.app = app
+        self.author_scope = author_scope
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        author: str | None = next(
+            (
+                # names are sent as UTF-8 in practice, though HTTP says Latin-1
+                value.decode("utf-8", "replace")
+                for name, value in scope["headers"]
+                if name == AUTHOR_HEADER
+            ),
+            None,
+        )
+        with self.author_scope(author):
+            await self.app(scope, receive, send)
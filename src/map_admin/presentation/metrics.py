@@ -0,0 +1,82 @@
+import time
+from typing import Any, Callable
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from containers import Container
+from map_admin.infrastructure.metrics import CONTENT_TYPE, Histogram, MetricsRegistry
+
+UNMATCHED_ROUTE = "unmatched"
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def get_metrics(
+    metrics: MetricsRegistry = Depends(Provide[Container.metrics]),
+) -> Response:
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
+
+class RouteTemplates:
+    """요청이 매칭된 라우트의 경로 템플릿(`/nodes/{node_id}`)을 찾습니다.
+
+    실제 URL을 레이블로 쓰면 경로 매개변수마다 시계열이나 스팬 이름이
+    늘어나므로, 앱이 요청을 처리한 뒤에 호출합니다.
+    """
+
+    def __init__(self) -> None:
+        self._paths: dict[Callable[..., Any], str] = {}
+
+    def resolve(self, scope: Scope) -> str:
+        # the router stores the matched endpoint in the shared scope
+        endpoint: Callable[..., Any] | None = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        if endpoint not in self._paths:
+            self._paths[endpoint] = next(
+                (
+                    route.path
+                    for route in scope["app"].routes
+                    if getattr(route, "endpoint", None) is endpoint
+                ),
+                UNMATCHED_ROUTE,
+            )
+        return self._paths[endpoint]
+
+
+class MetricsMiddleware:
+    """라우트별 요청 처리 시간을 히스토그램으로 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, metrics: MetricsRegistry) -> None:
+        self.app = app
+        self._seconds: Histogram = metrics.histogram(
+            "http_request_duration_seconds",
+            "Time spent handling HTTP requests",
+            ("method", "route", "status"),
+        )
+        self._route_templates = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started: float = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._seconds.labels(
+                scope["method"], self._route_templates.resolve(scope), str(status_code)
+            ).observe(time.perf_counter() - started)
@@ -1,16 +1,46 @@
+import math
+import sys
+from array import array
+from datetime import datetime
 from typing import TypeAlias
 
 from pydantic import BaseModel
 
 from map_admin.application.boundaries import (
+    ComputeRouteMatrixOutputBoundary,
     CreateNodeOutputBoundary,
+    ExportTablesOutputBoundary,
+    FindAlternativeRoutesOutputBoundary,
+    FindRouteOutputBoundary,
+    GetComponentsOutputBoundary,
+    GetReachabilityOutputBoundary,
+    GetRouteCacheStatsOutputBoundary,
+    ImportMapOutputBoundary,
+    ImportTablesOutputBoundary,
     ListEdgesOutputBoundary,
+    ListHistoryOutputBoundary,
     ListNodesOutputBoundary,
+    RecomputeEdgeDistancesOutputBoundary,
+    SampleNodeElevationsOutputBoundary,
+    ValidateGraphOutputBoundary,
 )
 from map_admin.application.dtos import (
+    ComputeRouteMatrixOutputData,
     CreateNodeOutputData,
+    ExportTablesOutputData,
+    FindAlternativeRoutesOutputData,
+    FindRouteOutputData,
+    GetComponentsOutputData,
+    GetReachabilityOutputData,
+    GetRouteCacheStatsOutputData,
+    ImportMapOutputData,
+    ImportTablesOutputData,
     ListEdgesOutputData,
+    ListHistoryOutputData,
     ListNodesOutputData,
+    RecomputeEdgeDistancesOutputData,
+    SampleNodeElevationsOutputData,
+    ValidateGraphOutputData,
 )
 
 
@@ -19,6 +49,8 @@ class NodePydanticViewModel(BaseModel):
     name: str
     longitude: float
     latitude: float
+    elevation: float | None
+    version: int
 
 
 ListNodesPydanticViewModel: TypeAlias = list[NodePydanticViewModel]
@@ -32,6 +64,12 @@ class ListNodesPydanticPresenter(ListNodesOutputBoundary):
                 name=output_data.name,
                 longitude=float(output_data.longitude),
                 latitude=float(output_data.latitude),
+                elevation=(
+                    None
+                    if output_data.elevation is None
+                    else float(output_data.elevation)
+                ),
+                version=output_data.version,
             )
             for output_data in output_data_list
         ]
@@ -66,6 +104,7 @@ class EdgePydanticViewModel(BaseModel):
     is_stair: bool
     is_step: bool
     quality: str
+    version: int
 
 
 ListEdgesPydanticViewModel: TypeAlias = list[EdgePydanticViewModel]
@@ -90,9 +129,343 @@ class ListEdgesPydanticPresenter(ListEdgesOutputBoundary):
                 is_stair=output_data.is_stair,
                 is_step=output_data.is_step,
                 quality=output_data.quality,
+                version=output_data.version,
             )
             for output_data in output_data_list
         ]
 
     def get_view_model(self) -> ListEdgesPydanticViewModel:
         return self._view_model
+
+
+class RecomputeEdgeDistancesPydanticViewModel(BaseModel):
+    updated_count: int
+
+
+class RecomputeEdgeDistancesPydanticPresenter(RecomputeEdgeDistancesOutputBoundary):
+    def present(self, output_data: RecomputeEdgeDistancesOutputData) -> None:
+        self._view_model = RecomputeEdgeDistancesPydanticViewModel(
+            updated_count=output_data.updated_count,
+        )
+
+    def get_view_model(self) -> RecomputeEdgeDistancesPydanticViewModel:
+        return self._view_model
+
+
+class SampleNodeElevationsPydanticViewModel(BaseModel):
+    updated_node_count: int
+    updated_edge_count: int
+
+
+class SampleNodeElevationsPydanticPresenter(SampleNodeElevationsOutputBoundary):
+    def present(self, output_data: SampleNodeElevationsOutputData) -> None:
+        self._view_model = SampleNodeElevationsPydanticViewModel(
+            updated_node_count=output_data.updated_node_count,
+            updated_edge_count=output_data.updated_edge_count,
+        )
+
+    def get_view_model(self) -> SampleNodeElevationsPydanticViewModel:
+        return self._view_model
+
+
+class ReachableNodePydanticViewModel(BaseModel):
+    id: int
+    cost: float
+
+
+class GetReachabilityPydanticViewModel(BaseModel):
+    nodes: list[ReachableNodePydanticViewModel]
+    hull: list[tuple[float, float]] | None
+
+
+class GetReachabilityPydanticPresenter(GetReachabilityOutputBoundary):
+    def present(self, output_data: GetReachabilityOutputData) -> None:
+        self._view_model = GetReachabilityPydanticViewModel(
+            nodes=[
+                ReachableNodePydanticViewModel(
+                    id=node.id,
+                    cost=float(node.cost),
+                )
+                for node in output_data.nodes
+            ],
+            hull=(
+                None
+                if output_data.hull is None
+                else [
+                    (float(coordinate.longitude), float(coordinate.latitude))
+                    for coordinate in output_data.hull
+                ]
+            ),
+        )
+
+    def get_view_model(self) -> GetReachabilityPydanticViewModel:
+        return self._view_model
+
+
+class ComputeRouteMatrixPydanticViewModel(BaseModel):
+    sources: list[int]
+    targets: list[int]
+    costs: list[list[float | None]]
+
+
+class ComputeRouteMatrixPydanticPresenter(ComputeRouteMatrixOutputBoundary):
+    def present(self, output_data: ComputeRouteMatrixOutputData) -> None:
+        self._view_model = ComputeRouteMatrixPydanticViewModel(
+            sources=output_data.source_ids,
+            targets=output_data.target_ids,
+            costs=[
+                [None if math.isinf(cost) else round(cost, 2) for cost in row]
+                for row in output_data.costs
+            ],
+        )
+
+    def get_view_model(self) -> ComputeRouteMatrixPydanticViewModel:
+        return self._view_model
+
+
+class ComputeRouteMatrixBinaryPresenter(ComputeRouteMatrixOutputBoundary):
+    """비용 행렬을 행 우선 little-endian float64 배열로 직렬화합니다.
+
+    도달할 수 없는 쌍은 +inf로 표현합니다.
+    """
+
+    def present(self, output_data: ComputeRouteMatrixOutputData) -> None:
+        costs: array[float] = array("d")
+        for row in output_data.costs:
+            costs.extend(row)
+        if sys.byteorder != "little":
+            costs.byteswap()
+        self._shape: tuple[int, int] = (
+            len(output_data.source_ids),
+            len(output_data.target_ids),
+        )
+        self._view_model: bytes = costs.tobytes()
+
+    def get_shape(self) -> tuple[int, int]:
+        return self._shape
+
+    def get_view_model(self) -> bytes:
+        return self._view_model
+
+
+class RoutePydanticViewModel(BaseModel):
+    nodes: list[int]
+    cost: float
+    stairs: int
+    steps: int
+    climb: float
+    low_quality_length: float
+
+
+FindRoutePydanticViewModel: TypeAlias = RoutePydanticViewModel
+
+
+def _to_route_view_model(output_data: FindRouteOutputData) -> RoutePydanticViewModel:
+    return RoutePydanticViewModel(
+        nodes=output_data.node_ids,
+        cost=float(output_data.cost),
+        stairs=output_data.stair_count,
+        steps=output_data.step_count,
+        climb=float(output_data.climb),
+        low_quality_length=float(output_data.low_quality_length),
+    )
+
+
+class FindRoutePydanticPresenter(FindRouteOutputBoundary):
+    def present(self, output_data: FindRouteOutputData) -> None:
+        self._view_model = _to_route_view_model(output_data)
+
+    def get_view_model(self) -> FindRoutePydanticViewModel:
+        return self._view_model
+
+
+class FindAlternativeRoutesPydanticViewModel(BaseModel):
+    routes: list[RoutePydanticViewModel]
+
+
+class FindAlternativeRoutesPydanticPresenter(FindAlternativeRoutesOutputBoundary):
+    def present(self, output_data: FindAlternativeRoutesOutputData) -> None:
+        self._view_model = FindAlternativeRoutesPydanticViewModel(
+            routes=[_to_route_view_model(route) for route in output_data.routes],
+        )
+
+    def get_view_model(self) -> FindAlternativeRoutesPydanticViewModel:
+        return self._view_model
+
+
+class GetRouteCacheStatsPydanticViewModel(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    version: int
+
+
+class GetRouteCacheStatsPydanticPresenter(GetRouteCacheStatsOutputBoundary):
+    def present(self, output_data: GetRouteCacheStatsOutputData) -> None:
+        self._view_model = GetRouteCacheStatsPydanticViewModel(
+            hits=output_data.hits,
+            misses=output_data.misses,
+            size=output_data.size,
+            version=output_data.version,
+        )
+
+    def get_view_model(self) -> GetRouteCacheStatsPydanticViewModel:
+        return self._view_model
+
+
+class ComponentPydanticViewModel(BaseModel):
+    size: int
+    nodes: list[int]
+
+
+class GetComponentsPydanticViewModel(BaseModel):
+    count: int
+    components: list[ComponentPydanticViewModel]
+
+
+class GetComponentsPydanticPresenter(GetComponentsOutputBoundary):
+    def present(self, output_data: GetComponentsOutputData) -> None:
+        self._view_model = GetComponentsPydanticViewModel(
+            count=len(output_data.components),
+            components=[
+                ComponentPydanticViewModel(size=len(node_ids), nodes=node_ids)
+                for node_ids in output_data.components
+            ],
+        )
+
+    def get_view_model(self) -> GetComponentsPydanticViewModel:
+        return self._view_model
+
+
+class ViolationPydanticViewModel(BaseModel):
+    kind: str
+    index: int
+    message: str
+
+
+class ValidateGraphPydanticViewModel(BaseModel):
+    nodes: int
+    edges: int
+    violations: list[ViolationPydanticViewModel]
+    repaired: bool
+
+
+class ValidateGraphPydanticPresenter(ValidateGraphOutputBoundary):
+    def present(self, output_data: ValidateGraphOutputData) -> None:
+        self._view_model = ValidateGraphPydanticViewModel(
+            nodes=output_data.node_count,
+            edges=output_data.edge_count,
+            violations=[
+                ViolationPydanticViewModel(
+                    kind=violation.kind,
+                    index=violation.index,
+                    message=violation.message,
+                )
+                for violation in output_data.violations
+            ],
+            repaired=output_data.repaired,
+        )
+
+    def get_view_model(self) -> ValidateGraphPydanticViewModel:
+        return self._view_model
+
+
+class HistoryEntryPydanticViewModel(BaseModel):
+    id: int
+    recorded_at: datetime
+    author: str | None
+    kind: str
+    node_id: int | None
+    node_ids: tuple[int, int] | None
+
+
+ListHistoryPydanticViewModel: TypeAlias = list[HistoryEntryPydanticViewModel]
+
+
+class ListHistoryPydanticPresenter(ListHistoryOutputBoundary):
+    def present(self, output_data_list: list[ListHistoryOutputData]) -> None:
+        self._view_model: ListHistoryPydanticViewModel = [
+            HistoryEntryPydanticViewModel(
+                id=output_data.id,
+                recorded_at=output_data.recorded_at,
+                author=output_data.author,
+                kind=output_data.kind,
+                node_id=output_data.node_id,
+                node_ids=output_data.node_ids,
+            )
+            for output_data in output_data_list
+        ]
+
+    def get_view_model(self) -> ListHistoryPydanticViewModel:
+        return self._view_model
+
+
+class ValidateGraphTextPresenter(ValidateGraphOutputBoundary):
+    """검사 결과를 터미널이나 로그에 찍을 줄 목록으로 만듭니다."""
+
+    def present(self, output_data: ValidateGraphOutputData) -> None:
+        self._has_violations: bool = bool(output_data.violations)
+        self._view_model: list[str] = [
+            f"[{violation.kind}] #{violation.index}: {violation.message}"
+            for violation in output_data.violations
+        ]
+        summary: str = (
+            f"{output_data.node_count} nodes, {output_data.edge_count} edges, "
+            f"{len(output_data.violations)} violations"
+        )
+        if output_data.repaired:
+            summary += " (repaired)"
+        self._view_model.append(summary)
+        self._is_clean: bool = output_data.repaired or not self._has_violations
+
+    def is_clean(self) -> bool:
+        """위반이 없거나 모두 고쳐졌는지 여부"""
+        return self._is_clean
+
+    def get_view_model(self) -> list[str]:
+        return self._view_model
+
+
+class ImportMapTextPresenter(ImportMapOutputBoundary):
+    def present(self, output_data: ImportMapOutputData) -> None:
+        self._view_model: str = (
+            f"Imported {output_data.created_node_count} nodes, "
+            f"{output_data.created_edge_count} edges"
+        )
+
+    def get_view_model(self) -> str:
+        return self._view_model
+
+
+class ImportTablesTextPresenter(ImportTablesOutputBoundary):
+    def present(self, output_data: ImportTablesOutputData) -> None:
+        self._is_imported: bool = output_data.imported
+        self._view_model: list[str] = [
+            f"[{violation.kind}] row {violation.index}: {violation.message}"
+            for violation in output_data.violations
+        ]
+        summary: str = (
+            f"{output_data.node_count} node rows, {output_data.edge_count} edge rows"
+        )
+        if output_data.imported:
+            self._view_model.append(f"Imported {summary}")
+        else:
+            self._view_model.append(
+                f"Rejected {summary}: {len(output_data.violations)} violations"
+            )
+
+    def is_imported(self) -> bool:
+        return self._is_imported
+
+    def get_view_model(self) -> list[str]:
+        return self._view_model
+
+
+class ExportTablesTextPresenter(ExportTablesOutputBoundary):
+    def present(self, output_data: ExportTablesOutputData) -> None:
+        self._view_model: str = (
+            f"Exported {output_data.node_count} nodes, {output_data.edge_count} edges"
+        )
+
+    def get_view_model(self) -> str:
+        return self._view_model
@@ -0,0 +1,97 @@
+import itertools
+import re
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Generator
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from map_admin.infrastructure.profiling import StackProfiler
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_FILE_HEADER = b"x-profile-file"
+
+
+class _Profiled:
+    """감싼 awaitable이 실행되는 동안에만 프로파일러를 켜 두는 awaitable"""
+
+    def __init__(self, awaitable: Awaitable[None], profiler: StackProfiler) -> None:
+        self.steps: Generator[Any, None, None] = awaitable.__await__()
+        self.profiler = profiler
+
+    def __await__(self) -> Generator[Any, Any, None]:
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            self.profiler.start()
+            try:
+                if error is None:
+                    yielded: Any = self.steps.send(value)
+                else:
+                    yielded = self.steps.throw(error)
+            except StopIteration:
+                return
+            finally:
+                self.profiler.stop()
+            value, error = None, None
+            try:
+                value = yield yielded
+            except GeneratorExit:
+                self.steps.close()
+                raise
+            except BaseException as exception:
+                error = exception
+
+
+class ProfilerMiddleware:
+    """`X-Profile` 헤더가 붙은 요청만 프로파일링하는 ASGI 미들웨어
+
+    결과는 접힌 스택 파일로 `directory`에 저장하고, 파일 이름을
+    `X-Profile-File` 응답 헤더로 알려 줍니다. 프로파일 훅은 이벤트 루프
+    스레드 전체에 걸리므로, 그 요청의 코루틴이 실행되는 동안에만 켜 두어
+    사이사이 처리되는 다른 요청은 기록하지 않습니다. 파일은 스레드 풀에서
+    씁니다. 설정으로 켜지 않으면 앱에 아예 추가되지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp, directory: Path) -> None:
+        self.app = app
+        self.directory = directory
+        self._sequence = itertools.count(1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not any(
+            name == PROFILE_HEADER for name, _ in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        file_path: Path = self.directory / self._file_name(scope)
+
+        async def send_with_file_name(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (PROFILE_FILE_HEADER, file_path.name.encode()),
+                    ],
+                }
+            await send(message)
+
+        profiler = StackProfiler()
+        try:
+            await _Profiled(self.app(scope, receive, send_with_file_name), profiler)
+        finally:
+            await run_in_threadpool(self._write, file_path, profiler.collapsed())
+
+    def _write(self, file_path: Path, lines: list[str]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("".join(line + "\n" for line in lines))
+
+    def _file_name(self, scope: Scope) -> str:
+        path: str = re.sub(r"[^\w.-]+", "_", scope["path"]).strip("_") or "root"
+        return (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{next(self._sequence)}"
+            f"-{scope['method']}-{path}.collapsed"
+        )
@@ -0,0 +1,46 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from map_admin.infrastructure.tracing import SPAN_KIND_SERVER, Span, Tracer
+from map_admin.presentation.metrics import RouteTemplates
+
+
+class TracingMiddleware:
+    """요청마다 핸들러 처리 전체를 감싸는 루트 스팬을 여는 ASGI 미들웨어
+
+    유스케이스와 저장소의 스팬은 이 스팬의 자식이 됩니다. 스팬 이름은 요청을
+    처리한 뒤 라우트의 경로 템플릿으로 정합니다.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+        self._route_templates = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        span: Span | None
+        with self.tracer.span(
+            scope["method"],
+            {"http.method": scope["method"], "http.target": scope["path"]},
+            kind=SPAN_KIND_SERVER,
+        ) as span:
+            assert span is not None
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route: str = self._route_templates.resolve(scope)
+                span.name = f"{scope['method']} {route}"
+                span.set_attribute("http.route", route)
+                span.set_attribute("http.status_code", status_code)
+                span.error = status_code >= 500
@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generator import (
+    GraphSpec,
+    SyntheticGraph,
+    generate_campus_graph,
+    write_graph,
+)
+from benchmarks.harness import BaselineStore, Result, percentile
+from benchmarks.run import main, run_suites
+from benchmarks.suites import SUITES
+
+
+@pytest.mark.parametrize("degree_distribution", ["poisson", "geometric", "uniform"])
+def test_generate_campus_graph_is_connected(degree_distribution: str) -> None:
+    # Given
+    spec = GraphSpec(
+        node_count=200,
+        max_degree=5,
+        degree_distribution=degree_distribution,  # type: ignore[arg-type]
+    )
+
+    # When
+    graph: SyntheticGraph = generate_campus_graph(spec)
+
+    # Then
+    assert graph == generate_campus_graph(spec)
+    adjacency: dict[int, set[int]] = {node["id"]: set() for node in graph.nodes}
+    for edge in graph.edges:
+        a, b = edge["node_ids"]
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    assert len(adjacency) == spec.node_count
+    assert len({frozenset(edge["node_ids"]) for edge in graph.edges}) == len(
+        graph.edges
+    )
+
+    visited: set[int] = {1}
+    stack: list[int] = [1]
+    while stack:
+        for neighbour in adjacency[stack.pop()] - visited:
+            visited.add(neighbour)
+            stack.append(neighbour)
+    assert len(visited) == spec.node_count
+
+
+def test_write_graph(tmp_path: Path) -> None:
+    # Given
+    graph: SyntheticGraph = generate_campus_graph(GraphSpec(node_count=20))
+
+    # When
+    files = write_graph(graph, tmp_path)
+
+    # Then
+    with open(files.node_file_path) as file:
+        assert json.load(file) == graph.nodes
+    assert Path(files.dem_file_path).with_suffix(".hdr").exists()
+    assert Path(files.osm_file_path).read_text().count("<way ") == len(graph.edges)
+
+
+def test_percentile() -> None:
+    samples: list[float] = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+    assert percentile(samples, 50) == 3.0
+    assert percentile(samples, 95) == 5.0
+    assert percentile(samples, 0) == 1.0
+
+
+def test_baseline_store_compare(tmp_path: Path) -> None:
+    # Given
+    path: Path = tmp_path / "baselines.json"
+    store = BaselineStore(path)
+    store.update("graph", [Result(name="case", samples=[0.01, 0.01, 0.01])])
+    store = BaselineStore(path)
+
+    # When
+    slower = store.compare("graph", Result(name="case", samples=[0.03]))
+    similar = store.compare("graph", Result(name="case", samples=[0.015]))
+    unknown = store.compare("other graph", Result(name="case", samples=[0.03]))
+
+    # Then
+    assert slower.ratio == pytest.approx(3.0)
+    assert slower.is_regression
+    assert not similar.is_regression
+    assert unknown.ratio is None
+    assert not unknown.is_regression
+
+
+def test_run_suites_measures_every_case() -> None:
+    # When
+    results: list[Result] = run_suites(
+        GraphSpec(node_count=30),
+        suites=list(SUITES),
+        name_filter="",
+        iterations=1,
+        warmup=0,
+    )
+
+    # Then
+    names: list[str] = [result.name for result in results]
+    assert len(names) == len(set(names))
+    assert {name.split(".")[0] for name in names} == set(SUITES)
+    assert all(len(result.samples) == 1 for result in results)
+
+
+def test_main_check_fails_on_regression(tmp_path: Path) -> None:
+    # Given
+    path: Path = tmp_path / "baselines.json"
+    path.write_text(
+        json.dumps(
+            {
+                "thresholds": {"default": 2.0},
+                "baselines": {
+                    "n30-poisson3-s0": {
+                        "repository.get_version": {"median": 1e-12, "p95": 1e-12}
+                    }
+                },
+            }
+        )
+    )
+    argv: list[str] = [
+        "--nodes=30",
+        "--suite=repository",
+        "--filter=get_version",
+        "--iterations=1",
+        "--warmup=0",
+        f"--baseline={path}",
+    ]
+
+    # When, Then
+    assert main(argv) == 0
+    assert main([*argv, "--check"]) == 1
@@ -0,0 +1,86 @@
+import asyncio
+import tempfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.generator import GraphSpec, generate_campus_graph, write_graph
+from benchmarks.load import (
+    DEFAULT_MIX,
+    LoadGenerator,
+    LoadReport,
+    LostUpdate,
+    Write,
+    find_lost_updates,
+    format_load_report,
+    parse_mix,
+)
+from benchmarks.suites import build_app, build_container
+
+
+def test_parse_mix() -> None:
+    assert parse_mix("list_nodes=3, patch_node=1") == {
+        "list_nodes": 3,
+        "patch_node": 1,
+    }
+    with pytest.raises(ValueError):
+        parse_mix("delete_node=1")
+    with pytest.raises(ValueError):
+        parse_mix("list_nodes=0")
+
+
+def test_find_lost_updates() -> None:
+    # Given
+    first = Write(target=1, value="a", started=0.0, finished=1.0)
+    concurrent = Write(target=1, value="b", started=0.5, finished=1.5)
+    later = Write(target=1, value="c", started=2.0, finished=3.0)
+    other = Write(target=2, value="d", started=0.0, finished=1.0)
+
+    # When
+    lost_updates: list[LostUpdate] = find_lost_updates(
+        [first, concurrent, later, other],
+        final_values={1: "b", 2: "initial"},
+    )
+
+    # Then
+    assert lost_updates == [
+        LostUpdate(write=later, overwritten_by=concurrent),
+        LostUpdate(write=other, overwritten_by=None),
+    ]
+
+
+def test_find_lost_updates_accepts_any_concurrent_winner() -> None:
+    writes: list[Write] = [
+        Write(target=1, value="a", started=0.0, finished=2.0),
+        Write(target=1, value="b", started=1.0, finished=3.0),
+    ]
+
+    assert find_lost_updates(writes, final_values={1: "a"}) == []
+    assert find_lost_updates(writes, final_values={1: "b"}) == []
+
+
+def test_load_generator_against_asgi_app() -> None:
+    # Given
+    graph = generate_campus_graph(GraphSpec(node_count=30))
+
+    async def run(directory: str) -> LoadReport:
+        app = build_app(build_container(write_graph(graph, Path(directory))))
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),  # type: ignore[arg-type]
+            base_url="http://load",
+        ) as client:
+            return await LoadGenerator(client, mix=DEFAULT_MIX).run(
+                users=4, duration=60.0, max_requests=60
+            )
+
+    # When
+    with tempfile.TemporaryDirectory() as directory:
+        report: LoadReport = asyncio.run(run(directory))
+
+    # Then
+    assert report.request_count == 60
+    assert all(operation.errors == 0 for operation in report.operations)
+    assert report.writes > 0
+    assert report.lost_updates == []
+    assert "0 of" in format_load_report(report)[-1]
@@ -0,0 +1,68 @@
+from decimal import Decimal
+from unittest import mock
+
+from map_admin.application.boundaries import ChangeFeedOutputBoundary
+from map_admin.application.dtos import ChangeOutputData
+from map_admin.application.subscribers import ChangeFeedPublisher
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import EdgeDeleted, GraphReplaced, NodeUpdated
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+def test_change_feed_publisher() -> None:
+    node = Node(
+        id=1,
+        name="A",
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        version=3,
+    )
+    edge = Edge(
+        node_ids=(2, 1),
+        vertical_distance=Decimal("0.5"),
+        horizontal_distance=Decimal("2.0"),
+        is_stair=True,
+        is_step=False,
+        quality=RoadQuality.LOW,
+        version=2,
+    )
+    mock_presenter = mock.Mock(spec_set=ChangeFeedOutputBoundary)
+    publisher = ChangeFeedPublisher(output_boundary=mock_presenter)
+
+    publisher.handle(NodeUpdated(before=node, after=node))
+    publisher.handle(EdgeDeleted(edge=edge))
+    publisher.handle(GraphReplaced())
+
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=ChangeOutputData(
+                kind="node_updated",
+                node=ChangeOutputData.Node(
+                    id=1,
+                    name="A",
+                    longitude=Decimal("1.0"),
+                    latitude=Decimal("2.0"),
+                    elevation=None,
+                    version=3,
+                ),
+                edge=None,
+            ),
+        ),
+        mock.call(
+            output_data=ChangeOutputData(
+                kind="edge_deleted",
+                node=None,
+                edge=ChangeOutputData.Edge(
+                    node_ids=(2, 1),
+                    vertical_distance=Decimal("0.5"),
+                    horizontal_distance=Decimal("2.0"),
+                    is_stair=True,
+                    is_step=False,
+                    quality=RoadQuality.LOW.value,
+                    version=2,
+                ),
+            ),
+        ),
+        mock.call(
+            output_data=ChangeOutputData(kind="graph_replaced", node=None, edge=None),
+        ),
+    ]
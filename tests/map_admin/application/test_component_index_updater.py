@@ -0,0 +1,57 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest import mock
+
+from map_admin.application.services import ComponentIndex
+from map_admin.application.subscribers import ComponentIndexUpdater
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeDeleted,
+    EdgeUpdated,
+    GraphReplaced,
+    NodeCreated,
+    NodeDeleted,
+    NodeUpdated,
+)
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+def test_component_index_updater() -> None:
+    edge = Edge(
+        node_ids=(1, 2),
+        vertical_distance=Decimal("0.0"),
+        horizontal_distance=Decimal("2.0"),
+        is_stair=False,
+        is_step=False,
+        quality=RoadQuality.HIGH,
+    )
+    stair: Edge = replace(edge, is_stair=True)
+    node = Node(
+        id=1,
+        name="A",
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        edges=[edge],
+    )
+    mock_component_index = mock.Mock(spec_set=ComponentIndex)
+    updater = ComponentIndexUpdater(component_index=mock_component_index)
+
+    for event in [
+        NodeCreated(node=node),
+        NodeUpdated(before=node, after=replace(node, name="B")),
+        EdgeCreated(edge=edge),
+        EdgeUpdated(before=edge, after=stair),
+        EdgeDeleted(edge=stair),
+        NodeDeleted(node=node),
+        GraphReplaced(),
+    ]:
+        updater.handle(event)
+
+    assert mock_component_index.method_calls == [
+        mock.call.add_node(node_id=1),
+        mock.call.add_edge(edge=edge),
+        mock.call.update_edge(before=edge, after=stair),
+        mock.call.remove_edge(edge=stair),
+        mock.call.remove_node(node=node),
+        mock.call.invalidate_all(),
+    ]
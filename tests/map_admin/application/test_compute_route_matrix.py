@@ -0,0 +1,92 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    ComputeRouteMatrixInputBoundary,
+    ComputeRouteMatrixOutputBoundary,
+)
+from map_admin.application.dtos import (
+    ComputeRouteMatrixInputData,
+    ComputeRouteMatrixOutputData,
+)
+from map_admin.application.repositories import GraphRepository
+from map_admin.application.services import RouteMatrixCalculator
+from map_admin.application.use_cases import ComputeRouteMatrixUseCase
+from map_admin.domain.entities import Node
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import AccessibilityProfile, Point
+
+
+@pytest.fixture()
+def graph() -> AccessibilityGraph:
+    return AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            )
+            for node_id in (1, 2, 3)
+        ],
+    )
+
+
+def test_compute_route_matrix(graph: AccessibilityGraph) -> None:
+    mock_graph_repo = mock.Mock(spec_set=GraphRepository)
+    mock_graph_repo.get_graph.return_value = graph
+    mock_calculator = mock.Mock(spec_set=RouteMatrixCalculator)
+    mock_calculator.compute.return_value = [[0.0, float("inf")], [12.5, 3.0]]
+    mock_presenter = mock.Mock(spec_set=ComputeRouteMatrixOutputBoundary)
+
+    ComputeRouteMatrixUseCase(
+        graph_repo=mock_graph_repo,
+        route_matrix_calculator=mock_calculator,
+    ).execute(
+        input_data=ComputeRouteMatrixInputData(
+            source_ids=[1, 2],
+            target_ids=[1, 3],
+            profile="wheelchair",
+        ),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_calculator.compute.call_args_list == [
+        mock.call(
+            graph=graph,
+            source_ids=[1, 2],
+            target_ids=[1, 3],
+            profile=AccessibilityProfile.WHEELCHAIR,
+        ),
+    ]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=ComputeRouteMatrixOutputData(
+                source_ids=[1, 2],
+                target_ids=[1, 3],
+                costs=[[0.0, float("inf")], [12.5, 3.0]],
+            ),
+        ),
+    ]
+
+
+def test_compute_route_matrix_with_invalid_node_id(graph: AccessibilityGraph) -> None:
+    mock_graph_repo = mock.Mock(spec_set=GraphRepository)
+    mock_graph_repo.get_graph.return_value = graph
+    mock_calculator = mock.Mock(spec_set=RouteMatrixCalculator)
+
+    with pytest.raises(ComputeRouteMatrixInputBoundary.NodeNotFoundError):
+        ComputeRouteMatrixUseCase(
+            graph_repo=mock_graph_repo,
+            route_matrix_calculator=mock_calculator,
+        ).execute(
+            input_data=ComputeRouteMatrixInputData(
+                source_ids=[1],
+                target_ids=[4],
+                profile="pedestrian",
+            ),
+            output_boundary=mock.Mock(spec_set=ComputeRouteMatrixOutputBoundary),
+        )
+
+    assert not mock_calculator.compute.called
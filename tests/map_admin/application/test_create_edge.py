@@ -6,8 +6,11 @@ import pytest
 from map_admin.application.boundaries import CreateEdgeInputBoundary
 from map_admin.application.dtos import CreateEdgeInputData
 from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import GraphEventBus
 from map_admin.application.use_cases import CreateEdgeUseCase
 from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import EdgeCreated
+from map_admin.domain.geometry import haversine_distance
 from map_admin.domain.value_objects import Point, RoadQuality
 
 
@@ -31,7 +34,7 @@ def test_create_edge() -> None:
         ),
     }
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [nodes[1], nodes[2]]
+    mock_node_repo.get_nodes_by_ids.return_value = [nodes[1], nodes[2]]
 
     CreateEdgeUseCase(
         node_repo=mock_node_repo,
@@ -46,14 +49,96 @@ def test_create_edge() -> None:
         ),
     )
 
-    assert mock_node_repo.update_node.call_args_list == [
-        mock.call(node=nodes[1]),
+    assert mock_node_repo.add_edge.call_args_list == [
+        mock.call(edge=nodes[1].edges[0]),
+    ]
+
+
+def test_create_edge_without_horizontal_distance() -> None:
+    nodes: dict[int, Node] = {
+        1: Node(
+            id=1,
+            name="A",
+            point=Point(
+                longitude=Decimal("127.0286"),
+                latitude=Decimal("37.5864"),
+            ),
+        ),
+        2: Node(
+            id=2,
+            name="B",
+            point=Point(
+                longitude=Decimal("127.0290"),
+                latitude=Decimal("37.5870"),
+            ),
+        ),
+    }
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_nodes_by_ids.return_value = [nodes[1], nodes[2]]
+
+    CreateEdgeUseCase(
+        node_repo=mock_node_repo,
+    ).execute(
+        input_data=CreateEdgeInputData(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("1.0"),
+            horizontal_distance=None,
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH.value,
+        ),
+    )
+
+    assert nodes[1].edges == [
+        Edge(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("1.0"),
+            horizontal_distance=haversine_distance(nodes[1].point, nodes[2].point),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+    ]
+    assert mock_node_repo.add_edge.call_args_list == [
+        mock.call(edge=nodes[1].edges[0]),
+    ]
+
+
+def test_create_edge_publishes_event() -> None:
+    nodes: dict[int, Node] = {
+        node_id: Node(
+            id=node_id,
+            name=f"Node {node_id}",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        )
+        for node_id in (1, 2)
+    }
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_nodes_by_ids.return_value = [nodes[1], nodes[2]]
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+
+    CreateEdgeUseCase(
+        node_repo=mock_node_repo,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=CreateEdgeInputData(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("1.0"),
+            horizontal_distance=Decimal("2.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH.value,
+        ),
+    )
+
+    assert mock_event_bus.publish.call_args_list == [
+        mock.call(EdgeCreated(edge=nodes[1].edges[0])),
     ]
 
 
 def test_create_edge_with_invalid_node_id() -> None:
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [NodeRepository.NodeNotFoundError]
+    mock_node_repo.get_nodes_by_ids.side_effect = NodeRepository.NodeNotFoundError
 
     with pytest.raises(CreateEdgeInputBoundary.NodeNotFoundError):
         CreateEdgeUseCase(
@@ -69,7 +154,7 @@ def test_create_edge_with_invalid_node_id() -> None:
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.add_edge.called
 
 
 def test_create_edge_with_same_node() -> None:
@@ -82,7 +167,7 @@ def test_create_edge_with_same_node() -> None:
         ),
     )
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [node, node]
+    mock_node_repo.get_nodes_by_ids.return_value = [node, node]
 
     with pytest.raises(CreateEdgeInputBoundary.ConnectingSameNodeError):
         CreateEdgeUseCase(
@@ -98,7 +183,7 @@ def test_create_edge_with_same_node() -> None:
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.add_edge.called
 
 
 def test_create_edge_with_duplication() -> None:
@@ -131,7 +216,7 @@ def test_create_edge_with_duplication() -> None:
         ),
     }
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [nodes[1], nodes[2]]
+    mock_node_repo.get_nodes_by_ids.return_value = [nodes[1], nodes[2]]
 
     with pytest.raises(CreateEdgeInputBoundary.AlreadyConnectedNodesError):
         CreateEdgeUseCase(
@@ -147,4 +232,4 @@ def test_create_edge_with_duplication() -> None:
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.add_edge.called
@@ -51,35 +51,38 @@ def test_delete_edge() -> None:
         ),
     }
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    side_effect: Callable[[int], Node] = lambda node_id: nodes[node_id]
-    mock_node_repo.get_node_by_id.side_effect = side_effect
+    side_effect: Callable[[list[int]], list[Node]] = lambda node_ids: [
+        nodes[node_id] for node_id in node_ids
+    ]
+    mock_node_repo.get_nodes_by_ids.side_effect = side_effect
 
     DeleteEdgeUseCase(
         node_repo=mock_node_repo,
     ).execute(
         input_data=DeleteEdgeInputData(
             node_ids=(1, 2),
+            version=None,
         ),
     )
 
-    assert mock_node_repo.update_node.call_args_list == [
+    assert mock_node_repo.remove_edge.call_args_list == [
         mock.call(
-            node=Node(
-                id=1,
-                name="A",
-                point=Point(
-                    longitude=Decimal("1.0"),
-                    latitude=Decimal("2.0"),
-                ),
-                edges=[],
+            edge=Edge(
+                node_ids=(1, 2),
+                vertical_distance=Decimal("1.0"),
+                horizontal_distance=Decimal("2.0"),
+                is_stair=False,
+                is_step=False,
+                quality=RoadQuality.HIGH,
             ),
         ),
     ]
+    assert nodes[1].edges == nodes[2].edges == []
 
 
 def test_delete_edge_with_invalid_node_id() -> None:
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [NodeRepository.NodeNotFoundError]
+    mock_node_repo.get_nodes_by_ids.side_effect = NodeRepository.NodeNotFoundError
 
     with pytest.raises(DeleteEdgeUseCase.NodeNotFoundError):
         DeleteEdgeUseCase(
@@ -87,6 +90,7 @@ def test_delete_edge_with_invalid_node_id() -> None:
         ).execute(
             input_data=DeleteEdgeInputData(
                 node_ids=(1, 2),
+                version=None,
             ),
         )
 
@@ -101,7 +105,7 @@ def test_delete_edge_with_same_node() -> None:
         ),
     )
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [node, node]
+    mock_node_repo.get_nodes_by_ids.return_value = [node, node]
 
     with pytest.raises(DeleteEdgeUseCase.ConnectingSameNodeError):
         DeleteEdgeUseCase(
@@ -109,6 +113,7 @@ def test_delete_edge_with_same_node() -> None:
         ).execute(
             input_data=DeleteEdgeInputData(
                 node_ids=(1, 1),
+                version=None,
             ),
         )
 
@@ -135,8 +140,10 @@ def test_delete_edge_with_no_edge_between_nodes() -> None:
         ),
     }
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    side_effect: Callable[[int], Node] = lambda node_id: nodes[node_id]
-    mock_node_repo.get_node_by_id.side_effect = side_effect
+    side_effect: Callable[[list[int]], list[Node]] = lambda node_ids: [
+        nodes[node_id] for node_id in node_ids
+    ]
+    mock_node_repo.get_nodes_by_ids.side_effect = side_effect
 
     with pytest.raises(DeleteEdgeUseCase.EdgeNotFoundError):
         DeleteEdgeUseCase(
@@ -144,7 +151,8 @@ def test_delete_edge_with_no_edge_between_nodes() -> None:
         ).execute(
             input_data=DeleteEdgeInputData(
                 node_ids=(1, 2),
+                version=None,
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.remove_edge.called
@@ -6,9 +6,11 @@ import pytest
 from map_admin.application.boundaries import DeleteNodeInputBoundary
 from map_admin.application.dtos import DeleteNodeInputData
 from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import GraphEventBus
 from map_admin.application.use_cases import DeleteNodeUseCase
-from map_admin.domain.entities import Node
-from map_admin.domain.value_objects import Point
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import NodeDeleted
+from map_admin.domain.value_objects import Point, RoadQuality
 
 
 def test_delete_node() -> None:
@@ -27,9 +29,13 @@ def test_delete_node() -> None:
     ).execute(
         input_data=DeleteNodeInputData(
             id=1,
+            version=None,
         ),
     )
 
+    assert mock_node_repo.get_node_by_id.call_args_list == [
+        mock.call(node_id=1),
+    ]
     assert mock_node_repo.delete_node.call_args_list == [
         mock.call(
             node=Node(
@@ -44,6 +50,44 @@ def test_delete_node() -> None:
     ]
 
 
+def test_delete_node_publishes_event_with_edges() -> None:
+    edges: list[Edge] = [
+        Edge(
+            node_ids=(1, other_id),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("10.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        )
+        for other_id in (2, 3)
+    ]
+    node = Node(
+        id=1,
+        name="A",
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        edges=edges,
+    )
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = node
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+
+    DeleteNodeUseCase(
+        node_repo=mock_node_repo,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=DeleteNodeInputData(
+            id=1,
+            version=None,
+        ),
+    )
+
+    assert mock_event_bus.publish.call_args_list == [
+        mock.call(NodeDeleted(node=node)),
+    ]
+    assert mock_event_bus.publish.call_args.args[0].node.edges == edges
+
+
 def test_delete_node_with_invalid_id() -> None:
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
     mock_node_repo.get_node_by_id.side_effect = [NodeRepository.NodeNotFoundError]
@@ -54,6 +98,7 @@ def test_delete_node_with_invalid_id() -> None:
         ).execute(
             input_data=DeleteNodeInputData(
                 id=1,
+                version=None,
             ),
         )
 
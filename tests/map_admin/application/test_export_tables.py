@@ -0,0 +1,50 @@
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    ExportTablesInputBoundary,
+    ExportTablesOutputBoundary,
+)
+from map_admin.application.dtos import ExportTablesInputData, ExportTablesOutputData
+from map_admin.application.services import GraphTableStore
+from map_admin.application.use_cases import ExportTablesUseCase
+
+
+def test_export_tables() -> None:
+    mock_table_store = mock.Mock(spec_set=GraphTableStore)
+    mock_table_store.export_nodes.return_value = 3
+    mock_presenter = mock.Mock(spec_set=ExportTablesOutputBoundary)
+
+    ExportTablesUseCase(table_store=mock_table_store).execute(
+        input_data=ExportTablesInputData(
+            node_file_path="nodes.parquet",
+            edge_file_path=None,
+        ),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_table_store.export_nodes.call_args_list == [
+        mock.call(file_path="nodes.parquet"),
+    ]
+    assert mock_table_store.export_edges.call_count == 0
+    assert mock_presenter.present.call_args_list == [
+        mock.call(output_data=ExportTablesOutputData(node_count=3, edge_count=0)),
+    ]
+
+
+def test_export_tables_with_unsupported_format() -> None:
+    mock_table_store = mock.Mock(spec_set=GraphTableStore)
+    mock_table_store.export_edges.side_effect = GraphTableStore.UnsupportedFormatError
+    mock_presenter = mock.Mock(spec_set=ExportTablesOutputBoundary)
+
+    with pytest.raises(ExportTablesInputBoundary.UnsupportedFormatError):
+        ExportTablesUseCase(table_store=mock_table_store).execute(
+            input_data=ExportTablesInputData(
+                node_file_path=None,
+                edge_file_path="edges.xlsx",
+            ),
+            output_boundary=mock_presenter,
+        )
+
+    assert mock_presenter.present.call_count == 0
@@ -0,0 +1,143 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    FindAlternativeRoutesInputBoundary,
+    FindAlternativeRoutesOutputBoundary,
+)
+from map_admin.application.dtos import (
+    FindAlternativeRoutesInputData,
+    FindAlternativeRoutesOutputData,
+    FindRouteOutputData,
+)
+from map_admin.application.repositories import GraphRepository
+from map_admin.application.use_cases import FindAlternativeRoutesUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+@pytest.fixture()
+def mock_graph_repo() -> mock.Mock:
+    """
+    1 --100-- 2 --100(step, 5m up)-- 4
+    |                                |
+    +---120-- 3 --100(low)-----------+
+    """
+    edges: list[Edge] = [
+        Edge(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("100.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        Edge(
+            node_ids=(2, 4),
+            vertical_distance=Decimal("5.0"),
+            horizontal_distance=Decimal("100.0"),
+            is_stair=False,
+            is_step=True,
+            quality=RoadQuality.HIGH,
+        ),
+        Edge(
+            node_ids=(1, 3),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("120.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        Edge(
+            node_ids=(3, 4),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("100.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.LOW,
+        ),
+    ]
+    mock_graph_repo: mock.Mock = mock.Mock(spec_set=GraphRepository)
+    mock_graph_repo.get_graph.return_value = AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id in (1, 2, 3, 4, 5)
+        ],
+    )
+    return mock_graph_repo
+
+
+def test_find_alternative_routes(mock_graph_repo: mock.Mock) -> None:
+    mock_presenter = mock.Mock(spec_set=FindAlternativeRoutesOutputBoundary)
+
+    FindAlternativeRoutesUseCase(
+        graph_repo=mock_graph_repo,
+    ).execute(
+        input_data=FindAlternativeRoutesInputData(
+            source_id=1,
+            target_id=4,
+            profile="pedestrian",
+            count=3,
+        ),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=FindAlternativeRoutesOutputData(
+                routes=[
+                    FindRouteOutputData(
+                        node_ids=[1, 2, 4],
+                        cost=Decimal("200.00"),
+                        stair_count=0,
+                        step_count=1,
+                        climb=Decimal("5.00"),
+                        low_quality_length=Decimal("0.00"),
+                    ),
+                    FindRouteOutputData(
+                        node_ids=[1, 3, 4],
+                        cost=Decimal("220.00"),
+                        stair_count=0,
+                        step_count=0,
+                        climb=Decimal("0.00"),
+                        low_quality_length=Decimal("100.00"),
+                    ),
+                ],
+            ),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "source_id, target_id, expected_exception",
+    [
+        (1, 6, FindAlternativeRoutesInputBoundary.NodeNotFoundError),
+        (1, 5, FindAlternativeRoutesInputBoundary.RouteNotFoundError),
+    ],
+)
+def test_find_alternative_routes_with_error(
+    mock_graph_repo: mock.Mock,
+    source_id: int,
+    target_id: int,
+    expected_exception: type[Exception],
+) -> None:
+    with pytest.raises(expected_exception):
+        FindAlternativeRoutesUseCase(
+            graph_repo=mock_graph_repo,
+        ).execute(
+            input_data=FindAlternativeRoutesInputData(
+                source_id=source_id,
+                target_id=target_id,
+                profile="pedestrian",
+                count=3,
+            ),
+            output_boundary=mock.Mock(spec_set=FindAlternativeRoutesOutputBoundary),
+        )
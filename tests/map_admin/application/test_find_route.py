@@ -0,0 +1,160 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    FindRouteInputBoundary,
+    FindRouteOutputBoundary,
+)
+from map_admin.application.dtos import FindRouteInputData, FindRouteOutputData
+from map_admin.application.repositories import GraphRepository
+from map_admin.application.services import RouteCache
+from map_admin.application.use_cases import FindRouteUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph, Route
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
+
+
+@pytest.fixture()
+def mock_graph_repo() -> mock.Mock:
+    edges: list[Edge] = [
+        Edge(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("100.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        Edge(
+            node_ids=(2, 3),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("50.5"),
+            is_stair=True,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+    ]
+    mock_graph_repo: mock.Mock = mock.Mock(spec_set=GraphRepository)
+    mock_graph_repo.get_graph.return_value = AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id in (1, 2, 3)
+        ],
+    )
+    return mock_graph_repo
+
+
+@pytest.fixture()
+def mock_route_cache() -> mock.Mock:
+    mock_route_cache: mock.Mock = mock.Mock(spec_set=RouteCache)
+    mock_route_cache.get.return_value = None
+    return mock_route_cache
+
+
+def test_find_route(mock_graph_repo: mock.Mock, mock_route_cache: mock.Mock) -> None:
+    mock_presenter = mock.Mock(spec_set=FindRouteOutputBoundary)
+
+    FindRouteUseCase(
+        graph_repo=mock_graph_repo,
+        route_cache=mock_route_cache,
+    ).execute(
+        input_data=FindRouteInputData(source_id=1, target_id=3, profile="pedestrian"),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=FindRouteOutputData(
+                node_ids=[1, 2, 3],
+                cost=Decimal("150.50"),
+                stair_count=1,
+                step_count=0,
+                climb=Decimal("0.00"),
+                low_quality_length=Decimal("0.00"),
+            ),
+        ),
+    ]
+    assert mock_route_cache.put.call_args_list == [
+        mock.call(
+            source_id=1,
+            target_id=3,
+            profile=AccessibilityProfile.PEDESTRIAN,
+            route=Route(node_ids=(1, 2, 3), cost=150.5, stair_count=1),
+        ),
+    ]
+
+
+def test_find_route_from_cache(
+    mock_graph_repo: mock.Mock,
+    mock_route_cache: mock.Mock,
+) -> None:
+    mock_route_cache.get.return_value = Route(node_ids=(1, 2), cost=100.0)
+    mock_presenter = mock.Mock(spec_set=FindRouteOutputBoundary)
+
+    FindRouteUseCase(
+        graph_repo=mock_graph_repo,
+        route_cache=mock_route_cache,
+    ).execute(
+        input_data=FindRouteInputData(source_id=1, target_id=2, profile="pedestrian"),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=FindRouteOutputData(
+                node_ids=[1, 2],
+                cost=Decimal("100.00"),
+                stair_count=0,
+                step_count=0,
+                climb=Decimal("0.00"),
+                low_quality_length=Decimal("0.00"),
+            ),
+        ),
+    ]
+    assert not mock_graph_repo.get_graph.called
+    assert not mock_route_cache.put.called
+
+
+def test_find_route_without_route(
+    mock_graph_repo: mock.Mock,
+    mock_route_cache: mock.Mock,
+) -> None:
+    with pytest.raises(FindRouteInputBoundary.RouteNotFoundError):
+        FindRouteUseCase(
+            graph_repo=mock_graph_repo,
+            route_cache=mock_route_cache,
+        ).execute(
+            input_data=FindRouteInputData(
+                source_id=1,
+                target_id=3,
+                profile="wheelchair",
+            ),
+            output_boundary=mock.Mock(spec_set=FindRouteOutputBoundary),
+        )
+
+    assert not mock_route_cache.put.called
+
+
+def test_find_route_with_invalid_node_id(
+    mock_graph_repo: mock.Mock,
+    mock_route_cache: mock.Mock,
+) -> None:
+    with pytest.raises(FindRouteInputBoundary.NodeNotFoundError):
+        FindRouteUseCase(
+            graph_repo=mock_graph_repo,
+            route_cache=mock_route_cache,
+        ).execute(
+            input_data=FindRouteInputData(
+                source_id=1,
+                target_id=4,
+                profile="pedestrian",
+            ),
+            output_boundary=mock.Mock(spec_set=FindRouteOutputBoundary),
+        )
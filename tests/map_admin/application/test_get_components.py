@@ -0,0 +1,27 @@
+from unittest import mock
+
+from map_admin.application.boundaries import GetComponentsOutputBoundary
+from map_admin.application.dtos import GetComponentsInputData, GetComponentsOutputData
+from map_admin.application.services import ComponentIndex
+from map_admin.application.use_cases import GetComponentsUseCase
+from map_admin.domain.value_objects import AccessibilityProfile
+
+
+def test_get_components() -> None:
+    mock_component_index = mock.Mock(spec_set=ComponentIndex)
+    mock_component_index.get_components.return_value = [[1, 2, 3], [4]]
+    mock_presenter = mock.Mock(spec_set=GetComponentsOutputBoundary)
+
+    GetComponentsUseCase(
+        component_index=mock_component_index,
+    ).execute(
+        input_data=GetComponentsInputData(profile="wheelchair"),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_component_index.get_components.call_args_list == [
+        mock.call(profile=AccessibilityProfile.WHEELCHAIR),
+    ]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(output_data=GetComponentsOutputData(components=[[1, 2, 3], [4]])),
+    ]
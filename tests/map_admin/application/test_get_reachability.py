@@ -0,0 +1,162 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    GetReachabilityInputBoundary,
+    GetReachabilityOutputBoundary,
+)
+from map_admin.application.dtos import (
+    GetReachabilityInputData,
+    GetReachabilityOutputData,
+)
+from map_admin.application.repositories import GraphRepository
+from map_admin.application.use_cases import GetReachabilityUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+@pytest.fixture()
+def mock_graph_repo() -> mock.Mock:
+    edges: list[Edge] = [
+        Edge(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("100.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        Edge(
+            node_ids=(2, 3),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("50.0"),
+            is_stair=True,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        Edge(
+            node_ids=(1, 4),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("500.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+    ]
+    points: dict[int, Point] = {
+        1: Point(longitude=Decimal("0.0"), latitude=Decimal("0.0")),
+        2: Point(longitude=Decimal("0.001"), latitude=Decimal("0.0")),
+        3: Point(longitude=Decimal("0.001"), latitude=Decimal("0.001")),
+        4: Point(longitude=Decimal("0.01"), latitude=Decimal("0.01")),
+    }
+    mock_graph_repo: mock.Mock = mock.Mock(spec_set=GraphRepository)
+    mock_graph_repo.get_graph.return_value = AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=point,
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id, point in points.items()
+        ],
+    )
+    return mock_graph_repo
+
+
+@pytest.mark.parametrize(
+    "profile, expected_nodes",
+    [
+        (
+            "pedestrian",
+            [
+                GetReachabilityOutputData.Node(id=1, cost=Decimal("0.00")),
+                GetReachabilityOutputData.Node(id=2, cost=Decimal("100.00")),
+                GetReachabilityOutputData.Node(id=3, cost=Decimal("150.00")),
+            ],
+        ),
+        (
+            "wheelchair",
+            [
+                GetReachabilityOutputData.Node(id=1, cost=Decimal("0.00")),
+                GetReachabilityOutputData.Node(id=2, cost=Decimal("100.00")),
+            ],
+        ),
+    ],
+)
+def test_get_reachability(
+    mock_graph_repo: mock.Mock,
+    profile: str,
+    expected_nodes: list[GetReachabilityOutputData.Node],
+) -> None:
+    mock_presenter = mock.Mock(spec_set=GetReachabilityOutputBoundary)
+
+    GetReachabilityUseCase(
+        graph_repo=mock_graph_repo,
+    ).execute(
+        input_data=GetReachabilityInputData(
+            node_id=1,
+            max_cost=Decimal("300"),
+            profile=profile,
+            include_hull=False,
+        ),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=GetReachabilityOutputData(nodes=expected_nodes, hull=None),
+        ),
+    ]
+
+
+def test_get_reachability_with_hull(mock_graph_repo: mock.Mock) -> None:
+    mock_presenter = mock.Mock(spec_set=GetReachabilityOutputBoundary)
+
+    GetReachabilityUseCase(
+        graph_repo=mock_graph_repo,
+    ).execute(
+        input_data=GetReachabilityInputData(
+            node_id=1,
+            max_cost=Decimal("300"),
+            profile="pedestrian",
+            include_hull=True,
+        ),
+        output_boundary=mock_presenter,
+    )
+
+    output_data: GetReachabilityOutputData = mock_presenter.present.call_args.kwargs[
+        "output_data"
+    ]
+    assert output_data.hull == [
+        GetReachabilityOutputData.Coordinate(
+            longitude=Decimal("0.0"),
+            latitude=Decimal("0.0"),
+        ),
+        GetReachabilityOutputData.Coordinate(
+            longitude=Decimal("0.001"),
+            latitude=Decimal("0.0"),
+        ),
+        GetReachabilityOutputData.Coordinate(
+            longitude=Decimal("0.001"),
+            latitude=Decimal("0.001"),
+        ),
+    ]
+
+
+def test_get_reachability_with_invalid_node_id(mock_graph_repo: mock.Mock) -> None:
+    with pytest.raises(GetReachabilityInputBoundary.NodeNotFoundError):
+        GetReachabilityUseCase(
+            graph_repo=mock_graph_repo,
+        ).execute(
+            input_data=GetReachabilityInputData(
+                node_id=5,
+                max_cost=Decimal("300"),
+                profile="pedestrian",
+                include_hull=False,
+            ),
+            output_boundary=mock.Mock(spec_set=GetReachabilityOutputBoundary),
+        )
@@ -0,0 +1,15 @@
+from unittest import mock
+
+from map_admin.application.services import GraphHistory
+from map_admin.application.subscribers import HistoryRecorder
+from map_admin.domain.events import GraphReplaced
+
+
+def test_history_recorder_records_every_event() -> None:
+    mock_history = mock.Mock(spec_set=GraphHistory)
+
+    HistoryRecorder(history=mock_history).handle(GraphReplaced())
+
+    assert mock_history.record.call_args_list == [
+        mock.call(event=GraphReplaced()),
+    ]
@@ -0,0 +1,162 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    ImportMapInputBoundary,
+    ImportMapOutputBoundary,
+)
+from map_admin.application.dtos import ImportMapInputData, ImportMapOutputData
+from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import GraphEventBus, MapNode, MapSource, MapWay
+from map_admin.application.use_cases import ImportMapUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import GraphReplaced
+from map_admin.domain.geometry import haversine_distance
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+def make_point(latitude: str) -> Point:
+    return Point(longitude=Decimal("127.0"), latitude=Decimal(latitude))
+
+
+def test_import_map() -> None:
+    points: dict[int, Point] = {
+        10: make_point("37.5000"),
+        15: make_point("37.5001"),
+        11: make_point("37.5002"),
+        12: make_point("37.5003"),
+        13: make_point("37.5004"),
+        14: make_point("37.5005"),
+    }
+    mock_map_source = mock.Mock(spec_set=MapSource)
+    mock_map_source.read_ways.return_value = iter(
+        [
+            MapWay(
+                node_refs=[10, 15, 11, 12],
+                is_stair=False,
+                quality=RoadQuality.HIGH,
+            ),
+            MapWay(node_refs=[12, 13], is_stair=True, quality=RoadQuality.LOW),
+            MapWay(node_refs=[11, 14], is_stair=False, quality=RoadQuality.MEDIUM),
+            # clipped by the extract boundary, so node 99 is never read
+            MapWay(node_refs=[14, 99], is_stair=False, quality=RoadQuality.MEDIUM),
+        ]
+    )
+    mock_map_source.read_nodes.return_value = iter(
+        [
+            MapNode(
+                ref=ref,
+                name="정문" if ref == 10 else None,
+                point=point,
+                is_step=ref == 15,
+            )
+            for ref, point in points.items()
+        ]
+    )
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_next_id.return_value = 5
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+    mock_presenter = mock.Mock(spec_set=ImportMapOutputBoundary)
+
+    ImportMapUseCase(
+        node_repo=mock_node_repo,
+        map_source=mock_map_source,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=ImportMapInputData(file_path="campus.osm", batch_size=2),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_map_source.read_nodes.call_args_list == [
+        mock.call(file_path="campus.osm", refs={10, 11, 12, 13, 14, 15, 99}),
+    ]
+
+    def make_edge(
+        node_ids: tuple[int, int],
+        horizontal_distance: Decimal,
+        is_stair: bool = False,
+        is_step: bool = False,
+        quality: RoadQuality = RoadQuality.MEDIUM,
+    ) -> Edge:
+        return Edge(
+            node_ids=node_ids,
+            vertical_distance=Decimal("0.00"),
+            horizontal_distance=horizontal_distance,
+            is_stair=is_stair,
+            is_step=is_step,
+            quality=quality,
+        )
+
+    # nodes of a batch are written before its edges
+    assert mock_node_repo.method_calls[1:] == [
+        mock.call.bulk_create_nodes(
+            nodes=[
+                Node(id=5, name="정문", point=points[10]),
+                Node(id=6, name="OSM 11", point=points[11]),
+                Node(id=7, name="OSM 12", point=points[12]),
+            ],
+        ),
+        mock.call.bulk_create_edges(
+            edges=[
+                make_edge(
+                    (5, 6),
+                    haversine_distance(points[10], points[15])
+                    + haversine_distance(points[15], points[11]),
+                    is_step=True,
+                    quality=RoadQuality.HIGH,
+                ),
+                make_edge(
+                    (6, 7),
+                    haversine_distance(points[11], points[12]),
+                    quality=RoadQuality.HIGH,
+                ),
+            ],
+        ),
+        mock.call.bulk_create_nodes(
+            nodes=[
+                Node(id=8, name="OSM 13", point=points[13]),
+                Node(id=9, name="OSM 14", point=points[14]),
+            ],
+        ),
+        mock.call.bulk_create_edges(
+            edges=[
+                make_edge(
+                    (7, 8),
+                    haversine_distance(points[12], points[13]),
+                    is_stair=True,
+                    quality=RoadQuality.LOW,
+                ),
+                make_edge((6, 9), haversine_distance(points[11], points[14])),
+            ],
+        ),
+    ]
+    assert mock_event_bus.publish.call_args_list == [mock.call(GraphReplaced())]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=ImportMapOutputData(
+                created_node_count=5,
+                created_edge_count=4,
+            ),
+        ),
+    ]
+
+
+def test_import_map_with_unavailable_source() -> None:
+    mock_map_source = mock.Mock(spec_set=MapSource)
+    mock_map_source.read_ways.side_effect = MapSource.MapSourceUnavailableError
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_presenter = mock.Mock(spec_set=ImportMapOutputBoundary)
+
+    with pytest.raises(ImportMapInputBoundary.MapSourceUnavailableError):
+        ImportMapUseCase(
+            node_repo=mock_node_repo,
+            map_source=mock_map_source,
+        ).execute(
+            input_data=ImportMapInputData(file_path="missing.osm", batch_size=10),
+            output_boundary=mock_presenter,
+        )
+
+    assert mock_node_repo.method_calls == []
+    assert mock_presenter.present.call_count == 0
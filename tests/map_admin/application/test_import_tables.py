@@ -0,0 +1,116 @@
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    ImportTablesInputBoundary,
+    ImportTablesOutputBoundary,
+)
+from map_admin.application.dtos import ImportTablesInputData, ImportTablesOutputData
+from map_admin.application.services import (
+    GraphEventBus,
+    GraphTableStore,
+    IntegrityViolation,
+    TableImportReport,
+    ViolationKind,
+)
+from map_admin.application.use_cases import ImportTablesUseCase
+from map_admin.domain.events import GraphReplaced
+
+
+@pytest.mark.parametrize(
+    "violations, expected_invalidate_count",
+    [
+        ([], 1),
+        (
+            [
+                IntegrityViolation(
+                    kind=ViolationKind.MISSING_NODE,
+                    index=3,
+                    message="Edge (1, 9) references missing node 9",
+                ),
+            ],
+            0,
+        ),
+    ],
+)
+def test_import_tables(
+    violations: list[IntegrityViolation],
+    expected_invalidate_count: int,
+) -> None:
+    mock_table_store = mock.Mock(spec_set=GraphTableStore)
+    mock_table_store.import_tables.return_value = TableImportReport(
+        node_count=2,
+        edge_count=4,
+        violations=violations,
+    )
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+    mock_presenter = mock.Mock(spec_set=ImportTablesOutputBoundary)
+
+    ImportTablesUseCase(
+        table_store=mock_table_store,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=ImportTablesInputData(
+            node_file_path="nodes.csv",
+            edge_file_path="edges.csv",
+        ),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_table_store.import_tables.call_args_list == [
+        mock.call(node_file_path="nodes.csv", edge_file_path="edges.csv"),
+    ]
+    assert mock_event_bus.publish.call_args_list == (
+        [mock.call(GraphReplaced())] * expected_invalidate_count
+    )
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=ImportTablesOutputData(
+                node_count=2,
+                edge_count=4,
+                violations=[
+                    ImportTablesOutputData.Violation(
+                        kind=violation.kind.value,
+                        index=violation.index,
+                        message=violation.message,
+                    )
+                    for violation in violations
+                ],
+                imported=not violations,
+            ),
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "store_error, expected_error",
+    [
+        (
+            GraphTableStore.UnsupportedFormatError,
+            ImportTablesInputBoundary.UnsupportedFormatError,
+        ),
+        (
+            GraphTableStore.MalformedTableError,
+            ImportTablesInputBoundary.MalformedTableError,
+        ),
+    ],
+)
+def test_import_tables_with_unreadable_table(
+    store_error: type[Exception],
+    expected_error: type[Exception],
+) -> None:
+    mock_table_store = mock.Mock(spec_set=GraphTableStore)
+    mock_table_store.import_tables.side_effect = store_error
+    mock_presenter = mock.Mock(spec_set=ImportTablesOutputBoundary)
+
+    with pytest.raises(expected_error):
+        ImportTablesUseCase(table_store=mock_table_store).execute(
+            input_data=ImportTablesInputData(
+                node_file_path="nodes.xlsx",
+                edge_file_path=None,
+            ),
+            output_boundary=mock_presenter,
+        )
+
+    assert mock_presenter.present.call_count == 0
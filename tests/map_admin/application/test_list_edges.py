@@ -83,6 +83,7 @@ def test_list_edges(
                     is_stair=False,
                     is_step=False,
                     quality=RoadQuality.HIGH.value,
+                    version=1,
                 ),
             ],
         ),
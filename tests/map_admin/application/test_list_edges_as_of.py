@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from map_admin.application.boundaries import ListEdgesOutputBoundary
+from map_admin.application.dtos import ListEdgesAsOfInputData, ListEdgesOutputData
+from map_admin.application.services import GraphHistory
+from map_admin.application.use_cases import ListEdgesAsOfUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.value_objects import Point, RoadQuality
+
+AS_OF = datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc)
+
+
+def test_list_edges_as_of() -> None:
+    edge = Edge(
+        node_ids=(1, 2),
+        vertical_distance=Decimal("0.5"),
+        horizontal_distance=Decimal("10.0"),
+        is_stair=True,
+        is_step=False,
+        quality=RoadQuality.LOW,
+        version=2,
+    )
+    mock_history = mock.Mock(spec_set=GraphHistory)
+    mock_history.get_nodes_as_of.return_value = [
+        Node(
+            id=node_id,
+            name=name,
+            point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+            edges=[edge],
+        )
+        for node_id, name in [(1, "A"), (2, "B")]
+    ]
+    mock_presenter = mock.Mock(spec_set=ListEdgesOutputBoundary)
+
+    ListEdgesAsOfUseCase(history=mock_history).execute(
+        input_data=ListEdgesAsOfInputData(as_of=AS_OF),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_history.get_nodes_as_of.call_args_list == [mock.call(as_of=AS_OF)]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data_list=[
+                ListEdgesOutputData(
+                    nodes=(
+                        ListEdgesOutputData.Node(id=1, name="A"),
+                        ListEdgesOutputData.Node(id=2, name="B"),
+                    ),
+                    vertical_distance=Decimal("0.5"),
+                    horizontal_distance=Decimal("10.0"),
+                    is_stair=True,
+                    is_step=False,
+                    quality=RoadQuality.LOW.value,
+                    version=2,
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from map_admin.application.boundaries import ListHistoryOutputBoundary
+from map_admin.application.dtos import ListHistoryInputData, ListHistoryOutputData
+from map_admin.application.services import GraphHistory, HistoryEntry
+from map_admin.application.use_cases import ListHistoryUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import EdgeDeleted, GraphReplaced, NodeCreated
+from map_admin.domain.value_objects import Point, RoadQuality
+
+RECORDED_AT = datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc)
+
+
+def test_list_history() -> None:
+    # Given
+    mock_history = mock.Mock(spec_set=GraphHistory)
+    mock_history.list_entries.return_value = [
+        HistoryEntry(
+            id=11,
+            recorded_at=RECORDED_AT,
+            author="jseop",
+            event=NodeCreated(
+                node=Node(
+                    id=3,
+                    name="C",
+                    point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+                ),
+            ),
+        ),
+        HistoryEntry(
+            id=12,
+            recorded_at=RECORDED_AT,
+            author=None,
+            event=EdgeDeleted(
+                edge=Edge(
+                    node_ids=(2, 3),
+                    vertical_distance=Decimal("0.0"),
+                    horizontal_distance=Decimal("1.0"),
+                    is_stair=False,
+                    is_step=False,
+                    quality=RoadQuality.HIGH,
+                ),
+            ),
+        ),
+        HistoryEntry(
+            id=13, recorded_at=RECORDED_AT, author=None, event=GraphReplaced()
+        ),
+    ]
+    mock_presenter = mock.Mock(spec_set=ListHistoryOutputBoundary)
+
+    # When
+    ListHistoryUseCase(history=mock_history).execute(
+        input_data=ListHistoryInputData(after_id=10, limit=3),
+        output_boundary=mock_presenter,
+    )
+
+    # Then
+    assert mock_history.list_entries.call_args_list == [
+        mock.call(after_id=10, limit=3),
+    ]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data_list=[
+                ListHistoryOutputData(
+                    id=11,
+                    recorded_at=RECORDED_AT,
+                    author="jseop",
+                    kind="node_created",
+                    node_id=3,
+                    node_ids=None,
+                ),
+                ListHistoryOutputData(
+                    id=12,
+                    recorded_at=RECORDED_AT,
+                    author=None,
+                    kind="edge_deleted",
+                    node_id=None,
+                    node_ids=(2, 3),
+                ),
+                ListHistoryOutputData(
+                    id=13,
+                    recorded_at=RECORDED_AT,
+                    author=None,
+                    kind="graph_replaced",
+                    node_id=None,
+                    node_ids=None,
+                ),
+            ],
+        ),
+    ]
@@ -23,7 +23,11 @@ def mock_node_repo() -> mock.Mock:
         Node(
             id=2,
             name="B",
-            point=Point(longitude=Decimal("3.0"), latitude=Decimal("4.0")),
+            point=Point(
+                longitude=Decimal("3.0"),
+                latitude=Decimal("4.0"),
+                elevation=Decimal("30.5"),
+            ),
         ),
     ]
     return mock_node_repo
@@ -53,12 +57,16 @@ def test_list_nodes(
                     name="A",
                     longitude=Decimal("1.0"),
                     latitude=Decimal("2.0"),
+                    elevation=None,
+                    version=1,
                 ),
                 ListNodesOutputData(
                     id=2,
                     name="B",
                     longitude=Decimal("3.0"),
                     latitude=Decimal("4.0"),
+                    elevation=Decimal("30.5"),
+                    version=1,
                 ),
             ],
         ),
@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    ListNodesAsOfInputBoundary,
+    ListNodesOutputBoundary,
+)
+from map_admin.application.dtos import ListNodesAsOfInputData, ListNodesOutputData
+from map_admin.application.services import GraphHistory
+from map_admin.application.use_cases import ListNodesAsOfUseCase
+from map_admin.domain.entities import Node
+from map_admin.domain.value_objects import Point
+
+AS_OF = datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc)
+
+
+def test_list_nodes_as_of() -> None:
+    mock_history = mock.Mock(spec_set=GraphHistory)
+    mock_history.get_nodes_as_of.return_value = [
+        Node(
+            id=1,
+            name="A",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            version=3,
+        ),
+    ]
+    mock_presenter = mock.Mock(spec_set=ListNodesOutputBoundary)
+
+    ListNodesAsOfUseCase(history=mock_history).execute(
+        input_data=ListNodesAsOfInputData(as_of=AS_OF),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_history.get_nodes_as_of.call_args_list == [mock.call(as_of=AS_OF)]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data_list=[
+                ListNodesOutputData(
+                    id=1,
+                    name="A",
+                    longitude=Decimal("1.0"),
+                    latitude=Decimal("2.0"),
+                    elevation=None,
+                    version=3,
+                ),
+            ],
+        ),
+    ]
+
+
+def test_list_nodes_before_history() -> None:
+    mock_history = mock.Mock(spec_set=GraphHistory)
+    mock_history.get_nodes_as_of.side_effect = GraphHistory.HistoryNotAvailableError
+
+    with pytest.raises(ListNodesAsOfInputBoundary.HistoryNotAvailableError):
+        ListNodesAsOfUseCase(history=mock_history).execute(
+            input_data=ListNodesAsOfInputData(as_of=AS_OF),
+            output_boundary=mock.Mock(spec_set=ListNodesOutputBoundary),
+        )
@@ -6,8 +6,10 @@ import pytest
 
 from map_admin.application.dtos import PartialUpdateEdgeInputData
 from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import GraphEventBus
 from map_admin.application.use_cases import PartialUpdateEdgeUseCase
 from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import EdgeUpdated
 from map_admin.domain.value_objects import Point, RoadQuality
 
 
@@ -82,8 +84,10 @@ def test_partial_update_edge(
         ),
     }
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    side_effect: Callable[[int], Node] = lambda node_id: nodes[node_id]
-    mock_node_repo.get_node_by_id.side_effect = side_effect
+    side_effect: Callable[[list[int]], list[Node]] = lambda node_ids: [
+        nodes[node_id] for node_id in node_ids
+    ]
+    mock_node_repo.get_nodes_by_ids.side_effect = side_effect
 
     PartialUpdateEdgeUseCase(
         node_repo=mock_node_repo,
@@ -95,36 +99,28 @@ def test_partial_update_edge(
             is_stair=input_is_stair,
             is_step=input_is_step,
             quality=input_quality,
+            version=None,
         ),
     )
 
-    assert mock_node_repo.update_node.call_args_list == [
+    assert mock_node_repo.update_edge.call_args_list == [
         mock.call(
-            node=Node(
-                id=1,
-                name="A",
-                point=Point(
-                    longitude=Decimal("1.0"),
-                    latitude=Decimal("2.0"),
-                ),
-                edges=[
-                    Edge(
-                        node_ids=(1, 2),
-                        vertical_distance=expected_vertical_distance,
-                        horizontal_distance=expected_horizontal_distance,
-                        is_stair=expected_is_stair,
-                        is_step=expected_is_step,
-                        quality=expected_quality,
-                    ),
-                ],
+            edge=Edge(
+                node_ids=(1, 2),
+                vertical_distance=expected_vertical_distance,
+                horizontal_distance=expected_horizontal_distance,
+                is_stair=expected_is_stair,
+                is_step=expected_is_step,
+                quality=expected_quality,
             ),
         ),
     ]
+    assert not mock_node_repo.update_node.called
 
 
 def test_partial_update_edge_with_invalid_node_id() -> None:
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [NodeRepository.NodeNotFoundError]
+    mock_node_repo.get_nodes_by_ids.side_effect = NodeRepository.NodeNotFoundError
 
     with pytest.raises(PartialUpdateEdgeUseCase.NodeNotFoundError):
         PartialUpdateEdgeUseCase(
@@ -137,10 +133,11 @@ def test_partial_update_edge_with_invalid_node_id() -> None:
                 is_stair=False,
                 is_step=False,
                 quality=RoadQuality.HIGH,
+                version=None,
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.update_edge.called
 
 
 def test_partial_update_edge_with_same_node() -> None:
@@ -153,7 +150,7 @@ def test_partial_update_edge_with_same_node() -> None:
         ),
     )
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    mock_node_repo.get_node_by_id.side_effect = [node, node]
+    mock_node_repo.get_nodes_by_ids.return_value = [node, node]
 
     with pytest.raises(PartialUpdateEdgeUseCase.ConnectingSameNodeError):
         PartialUpdateEdgeUseCase(
@@ -166,10 +163,11 @@ def test_partial_update_edge_with_same_node() -> None:
                 is_stair=False,
                 is_step=False,
                 quality=RoadQuality.HIGH,
+                version=None,
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.update_edge.called
 
 
 def test_partial_update_edge_with_no_edge_between_nodes() -> None:
@@ -194,8 +192,10 @@ def test_partial_update_edge_with_no_edge_between_nodes() -> None:
         ),
     }
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
-    side_effect: Callable[[int], Node] = lambda node_id: nodes[node_id]
-    mock_node_repo.get_node_by_id.side_effect = side_effect
+    side_effect: Callable[[list[int]], list[Node]] = lambda node_ids: [
+        nodes[node_id] for node_id in node_ids
+    ]
+    mock_node_repo.get_nodes_by_ids.side_effect = side_effect
 
     with pytest.raises(PartialUpdateEdgeUseCase.EdgeNotFoundError):
         PartialUpdateEdgeUseCase(
@@ -208,7 +208,103 @@ def test_partial_update_edge_with_no_edge_between_nodes() -> None:
                 is_stair=False,
                 is_step=False,
                 quality=RoadQuality.HIGH,
+                version=None,
             ),
         )
 
-    assert not mock_node_repo.update_node.called
+    assert not mock_node_repo.update_edge.called
+
+
+def test_partial_update_edge_publishes_event() -> None:
+    nodes: dict[int, Node] = {
+        node_id: Node(
+            id=node_id,
+            name=f"Node {node_id}",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            edges=[
+                Edge(
+                    node_ids=(1, 2),
+                    vertical_distance=Decimal("0.0"),
+                    horizontal_distance=Decimal("2.0"),
+                    is_stair=False,
+                    is_step=False,
+                    quality=RoadQuality.HIGH,
+                ),
+            ],
+        )
+        for node_id in (1, 2)
+    }
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    side_effect: Callable[[list[int]], list[Node]] = lambda node_ids: [
+        nodes[node_id] for node_id in node_ids
+    ]
+    mock_node_repo.get_nodes_by_ids.side_effect = side_effect
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+
+    PartialUpdateEdgeUseCase(
+        node_repo=mock_node_repo,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=PartialUpdateEdgeInputData(
+            node_ids=(1, 2),
+            vertical_distance=None,
+            horizontal_distance=Decimal("3.0"),
+            is_stair=None,
+            is_step=None,
+            quality=None,
+            version=None,
+        ),
+    )
+
+    (event,) = [call.args[0] for call in mock_event_bus.publish.call_args_list]
+    assert isinstance(event, EdgeUpdated)
+    assert event.before.horizontal_distance == Decimal("2.0")
+    assert event.after == nodes[1].edges[0]
+    assert event.after.horizontal_distance == Decimal("3.0")
+
+
+@pytest.mark.parametrize("version, expected_conflict", [(2, True), (3, False)])
+def test_partial_update_edge_checks_version(
+    version: int,
+    expected_conflict: bool,
+) -> None:
+    edge = Edge(
+        node_ids=(1, 2),
+        vertical_distance=Decimal("1.0"),
+        horizontal_distance=Decimal("2.0"),
+        is_stair=False,
+        is_step=False,
+        quality=RoadQuality.HIGH,
+        version=3,
+    )
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_nodes_by_ids.return_value = [
+        Node(
+            id=node_id,
+            name=name,
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            edges=[edge],
+        )
+        for node_id, name in ((1, "A"), (2, "B"))
+    ]
+    input_data = PartialUpdateEdgeInputData(
+        node_ids=(1, 2),
+        vertical_distance=None,
+        horizontal_distance=None,
+        is_stair=True,
+        is_step=None,
+        quality=None,
+        version=version,
+    )
+
+    if expected_conflict:
+        with pytest.raises(PartialUpdateEdgeUseCase.VersionConflictError):
+            PartialUpdateEdgeUseCase(node_repo=mock_node_repo).execute(
+                input_data=input_data
+            )
+        assert not mock_node_repo.update_edge.called
+    else:
+        PartialUpdateEdgeUseCase(node_repo=mock_node_repo).execute(
+            input_data=input_data
+        )
+        assert mock_node_repo.update_edge.called
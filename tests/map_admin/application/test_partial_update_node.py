@@ -6,8 +6,10 @@ import pytest
 from map_admin.application.boundaries import PartialUpdateNodeInputBoundary
 from map_admin.application.dtos import PartialUpdateNodeInputData
 from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import GraphEventBus
 from map_admin.application.use_cases import PartialUpdateNodeUseCase
 from map_admin.domain.entities import Node
+from map_admin.domain.events import NodeUpdated
 from map_admin.domain.value_objects import Point
 
 
@@ -49,9 +51,13 @@ def test_partial_update_node(
             name=name,
             longitude=longitude,
             latitude=latitude,
+            version=None,
         ),
     )
 
+    assert mock_node_repo.get_node_by_id.call_args_list == [
+        mock.call(node_id=1, include_edges=False),
+    ]
     assert mock_node_repo.update_node.call_args_list == [
         mock.call(
             node=Node(
@@ -66,6 +72,82 @@ def test_partial_update_node(
     ]
 
 
+def test_partial_update_node_keeps_zero_coordinates_and_elevation() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = Node(
+        id=1,
+        name="A",
+        point=Point(
+            longitude=Decimal("1.0"),
+            latitude=Decimal("2.0"),
+            elevation=Decimal("35.5"),
+        ),
+    )
+
+    PartialUpdateNodeUseCase(
+        node_repo=mock_node_repo,
+    ).execute(
+        input_data=PartialUpdateNodeInputData(
+            id=1,
+            name=None,
+            longitude=Decimal("0.0"),
+            latitude=None,
+            version=None,
+        ),
+    )
+
+    assert mock_node_repo.update_node.call_args_list == [
+        mock.call(
+            node=Node(
+                id=1,
+                name="A",
+                point=Point(
+                    longitude=Decimal("0.0"),
+                    latitude=Decimal("2.0"),
+                    elevation=Decimal("35.5"),
+                ),
+            ),
+        ),
+    ]
+
+
+@pytest.mark.parametrize("name, expected_published", [("B", True), ("A", False)])
+def test_partial_update_node_publishes_event(
+    name: str,
+    expected_published: bool,
+) -> None:
+    point = Point(longitude=Decimal("1.0"), latitude=Decimal("2.0"))
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = Node(id=1, name="A", point=point)
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+
+    PartialUpdateNodeUseCase(
+        node_repo=mock_node_repo,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=PartialUpdateNodeInputData(
+            id=1,
+            name=name,
+            longitude=None,
+            latitude=None,
+            version=None,
+        ),
+    )
+
+    assert mock_event_bus.publish.call_args_list == (
+        [
+            mock.call(
+                NodeUpdated(
+                    before=Node(id=1, name="A", point=point),
+                    after=Node(id=1, name=name, point=point),
+                )
+            )
+        ]
+        if expected_published
+        else []
+    )
+
+
 def test_partial_update_node_with_invalid_id() -> None:
     mock_node_repo = mock.Mock(spec_set=NodeRepository)
     mock_node_repo.get_node_by_id.side_effect = [NodeRepository.NodeNotFoundError]
@@ -79,7 +161,57 @@ def test_partial_update_node_with_invalid_id() -> None:
                 name="A updated",
                 longitude=Decimal("5.0"),
                 latitude=Decimal("6.0"),
+                version=None,
             ),
         )
 
     assert not mock_node_repo.update_node.called
+
+
+def test_partial_update_node_with_stale_version() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = Node(
+        id=1,
+        name="A",
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        version=3,
+    )
+
+    with pytest.raises(PartialUpdateNodeInputBoundary.VersionConflictError):
+        PartialUpdateNodeUseCase(
+            node_repo=mock_node_repo,
+        ).execute(
+            input_data=PartialUpdateNodeInputData(
+                id=1,
+                name="A updated",
+                longitude=None,
+                latitude=None,
+                version=2,
+            ),
+        )
+
+    assert not mock_node_repo.update_node.called
+
+
+def test_partial_update_node_saved_concurrently() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = Node(
+        id=1,
+        name="A",
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        version=2,
+    )
+    mock_node_repo.update_node.side_effect = [NodeRepository.VersionConflictError]
+
+    with pytest.raises(PartialUpdateNodeInputBoundary.VersionConflictError):
+        PartialUpdateNodeUseCase(
+            node_repo=mock_node_repo,
+        ).execute(
+            input_data=PartialUpdateNodeInputData(
+                id=1,
+                name="A updated",
+                longitude=None,
+                latitude=None,
+                version=2,
+            ),
+        )
@@ -0,0 +1,84 @@
+from decimal import Decimal
+from unittest import mock
+
+from map_admin.application.boundaries import RecomputeEdgeDistancesOutputBoundary
+from map_admin.application.dtos import RecomputeEdgeDistancesOutputData
+from map_admin.application.repositories import NodeRepository
+from map_admin.application.use_cases import RecomputeEdgeDistancesUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.geometry import haversine_distance
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+def test_recompute_edge_distances() -> None:
+    points: dict[int, Point] = {
+        1: Point(longitude=Decimal("127.0286"), latitude=Decimal("37.5864")),
+        2: Point(longitude=Decimal("127.0290"), latitude=Decimal("37.5870")),
+        3: Point(longitude=Decimal("127.0301"), latitude=Decimal("37.5859")),
+    }
+    edges: dict[tuple[int, int], Edge] = {
+        (1, 2): Edge(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("1.0"),
+            horizontal_distance=Decimal("2.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        (2, 3): Edge(
+            node_ids=(3, 2),
+            vertical_distance=Decimal("3.0"),
+            horizontal_distance=Decimal("4.0"),
+            is_stair=True,
+            is_step=False,
+            quality=RoadQuality.LOW,
+        ),
+    }
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_all_nodes.return_value = [
+        Node(id=1, name="A", point=points[1], edges=[edges[(1, 2)]]),
+        Node(id=2, name="B", point=points[2], edges=[edges[(1, 2)], edges[(2, 3)]]),
+        Node(id=3, name="C", point=points[3], edges=[edges[(2, 3)]]),
+    ]
+    mock_node_repo.locked.return_value = mock.MagicMock()
+    mock_presenter = mock.Mock(spec_set=RecomputeEdgeDistancesOutputBoundary)
+
+    RecomputeEdgeDistancesUseCase(
+        node_repo=mock_node_repo,
+    ).execute(
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_node_repo.bulk_update_edges.call_args_list == [
+        mock.call(
+            edges=[
+                Edge(
+                    node_ids=(1, 2),
+                    vertical_distance=Decimal("1.0"),
+                    horizontal_distance=haversine_distance(points[1], points[2]),
+                    is_stair=False,
+                    is_step=False,
+                    quality=RoadQuality.HIGH,
+                ),
+                Edge(
+                    node_ids=(3, 2),
+                    vertical_distance=Decimal("3.0"),
+                    horizontal_distance=haversine_distance(points[3], points[2]),
+                    is_stair=True,
+                    is_step=False,
+                    quality=RoadQuality.LOW,
+                ),
+            ],
+        ),
+    ]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(output_data=RecomputeEdgeDistancesOutputData(updated_count=2)),
+    ]
+    # an edit cannot land between the read and the write
+    assert [name for name, _, _ in mock_node_repo.mock_calls] == [
+        "locked",
+        "locked().__enter__",
+        "get_all_nodes",
+        "bulk_update_edges",
+        "locked().__exit__",
+    ]
@@ -0,0 +1,79 @@
+from dataclasses import replace
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.services import RouteCache
+from map_admin.application.subscribers import RouteCacheInvalidator
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeDeleted,
+    EdgeUpdated,
+    GraphReplaced,
+    NodeCreated,
+    NodeDeleted,
+    NodeUpdated,
+)
+from map_admin.domain.value_objects import Point, RoadQuality
+
+EDGE = Edge(
+    node_ids=(1, 2),
+    vertical_distance=Decimal("0.0"),
+    horizontal_distance=Decimal("2.0"),
+    is_stair=False,
+    is_step=False,
+    quality=RoadQuality.HIGH,
+)
+NODE = Node(
+    id=1,
+    name="A",
+    point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+    edges=[EDGE],
+)
+
+
+@pytest.mark.parametrize(
+    "horizontal_distance, is_shortened",
+    [(Decimal("1.0"), True), (Decimal("3.0"), False)],
+)
+def test_edge_updated(horizontal_distance: Decimal, is_shortened: bool) -> None:
+    mock_route_cache = mock.Mock(spec_set=RouteCache)
+
+    RouteCacheInvalidator(route_cache=mock_route_cache).handle(
+        EdgeUpdated(
+            before=EDGE,
+            after=replace(EDGE, horizontal_distance=horizontal_distance),
+        )
+    )
+
+    if is_shortened:
+        assert mock_route_cache.invalidate_all.call_count == 1
+        assert not mock_route_cache.invalidate_edge.called
+    else:
+        assert not mock_route_cache.invalidate_all.called
+        assert mock_route_cache.invalidate_edge.call_args_list == [
+            mock.call(node_ids=(1, 2)),
+        ]
+
+
+def test_other_events() -> None:
+    mock_route_cache = mock.Mock(spec_set=RouteCache)
+    invalidator = RouteCacheInvalidator(route_cache=mock_route_cache)
+
+    invalidator.handle(NodeCreated(node=NODE))
+    invalidator.handle(NodeUpdated(before=NODE, after=replace(NODE, name="B")))
+    assert mock_route_cache.method_calls == []
+
+    invalidator.handle(NodeDeleted(node=NODE))
+    invalidator.handle(EdgeDeleted(edge=EDGE))
+    invalidator.handle(EdgeCreated(edge=EDGE))
+    invalidator.handle(GraphReplaced())
+
+    assert mock_route_cache.method_calls == [
+        mock.call.invalidate_node(node_id=1),
+        mock.call.invalidate_edge(node_ids=(1, 2)),
+        mock.call.invalidate_all(),
+        mock.call.invalidate_all(),
+    ]
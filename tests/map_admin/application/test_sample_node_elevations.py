@@ -0,0 +1,144 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    SampleNodeElevationsInputBoundary,
+    SampleNodeElevationsOutputBoundary,
+)
+from map_admin.application.dtos import SampleNodeElevationsOutputData
+from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import ElevationProvider
+from map_admin.application.use_cases import SampleNodeElevationsUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+def make_nodes() -> list[Node]:
+    edges: dict[tuple[int, int], Edge] = {
+        (1, 2): Edge(
+            node_ids=(1, 2),
+            vertical_distance=Decimal("1.0"),
+            horizontal_distance=Decimal("2.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+        (2, 3): Edge(
+            node_ids=(2, 3),
+            vertical_distance=Decimal("3.0"),
+            horizontal_distance=Decimal("4.0"),
+            is_stair=False,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        ),
+    }
+    return [
+        Node(
+            id=1,
+            name="A",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            edges=[edges[(1, 2)]],
+        ),
+        Node(
+            id=2,
+            name="B",
+            point=Point(longitude=Decimal("3.0"), latitude=Decimal("4.0")),
+            edges=[edges[(1, 2)], edges[(2, 3)]],
+        ),
+        Node(
+            id=3,
+            name="C",
+            point=Point(longitude=Decimal("5.0"), latitude=Decimal("6.0")),
+            edges=[edges[(2, 3)]],
+        ),
+    ]
+
+
+def test_sample_node_elevations() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_all_nodes.return_value = make_nodes()
+    mock_elevation_provider = mock.Mock(spec_set=ElevationProvider)
+    mock_elevation_provider.get_elevations.return_value = [
+        Decimal("10.25"),
+        Decimal("12.50"),
+        None,
+    ]
+    mock_presenter = mock.Mock(spec_set=SampleNodeElevationsOutputBoundary)
+
+    SampleNodeElevationsUseCase(
+        node_repo=mock_node_repo,
+        elevation_provider=mock_elevation_provider,
+    ).execute(
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_node_repo.bulk_update_nodes.call_args_list == [
+        mock.call(
+            nodes=[
+                Node(
+                    id=1,
+                    name="A",
+                    point=Point(
+                        longitude=Decimal("1.0"),
+                        latitude=Decimal("2.0"),
+                        elevation=Decimal("10.25"),
+                    ),
+                ),
+                Node(
+                    id=2,
+                    name="B",
+                    point=Point(
+                        longitude=Decimal("3.0"),
+                        latitude=Decimal("4.0"),
+                        elevation=Decimal("12.50"),
+                    ),
+                ),
+            ],
+        ),
+    ]
+    assert mock_node_repo.bulk_update_edges.call_args_list == [
+        mock.call(
+            edges=[
+                Edge(
+                    node_ids=(1, 2),
+                    vertical_distance=Decimal("2.25"),
+                    horizontal_distance=Decimal("2.0"),
+                    is_stair=False,
+                    is_step=False,
+                    quality=RoadQuality.HIGH,
+                ),
+            ],
+        ),
+    ]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=SampleNodeElevationsOutputData(
+                updated_node_count=2,
+                updated_edge_count=1,
+            ),
+        ),
+    ]
+
+
+def test_sample_node_elevations_without_source() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_all_nodes.return_value = make_nodes()
+    mock_elevation_provider = mock.Mock(spec_set=ElevationProvider)
+    mock_elevation_provider.get_elevations.side_effect = [
+        ElevationProvider.ElevationSourceUnavailableError
+    ]
+
+    with pytest.raises(
+        SampleNodeElevationsInputBoundary.ElevationSourceUnavailableError
+    ):
+        SampleNodeElevationsUseCase(
+            node_repo=mock_node_repo,
+            elevation_provider=mock_elevation_provider,
+        ).execute(
+            output_boundary=mock.Mock(spec_set=SampleNodeElevationsOutputBoundary),
+        )
+
+    assert not mock_node_repo.bulk_update_nodes.called
+    assert not mock_node_repo.bulk_update_edges.called
@@ -0,0 +1,185 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import UndoChangeInputBoundary
+from map_admin.application.dtos import UndoChangeInputData
+from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import GraphEventBus, GraphHistory, HistoryEntry
+from map_admin.application.use_cases import UndoChangeUseCase
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeUpdated,
+    GraphEvent,
+    GraphReplaced,
+    NodeCreated,
+    NodeDeleted,
+    NodeUpdated,
+)
+from map_admin.domain.value_objects import Point, RoadQuality
+
+
+def make_node(name: str, version: int = 1, edges: list[Edge] | None = None) -> Node:
+    return Node(
+        id=1,
+        name=name,
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        edges=edges or [],
+        version=version,
+    )
+
+
+def make_edge(quality: RoadQuality, version: int = 1) -> Edge:
+    return Edge(
+        node_ids=(1, 2),
+        vertical_distance=Decimal("0.5"),
+        horizontal_distance=Decimal("10.0"),
+        is_stair=False,
+        is_step=False,
+        quality=quality,
+        version=version,
+    )
+
+
+def make_history(event: GraphEvent) -> mock.Mock:
+    mock_history = mock.Mock(spec_set=GraphHistory)
+    mock_history.get_entry.return_value = HistoryEntry(
+        id=7,
+        recorded_at=datetime(2024, 3, 5, tzinfo=timezone.utc),
+        author="jseop",
+        event=event,
+    )
+    return mock_history
+
+
+def test_undo_node_update_restores_the_previous_values() -> None:
+    # Given
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = make_node("B", version=2)
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+
+    # When
+    UndoChangeUseCase(
+        node_repo=mock_node_repo,
+        history=make_history(
+            NodeUpdated(before=make_node("A"), after=make_node("B", version=2))
+        ),
+        event_bus=mock_event_bus,
+    ).execute(input_data=UndoChangeInputData(entry_id=7))
+
+    # Then
+    assert mock_node_repo.get_node_by_id.call_args_list == [
+        mock.call(node_id=1, include_edges=False),
+    ]
+    assert mock_node_repo.update_node.call_args_list == [
+        mock.call(node=make_node("A")),
+    ]
+    assert mock_event_bus.publish.call_args_list == [
+        mock.call(NodeUpdated(before=make_node("B"), after=make_node("A"))),
+    ]
+
+
+def test_undo_node_deletion_recreates_the_node_with_its_edges() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.side_effect = NodeRepository.NodeNotFoundError
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+    edge: Edge = make_edge(RoadQuality.HIGH)
+
+    UndoChangeUseCase(
+        node_repo=mock_node_repo,
+        history=make_history(NodeDeleted(node=make_node("A", edges=[edge]))),
+        event_bus=mock_event_bus,
+    ).execute(input_data=UndoChangeInputData(entry_id=7))
+
+    # the other end must still be there
+    assert mock_node_repo.get_nodes_by_ids.call_args_list == [
+        mock.call(node_ids=[2]),
+    ]
+    assert mock_node_repo.create_node.call_args_list == [
+        mock.call(node=make_node("A")),
+    ]
+    assert mock_node_repo.bulk_create_edges.call_args_list == [
+        mock.call(edges=[edge]),
+    ]
+    assert mock_event_bus.publish.call_args_list == [
+        mock.call(NodeCreated(node=make_node("A"))),
+        mock.call(EdgeCreated(edge=edge)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "event, current_node",
+    [
+        # edited again since
+        (
+            NodeUpdated(before=make_node("A"), after=make_node("B", version=2)),
+            make_node("C", version=3),
+        ),
+        # an edge was added to it since
+        (
+            NodeCreated(node=make_node("A")),
+            make_node("A", edges=[make_edge(RoadQuality.LOW)]),
+        ),
+    ],
+)
+def test_undo_refuses_to_overwrite_later_changes(
+    event: GraphEvent,
+    current_node: Node,
+) -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = current_node
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+
+    with pytest.raises(UndoChangeInputBoundary.VersionConflictError):
+        UndoChangeUseCase(
+            node_repo=mock_node_repo,
+            history=make_history(event),
+            event_bus=mock_event_bus,
+        ).execute(input_data=UndoChangeInputData(entry_id=7))
+
+    mock_node_repo.update_node.assert_not_called()
+    mock_node_repo.delete_node.assert_not_called()
+    mock_event_bus.publish.assert_not_called()
+
+
+def test_undo_edge_update_saved_concurrently_is_a_conflict() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_node_by_id.return_value = make_node(
+        "A", edges=[make_edge(RoadQuality.MEDIUM, version=2)]
+    )
+    mock_node_repo.update_edge.side_effect = NodeRepository.VersionConflictError
+
+    with pytest.raises(UndoChangeInputBoundary.VersionConflictError):
+        UndoChangeUseCase(
+            node_repo=mock_node_repo,
+            history=make_history(
+                EdgeUpdated(
+                    before=make_edge(RoadQuality.HIGH),
+                    after=make_edge(RoadQuality.MEDIUM, version=2),
+                )
+            ),
+        ).execute(input_data=UndoChangeInputData(entry_id=7))
+
+
+def test_undo_bulk_change_is_refused() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+
+    with pytest.raises(UndoChangeInputBoundary.IrreversibleChangeError):
+        UndoChangeUseCase(
+            node_repo=mock_node_repo,
+            history=make_history(GraphReplaced()),
+        ).execute(input_data=UndoChangeInputData(entry_id=7))
+
+
+def test_undo_unknown_entry() -> None:
+    mock_history = mock.Mock(spec_set=GraphHistory)
+    mock_history.get_entry.side_effect = GraphHistory.EntryNotFoundError
+
+    with pytest.raises(UndoChangeInputBoundary.EntryNotFoundError):
+        UndoChangeUseCase(
+            node_repo=mock.Mock(spec_set=NodeRepository),
+            history=mock_history,
+        ).execute(input_data=UndoChangeInputData(entry_id=7))
@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+
+from map_admin.application.boundaries import (
+    ValidateGraphInputBoundary,
+    ValidateGraphOutputBoundary,
+)
+from map_admin.application.dtos import ValidateGraphInputData, ValidateGraphOutputData
+from map_admin.application.services import (
+    GraphEventBus,
+    GraphValidator,
+    IntegrityReport,
+    IntegrityViolation,
+    ViolationKind,
+)
+from map_admin.application.use_cases import ValidateGraphUseCase
+
+
+@pytest.mark.parametrize("repaired", [True, False])
+def test_validate_graph(repaired: bool) -> None:
+    mock_graph_validator = mock.Mock(spec_set=GraphValidator)
+    mock_graph_validator.validate.return_value = IntegrityReport(
+        node_count=2,
+        edge_count=1,
+        violations=[
+            IntegrityViolation(
+                kind=ViolationKind.SELF_LOOP,
+                index=0,
+                message="Edge (1, 1) is a self-loop",
+            ),
+        ],
+        repaired=repaired,
+    )
+    mock_event_bus = mock.Mock(spec_set=GraphEventBus)
+    mock_presenter = mock.Mock(spec_set=ValidateGraphOutputBoundary)
+
+    ValidateGraphUseCase(
+        graph_validator=mock_graph_validator,
+        event_bus=mock_event_bus,
+    ).execute(
+        input_data=ValidateGraphInputData(repair=repaired),
+        output_boundary=mock_presenter,
+    )
+
+    assert mock_graph_validator.validate.call_args_list == [mock.call(repair=repaired)]
+    assert mock_presenter.present.call_args_list == [
+        mock.call(
+            output_data=ValidateGraphOutputData(
+                node_count=2,
+                edge_count=1,
+                violations=[
+                    ValidateGraphOutputData.Violation(
+                        kind="self_loop",
+                        index=0,
+                        message="Edge (1, 1) is a self-loop",
+                    ),
+                ],
+                repaired=repaired,
+            ),
+        ),
+    ]
+    assert mock_event_bus.publish.called == repaired
+
+
+def test_validate_graph_with_malformed_data() -> None:
+    mock_graph_validator = mock.Mock(spec_set=GraphValidator)
+    mock_graph_validator.validate.side_effect = GraphValidator.MalformedDataError
+
+    with pytest.raises(ValidateGraphInputBoundary.MalformedDataError):
+        ValidateGraphUseCase(
+            graph_validator=mock_graph_validator,
+        ).execute(
+            input_data=ValidateGraphInputData(repair=False),
+            output_boundary=mock.Mock(spec_set=ValidateGraphOutputBoundary),
+        )
@@ -0,0 +1,121 @@
+from decimal import Decimal
+
+from map_admin.domain.geometry import (
+    concave_hull,
+    convex_hull,
+    elevation_difference,
+    haversine_distance,
+    haversine_distances,
+)
+from map_admin.domain.value_objects import Point
+
+
+def test_haversine_distance() -> None:
+    result = haversine_distance(
+        Point(longitude=Decimal("127.0"), latitude=Decimal("37.0")),
+        Point(longitude=Decimal("127.0"), latitude=Decimal("38.0")),
+    )
+
+    assert result == Decimal("111195.08")
+
+
+def test_haversine_distance_with_same_point() -> None:
+    point = Point(longitude=Decimal("127.0286"), latitude=Decimal("37.5864"))
+
+    assert haversine_distance(point, point) == Decimal("0.00")
+
+
+def test_haversine_distances() -> None:
+    points: list[Point] = [
+        Point(longitude=Decimal("127.0286"), latitude=Decimal("37.5864")),
+        Point(longitude=Decimal("127.0290"), latitude=Decimal("37.5870")),
+        Point(longitude=Decimal("127.0301"), latitude=Decimal("37.5859")),
+    ]
+    point_pairs: list[tuple[Point, Point]] = [
+        (points[0], points[1]),
+        (points[1], points[2]),
+        (points[2], points[0]),
+    ]
+
+    result = haversine_distances(point_pairs)
+
+    assert result == [haversine_distance(a, b) for a, b in point_pairs]
+    assert haversine_distances([(b, a) for a, b in point_pairs]) == result
+
+
+def test_haversine_distances_with_empty_input() -> None:
+    assert haversine_distances([]) == []
+
+
+def test_elevation_difference() -> None:
+    result = elevation_difference(
+        Point(
+            longitude=Decimal("127.0"),
+            latitude=Decimal("37.0"),
+            elevation=Decimal("30.5"),
+        ),
+        Point(
+            longitude=Decimal("127.1"),
+            latitude=Decimal("37.0"),
+            elevation=Decimal("42.25"),
+        ),
+    )
+
+    assert result == Decimal("11.75")
+
+
+def test_elevation_difference_without_elevation() -> None:
+    result = elevation_difference(
+        Point(longitude=Decimal("127.0"), latitude=Decimal("37.0")),
+        Point(
+            longitude=Decimal("127.1"),
+            latitude=Decimal("37.0"),
+            elevation=Decimal("42.25"),
+        ),
+    )
+
+    assert result is None
+
+
+def test_convex_hull() -> None:
+    result = convex_hull([(0.0, 0.0), (2.0, 0.0), (1.0, 1.0), (2.0, 2.0), (0.0, 2.0)])
+
+    assert result == [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+
+
+def test_concave_hull() -> None:
+    # L-shaped cluster of points without the upper right quadrant
+    coordinates: list[tuple[float, float]] = [
+        (x * 0.001, y * 0.001)
+        for x in range(5)
+        for y in range(5)
+        if not (x > 2 and y > 2)
+    ]
+
+    result = concave_hull(coordinates)
+
+    assert result == [
+        (0.0, 0.0),
+        (0.001, 0.0),
+        (0.002, 0.0),
+        (0.003, 0.0),
+        (0.004, 0.0),
+        (0.004, 0.001),
+        (0.004, 0.002),
+        (0.003, 0.002),
+        (0.002, 0.002),
+        (0.002, 0.003),
+        (0.002, 0.004),
+        (0.001, 0.004),
+        (0.0, 0.004),
+        (0.0, 0.003),
+        (0.0, 0.002),
+        (0.0, 0.001),
+    ]
+
+
+def test_concave_hull_with_few_points() -> None:
+    assert concave_hull([(0.0, 0.0), (1.0, 0.0), (0.0, 0.0)]) == [
+        (0.0, 0.0),
+        (1.0, 0.0),
+    ]
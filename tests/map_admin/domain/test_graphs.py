@@ -0,0 +1,303 @@
+from decimal import Decimal
+
+import pytest
+
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.exceptions import NodeNotInGraphError
+from map_admin.domain.graphs import AccessibilityGraph, DisjointSet, Route, edge_cost
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
+
+
+def make_edge(
+    node_ids: tuple[int, int],
+    horizontal_distance: str,
+    vertical_distance: str = "0.0",
+    is_stair: bool = False,
+    is_step: bool = False,
+    quality: RoadQuality = RoadQuality.HIGH,
+) -> Edge:
+    return Edge(
+        node_ids=node_ids,
+        vertical_distance=Decimal(vertical_distance),
+        horizontal_distance=Decimal(horizontal_distance),
+        is_stair=is_stair,
+        is_step=is_step,
+        quality=quality,
+    )
+
+
+@pytest.fixture()
+def graph() -> AccessibilityGraph:
+    """
+    1 --100-- 2 --100(stair)-- 3
+    |                          |
+    +--------150(low)--------- 4 --50-- 3
+    """
+    edges: list[Edge] = [
+        make_edge((1, 2), "100.0"),
+        make_edge((2, 3), "100.0", is_stair=True),
+        make_edge((1, 4), "150.0", quality=RoadQuality.LOW),
+        make_edge((4, 3), "50.0"),
+    ]
+    return AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id in (3, 1, 4, 2, 5)
+        ],
+        version="v1",
+    )
+
+
+def test_graph_layout(graph: AccessibilityGraph) -> None:
+    assert list(graph.node_ids) == [1, 2, 3, 4, 5]
+    assert graph.node_count == 5
+    assert graph.edge_count == 4
+    assert list(graph.offsets) == [0, 2, 4, 6, 8, 8]
+    assert {
+        graph.node_ids[graph.targets[slot]]
+        for slot in range(graph.offsets[0], graph.offsets[1])
+    } == {2, 4}
+
+
+def test_graph_from_columns(graph: AccessibilityGraph) -> None:
+    columns = {
+        name: memoryview(column).toreadonly()  # type: ignore
+        for name, column in graph.columns().items()
+    }
+
+    restored = AccessibilityGraph.from_columns(columns, version=graph.version)
+
+    assert restored.version == "v1"
+    assert restored.node_ids is columns["node_ids"]
+    assert restored.shortest_path(
+        source_id=1, target_id=3, profile=AccessibilityProfile.WHEELCHAIR
+    ) == graph.shortest_path(
+        source_id=1, target_id=3, profile=AccessibilityProfile.WHEELCHAIR
+    )
+    with pytest.raises(NodeNotInGraphError):
+        restored.index_of(6)
+
+
+@pytest.mark.parametrize(
+    "profile, flags, vertical_distance, quality, expected_cost",
+    [
+        (AccessibilityProfile.PEDESTRIAN, 1, 5.0, RoadQuality.LOW, 60.0),
+        (AccessibilityProfile.WHEELCHAIR, 0, 0.0, RoadQuality.HIGH, 60.0),
+        (AccessibilityProfile.WHEELCHAIR, 0, 0.0, RoadQuality.LOW, 90.0),
+        (AccessibilityProfile.WHEELCHAIR, 0, 5.0, RoadQuality.HIGH, 120.0),
+        (AccessibilityProfile.WHEELCHAIR, 1, 0.0, RoadQuality.HIGH, float("inf")),
+        (AccessibilityProfile.WHEELCHAIR, 2, 0.0, RoadQuality.HIGH, float("inf")),
+    ],
+)
+def test_edge_cost(
+    profile: AccessibilityProfile,
+    flags: int,
+    vertical_distance: float,
+    quality: RoadQuality,
+    expected_cost: float,
+) -> None:
+    result = edge_cost(
+        profile=profile,
+        horizontal_distance=60.0,
+        vertical_distance=vertical_distance,
+        flags=flags,
+        quality=quality,
+    )
+
+    assert result == pytest.approx(expected_cost)
+
+
+def test_reachable(graph: AccessibilityGraph) -> None:
+    result = graph.reachable(
+        source_id=1,
+        max_cost=200.0,
+        profile=AccessibilityProfile.PEDESTRIAN,
+    )
+
+    assert result == {1: 0.0, 2: 100.0, 4: 150.0, 3: 200.0}
+
+
+def test_reachable_with_max_cost(graph: AccessibilityGraph) -> None:
+    result = graph.reachable(
+        source_id=1,
+        max_cost=120.0,
+        profile=AccessibilityProfile.PEDESTRIAN,
+    )
+
+    assert result == {1: 0.0, 2: 100.0}
+
+
+def test_reachable_by_wheelchair(graph: AccessibilityGraph) -> None:
+    result = graph.reachable(
+        source_id=2,
+        max_cost=1000.0,
+        profile=AccessibilityProfile.WHEELCHAIR,
+    )
+
+    assert result == {
+        2: 0.0,
+        1: pytest.approx(100.0),
+        4: pytest.approx(325.0),
+        3: pytest.approx(375.0),
+    }
+
+
+def test_reachable_with_unknown_node(graph: AccessibilityGraph) -> None:
+    with pytest.raises(NodeNotInGraphError):
+        graph.reachable(
+            source_id=6,
+            max_cost=100.0,
+            profile=AccessibilityProfile.PEDESTRIAN,
+        )
+
+
+def test_distances(graph: AccessibilityGraph) -> None:
+    result = graph.distances(
+        source_id=1,
+        target_ids=[3, 1, 5],
+        profile=AccessibilityProfile.PEDESTRIAN,
+    )
+
+    assert result == [200.0, 0.0, float("inf")]
+
+
+def test_distances_by_wheelchair(graph: AccessibilityGraph) -> None:
+    result = graph.distances(
+        source_id=2,
+        target_ids=[3],
+        profile=AccessibilityProfile.WHEELCHAIR,
+    )
+
+    assert result == [pytest.approx(375.0)]
+
+
+def test_shortest_path(graph: AccessibilityGraph) -> None:
+    route = graph.shortest_path(
+        source_id=1,
+        target_id=3,
+        profile=AccessibilityProfile.PEDESTRIAN,
+    )
+
+    assert route is not None
+    assert route.node_ids == (1, 2, 3)
+    assert route.cost == 200.0
+    assert route.edge_node_ids == [(1, 2), (2, 3)]
+
+
+def test_shortest_path_by_wheelchair(graph: AccessibilityGraph) -> None:
+    route = graph.shortest_path(
+        source_id=1,
+        target_id=3,
+        profile=AccessibilityProfile.WHEELCHAIR,
+    )
+
+    assert route is not None
+    assert route.node_ids == (1, 4, 3)
+    assert route.cost == pytest.approx(275.0)
+
+
+def test_shortest_path_without_route(graph: AccessibilityGraph) -> None:
+    assert (
+        graph.shortest_path(
+            source_id=1,
+            target_id=5,
+            profile=AccessibilityProfile.PEDESTRIAN,
+        )
+        is None
+    )
+
+
+def test_shortest_path_to_itself(graph: AccessibilityGraph) -> None:
+    route = graph.shortest_path(
+        source_id=5,
+        target_id=5,
+        profile=AccessibilityProfile.PEDESTRIAN,
+    )
+
+    assert route == Route(node_ids=(5,), cost=0.0)
+
+
+def test_alternative_routes(graph: AccessibilityGraph) -> None:
+    routes = graph.alternative_routes(
+        source_id=1,
+        target_id=3,
+        profile=AccessibilityProfile.PEDESTRIAN,
+    )
+
+    assert sorted(routes, key=lambda route: route.node_ids) == [
+        Route(node_ids=(1, 2, 3), cost=200.0, stair_count=1),
+        Route(node_ids=(1, 4, 3), cost=200.0, low_quality_length=150.0),
+    ]
+
+
+def test_alternative_routes_with_max_stretch(graph: AccessibilityGraph) -> None:
+    routes = graph.alternative_routes(
+        source_id=1,
+        target_id=4,
+        profile=AccessibilityProfile.PEDESTRIAN,
+        max_stretch=1.1,
+    )
+
+    assert [route.node_ids for route in routes] == [(1, 4)]
+
+
+def test_disjoint_set() -> None:
+    components = DisjointSet([1, 2, 3, 4, 5])
+
+    assert components.union(1, 2)
+    assert components.union(4, 3)
+    assert components.union(2, 4)
+    assert not components.union(1, 3)
+
+    assert components.find(3) == components.find(1)
+    assert 5 in components and 6 not in components
+    assert components.groups() == [[1, 2, 3, 4], [5]]
+
+
+def test_disjoint_set_discard() -> None:
+    components = DisjointSet([1, 2, 3])
+    components.union(1, 2)
+
+    assert components.discard(3)
+    assert components.discard(4)
+    assert not components.discard(1)
+    assert not components.discard(2)
+    assert components.groups() == [[1, 2]]
+
+
+@pytest.mark.parametrize(
+    "profile, expected_groups",
+    [
+        (AccessibilityProfile.PEDESTRIAN, [[1, 2, 3, 4], [5]]),
+        (AccessibilityProfile.WHEELCHAIR, [[1, 2, 3, 4], [5]]),
+    ],
+)
+def test_components(
+    graph: AccessibilityGraph,
+    profile: AccessibilityProfile,
+    expected_groups: list[list[int]],
+) -> None:
+    assert graph.components(profile).groups() == expected_groups
+
+
+def test_components_by_wheelchair_splits_stairs() -> None:
+    edges: list[Edge] = [make_edge((1, 2), "10.0", is_stair=True)]
+    graph = AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id in (1, 2)
+        ],
+    )
+
+    assert graph.components(AccessibilityProfile.PEDESTRIAN).groups() == [[1, 2]]
+    assert graph.components(AccessibilityProfile.WHEELCHAIR).groups() == [[1], [2]]
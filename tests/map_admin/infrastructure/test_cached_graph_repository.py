@@ -0,0 +1,49 @@
+from decimal import Decimal
+from unittest import mock
+
+from map_admin.application.repositories import NodeRepository
+from map_admin.domain.entities import Node
+from map_admin.domain.value_objects import Point
+from map_admin.infrastructure.metrics import MetricsRegistry
+from map_admin.infrastructure.repositories import CachedGraphRepository
+
+
+def test_get_graph_rebuilds_only_on_version_change() -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.side_effect = ["v1", "v1", "v2"]
+    mock_node_repo.get_all_nodes.return_value = [
+        Node(
+            id=1,
+            name="A",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        ),
+    ]
+    graph_repo = CachedGraphRepository(node_repo=mock_node_repo)
+
+    first = graph_repo.get_graph()
+    second = graph_repo.get_graph()
+    third = graph_repo.get_graph()
+
+    assert first is second
+    assert third is not first
+    assert (first.version, third.version) == ("v1", "v2")
+    assert mock_node_repo.get_all_nodes.call_count == 2
+
+
+def test_get_graph_exports_cache_metrics() -> None:
+    # Given
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.return_value = "v1"
+    mock_node_repo.get_all_nodes.return_value = []
+    metrics = MetricsRegistry()
+    graph_repo = CachedGraphRepository(node_repo=mock_node_repo, metrics=metrics)
+
+    # When
+    for _ in range(4):
+        graph_repo.get_graph()
+
+    # Then
+    rendered: str = metrics.render()
+    assert "graph_cache_hits_total 3.0\n" in rendered
+    assert "graph_cache_misses_total 1.0\n" in rendered
+    assert "graph_cache_hit_ratio 0.75\n" in rendered
@@ -0,0 +1,232 @@
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from map_admin.application.services import GraphHistory
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.events import (
+    EdgeCreated,
+    EdgeDeleted,
+    GraphReplaced,
+    NodeCreated,
+    NodeUpdated,
+)
+from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.infrastructure.history import FileGraphHistory, authored_by
+from map_admin.infrastructure.metrics import MetricsRegistry
+from map_admin.infrastructure.repositories import FileNodeRepository
+
+START = datetime(2024, 3, 5, 9, 0, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now: datetime = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def make_node(node_id: int, name: str) -> Node:
+    return Node(
+        id=node_id,
+        name=name,
+        point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+    )
+
+
+def summarize(nodes: list[Node]) -> list[tuple[int, str, list[tuple[int, ...]]]]:
+    return [
+        (node.id, node.name, sorted(tuple(edge.node_ids) for edge in node.edges))
+        for node in nodes
+    ]
+
+
+@pytest.fixture()
+def node_repo(tmp_path: Path) -> FileNodeRepository:
+    node_file_path: Path = tmp_path / "nodes.json"
+    edge_file_path: Path = tmp_path / "edges.json"
+    node_file_path.write_text(
+        json.dumps(
+            [
+                {"id": 1, "name": "A", "longitude": "1", "latitude": "1"},
+                {"id": 2, "name": "B", "longitude": "2", "latitude": "2"},
+            ]
+        )
+    )
+    edge_file_path.write_text("[]")
+    return FileNodeRepository(
+        node_file_path=str(node_file_path),
+        edge_file_path=str(edge_file_path),
+    )
+
+
+def test_reads_the_graph_as_of_any_recorded_time(
+    tmp_path: Path,
+    node_repo: FileNodeRepository,
+) -> None:
+    # Given
+    clock = Clock()
+    metrics = MetricsRegistry()
+    history = FileGraphHistory(
+        directory=tmp_path / "history",
+        node_file_path=node_repo.node_file_path,
+        edge_file_path=node_repo.edge_file_path,
+        checkpoint_interval=2,
+        metrics=metrics,
+        clock=clock,
+    )
+    edge = Edge(
+        node_ids=(1, 3),
+        vertical_distance=Decimal("0.0"),
+        horizontal_distance=Decimal("5.0"),
+        is_stair=False,
+        is_step=False,
+        quality=RoadQuality.HIGH,
+    )
+
+    # When
+    clock.now = START + timedelta(minutes=1)
+    node_repo.create_node(node=make_node(3, "C"))
+    history.record(event=NodeCreated(node=make_node(3, "C")))
+
+    clock.now = START + timedelta(minutes=2)
+    node_repo.add_edge(edge=edge)
+    history.record(event=EdgeCreated(edge=edge))
+
+    clock.now = START + timedelta(minutes=3)
+    before: Node = node_repo.get_node_by_id(node_id=1, include_edges=False)
+    after: Node = replace(before, name="A'")
+    node_repo.update_node(node=after)
+    with authored_by("jseop"):
+        history.record(event=NodeUpdated(before=before, after=after))
+
+    clock.now = START + timedelta(minutes=4)
+    node_repo.remove_edge(edge=edge)
+    history.record(event=EdgeDeleted(edge=edge))
+
+    # Then
+    with pytest.raises(GraphHistory.HistoryNotAvailableError):
+        history.get_nodes_as_of(as_of=START)
+    assert (tmp_path / "history" / "entries.jsonl").exists()
+    assert summarize(history.get_nodes_as_of(as_of=START + timedelta(minutes=1))) == [
+        (1, "A", []),
+        (2, "B", []),
+        (3, "C", []),
+    ]
+    assert summarize(
+        history.get_nodes_as_of(as_of=START + timedelta(minutes=2, seconds=30))
+    ) == [(1, "A", [(1, 3)]), (2, "B", []), (3, "C", [(1, 3)])]
+    assert summarize(
+        # without a timezone, taken as UTC
+        history.get_nodes_as_of(as_of=datetime(2024, 3, 5, 9, 3))
+    ) == [(1, "A'", [(1, 3)]), (2, "B", []), (3, "C", [(1, 3)])]
+    assert summarize(
+        history.get_nodes_as_of(as_of=START + timedelta(days=1))
+    ) == summarize(node_repo.get_all_nodes())
+
+    # checkpoints after entries 1 and 3; every read replayed at most one entry
+    assert sorted(
+        path.name for path in (tmp_path / "history" / "checkpoints").iterdir()
+    ) == ["1.json", "3.json"]
+    assert "graph_history_replayed_entries_total 2.0" in metrics.render()
+
+    # a new process finds the same entries through the file
+    reopened = FileGraphHistory(
+        directory=tmp_path / "history",
+        node_file_path=node_repo.node_file_path,
+        edge_file_path=node_repo.edge_file_path,
+    )
+    entries = reopened.list_entries(after_id=1, limit=2)
+    assert [(entry.id, entry.author, entry.event.kind) for entry in entries] == [
+        (2, None, "edge_created"),
+        (3, "jseop", "node_updated"),
+    ]
+    assert reopened.get_entry(entry_id=4).event == EdgeDeleted(edge=edge)
+    with pytest.raises(GraphHistory.EntryNotFoundError):
+        reopened.get_entry(entry_id=5)
+
+
+def test_reads_before_the_first_write_leave_no_files(
+    tmp_path: Path,
+    node_repo: FileNodeRepository,
+) -> None:
+    history = FileGraphHistory(
+        directory=tmp_path / "history",
+        node_file_path=node_repo.node_file_path,
+        edge_file_path=node_repo.edge_file_path,
+    )
+
+    assert history.list_entries(after_id=0, limit=10) == []
+    with pytest.raises(GraphHistory.HistoryNotAvailableError):
+        history.get_nodes_as_of(as_of=START)
+    with pytest.raises(GraphHistory.EntryNotFoundError):
+        history.get_entry(entry_id=1)
+    assert not (tmp_path / "history").exists()
+
+
+def test_graph_replacement_writes_a_checkpoint(
+    tmp_path: Path,
+    node_repo: FileNodeRepository,
+) -> None:
+    clock = Clock()
+    history = FileGraphHistory(
+        directory=tmp_path / "history",
+        node_file_path=node_repo.node_file_path,
+        edge_file_path=node_repo.edge_file_path,
+        checkpoint_interval=100,
+        clock=clock,
+    )
+    clock.now = START + timedelta(minutes=1)
+    history.record(event=NodeCreated(node=make_node(1, "A")))
+
+    # a bulk change records no deltas; the checkpoint is its only trace
+    clock.now = START + timedelta(minutes=2)
+    node_repo.bulk_create_nodes(nodes=[make_node(3, "C"), make_node(4, "D")])
+    entry = history.record(event=GraphReplaced())
+
+    assert entry.id == 2
+    assert [node.id for node in history.get_nodes_as_of(as_of=clock.now)] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+    # the clock going back does not reorder the entries
+    clock.now = START
+    assert history.record(event=GraphReplaced()).recorded_at == START + timedelta(
+        minutes=2
+    )
+
+
+def test_finds_checkpoints_written_by_another_worker(
+    tmp_path: Path,
+    node_repo: FileNodeRepository,
+) -> None:
+    clock = Clock()
+    histories: list[FileGraphHistory] = [
+        FileGraphHistory(
+            directory=tmp_path / "history",
+            node_file_path=node_repo.node_file_path,
+            edge_file_path=node_repo.edge_file_path,
+            clock=clock,
+        )
+        for _ in range(2)
+    ]
+    clock.now = START + timedelta(minutes=1)
+    histories[0].record(event=NodeCreated(node=make_node(1, "A")))
+    assert histories[1].list_entries(after_id=0, limit=10) != []
+
+    clock.now = START + timedelta(minutes=2)
+    node_repo.bulk_create_nodes(nodes=[make_node(3, "C")])
+    histories[0].record(event=GraphReplaced())
+
+    assert [node.id for node in histories[1].get_nodes_as_of(as_of=clock.now)] == [
+        1,
+        2,
+        3,
+    ]
@@ -0,0 +1,250 @@
+import json
+import sys
+import threading
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from map_admin.application.services import (
+    GraphTableStore,
+    IntegrityViolation,
+    TableImportReport,
+    ViolationKind,
+)
+from map_admin.domain.entities import Node
+from map_admin.domain.value_objects import Point
+from map_admin.infrastructure.repositories import FileNodeRepository
+from map_admin.infrastructure.tables import FileGraphTableStore
+
+NODES: list[dict[str, Any]] = [
+    {"id": 1, "name": "정문", "longitude": "127.0286", "latitude": "37.5864"},
+    {
+        "id": 2,
+        "name": "본관",
+        "longitude": "127.0290",
+        "latitude": "37.5870",
+        "elevation": "31.25",
+    },
+]
+EDGES: list[dict[str, Any]] = [
+    {
+        "node_ids": [1, 2],
+        "vertical_distance": "1.0",
+        "horizontal_distance": "2.0",
+        "is_stair": False,
+        "is_step": True,
+        "quality": "상",
+    },
+]
+
+
+@pytest.fixture()
+def table_store(tmp_path: Path) -> FileGraphTableStore:
+    (tmp_path / "node.json").write_text(json.dumps(NODES), encoding="utf-8")
+    (tmp_path / "edge.json").write_text(json.dumps(EDGES), encoding="utf-8")
+    return FileGraphTableStore(
+        node_file_path=str(tmp_path / "node.json"),
+        edge_file_path=str(tmp_path / "edge.json"),
+        chunk_size=1,
+    )
+
+
+def load(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_export_tables_to_csv(table_store: FileGraphTableStore, tmp_path: Path) -> None:
+    assert table_store.export_nodes(file_path=str(tmp_path / "nodes.csv")) == 2
+    assert table_store.export_edges(file_path=str(tmp_path / "edges.csv")) == 1
+
+    assert (tmp_path / "nodes.csv").read_text(encoding="utf-8").splitlines() == [
+        "id,name,longitude,latitude,elevation",
+        "1,정문,127.0286,37.5864,",
+        "2,본관,127.0290,37.5870,31.25",
+    ]
+    assert (tmp_path / "edges.csv").read_text(encoding="utf-8").splitlines() == [
+        (
+            "node_id_1,node_id_2,vertical_distance,horizontal_distance,"
+            "is_stair,is_step,quality"
+        ),
+        "1,2,1.0,2.0,False,True,상",
+    ]
+
+
+def test_import_tables_from_csv(
+    table_store: FileGraphTableStore, tmp_path: Path
+) -> None:
+    (tmp_path / "nodes.csv").write_text(
+        "\ufeffid,name,longitude,latitude\n3,중앙광장,127.0301,37.5859\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "edges.csv").write_text(
+        "node_id_1,node_id_2,vertical_distance,horizontal_distance,is_stair,is_step,"
+        "quality\n2,3,0.5,12.25,TRUE,false,하\n",
+        encoding="utf-8",
+    )
+
+    report: TableImportReport = table_store.import_tables(
+        node_file_path=str(tmp_path / "nodes.csv"),
+        edge_file_path=str(tmp_path / "edges.csv"),
+    )
+
+    assert report == TableImportReport(node_count=1, edge_count=1, violations=[])
+    assert load(table_store.node_file_path) == NODES + [
+        {"id": 3, "name": "중앙광장", "longitude": "127.0301", "latitude": "37.5859"},
+    ]
+    assert load(table_store.edge_file_path) == EDGES + [
+        {
+            "node_ids": [2, 3],
+            "vertical_distance": "0.5",
+            "horizontal_distance": "12.25",
+            "is_stair": True,
+            "is_step": False,
+            "quality": "하",
+        },
+    ]
+
+
+def test_import_tables_keeps_a_write_made_while_it_waits(
+    table_store: FileGraphTableStore, tmp_path: Path
+) -> None:
+    # Given
+    (tmp_path / "nodes.csv").write_text(
+        "id,name,longitude,latitude\n3,A,127.0,37.5\n", encoding="utf-8"
+    )
+    node_repo = FileNodeRepository(
+        node_file_path=table_store.node_file_path,
+        edge_file_path=table_store.edge_file_path,
+    )
+    importing = threading.Thread(
+        target=table_store.import_tables,
+        kwargs={"node_file_path": str(tmp_path / "nodes.csv"), "edge_file_path": None},
+    )
+
+    # When
+    with node_repo.locked():
+        importing.start()
+        importing.join(timeout=0.2)
+        assert importing.is_alive()
+        node_repo.create_node(
+            node=Node(
+                id=4,
+                name="B",
+                point=Point(longitude=Decimal("127.0"), latitude=Decimal("37.5")),
+            ),
+        )
+    importing.join()
+
+    # Then
+    assert [node_dict["id"] for node_dict in load(table_store.node_file_path)] == [
+        *(node_dict["id"] for node_dict in NODES),
+        4,
+        3,
+    ]
+
+
+def test_import_tables_rejects_all_rows_on_violation(
+    table_store: FileGraphTableStore, tmp_path: Path
+) -> None:
+    (tmp_path / "nodes.csv").write_text(
+        "id,name,longitude,latitude\n3,A,127.0,37.5\n2,B,127.0,37.5\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "edges.csv").write_text(
+        "node_id_1,node_id_2,vertical_distance,horizontal_distance,is_stair,is_step,"
+        "quality\n1,2,0,1,false,false,상\n3,9,0,1,false,false,상\n",
+        encoding="utf-8",
+    )
+
+    report: TableImportReport = table_store.import_tables(
+        node_file_path=str(tmp_path / "nodes.csv"),
+        edge_file_path=str(tmp_path / "edges.csv"),
+    )
+
+    assert report.violations == [
+        IntegrityViolation(
+            kind=ViolationKind.DUPLICATE_NODE_ID,
+            index=1,
+            message="Node id 2 is already used",
+        ),
+        IntegrityViolation(
+            kind=ViolationKind.DUPLICATE_EDGE,
+            index=0,
+            message="Edge (1, 2) duplicates an earlier edge",
+        ),
+        IntegrityViolation(
+            kind=ViolationKind.MISSING_NODE,
+            index=1,
+            message="Edge (3, 9) references missing node 9",
+        ),
+    ]
+    assert load(table_store.node_file_path) == NODES
+    assert load(table_store.edge_file_path) == EDGES
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "edge.json",
+        "edges.csv",
+        "node.json",
+        "node.json.lock",
+        "nodes.csv",
+    ]
+
+
+def test_import_tables_with_missing_columns(
+    table_store: FileGraphTableStore, tmp_path: Path
+) -> None:
+    (tmp_path / "nodes.csv").write_text("id,name\n3,A\n", encoding="utf-8")
+
+    with pytest.raises(GraphTableStore.MalformedTableError):
+        table_store.import_tables(
+            node_file_path=str(tmp_path / "nodes.csv"),
+            edge_file_path=None,
+        )
+
+    assert load(table_store.node_file_path) == NODES
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "edge.json",
+        "node.json",
+        "node.json.lock",
+        "nodes.csv",
+    ]
+
+
+def test_unsupported_format(
+    table_store: FileGraphTableStore,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # make pyarrow unimportable regardless of the environment
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(GraphTableStore.UnsupportedFormatError):
+        table_store.export_nodes(file_path=str(tmp_path / "nodes.xlsx"))
+    with pytest.raises(GraphTableStore.UnsupportedFormatError):
+        table_store.import_tables(
+            node_file_path=None,
+            edge_file_path=str(tmp_path / "edges.parquet"),
+        )
+
+
+def test_parquet_round_trip(table_store: FileGraphTableStore, tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    table_store.export_nodes(file_path=str(tmp_path / "nodes.parquet"))
+    table_store.export_edges(file_path=str(tmp_path / "edges.parquet"))
+    target = FileGraphTableStore(
+        node_file_path=str(tmp_path / "target_node.json"),
+        edge_file_path=str(tmp_path / "target_edge.json"),
+    )
+    for path in (target.node_file_path, target.edge_file_path):
+        Path(path).write_text("[]", encoding="utf-8")
+
+    report: TableImportReport = target.import_tables(
+        node_file_path=str(tmp_path / "nodes.parquet"),
+        edge_file_path=str(tmp_path / "edges.parquet"),
+    )
+
+    assert report == TableImportReport(node_count=2, edge_count=1, violations=[])
+    assert load(target.node_file_path) == NODES
+    assert load(target.edge_file_path) == EDGES
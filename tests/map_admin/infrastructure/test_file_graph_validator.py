@@ -0,0 +1,184 @@
+import io
+import json
+import threading
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from map_admin.application.services import (
+    GraphValidator,
+    IntegrityViolation,
+    ViolationKind,
+)
+from map_admin.domain.entities import Node
+from map_admin.domain.value_objects import Point
+from map_admin.infrastructure.repositories import FileNodeRepository
+from map_admin.infrastructure.validators import FileGraphValidator, iter_json_array
+
+
+def make_node(node_id: Any, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": node_id,
+        "name": f"Node {node_id}",
+        "longitude": "127.0",
+        "latitude": "37.5",
+        **fields,
+    }
+
+
+def make_edge(node_ids: list[Any], **fields: Any) -> dict[str, Any]:
+    return {
+        "node_ids": node_ids,
+        "vertical_distance": "1.0",
+        "horizontal_distance": "2.0",
+        "is_stair": False,
+        "is_step": False,
+        "quality": "상",
+        **fields,
+    }
+
+
+@pytest.fixture()
+def file_paths(tmp_path: Path) -> tuple[Path, Path]:
+    nodes: list[Any] = [
+        make_node(1),
+        make_node(2),
+        make_node(2),
+        make_node(3, latitude="91.0"),
+        "node",
+    ]
+    edges: list[Any] = [
+        make_edge([1, 2]),
+        make_edge([2, 1]),
+        make_edge([1, 1]),
+        make_edge([1, 4]),
+        make_edge([1, 3]),
+        make_edge([2, 5], quality="최상"),
+        make_edge(["1", 2]),
+    ]
+    node_file_path, edge_file_path = tmp_path / "node.json", tmp_path / "edge.json"
+    node_file_path.write_text(json.dumps(nodes, indent=4))
+    edge_file_path.write_text(json.dumps(edges, indent=4))
+    return node_file_path, edge_file_path
+
+
+def test_validate(file_paths: tuple[Path, Path]) -> None:
+    node_file_path, edge_file_path = file_paths
+    original: tuple[str, str] = (node_file_path.read_text(), edge_file_path.read_text())
+
+    report = FileGraphValidator(
+        node_file_path=str(node_file_path),
+        edge_file_path=str(edge_file_path),
+    ).validate(repair=False)
+
+    assert (report.node_count, report.edge_count, report.repaired) == (5, 7, False)
+    assert [(violation.kind, violation.index) for violation in report.violations] == [
+        (ViolationKind.DUPLICATE_NODE_ID, 2),
+        (ViolationKind.MALFORMED_NODE, 3),
+        (ViolationKind.MALFORMED_NODE, 4),
+        (ViolationKind.DUPLICATE_EDGE, 1),
+        (ViolationKind.SELF_LOOP, 2),
+        (ViolationKind.MISSING_NODE, 3),
+        (ViolationKind.MISSING_NODE, 4),
+        (ViolationKind.MALFORMED_EDGE, 5),
+        (ViolationKind.MALFORMED_EDGE, 6),
+    ]
+    assert report.violations[5] == IntegrityViolation(
+        kind=ViolationKind.MISSING_NODE,
+        index=3,
+        message="Edge (1, 4) references missing node 4",
+    )
+    assert (node_file_path.read_text(), edge_file_path.read_text()) == original
+
+
+def test_validate_with_repair(file_paths: tuple[Path, Path]) -> None:
+    node_file_path, edge_file_path = file_paths
+    validator = FileGraphValidator(
+        node_file_path=str(node_file_path),
+        edge_file_path=str(edge_file_path),
+    )
+
+    report = validator.validate(repair=True)
+
+    assert report.repaired
+    assert node_file_path.read_text() == json.dumps(
+        [make_node(1), make_node(2)], indent=4
+    )
+    assert edge_file_path.read_text() == json.dumps([make_edge([1, 2])], indent=4)
+    assert list(node_file_path.parent.glob("*.tmp")) == []
+
+    report = validator.validate(repair=True)
+
+    assert (report.node_count, report.edge_count) == (2, 1)
+    assert report.violations == []
+    assert not report.repaired
+
+
+def test_repair_keeps_a_write_made_while_it_waits(
+    file_paths: tuple[Path, Path],
+) -> None:
+    # Given
+    node_file_path, edge_file_path = file_paths
+    node_repo = FileNodeRepository(
+        node_file_path=str(node_file_path),
+        edge_file_path=str(edge_file_path),
+    )
+    validator = FileGraphValidator(
+        node_file_path=str(node_file_path),
+        edge_file_path=str(edge_file_path),
+    )
+    repairing = threading.Thread(target=validator.validate, kwargs={"repair": True})
+
+    # When
+    with node_repo.locked():
+        repairing.start()
+        repairing.join(timeout=0.2)
+        assert repairing.is_alive()
+        node_repo.create_node(
+            node=Node(
+                id=4,
+                name="Node 4",
+                point=Point(longitude=Decimal("127.0"), latitude=Decimal("37.5")),
+            ),
+        )
+    repairing.join()
+
+    # Then
+    assert json.loads(node_file_path.read_text()) == [
+        make_node(1),
+        make_node(2),
+        make_node(4),
+    ]
+
+
+def test_validate_with_malformed_file(tmp_path: Path) -> None:
+    node_file_path, edge_file_path = tmp_path / "node.json", tmp_path / "edge.json"
+    node_file_path.write_text('[{"id": 1}')
+    edge_file_path.write_text("[]")
+
+    with pytest.raises(GraphValidator.MalformedDataError):
+        FileGraphValidator(
+            node_file_path=str(node_file_path),
+            edge_file_path=str(edge_file_path),
+        ).validate(repair=True)
+
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+@pytest.mark.parametrize(
+    "items",
+    [[], [1234567, "a, b]", None], [make_node(1), [make_edge([1, 2])], 1.5]],
+)
+def test_iter_json_array(chunk_size: int, items: list[Any]) -> None:
+    file = io.StringIO(json.dumps(items, indent=4))
+
+    assert list(iter_json_array(file, chunk_size=chunk_size)) == items
+
+
+@pytest.mark.parametrize("content", ["{}", "[1, 2", "[1 2]", "[1,]"])
+def test_iter_json_array_with_malformed_content(content: str) -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.StringIO(content), chunk_size=2))
@@ -1,15 +1,24 @@
 import json
 import os
+from dataclasses import replace
 from decimal import Decimal
 from tempfile import NamedTemporaryFile
 from typing import Generator
+from unittest import mock
 
 import pytest
 
 from map_admin.application.repositories import NodeRepository
 from map_admin.domain.entities import Edge, Node
 from map_admin.domain.value_objects import Point, RoadQuality
-from map_admin.infrastructure.repositories import FileEdge, FileNode, FileNodeRepository
+from map_admin.infrastructure.metrics import MetricsRegistry
+from map_admin.infrastructure.repositories import (
+    FileEdge,
+    FileNode,
+    FileNodeRepository,
+    InstrumentedNodeRepository,
+)
+from map_admin.infrastructure.tracing import Span, SpanExporter, Tracer
 
 
 @pytest.fixture()
@@ -22,6 +31,8 @@ def temp_node_file_path() -> Generator[str, None, None]:
 
     # cleanup after test
     os.unlink(file_path)
+    if os.path.exists(f"{file_path}.lock"):
+        os.unlink(f"{file_path}.lock")
 
 
 @pytest.fixture()
@@ -197,6 +208,28 @@ def test_get_node_by_id(
     ]
 
 
+def test_get_node_by_id_without_edges(temp_node_file_path: str) -> None:
+    nodes: list[FileNode] = [
+        {"id": 1, "name": "Node 1", "longitude": "1.0", "latitude": "2.0"},
+    ]
+    with open(temp_node_file_path, "w") as file:
+        json.dump(nodes, file)
+
+    # the edge file is never opened
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path="",
+    )
+    result = node_repo.get_node_by_id(node_id=1, include_edges=False)
+
+    assert result == Node(
+        id=1,
+        name="Node 1",
+        point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+    )
+    assert result.edges == []
+
+
 def test_get_node_by_id_with_invalid_id(
     temp_node_file_path: str,
     temp_edge_file_path: str,
@@ -209,8 +242,60 @@ def test_get_node_by_id_with_invalid_id(
         node_repo.get_node_by_id(node_id=2)
 
 
+def test_get_nodes_by_ids(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    nodes: list[FileNode] = [
+        {
+            "id": node_id,
+            "name": f"Node {node_id}",
+            "longitude": "1.0",
+            "latitude": "2.0",
+        }
+        for node_id in (1, 2, 3)
+    ]
+    edges: list[FileEdge] = [
+        {
+            "node_ids": node_ids,
+            "vertical_distance": "1.0",
+            "horizontal_distance": "2.0",
+            "is_stair": False,
+            "is_step": False,
+            "quality": "상",
+        }
+        for node_ids in ((1, 2), (2, 3))
+    ]
+    with open(temp_node_file_path, "w") as file:
+        json.dump(nodes, file)
+    with open(temp_edge_file_path, "w") as file:
+        json.dump(edges, file)
+    metrics = MetricsRegistry()
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+        metrics=metrics,
+    )
+
+    result = node_repo.get_nodes_by_ids(node_ids=[3, 2])
+
+    assert [node.id for node in result] == [3, 2]
+    assert [[tuple(edge.node_ids) for edge in node.edges] for node in result] == [
+        [(2, 3)],
+        [(1, 2), (2, 3)],
+    ]
+    assert result == [node_repo.get_node_by_id(3), node_repo.get_node_by_id(2)]
+    # both files are parsed once for the whole batch
+    assert 'node_repository_json_parse_seconds_count{file="node"} 3.0' in (
+        metrics.render()
+    )
+    with pytest.raises(NodeRepository.NodeNotFoundError):
+        node_repo.get_nodes_by_ids(node_ids=[1, 4])
+
+
 def test_create_node(
     temp_node_file_path: str,
+    temp_edge_file_path: str,
 ) -> None:
     new_node = Node(
         id=3,
@@ -223,7 +308,7 @@ def test_create_node(
 
     node_repo = FileNodeRepository(
         node_file_path=temp_node_file_path,
-        edge_file_path="",
+        edge_file_path=temp_edge_file_path,
     )
     node_repo.create_node(node=new_node)
 
@@ -307,28 +392,125 @@ def test_update_node(
     with open(temp_edge_file_path, "r") as file:
         edge_result: list[FileEdge] = json.load(file)
     assert node_result == [
-        {"id": 1, "name": "Node 1 Updated", "longitude": "5.0", "latitude": "6.0"},
+        {
+            "id": 1,
+            "name": "Node 1 Updated",
+            "longitude": "5.0",
+            "latitude": "6.0",
+            "version": 2,
+        },
         {"id": 2, "name": "Node 2", "longitude": "3.0", "latitude": "4.0"},
         {"id": 3, "name": "Node 3", "longitude": "5.0", "latitude": "6.0"},
     ]
+    # edges are saved by the edge operations only
+    assert edge_result == [
+        {**edge_dict, "node_ids": list(edge_dict["node_ids"])} for edge_dict in edges
+    ]
+
+
+def test_update_node_checks_versions(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    # Given
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    node_repo.bulk_create_nodes(
+        [
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            )
+            for node_id in (1, 2)
+        ]
+    )
+    first, second = node_repo.get_node_by_id(1), node_repo.get_node_by_id(1)
+
+    # When
+    first.update_name("Renamed")
+    node_repo.update_node(first)
+    second.update_name("Renamed again")
+
+    # Then
+    with pytest.raises(NodeRepository.VersionConflictError):
+        node_repo.update_node(second)
+    with pytest.raises(NodeRepository.VersionConflictError):
+        node_repo.delete_node(second)
+    node: Node = node_repo.get_node_by_id(1)
+    assert (node.name, node.version) == ("Renamed", 2)
+    # saving an unchanged node keeps its version
+    node_repo.update_node(node)
+    assert node_repo.get_node_by_id(1).version == node.version == 2
+
+
+def test_edge_operations(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    # Given
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    node_repo.bulk_create_nodes(
+        [
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+            )
+            for node_id in (1, 2, 3)
+        ]
+    )
+    edge = Edge(
+        node_ids=(2, 1),
+        vertical_distance=Decimal("1.0"),
+        horizontal_distance=Decimal("2.0"),
+        is_stair=False,
+        is_step=False,
+        quality=RoadQuality.HIGH,
+    )
+    with open(temp_node_file_path, "rb") as file:
+        node_payload: bytes = file.read()
+
+    # When
+    node_repo.add_edge(edge)
+    stale: Edge = node_repo.get_node_by_id(1).edges[0]
+    edge.update_is_stair(True)
+    node_repo.update_edge(edge)
+
+    # Then
+    with open(temp_node_file_path, "rb") as file:
+        assert file.read() == node_payload
+    with open(temp_edge_file_path, "r") as file:
+        edge_result: list[FileEdge] = json.load(file)
     assert edge_result == [
         {
-            "node_ids": [2, 3],
-            "vertical_distance": "5.0",
-            "horizontal_distance": "6.0",
-            "is_stair": False,
+            "node_ids": [2, 1],
+            "vertical_distance": "1.0",
+            "horizontal_distance": "2.0",
+            "is_stair": True,
             "is_step": False,
             "quality": "상",
-        },
-        {
-            "node_ids": [1, 2],
-            "vertical_distance": "11.0",
-            "horizontal_distance": "12.0",
-            "is_stair": True,
-            "is_step": True,
-            "quality": "하",
+            "version": 2,
         },
     ]
+    assert edge.version == 2
+    with pytest.raises(NodeRepository.VersionConflictError):
+        node_repo.add_edge(stale)
+    with pytest.raises(NodeRepository.VersionConflictError):
+        node_repo.update_edge(stale)
+    with pytest.raises(NodeRepository.VersionConflictError):
+        node_repo.remove_edge(stale)
+    with pytest.raises(NodeRepository.EdgeNotFoundError):
+        node_repo.update_edge(replace(edge, node_ids=(1, 3)))
+    with pytest.raises(NodeRepository.NodeNotFoundError):
+        node_repo.add_edge(replace(edge, node_ids=(1, 4)))
+    node_repo.remove_edge(edge)
+    assert node_repo.get_node_by_id(1).edges == []
 
 
 def test_delete_node(
@@ -377,3 +559,346 @@ def test_delete_node(
         {"id": 2, "name": "Node 2", "longitude": "3.0", "latitude": "4.0"},
     ]
     assert edge_result == []
+
+
+def test_delete_isolated_node_keeps_edge_file(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    nodes: list[FileNode] = [
+        {"id": 1, "name": "Node 1", "longitude": "1.0", "latitude": "2.0"},
+        {"id": 2, "name": "Node 2", "longitude": "3.0", "latitude": "4.0"},
+        {"id": 3, "name": "Node 3", "longitude": "5.0", "latitude": "6.0"},
+    ]
+    edges: list[FileEdge] = [
+        {
+            "node_ids": (1, 2),
+            "vertical_distance": "1.0",
+            "horizontal_distance": "2.0",
+            "is_stair": False,
+            "is_step": False,
+            "quality": "상",
+        },
+    ]
+    with open(temp_edge_file_path, "w") as file:
+        # compact, unlike what the repository writes
+        json.dump(edges, file)
+    with open(temp_node_file_path, "w") as file:
+        json.dump(nodes, file)
+    with open(temp_edge_file_path, "rb") as file:
+        edge_payload: bytes = file.read()
+
+    FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    ).delete_node(
+        node=Node(
+            id=3,
+            name="Node 3",
+            point=Point(
+                longitude=Decimal("5.0"),
+                latitude=Decimal("6.0"),
+            ),
+        ),
+    )
+
+    with open(temp_node_file_path, "r") as file:
+        node_result: list[FileNode] = json.load(file)
+    with open(temp_edge_file_path, "rb") as file:
+        assert file.read() == edge_payload
+    assert [node["id"] for node in node_result] == [1, 2]
+
+
+def test_bulk_update_edges(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    edges: list[FileEdge] = [
+        {
+            "node_ids": (1, 2),
+            "vertical_distance": "1.0",
+            "horizontal_distance": "2.0",
+            "is_stair": False,
+            "is_step": False,
+            "quality": "상",
+        },
+        {
+            "node_ids": (2, 3),
+            "vertical_distance": "3.0",
+            "horizontal_distance": "4.0",
+            "is_stair": False,
+            "is_step": False,
+            "quality": "상",
+        },
+    ]
+    with open(temp_edge_file_path, "w") as file:
+        json.dump(edges, file)
+
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    node_repo.bulk_update_edges(
+        edges=[
+            Edge(
+                node_ids=(3, 2),
+                vertical_distance=Decimal("3.0"),
+                horizontal_distance=Decimal("14.25"),
+                is_stair=False,
+                is_step=True,
+                quality=RoadQuality.MEDIUM,
+            ),
+        ],
+    )
+
+    with open(temp_edge_file_path, "r") as file:
+        edge_result: list[FileEdge] = json.load(file)
+    assert edge_result == [
+        {
+            "node_ids": [1, 2],
+            "vertical_distance": "1.0",
+            "horizontal_distance": "2.0",
+            "is_stair": False,
+            "is_step": False,
+            "quality": "상",
+        },
+        {
+            "node_ids": [2, 3],
+            "vertical_distance": "3.0",
+            "horizontal_distance": "14.25",
+            "is_stair": False,
+            "is_step": True,
+            "quality": "중",
+            "version": 2,
+        },
+    ]
+
+
+def test_bulk_update_nodes(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    nodes: list[FileNode] = [
+        {"id": 1, "name": "Node 1", "longitude": "1.0", "latitude": "2.0"},
+        {"id": 2, "name": "Node 2", "longitude": "3.0", "latitude": "4.0"},
+    ]
+    with open(temp_node_file_path, "w") as file:
+        json.dump(nodes, file)
+
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    node_repo.bulk_update_nodes(
+        nodes=[
+            Node(
+                id=2,
+                name="Node 2",
+                point=Point(
+                    longitude=Decimal("3.0"),
+                    latitude=Decimal("4.0"),
+                    elevation=Decimal("31.25"),
+                ),
+            ),
+        ],
+    )
+
+    with open(temp_node_file_path, "r") as file:
+        node_result: list[FileNode] = json.load(file)
+    assert node_result == [
+        {"id": 1, "name": "Node 1", "longitude": "1.0", "latitude": "2.0"},
+        {
+            "id": 2,
+            "name": "Node 2",
+            "longitude": "3.0",
+            "latitude": "4.0",
+            "elevation": "31.25",
+            "version": 2,
+        },
+    ]
+    assert node_repo.get_node_by_id(node_id=2).point == Point(
+        longitude=Decimal("3.0"),
+        latitude=Decimal("4.0"),
+        elevation=Decimal("31.25"),
+    )
+
+
+def test_bulk_create_nodes_and_edges(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    nodes: list[FileNode] = [
+        {"id": 1, "name": "Node 1", "longitude": "1.0", "latitude": "2.0"},
+    ]
+    with open(temp_node_file_path, "w") as file:
+        json.dump(nodes, file)
+
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    node_repo.bulk_create_nodes(
+        nodes=[
+            Node(
+                id=2,
+                name="Node 2",
+                point=Point(longitude=Decimal("3.0"), latitude=Decimal("4.0")),
+            ),
+        ],
+    )
+    node_repo.bulk_create_edges(
+        edges=[
+            Edge(
+                node_ids=(1, 2),
+                vertical_distance=Decimal("0.00"),
+                horizontal_distance=Decimal("12.50"),
+                is_stair=True,
+                is_step=False,
+                quality=RoadQuality.LOW,
+            ),
+        ],
+    )
+
+    with open(temp_node_file_path, "r") as file:
+        node_result: list[FileNode] = json.load(file)
+    assert node_result == [
+        {"id": 1, "name": "Node 1", "longitude": "1.0", "latitude": "2.0"},
+        {"id": 2, "name": "Node 2", "longitude": "3.0", "latitude": "4.0"},
+    ]
+    with open(temp_edge_file_path, "r") as file:
+        edge_result: list[FileEdge] = json.load(file)
+    assert edge_result == [
+        {
+            "node_ids": [1, 2],
+            "vertical_distance": "0.00",
+            "horizontal_distance": "12.50",
+            "is_stair": True,
+            "is_step": False,
+            "quality": "하",
+        },
+    ]
+    assert node_repo.get_next_id() == 3
+
+
+def test_get_version(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    version: str = node_repo.get_version()
+
+    node_repo.create_node(
+        node=Node(
+            id=1,
+            name="Node 1",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        ),
+    )
+
+    assert node_repo.get_version() == node_repo.get_version()
+    assert node_repo.get_version() != version
+
+
+def test_file_io_metrics(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    # Given
+    metrics = MetricsRegistry()
+    node_repo = InstrumentedNodeRepository(
+        node_repo=FileNodeRepository(
+            node_file_path=temp_node_file_path,
+            edge_file_path=temp_edge_file_path,
+            metrics=metrics,
+        ),
+        metrics=metrics,
+    )
+
+    # When
+    node_repo.create_node(
+        node=Node(
+            id=1,
+            name="Node 1",
+            point=Point(longitude=Decimal("1.0"), latitude=Decimal("2.0")),
+        )
+    )
+    node_repo.get_all_nodes()
+    with pytest.raises(NodeRepository.NodeNotFoundError):
+        node_repo.get_node_by_id(node_id=2)
+
+    # Then
+    written_bytes: int = os.path.getsize(temp_node_file_path)
+    rendered: str = metrics.render()
+    read_bytes: int = len("[]") + 2 * written_bytes
+    assert (
+        f'node_repository_file_read_bytes_total{{file="node"}} {read_bytes}.0'
+        in rendered
+    )
+    assert (
+        f'node_repository_file_written_bytes_total{{file="node"}} {written_bytes}.0'
+        in rendered
+    )
+    assert 'graph_records{file="node"} 1.0' in rendered
+    assert 'graph_records{file="edge"} 0.0' in rendered
+    assert 'node_repository_json_parse_seconds_count{file="node"} 3.0' in rendered
+    for method in ("create_node", "get_all_nodes", "get_node_by_id"):
+        assert (
+            f'node_repository_operation_seconds_count{{method="{method}"}} 1.0'
+            in rendered
+        )
+
+
+def test_file_io_spans(
+    temp_node_file_path: str,
+    temp_edge_file_path: str,
+) -> None:
+    # Given
+    traces: list[list[Span]] = []
+    exporter = mock.Mock(spec_set=SpanExporter)
+    exporter.export.side_effect = traces.append
+    tracer = Tracer(exporter=exporter)
+    metrics = MetricsRegistry()
+    node_repo = InstrumentedNodeRepository(
+        node_repo=FileNodeRepository(
+            node_file_path=temp_node_file_path,
+            edge_file_path=temp_edge_file_path,
+            tracer=tracer,
+        ),
+        metrics=metrics,
+        tracer=tracer,
+    )
+
+    # When
+    node_repo.get_next_id()
+
+    # Then
+    (repository_span, read_span, parse_span), *_ = traces
+    assert repository_span.name == "NodeRepository.get_next_id"
+    assert (read_span.name, parse_span.name) == ("file.read", "json.parse")
+    assert read_span.attributes == {"file": "node", "file.bytes": 2}
+    assert read_span.parent_span_id == repository_span.span_id
+
+
+def test_written_versions(temp_node_file_path: str, temp_edge_file_path: str) -> None:
+    node_repo = FileNodeRepository(
+        node_file_path=temp_node_file_path,
+        edge_file_path=temp_edge_file_path,
+    )
+    assert node_repo.get_written_versions() is None
+
+    version: str = node_repo.get_version()
+    with node_repo.locked():
+        # both writes count as one
+        for node_id in (3, 4):
+            node_repo.create_node(
+                node=Node(
+                    id=node_id,
+                    name=f"Node {node_id}",
+                    point=Point(longitude=Decimal("5.0"), latitude=Decimal("6.0")),
+                ),
+            )
+
+    assert node_repo.get_written_versions() == (version, node_repo.get_version())
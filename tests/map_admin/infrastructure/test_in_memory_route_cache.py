@@ -0,0 +1,193 @@
+from unittest import mock
+
+import pytest
+
+from map_admin.application.repositories import NodeRepository
+from map_admin.application.services import RouteCacheStats
+from map_admin.domain.graphs import Route
+from map_admin.domain.value_objects import AccessibilityProfile
+from map_admin.infrastructure.caches import InMemoryRouteCache
+from map_admin.infrastructure.metrics import MetricsRegistry
+
+PEDESTRIAN = AccessibilityProfile.PEDESTRIAN
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def mock_node_repo() -> mock.Mock:
+    mock_node_repo: mock.Mock = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.return_value = "1"
+    return mock_node_repo
+
+
+def test_get_and_put(mock_node_repo: mock.Mock) -> None:
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo)
+    route = Route(node_ids=(1, 2, 3), cost=10.0)
+
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) is None
+    route_cache.put(source_id=1, target_id=3, profile=PEDESTRIAN, route=route)
+
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) == route
+    assert (
+        route_cache.get(
+            source_id=1, target_id=3, profile=AccessibilityProfile.WHEELCHAIR
+        )
+        is None
+    )
+    assert route_cache.get_stats() == RouteCacheStats(
+        hits=1, misses=2, size=1, version=0
+    )
+
+
+def test_get_expired_route(mock_node_repo: mock.Mock) -> None:
+    clock = FakeClock()
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo, ttl=60.0, clock=clock)
+    route_cache.put(
+        source_id=1,
+        target_id=2,
+        profile=PEDESTRIAN,
+        route=Route(node_ids=(1, 2), cost=1.0),
+    )
+
+    clock.now = 60.0
+
+    assert route_cache.get(source_id=1, target_id=2, profile=PEDESTRIAN) is None
+    assert route_cache.get_stats().size == 0
+
+
+def test_put_evicts_least_recently_used_route(mock_node_repo: mock.Mock) -> None:
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo, max_size=2)
+    for target_id in (2, 3):
+        route_cache.put(
+            source_id=1,
+            target_id=target_id,
+            profile=PEDESTRIAN,
+            route=Route(node_ids=(1, target_id), cost=1.0),
+        )
+    route_cache.get(source_id=1, target_id=2, profile=PEDESTRIAN)
+
+    route_cache.put(
+        source_id=1,
+        target_id=4,
+        profile=PEDESTRIAN,
+        route=Route(node_ids=(1, 4), cost=1.0),
+    )
+
+    assert route_cache.get(source_id=1, target_id=2, profile=PEDESTRIAN) is not None
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) is None
+
+
+def test_invalidate_edge(mock_node_repo: mock.Mock) -> None:
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo)
+    for route in (
+        Route(node_ids=(1, 2, 3), cost=2.0),
+        Route(node_ids=(2, 1, 4), cost=2.0),
+        Route(node_ids=(3, 2, 4), cost=2.0),
+    ):
+        route_cache.put(
+            source_id=route.node_ids[0],
+            target_id=route.node_ids[-1],
+            profile=PEDESTRIAN,
+            route=route,
+        )
+
+    route_cache.invalidate_edge(node_ids=(2, 1))
+
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) is None
+    assert route_cache.get(source_id=2, target_id=4, profile=PEDESTRIAN) is None
+    assert route_cache.get(source_id=3, target_id=4, profile=PEDESTRIAN) is not None
+
+
+def test_invalidate_node(mock_node_repo: mock.Mock) -> None:
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo)
+    route_cache.put(
+        source_id=1,
+        target_id=3,
+        profile=PEDESTRIAN,
+        route=Route(node_ids=(1, 2, 3), cost=2.0),
+    )
+    route_cache.put(
+        source_id=1,
+        target_id=4,
+        profile=PEDESTRIAN,
+        route=Route(node_ids=(1, 4), cost=1.0),
+    )
+
+    route_cache.invalidate_node(node_id=2)
+
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) is None
+    assert route_cache.get(source_id=1, target_id=4, profile=PEDESTRIAN) is not None
+
+
+def test_invalidate_all(mock_node_repo: mock.Mock) -> None:
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo)
+    route_cache.put(
+        source_id=1,
+        target_id=2,
+        profile=PEDESTRIAN,
+        route=Route(node_ids=(1, 2), cost=1.0),
+    )
+
+    route_cache.invalidate_all()
+
+    assert route_cache.get(source_id=1, target_id=2, profile=PEDESTRIAN) is None
+    assert route_cache.get_stats().version == 1
+
+
+def test_drops_routes_after_a_write_from_elsewhere(mock_node_repo: mock.Mock) -> None:
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo)
+    for target_id in (2, 3):
+        route_cache.get(source_id=1, target_id=target_id, profile=PEDESTRIAN)
+        route_cache.put(
+            source_id=1,
+            target_id=target_id,
+            profile=PEDESTRIAN,
+            route=Route(node_ids=(1, target_id), cost=1.0),
+        )
+
+    # an edit through the cache keeps the routes it does not touch
+    mock_node_repo.get_version.return_value = "2"
+    route_cache.invalidate_node(node_id=2)
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) is not None
+
+    # an edit by the CLI or another worker keeps none
+    mock_node_repo.get_version.return_value = "3"
+    assert route_cache.get(source_id=1, target_id=3, profile=PEDESTRIAN) is None
+    assert route_cache.get_stats().version == 1
+
+    # nor a route found on the graph before that edit
+    route_cache.get(source_id=1, target_id=4, profile=PEDESTRIAN)
+    mock_node_repo.get_version.return_value = "4"
+    route_cache.put(
+        source_id=1,
+        target_id=4,
+        profile=PEDESTRIAN,
+        route=Route(node_ids=(1, 4), cost=1.0),
+    )
+    assert route_cache.get_stats().size == 0
+
+
+def test_route_cache_metrics(mock_node_repo: mock.Mock) -> None:
+    # Given
+    metrics = MetricsRegistry()
+    route_cache = InMemoryRouteCache(node_repo=mock_node_repo, metrics=metrics)
+    route = Route(node_ids=(1, 2), cost=1.0)
+    route_cache.put(source_id=1, target_id=2, profile=PEDESTRIAN, route=route)
+
+    # When
+    route_cache.get(source_id=1, target_id=2, profile=PEDESTRIAN)
+    route_cache.get(source_id=2, target_id=1, profile=PEDESTRIAN)
+
+    # Then
+    rendered: str = metrics.render()
+    assert "route_cache_hits_total 1.0\n" in rendered
+    assert "route_cache_misses_total 1.0\n" in rendered
+    assert "route_cache_hit_ratio 0.5\n" in rendered
+    assert "route_cache_entries 1.0\n" in rendered
@@ -0,0 +1,99 @@
+import logging
+import threading
+from decimal import Decimal
+
+import pytest
+
+from map_admin.application.services import GraphEventSubscriber
+from map_admin.domain.entities import Node
+from map_admin.domain.events import GraphEvent, GraphReplaced, NodeCreated
+from map_admin.domain.value_objects import Point
+from map_admin.infrastructure.events import InProcessEventBus
+from map_admin.infrastructure.metrics import MetricsRegistry
+
+
+class RecordingSubscriber(GraphEventSubscriber):
+    def __init__(self, log: list[tuple[str, GraphEvent]], name: str) -> None:
+        self.log = log
+        self.name = name
+        self.threads: set[str] = set()
+
+    def handle(self, event: GraphEvent) -> None:
+        self.threads.add(threading.current_thread().name)
+        self.log.append((self.name, event))
+
+
+class FailingSubscriber(GraphEventSubscriber):
+    def handle(self, event: GraphEvent) -> None:
+        raise RuntimeError("broken subscriber")
+
+
+def make_event(node_id: int) -> NodeCreated:
+    return NodeCreated(
+        node=Node(
+            id=node_id,
+            name=f"Node {node_id}",
+            point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+        ),
+    )
+
+
+def test_sync_subscribers_run_in_order_before_publish_returns() -> None:
+    log: list[tuple[str, GraphEvent]] = []
+    first, second = RecordingSubscriber(log, "first"), RecordingSubscriber(log, "2nd")
+    event_bus = InProcessEventBus(subscribers=[first, second])
+
+    event_bus.publish(make_event(1))
+
+    assert log == [("first", make_event(1)), ("2nd", make_event(1))]
+    assert first.threads == {threading.current_thread().name}
+
+    event_bus.unsubscribe(first)
+    event_bus.publish(GraphReplaced())
+
+    assert log[2:] == [("2nd", GraphReplaced())]
+
+
+def test_sync_subscriber_errors_are_logged_and_skipped(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Given
+    log: list[tuple[str, GraphEvent]] = []
+    metrics = MetricsRegistry()
+    event_bus = InProcessEventBus(
+        subscribers=[FailingSubscriber(), RecordingSubscriber(log, "after")],
+        metrics=metrics,
+    )
+
+    # When
+    with caplog.at_level(logging.ERROR, logger="map_admin.infrastructure.events"):
+        event_bus.publish(GraphReplaced())
+
+    # Then
+    assert log == [("after", GraphReplaced())]
+    assert "broken subscriber" in caplog.text
+    assert "graph_event_subscriber_failures_total 1.0" in metrics.render()
+
+
+def test_background_subscribers_keep_order_and_survive_errors() -> None:
+    # Given
+    log: list[tuple[str, GraphEvent]] = []
+    background = RecordingSubscriber(log, "background")
+    metrics = MetricsRegistry()
+    event_bus = InProcessEventBus(
+        background_subscribers=[FailingSubscriber(), background],
+        metrics=metrics,
+    )
+
+    # When
+    for node_id in range(1, 6):
+        event_bus.publish(make_event(node_id))
+    event_bus.join()
+
+    # Then
+    assert log == [("background", make_event(node_id)) for node_id in range(1, 6)]
+    assert background.threads == {"graph-event-bus"}
+    rendered: str = metrics.render()
+    assert 'graph_events_published_total{event="NodeCreated"} 5.0' in rendered
+    assert "graph_event_subscriber_failures_total 5.0" in rendered
+    assert "graph_event_queue_depth 0.0" in rendered
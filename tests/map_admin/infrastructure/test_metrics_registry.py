@@ -0,0 +1,76 @@
+import pytest
+
+from map_admin.infrastructure.metrics import MetricsRegistry, cache_metrics
+
+
+def test_render_counter_and_gauge() -> None:
+    # Given
+    metrics = MetricsRegistry()
+    counter = metrics.counter("reads_total", "Reads", ("file",))
+    gauge = metrics.gauge("records", 'Records "now"')
+
+    # When
+    counter.labels("node").inc(3)
+    counter.labels('a"b').inc()
+    gauge.set(7)
+
+    # Then
+    assert (
+        metrics.render()
+        == "# HELP reads_total Reads\n"
+        "# TYPE reads_total counter\n"
+        'reads_total{file="node"} 3.0\n'
+        'reads_total{file="a\\"b"} 1.0\n'
+        '# HELP records Records \\"now\\"\n'
+        "# TYPE records gauge\n"
+        "records 7.0\n"
+    )
+
+
+def test_render_histogram_buckets() -> None:
+    # Given
+    metrics = MetricsRegistry()
+    histogram = metrics.histogram("seconds", "Seconds", ("method",))
+    histogram.buckets = (0.1, 1.0)
+
+    # When
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.labels("get").observe(value)
+
+    # Then
+    assert metrics.render().splitlines()[2:] == [
+        'seconds_bucket{method="get",le="0.1"} 2.0',
+        'seconds_bucket{method="get",le="1.0"} 3.0',
+        'seconds_bucket{method="get",le="+Inf"} 4.0',
+        'seconds_sum{method="get"} 3.65',
+        'seconds_count{method="get"} 4.0',
+    ]
+
+
+def test_get_or_create() -> None:
+    metrics = MetricsRegistry()
+
+    assert metrics.counter("a_total", "A") is metrics.counter("a_total", "A")
+    with pytest.raises(ValueError):
+        metrics.gauge("a_total", "A")
+    with pytest.raises(ValueError):
+        metrics.counter("a_total", "A", ("label",))
+    with pytest.raises(ValueError):
+        metrics.counter("a_total", "A").labels("unexpected")
+    with pytest.raises(ValueError):
+        metrics.counter("a_total", "A").inc(-1)
+
+
+def test_register_collector_replaces_same_name() -> None:
+    # Given
+    metrics = MetricsRegistry()
+
+    # When
+    metrics.register_collector("cache", lambda: cache_metrics("cache", "C", 1, 1))
+    metrics.register_collector("cache", lambda: cache_metrics("cache", "C", 3, 1))
+
+    # Then
+    rendered: str = metrics.render()
+    assert "cache_hits_total 3.0\n" in rendered
+    assert "cache_misses_total 1.0\n" in rendered
+    assert "cache_hit_ratio 0.75\n" in rendered
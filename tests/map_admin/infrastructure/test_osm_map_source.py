@@ -0,0 +1,209 @@
+import struct
+import zlib
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from map_admin.application.services import MapNode, MapSource, MapWay
+from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.infrastructure.osm import OsmMapSource, is_walkable, road_quality
+
+OSM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="1" lat="37.5000000" lon="127.0000000">
+    <tag k="name" v="정문"/>
+  </node>
+  <node id="2" lat="37.5000100" lon="127.0000100">
+    <tag k="kerb" v="raised"/>
+  </node>
+  <node id="3" lat="37.5000200" lon="127.0000200"/>
+  <way id="100">
+    <nd ref="1"/>
+    <nd ref="2"/>
+    <tag k="highway" v="steps"/>
+  </way>
+  <way id="101">
+    <nd ref="2"/>
+    <nd ref="3"/>
+    <tag k="highway" v="footway"/>
+    <tag k="surface" v="gravel"/>
+  </way>
+  <way id="102">
+    <nd ref="1"/>
+    <nd ref="3"/>
+    <tag k="highway" v="primary"/>
+  </way>
+  <relation id="200">
+    <member type="way" ref="100" role=""/>
+  </relation>
+</osm>
+"""
+
+EXPECTED_WAYS: list[MapWay] = [
+    MapWay(node_refs=[1, 2], is_stair=True, quality=RoadQuality.MEDIUM),
+    MapWay(node_refs=[2, 3], is_stair=False, quality=RoadQuality.LOW),
+]
+EXPECTED_NODES: list[MapNode] = [
+    MapNode(
+        ref=1,
+        name="정문",
+        point=Point(longitude=Decimal("127.0000000"), latitude=Decimal("37.5000000")),
+        is_step=False,
+    ),
+    MapNode(
+        ref=2,
+        name=None,
+        point=Point(longitude=Decimal("127.0000100"), latitude=Decimal("37.5000100")),
+        is_step=True,
+    ),
+]
+
+
+def _varint(value: int) -> bytes:
+    result = bytearray()
+    while value >= 0x80:
+        result.append(value & 0x7F | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _uint(number: int, value: int) -> bytes:
+    return _varint(number << 3) + _varint(value)
+
+
+def _bytes(number: int, data: bytes) -> bytes:
+    return _varint(number << 3 | 2) + _varint(len(data)) + data
+
+
+def _packed(number: int, values: list[int]) -> bytes:
+    return _bytes(number, b"".join(_varint(value) for value in values))
+
+
+def _deltas(values: list[int]) -> list[int]:
+    return [_zigzag(b - a) for a, b in zip([0] + values, values)]
+
+
+def _blob(blob_type: str, data: bytes) -> bytes:
+    blob: bytes = _uint(2, len(data)) + _bytes(3, zlib.compress(data))
+    header: bytes = _bytes(1, blob_type.encode()) + _uint(3, len(blob))
+    return struct.pack(">I", len(header)) + header + blob
+
+
+def make_pbf() -> bytes:
+    strings: list[str] = [
+        "",
+        "highway",
+        "steps",
+        "footway",
+        "surface",
+        "gravel",
+        "primary",
+        "kerb",
+        "raised",
+        "name",
+        "정문",
+    ]
+    string_table: bytes = b"".join(_bytes(1, string.encode()) for string in strings)
+    dense: bytes = (
+        _packed(1, _deltas([1, 2, 3]))
+        # granularity 100 nanodegrees, so 37.5 degrees is 375_000_000
+        + _packed(8, _deltas([375_000_000, 375_000_100, 375_000_200]))
+        + _packed(9, _deltas([1_270_000_000, 1_270_000_100, 1_270_000_200]))
+        + _packed(10, [9, 10, 0, 7, 8, 0, 0])
+    )
+    ways: bytes = b"".join(
+        _bytes(
+            3,
+            _uint(1, way_id)
+            + _packed(2, keys)
+            + _packed(3, values)
+            + _packed(8, _deltas(refs)),
+        )
+        for way_id, keys, values, refs in [
+            (100, [1], [2], [1, 2]),
+            (101, [1, 4], [3, 5], [2, 3]),
+            (102, [1], [6], [1, 3]),
+        ]
+    )
+    block: bytes = (
+        _bytes(1, string_table)
+        + _bytes(2, _bytes(2, dense))
+        + _bytes(2, ways)
+        + _uint(17, 100)
+    )
+    return _blob("OSMHeader", _bytes(4, b"DenseNodes")) + _blob("OSMData", block)
+
+
+@pytest.fixture(params=["osm", "osm.pbf"])
+def map_file_path(request: pytest.FixtureRequest, tmp_path: Path) -> str:
+    path: Path = tmp_path / f"campus.{request.param}"
+    if request.param == "osm":
+        path.write_text(OSM_XML, encoding="utf-8")
+    else:
+        path.write_bytes(make_pbf())
+    return str(path)
+
+
+def test_read_ways(map_file_path: str) -> None:
+    assert list(OsmMapSource().read_ways(file_path=map_file_path)) == EXPECTED_WAYS
+
+
+def test_read_nodes(map_file_path: str) -> None:
+    assert (
+        list(OsmMapSource().read_nodes(file_path=map_file_path, refs={1, 2}))
+        == EXPECTED_NODES
+    )
+
+
+@pytest.mark.parametrize("content", [b"", b"<osm><node id='1'>", b"\x00\x00\x00\x09"])
+def test_read_ways_with_malformed_file(tmp_path: Path, content: bytes) -> None:
+    path: Path = tmp_path / ("campus.osm.pbf" if content[:1] == b"\x00" else "a.osm")
+    path.write_bytes(content)
+
+    with pytest.raises(MapSource.MapSourceUnavailableError):
+        list(OsmMapSource().read_ways(file_path=str(path)))
+
+
+def test_read_ways_with_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(MapSource.MapSourceUnavailableError):
+        list(OsmMapSource().read_ways(file_path=str(tmp_path / "missing.osm")))
+
+
+@pytest.mark.parametrize(
+    "tags, expected",
+    [
+        ({"highway": "footway"}, True),
+        ({"highway": "steps"}, True),
+        ({"highway": "primary"}, False),
+        ({"highway": "primary", "foot": "yes"}, True),
+        ({"highway": "footway", "foot": "no"}, False),
+        ({"highway": "service", "access": "private"}, False),
+        ({"highway": "service", "access": "private", "foot": "yes"}, True),
+        ({"highway": "pedestrian", "area": "yes"}, False),
+        ({"building": "yes"}, False),
+    ],
+)
+def test_is_walkable(tags: dict[str, str], expected: bool) -> None:
+    assert is_walkable(tags) is expected
+
+
+@pytest.mark.parametrize(
+    "tags, expected",
+    [
+        ({"smoothness": "excellent"}, RoadQuality.HIGH),
+        ({"smoothness": "bad", "surface": "asphalt"}, RoadQuality.LOW),
+        ({"surface": "paving_stones"}, RoadQuality.HIGH),
+        ({"surface": "sett"}, RoadQuality.MEDIUM),
+        ({"surface": "dirt"}, RoadQuality.LOW),
+        ({"surface": "unknown"}, RoadQuality.MEDIUM),
+        ({}, RoadQuality.MEDIUM),
+    ],
+)
+def test_road_quality(tags: dict[str, str], expected: RoadQuality) -> None:
+    assert road_quality(tags) == expected
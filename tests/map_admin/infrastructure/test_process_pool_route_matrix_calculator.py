@@ -0,0 +1,91 @@
+from decimal import Decimal
+
+import pytest
+
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
+from map_admin.infrastructure.routing import ProcessPoolRouteMatrixCalculator
+
+
+def make_graph() -> AccessibilityGraph:
+    """경로 그래프 1 - 2 - ... - 10 (간선 길이 10, 5-6 구간은 계단)"""
+    edges: list[Edge] = [
+        Edge(
+            node_ids=(node_id, node_id + 1),
+            vertical_distance=Decimal("0.0"),
+            horizontal_distance=Decimal("10.0"),
+            is_stair=node_id == 5,
+            is_step=False,
+            quality=RoadQuality.HIGH,
+        )
+        for node_id in range(1, 10)
+    ]
+    return AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal(node_id), latitude=Decimal("0.0")),
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id in range(1, 11)
+        ],
+    )
+
+
+@pytest.fixture()
+def graph() -> AccessibilityGraph:
+    return make_graph()
+
+
+@pytest.mark.parametrize(
+    "max_workers, min_parallel_sources",
+    [(1, 32), (2, 1)],
+    ids=["serial", "parallel"],
+)
+def test_compute(
+    graph: AccessibilityGraph,
+    max_workers: int,
+    min_parallel_sources: int,
+) -> None:
+    calculator = ProcessPoolRouteMatrixCalculator(
+        max_workers=max_workers,
+        min_parallel_sources=min_parallel_sources,
+    )
+
+    result = calculator.compute(
+        graph=graph,
+        source_ids=list(range(1, 11)),
+        target_ids=[1, 10],
+        profile=AccessibilityProfile.WHEELCHAIR,
+    )
+    calculator.shutdown()
+
+    inf = float("inf")
+    assert result == [
+        *([10.0 * (node_id - 1), inf] for node_id in range(1, 6)),
+        *([inf, 10.0 * (10 - node_id)] for node_id in range(6, 11)),
+    ]
+
+
+def test_pool_in_use_outlives_a_new_graph(graph: AccessibilityGraph) -> None:
+    calculator = ProcessPoolRouteMatrixCalculator(
+        max_workers=2,
+        min_parallel_sources=1,
+    )
+
+    with calculator._using(graph) as executor:
+        # another request moves on to a pool for the changed graph
+        calculator.compute(
+            graph=make_graph(),
+            source_ids=[1],
+            target_ids=[10],
+            profile=AccessibilityProfile.PEDESTRIAN,
+        )
+
+        assert executor.submit(str.upper, "a").result() == "A"
+    calculator.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(str.upper, "a")
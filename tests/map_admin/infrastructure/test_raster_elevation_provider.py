@@ -0,0 +1,144 @@
+import struct
+from array import array
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from map_admin.application.services import ElevationProvider
+from map_admin.domain.value_objects import Point
+from map_admin.infrastructure.elevations import RasterElevationProvider
+
+# 3x3 grid of 1 degree cells whose upper left corner is (127.0, 38.0)
+ELEVATIONS: list[float] = [
+    10.0, 20.0, 30.0,
+    40.0, 50.0, 60.0,
+    70.0, 80.0, -9999.0,
+]  # fmt: skip
+
+
+def write_raw_dem(tmp_path: Path) -> Path:
+    dem_path: Path = tmp_path / "dem.flt"
+    with open(dem_path, "wb") as file:
+        array("f", ELEVATIONS).tofile(file)
+    with open(tmp_path / "dem.hdr", "w") as file:
+        file.write(
+            "ncols 3\n"
+            "nrows 3\n"
+            "xllcorner 127.0\n"
+            "yllcorner 35.0\n"
+            "cellsize 1.0\n"
+            "nodata_value -9999\n"
+            "byteorder LSBFIRST\n"
+        )
+    return dem_path
+
+
+def write_geotiff_dem(tmp_path: Path) -> Path:
+    """타일 없이 한 행씩 스트립으로 저장한 float32 GeoTIFF를 만듭니다."""
+    dem_path: Path = tmp_path / "dem.tif"
+    pixel_data: bytes = array("f", ELEVATIONS).tobytes()
+    nodata: bytes = b"-9999\x00"
+    scale: bytes = struct.pack("<3d", 1.0, 1.0, 0.0)
+    tiepoint: bytes = struct.pack("<6d", 0.0, 0.0, 0.0, 127.0, 38.0, 0.0)
+
+    entry_count = 12
+    ifd_offset = 8
+    data_offset: int = ifd_offset + 2 + entry_count * 12 + 4
+    scale_offset: int = data_offset + len(pixel_data)
+    tiepoint_offset: int = scale_offset + len(scale)
+    nodata_offset: int = tiepoint_offset + len(tiepoint)
+    strip_offsets_offset: int = nodata_offset + len(nodata)
+    strip_counts_offset: int = strip_offsets_offset + 12
+    entries: list[tuple[int, int, int, int]] = [
+        (256, 3, 1, 3),  # ImageWidth
+        (257, 3, 1, 3),  # ImageLength
+        (258, 3, 1, 32),  # BitsPerSample
+        (259, 3, 1, 1),  # Compression
+        (273, 4, 3, strip_offsets_offset),  # StripOffsets
+        (277, 3, 1, 1),  # SamplesPerPixel
+        (278, 3, 1, 1),  # RowsPerStrip
+        (279, 4, 3, strip_counts_offset),  # StripByteCounts
+        (339, 3, 1, 3),  # SampleFormat
+        (33550, 12, 3, scale_offset),  # ModelPixelScale
+        (33922, 12, 6, tiepoint_offset),  # ModelTiepoint
+        (42113, 2, len(nodata), nodata_offset),  # GDAL_NODATA
+    ]
+    with open(dem_path, "wb") as file:
+        file.write(b"II" + struct.pack("<HI", 42, ifd_offset))
+        file.write(struct.pack("<H", entry_count))
+        for tag, field_type, count, value in entries:
+            value_format: str = "<HHIHxx" if field_type == 3 else "<HHII"
+            file.write(struct.pack(value_format, tag, field_type, count, value))
+        file.write(struct.pack("<I", 0))
+        file.write(pixel_data + scale + tiepoint + nodata)
+        file.write(struct.pack("<3I", *(data_offset + 12 * row for row in range(3))))
+        file.write(struct.pack("<3I", 12, 12, 12))
+    return dem_path
+
+
+@pytest.fixture(params=[write_raw_dem, write_geotiff_dem], ids=["raw", "geotiff"])
+def dem_file_path(request: pytest.FixtureRequest, tmp_path: Path) -> str:
+    return str(request.param(tmp_path))
+
+
+@pytest.mark.parametrize(
+    "longitude, latitude, expected_elevation",
+    [
+        # pixel centers
+        ("127.5", "37.5", Decimal("10.00")),
+        ("128.5", "36.5", Decimal("50.00")),
+        # bilinear interpolation between four centers
+        ("128.0", "37.0", Decimal("30.00")),
+        ("127.75", "37.5", Decimal("12.50")),
+        # clamped at the raster border
+        ("127.1", "37.9", Decimal("10.00")),
+        # nodata cell is ignored by renormalizing the remaining weights
+        ("129.0", "36.0", Decimal("63.33")),
+        ("129.5", "35.5", None),
+        # outside of the raster
+        ("126.0", "37.0", None),
+    ],
+)
+def test_get_elevations(
+    dem_file_path: str,
+    longitude: str,
+    latitude: str,
+    expected_elevation: Decimal | None,
+) -> None:
+    elevation_provider = RasterElevationProvider(file_path=dem_file_path)
+
+    result = elevation_provider.get_elevations(
+        points=[Point(longitude=Decimal(longitude), latitude=Decimal(latitude))],
+    )
+    elevation_provider.close()
+
+    assert result == [expected_elevation]
+
+
+def test_get_elevations_caches_blocks(dem_file_path: str) -> None:
+    elevation_provider = RasterElevationProvider(
+        file_path=dem_file_path,
+        block_cache_size=2,
+    )
+
+    elevation_provider.get_elevations(
+        points=[
+            Point(longitude=Decimal("127.5"), latitude=Decimal("37.5")),
+            Point(longitude=Decimal("128.5"), latitude=Decimal("37.5")),
+            Point(longitude=Decimal("128.5"), latitude=Decimal("35.5")),
+        ],
+    )
+
+    assert len(elevation_provider._blocks) <= 2
+    elevation_provider.close()
+
+
+@pytest.mark.parametrize("file_path", [None, "/nonexistent/dem.tif"])
+def test_get_elevations_without_source(file_path: str | None) -> None:
+    elevation_provider = RasterElevationProvider(file_path=file_path)
+
+    with pytest.raises(ElevationProvider.ElevationSourceUnavailableError):
+        elevation_provider.get_elevations(
+            points=[Point(longitude=Decimal("127.5"), latitude=Decimal("37.5"))],
+        )
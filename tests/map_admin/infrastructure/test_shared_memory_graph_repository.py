@@ -0,0 +1,129 @@
+import pickle
+import uuid
+from decimal import Decimal
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Generator
+from unittest import mock
+
+import pytest
+
+from map_admin.application.repositories import NodeRepository
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
+from map_admin.infrastructure.metrics import MetricsRegistry
+from map_admin.infrastructure.shared_graphs import SharedMemoryGraphRepository
+
+
+def make_nodes(horizontal_distance: str) -> list[Node]:
+    edge = Edge(
+        node_ids=(1, 2),
+        vertical_distance=Decimal("1.0"),
+        horizontal_distance=Decimal(horizontal_distance),
+        is_stair=False,
+        is_step=False,
+        quality=RoadQuality.MEDIUM,
+    )
+    return [
+        Node(
+            id=node_id,
+            name=f"Node {node_id}",
+            point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+            edges=[edge],
+        )
+        for node_id in (1, 2)
+    ]
+
+
+@pytest.fixture()
+def segment_name() -> Generator[str, None, None]:
+    name: str = f"anam-test-{uuid.uuid4().hex[:8]}"
+    yield name
+    for suffix in ("", *(f"-{generation}" for generation in range(1, 4))):
+        try:
+            segment = shared_memory.SharedMemory(name=f"{name}{suffix}")
+        except FileNotFoundError:
+            continue
+        segment.close()
+        segment.unlink()
+
+
+def make_repository(
+    node_repo: NodeRepository,
+    name: str,
+    tmp_path: Path,
+    metrics: MetricsRegistry | None = None,
+) -> SharedMemoryGraphRepository:
+    return SharedMemoryGraphRepository(
+        node_repo=node_repo,
+        name=name,
+        lock_file_path=tmp_path / "graph.lock",
+        metrics=metrics,
+    )
+
+
+def test_workers_share_one_published_graph(segment_name: str, tmp_path: Path) -> None:
+    # Given
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.return_value = "v1"
+    mock_node_repo.get_all_nodes.return_value = make_nodes("100.0")
+    leader = make_repository(mock_node_repo, segment_name, tmp_path)
+    follower = make_repository(mock_node_repo, segment_name, tmp_path)
+
+    # When
+    leader_graph = leader.get_graph()
+    follower_graph = follower.get_graph()
+
+    # Then
+    assert mock_node_repo.get_all_nodes.call_count == 1
+    assert follower.get_graph() is follower_graph
+    assert isinstance(follower_graph.node_ids, memoryview)
+    assert follower_graph.node_ids.readonly
+    assert follower_graph.columns() == leader_graph.columns()
+    route = follower_graph.shortest_path(
+        source_id=1, target_id=2, profile=AccessibilityProfile.WHEELCHAIR
+    )
+    assert route is not None
+    assert route.cost == pytest.approx(100.0 * 1.2 * (1 + 12.0 * 0.01))
+
+
+def test_version_change_swaps_segment(segment_name: str, tmp_path: Path) -> None:
+    # Given
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.return_value = "v1"
+    mock_node_repo.get_all_nodes.return_value = make_nodes("100.0")
+    metrics = MetricsRegistry()
+    leader = make_repository(mock_node_repo, segment_name, tmp_path, metrics)
+    follower = make_repository(mock_node_repo, segment_name, tmp_path)
+    old_graph = follower.get_graph()
+
+    # When
+    mock_node_repo.get_version.return_value = "v2"
+    mock_node_repo.get_all_nodes.return_value = make_nodes("50.0")
+    new_graph = leader.get_graph()
+
+    # Then
+    assert mock_node_repo.get_all_nodes.call_count == 2
+    assert follower.get_graph().horizontal_distances[0] == 50.0
+    # the replaced segment is unlinked but stays readable for its holders
+    assert old_graph.horizontal_distances[0] == 100.0
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=f"{segment_name}-1")
+    assert new_graph.version == "v2"
+    rendered: str = metrics.render()
+    assert "shared_graph_generation 2.0\n" in rendered
+    assert "shared_graph_rebuilds_total 1.0\n" in rendered
+
+
+def test_shared_graph_pickles_as_copy(segment_name: str, tmp_path: Path) -> None:
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.return_value = "v1"
+    mock_node_repo.get_all_nodes.return_value = make_nodes("100.0")
+    graph = make_repository(mock_node_repo, segment_name, tmp_path).get_graph()
+
+    copied = pickle.loads(pickle.dumps(graph))
+
+    assert type(copied) is AccessibilityGraph
+    assert copied.columns() == graph.columns()
+    assert copied.version == "v1"
@@ -0,0 +1,214 @@
+import json
+import threading
+from contextlib import nullcontext
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from map_admin.application.repositories import NodeRepository
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.value_objects import Point, RoadQuality
+from map_admin.infrastructure.repositories import FileNodeRepository
+from map_admin.infrastructure.snapshots import BUCKET_SIZE, SnapshotNodeRepository
+
+
+def make_node(node_id: int, name: str = "") -> Node:
+    return Node(
+        id=node_id,
+        name=name or f"Node {node_id}",
+        point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+    )
+
+
+def make_edge(node_ids: tuple[int, int], horizontal_distance: str = "10.0") -> Edge:
+    return Edge(
+        node_ids=node_ids,
+        vertical_distance=Decimal("0.0"),
+        horizontal_distance=Decimal(horizontal_distance),
+        is_stair=False,
+        is_step=False,
+        quality=RoadQuality.HIGH,
+    )
+
+
+@pytest.fixture()
+def file_node_repo(tmp_path: Path) -> FileNodeRepository:
+    for name in ("node.json", "edge.json"):
+        (tmp_path / name).write_text(json.dumps([]))
+    return FileNodeRepository(
+        node_file_path=str(tmp_path / "node.json"),
+        edge_file_path=str(tmp_path / "edge.json"),
+    )
+
+
+def assert_same_graph(node_repo: NodeRepository, expected: NodeRepository) -> None:
+    nodes: list[Node] = node_repo.get_all_nodes()
+    expected_nodes: list[Node] = sorted(
+        expected.get_all_nodes(), key=lambda node: node.id
+    )
+    assert nodes == expected_nodes
+    assert [node.edges for node in nodes] == [node.edges for node in expected_nodes]
+    assert [
+        (node.version, [edge.version for edge in node.edges]) for node in nodes
+    ] == [
+        (node.version, [edge.version for edge in node.edges]) for node in expected_nodes
+    ]
+
+
+def test_writes_match_file_repository(file_node_repo: FileNodeRepository) -> None:
+    node_repo = SnapshotNodeRepository(node_repo=file_node_repo)
+
+    node_repo.bulk_create_nodes([make_node(node_id) for node_id in (1, 2, 3, 300)])
+    node_repo.bulk_create_edges([make_edge((1, 2)), make_edge((2, 300))])
+    assert_same_graph(node_repo, file_node_repo)
+
+    node = node_repo.get_node_by_id(2)
+    node.add_edge(
+        other_node=node_repo.get_node_by_id(3),
+        vertical_distance=Decimal("1.0"),
+        horizontal_distance=Decimal("5.0"),
+        is_stair=True,
+        is_step=False,
+        quality=RoadQuality.LOW,
+    )
+    node_repo.add_edge(node.edges[-1])
+    node.update_name("Renamed")
+    node_repo.update_node(node)
+    assert_same_graph(node_repo, file_node_repo)
+
+    edge = node_repo.get_node_by_id(1).edges[0]
+    edge.update_horizontal_distance(Decimal("7.0"))
+    node_repo.update_edge(edge)
+    node_repo.remove_edge(node_repo.get_node_by_id(3).edges[0])
+    assert_same_graph(node_repo, file_node_repo)
+    assert [edge.version for edge in node_repo.get_node_by_id(1).edges] == [2]
+
+    node_repo.bulk_update_edges([make_edge((300, 2), "20.0")])
+    node_repo.bulk_update_nodes([make_node(1, "Bulk renamed")])
+    node_repo.create_node(make_node(4))
+    assert_same_graph(node_repo, file_node_repo)
+
+    node_repo.delete_node(node_repo.get_node_by_id(2))
+    assert_same_graph(node_repo, file_node_repo)
+    assert node_repo.get_next_id() == file_node_repo.get_next_id() == 301
+    assert [(node, node.edges) for node in node_repo.get_nodes_by_ids([300, 1])] == [
+        (node, node.edges) for node in file_node_repo.get_nodes_by_ids([300, 1])
+    ]
+    with pytest.raises(NodeRepository.NodeNotFoundError):
+        node_repo.get_nodes_by_ids([1, 2])
+    assert node_repo.get_version() == file_node_repo.get_version()
+
+
+def test_write_copies_only_touched_buckets(
+    file_node_repo: FileNodeRepository,
+) -> None:
+    # Given
+    node_repo = SnapshotNodeRepository(node_repo=file_node_repo)
+    node_repo.bulk_create_nodes([make_node(1), make_node(BUCKET_SIZE + 1)])
+    before = node_repo.snapshot()
+
+    # When
+    node_repo.update_node(make_node(1, "Renamed"))
+
+    # Then
+    after = node_repo.snapshot()
+    assert after.buckets[1] is before.buckets[1]
+    assert after.buckets[0] is not before.buckets[0]
+    # a pinned snapshot keeps the state it was published with
+    node = before.get(1)
+    assert node is not None and node.name == "Node 1"
+
+
+def test_returned_nodes_are_copies(file_node_repo: FileNodeRepository) -> None:
+    node_repo = SnapshotNodeRepository(node_repo=file_node_repo)
+    node_repo.bulk_create_nodes([make_node(1), make_node(2)])
+    node_repo.bulk_create_edges([make_edge((1, 2))])
+
+    node = node_repo.get_node_by_id(1)
+    node.update_name("Unsaved")
+    node.edges[0].update_is_stair(True)
+
+    assert node_repo.get_node_by_id(1).name == "Node 1"
+    assert node_repo.get_node_by_id(2).edges[0].is_stair is False
+    assert node_repo.get_node_by_id(2, include_edges=False).edges == []
+    assert len(node_repo.get_node_by_id(2).edges) == 1
+
+
+def test_reload_on_write_by_another_process(
+    file_node_repo: FileNodeRepository,
+) -> None:
+    node_repo = SnapshotNodeRepository(node_repo=file_node_repo)
+    assert node_repo.get_all_nodes() == []
+
+    file_node_repo.create_node(make_node(1))
+
+    assert node_repo.get_all_nodes() == [make_node(1)]
+
+
+def test_write_by_another_process_during_a_write(
+    file_node_repo: FileNodeRepository,
+) -> None:
+    # Given: another worker writes as soon as this one has saved
+    writers: list[threading.Thread] = []
+
+    class RacedFileNodeRepository(FileNodeRepository):
+        def create_node(self, node: Node) -> None:
+            super().create_node(node)
+            writer = threading.Thread(
+                target=file_node_repo.create_node, args=(make_node(2),)
+            )
+            writer.start()
+            writer.join(timeout=0.2)
+            writers.append(writer)
+
+    node_repo = SnapshotNodeRepository(
+        node_repo=RacedFileNodeRepository(
+            node_file_path=file_node_repo.node_file_path,
+            edge_file_path=file_node_repo.edge_file_path,
+        )
+    )
+    node_repo.get_all_nodes()
+
+    # When
+    node_repo.create_node(make_node(1))
+    writers[0].join(timeout=5)
+
+    # Then: the other write waited, and the next read loads it
+    assert [node.id for node in node_repo.get_all_nodes()] == [1, 2]
+
+
+def test_reads_do_not_wait_for_write() -> None:
+    # Given
+    versions: list[str] = ["v1"]
+    writing, release = threading.Event(), threading.Event()
+
+    def slow_update_node(node: Node) -> None:
+        versions.append("v2")
+        writing.set()
+        release.wait(timeout=5)
+
+    mock_node_repo = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.side_effect = lambda: versions[-1]
+    mock_node_repo.locked.return_value = nullcontext()
+    mock_node_repo.get_all_nodes.return_value = [make_node(1)]
+    mock_node_repo.update_node.side_effect = slow_update_node
+    node_repo = SnapshotNodeRepository(node_repo=mock_node_repo)
+    node_repo.get_all_nodes()
+
+    # When
+    writer = threading.Thread(
+        target=node_repo.update_node, args=(make_node(1, "Renamed"),)
+    )
+    writer.start()
+    writing.wait(timeout=5)
+    during: Node = node_repo.get_node_by_id(1)
+    release.set()
+    writer.join(timeout=5)
+
+    # Then
+    assert during.name == "Node 1"
+    assert node_repo.get_node_by_id(1).name == "Renamed"
+    assert node_repo.get_version() == "v2"
+    assert mock_node_repo.get_all_nodes.call_count == 1
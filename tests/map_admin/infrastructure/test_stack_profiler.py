@@ -0,0 +1,42 @@
+from map_admin.infrastructure.profiling import StackProfiler
+
+
+def inner() -> int:
+    return sum(range(10_000))
+
+
+def outer() -> int:
+    return inner() + inner()
+
+
+def test_collapsed_stacks() -> None:
+    # Given
+    profiler = StackProfiler()
+
+    # When
+    profiler.start()
+    outer()
+    profiler.stop()
+
+    # Then
+    stacks: dict[str, int] = {
+        stack: int(micros)
+        for stack, micros in (line.rsplit(" ", 1) for line in profiler.collapsed())
+    }
+    inner_stacks: list[str] = [
+        stack
+        for stack in stacks
+        if stack.endswith("builtins:sum")
+        and "test_stack_profiler:outer" in stack
+        and "test_stack_profiler:inner" in stack
+    ]
+    assert len(inner_stacks) == 1
+    assert inner_stacks[0].index(":outer") < inner_stacks[0].index(":inner")
+    assert all(micros > 0 for micros in stacks.values())
+
+
+def test_collapsed_sorts_by_time() -> None:
+    profiler = StackProfiler()
+    profiler.self_times = {"a": 0.000001, "a;b": 0.5, "a;c": 0.0000001}
+
+    assert profiler.collapsed() == ["a;b 500000", "a 1"]
@@ -0,0 +1,156 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from map_admin.infrastructure.tracing import (
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+    Span,
+    SpanExporter,
+    TracedUseCase,
+    Tracer,
+    to_otlp,
+)
+
+
+class MemorySpanExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.traces: list[list[Span]] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.traces.append(spans)
+
+
+def test_nested_spans_share_one_trace() -> None:
+    # Given
+    exporter = MemorySpanExporter()
+    tracer = Tracer(exporter=exporter)
+
+    # When
+    with tracer.span("handler"):
+        with tracer.span("use case", {"node_id": 1}):
+            with tracer.span("repository"):
+                pass
+        assert exporter.traces == []
+    with tracer.span("next request"):
+        pass
+
+    # Then
+    (handler, use_case, repository), (next_request,) = exporter.traces
+    assert [span.name for span in (handler, use_case, repository)] == [
+        "handler",
+        "use case",
+        "repository",
+    ]
+    assert handler.parent_span_id is None
+    assert use_case.parent_span_id == handler.span_id
+    assert repository.parent_span_id == use_case.span_id
+    assert {span.trace_id for span in (handler, use_case, repository)} == {
+        handler.trace_id
+    }
+    assert next_request.trace_id != handler.trace_id
+    assert handler.start_time <= use_case.start_time <= use_case.end_time
+    assert use_case.end_time <= handler.end_time
+    assert use_case.attributes == {"node_id": 1}
+
+
+def test_span_records_error() -> None:
+    exporter = MemorySpanExporter()
+    tracer = Tracer(exporter=exporter)
+
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError
+
+    assert exporter.traces[0][0].error
+
+
+def test_disabled_tracer_creates_no_spans() -> None:
+    tracer = Tracer()
+
+    with tracer.span("handler") as span:
+        assert span is None
+    assert not tracer.enabled
+
+
+def test_traced_use_case() -> None:
+    # Given
+    class FakeUseCase:
+        name = "fake"
+
+        def execute(self, value: int) -> int:
+            return value * 2
+
+    exporter = MemorySpanExporter()
+    use_case = TracedUseCase(use_case=FakeUseCase(), tracer=Tracer(exporter))
+
+    # When, Then
+    assert use_case.execute(value=2) == 4
+    assert use_case.name == "fake"
+    assert exporter.traces[0][0].name == "FakeUseCase.execute"
+
+
+def test_json_lines_span_exporter(tmp_path: Path) -> None:
+    # Given
+    file_path: Path = tmp_path / "traces.jsonl"
+    tracer = Tracer(exporter=JsonLinesSpanExporter(file_path=file_path))
+
+    # When
+    for _ in range(2):
+        with tracer.span("handler", {"http.status_code": 200, "ok": True}):
+            with tracer.span("child", {"ratio": 0.5, "file": "node"}):
+                pass
+
+    # Then
+    lines: list[str] = file_path.read_text().splitlines()
+    assert len(lines) == 2
+    spans: list[dict[str, Any]] = json.loads(lines[0])["resourceSpans"][0][
+        "scopeSpans"
+    ][0]["spans"]
+    assert [span["name"] for span in spans] == ["handler", "child"]
+    assert "parentSpanId" not in spans[0]
+    assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+    assert spans[0]["attributes"] == [
+        {"key": "http.status_code", "value": {"intValue": "200"}},
+        {"key": "ok", "value": {"boolValue": True}},
+    ]
+    assert spans[1]["attributes"] == [
+        {"key": "ratio", "value": {"doubleValue": 0.5}},
+        {"key": "file", "value": {"stringValue": "node"}},
+    ]
+
+
+def test_otlp_http_span_exporter() -> None:
+    # Given
+    bodies: list[dict[str, Any]] = []
+
+    class CollectorHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers["Content-Length"])
+            bodies.append(json.loads(self.rfile.read(length)))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), CollectorHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    exporter = OtlpHttpSpanExporter(
+        endpoint=f"http://127.0.0.1:{server.server_port}/v1/traces"
+    )
+    tracer = Tracer(exporter=exporter)
+
+    # When
+    with tracer.span("handler") as span:
+        assert span is not None
+    exporter.flush()
+    server.shutdown()
+
+    # Then
+    assert bodies == [to_otlp([span])]
+    assert exporter.dropped == 0
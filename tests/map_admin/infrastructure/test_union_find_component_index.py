@@ -0,0 +1,249 @@
+import json
+from dataclasses import replace
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from map_admin.application.repositories import GraphRepository, NodeRepository
+from map_admin.domain.entities import Edge, Node
+from map_admin.domain.graphs import AccessibilityGraph
+from map_admin.domain.value_objects import AccessibilityProfile, Point, RoadQuality
+from map_admin.infrastructure.indexes import UnionFindComponentIndex
+from map_admin.infrastructure.repositories import (
+    CachedGraphRepository,
+    FileNodeRepository,
+)
+
+PEDESTRIAN = AccessibilityProfile.PEDESTRIAN
+WHEELCHAIR = AccessibilityProfile.WHEELCHAIR
+
+
+def make_edge(node_ids: tuple[int, int], is_stair: bool = False) -> Edge:
+    return Edge(
+        node_ids=node_ids,
+        vertical_distance=Decimal("0.0"),
+        horizontal_distance=Decimal("10.0"),
+        is_stair=is_stair,
+        is_step=False,
+        quality=RoadQuality.HIGH,
+    )
+
+
+@pytest.fixture()
+def mock_graph_repo() -> mock.Mock:
+    edges: list[Edge] = [make_edge((1, 2)), make_edge((2, 3), is_stair=True)]
+    mock_graph_repo: mock.Mock = mock.Mock(spec_set=GraphRepository)
+    mock_graph_repo.get_graph.return_value = AccessibilityGraph(
+        nodes=[
+            Node(
+                id=node_id,
+                name=f"Node {node_id}",
+                point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+                edges=[edge for edge in edges if node_id in edge.node_ids],
+            )
+            for node_id in (1, 2, 3, 4)
+        ],
+    )
+    return mock_graph_repo
+
+
+@pytest.fixture()
+def mock_node_repo() -> mock.Mock:
+    mock_node_repo: mock.Mock = mock.Mock(spec_set=NodeRepository)
+    mock_node_repo.get_version.return_value = "1"
+    mock_node_repo.get_written_versions.return_value = ("1", "1")
+    return mock_node_repo
+
+
+def test_get_components(mock_graph_repo: mock.Mock, mock_node_repo: mock.Mock) -> None:
+    component_index = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3], [4]]
+    assert component_index.get_components(WHEELCHAIR) == [[1, 2], [3], [4]]
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3], [4]]
+    assert mock_graph_repo.get_graph.call_count == 2
+
+
+def test_add_node_and_edge_incrementally(
+    mock_graph_repo: mock.Mock, mock_node_repo: mock.Mock
+) -> None:
+    component_index = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+    component_index.get_components(PEDESTRIAN)
+    component_index.get_components(WHEELCHAIR)
+
+    component_index.add_node(node_id=5)
+    component_index.add_edge(edge=make_edge((4, 5)))
+    component_index.add_edge(edge=make_edge((1, 4), is_stair=True))
+
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3, 4, 5]]
+    assert component_index.get_components(WHEELCHAIR) == [[1, 2], [4, 5], [3]]
+    assert mock_graph_repo.get_graph.call_count == 2
+
+
+def test_update_edge(mock_graph_repo: mock.Mock, mock_node_repo: mock.Mock) -> None:
+    component_index = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+    component_index.get_components(PEDESTRIAN)
+    component_index.get_components(WHEELCHAIR)
+    stair: Edge = make_edge((2, 3), is_stair=True)
+
+    component_index.update_edge(before=stair, after=replace(stair, is_stair=False))
+
+    assert component_index.get_components(WHEELCHAIR) == [[1, 2, 3], [4]]
+    assert mock_graph_repo.get_graph.call_count == 2
+
+
+def test_remove_edge_rebuilds_lazily(
+    mock_graph_repo: mock.Mock, mock_node_repo: mock.Mock
+) -> None:
+    component_index = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+    component_index.get_components(PEDESTRIAN)
+    component_index.get_components(WHEELCHAIR)
+
+    component_index.remove_edge(edge=make_edge((2, 3), is_stair=True))
+
+    assert mock_graph_repo.get_graph.call_count == 2
+    component_index.get_components(WHEELCHAIR)
+    assert mock_graph_repo.get_graph.call_count == 2
+    component_index.get_components(PEDESTRIAN)
+    assert mock_graph_repo.get_graph.call_count == 3
+
+
+def test_remove_node_matches_rebuild(
+    mock_graph_repo: mock.Mock, mock_node_repo: mock.Mock
+) -> None:
+    # Given: 2 is a hub joining 1, 3 and 5 on foot, 4 stays isolated
+    edges: list[Edge] = [
+        make_edge((1, 2)),
+        make_edge((2, 3), is_stair=True),
+        make_edge((2, 5)),
+        make_edge((5, 6), is_stair=True),
+    ]
+
+    def make_graph(node_ids: list[int]) -> AccessibilityGraph:
+        return AccessibilityGraph(
+            nodes=[
+                Node(
+                    id=node_id,
+                    name=f"Node {node_id}",
+                    point=Point(longitude=Decimal(node_id), latitude=Decimal(node_id)),
+                    edges=[
+                        edge
+                        for edge in edges
+                        if node_id in edge.node_ids
+                        and set(edge.node_ids) <= set(node_ids)
+                    ],
+                )
+                for node_id in node_ids
+            ],
+        )
+
+    mock_graph_repo.get_graph.return_value = make_graph([1, 2, 3, 4, 5, 6])
+    component_index = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+    for profile in AccessibilityProfile:
+        component_index.get_components(profile)
+    builds: int = mock_graph_repo.get_graph.call_count
+
+    # When: the isolated node only leaves its own set
+    component_index.remove_node(
+        node=Node(
+            id=4, name="Node 4", point=Point(longitude=Decimal(4), latitude=Decimal(4))
+        )
+    )
+
+    # Then
+    assert mock_graph_repo.get_graph.call_count == builds
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3, 5, 6]]
+
+    # When: the hub only invalidates the profiles its edges were open to
+    hub = Node(
+        id=2,
+        name="Node 2",
+        point=Point(longitude=Decimal(2), latitude=Decimal(2)),
+        edges=[edge for edge in edges if 2 in edge.node_ids],
+    )
+    mock_graph_repo.get_graph.return_value = make_graph([1, 3, 5, 6])
+    component_index.remove_node(node=hub)
+
+    # Then
+    rebuilt = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+    for profile in AccessibilityProfile:
+        assert component_index.get_components(profile) == rebuilt.get_components(
+            profile
+        )
+    assert component_index.get_components(PEDESTRIAN) == [[5, 6], [1], [3]]
+    assert component_index.get_components(WHEELCHAIR) == [[1], [3], [5], [6]]
+
+
+def test_rebuilds_after_a_write_from_elsewhere(
+    mock_graph_repo: mock.Mock, mock_node_repo: mock.Mock
+) -> None:
+    component_index = UnionFindComponentIndex(
+        graph_repo=mock_graph_repo, node_repo=mock_node_repo
+    )
+    component_index.get_components(PEDESTRIAN)
+
+    # an edit through the index keeps what was built
+    mock_node_repo.get_version.return_value = "2"
+    mock_node_repo.get_written_versions.return_value = ("1", "2")
+    component_index.add_node(node_id=5)
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3], [4], [5]]
+    assert mock_graph_repo.get_graph.call_count == 1
+
+    # an edit by the CLI or another worker does not
+    mock_node_repo.get_version.return_value = "3"
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3], [4]]
+    assert mock_graph_repo.get_graph.call_count == 2
+
+
+def test_rebuilds_when_another_worker_wrote_first(tmp_path: Path) -> None:
+    # Given
+    (tmp_path / "node.json").write_text(
+        json.dumps(
+            [
+                {
+                    "id": node_id,
+                    "name": f"Node {node_id}",
+                    "longitude": "0",
+                    "latitude": "0",
+                }
+                for node_id in (1, 2, 3)
+            ]
+        )
+    )
+    (tmp_path / "edge.json").write_text(json.dumps([]))
+
+    def open_repository() -> FileNodeRepository:
+        return FileNodeRepository(
+            node_file_path=str(tmp_path / "node.json"),
+            edge_file_path=str(tmp_path / "edge.json"),
+        )
+
+    node_repo, other_node_repo = open_repository(), open_repository()
+    component_index = UnionFindComponentIndex(
+        graph_repo=CachedGraphRepository(node_repo=node_repo), node_repo=node_repo
+    )
+    assert component_index.get_components(PEDESTRIAN) == [[1], [2], [3]]
+
+    # When
+    other_node_repo.add_edge(edge=make_edge((1, 2)))
+    edge: Edge = make_edge((2, 3), is_stair=True)
+    node_repo.add_edge(edge=edge)
+    component_index.add_edge(edge=edge)
+
+    # Then
+    assert component_index.get_components(PEDESTRIAN) == [[1, 2, 3]]
+    assert component_index.get_components(WHEELCHAIR) == [[1, 2], [3]]
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config import Settings
+from containers import Container
+from map_admin.presentation import apis as map_admin_apis
+
+
+@pytest.fixture()
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    node_file_path: Path = tmp_path / "nodes.json"
+    edge_file_path: Path = tmp_path / "edges.json"
+    node_file_path.write_text(
+        json.dumps(
+            [
+                {"id": 1, "name": "A", "longitude": "127.03", "latitude": "37.58"},
+                {"id": 2, "name": "B", "longitude": "127.04", "latitude": "37.59"},
+            ]
+        )
+    )
+    edge_file_path.write_text(
+        json.dumps(
+            [
+                {
+                    "node_ids": [1, 2],
+                    "vertical_distance": "1.0",
+                    "horizontal_distance": "2.0",
+                    "is_stair": False,
+                    "is_step": False,
+                    "quality": "상",
+                }
+            ]
+        )
+    )
+    settings = Settings(
+        file_path={"node": node_file_path, "edge": edge_file_path},  # type: ignore
+        history_directory=tmp_path / "history",
+    )
+    container = Container()
+    container.config.from_dict(settings.model_dump())
+    container.wire(modules=[map_admin_apis])
+    app = FastAPI()
+    app.include_router(map_admin_apis.router)
+    yield TestClient(app)
+    container.unwire()
+
+
+def test_partial_update_edge_in_files(client: TestClient) -> None:
+    # When
+    response = client.patch(
+        "/edges/2/1",
+        json={"horizontal_distance": 3.5, "quality": "하"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    edge: dict[str, Any] = client.get("/edges").json()[0]
+    assert (edge["horizontal_distance"], edge["quality"]) == (3.5, "하")
+
+
+def test_list_without_as_of_leaves_the_history_alone(
+    tmp_path: Path, client: TestClient
+) -> None:
+    assert client.get("/nodes").status_code == 200
+    assert client.get("/edges").status_code == 200
+    assert (
+        client.get("/nodes", params={"as_of": "2024-01-01T00:00:00Z"}).status_code
+        == 404
+    )
+
+    assert not (tmp_path / "history").exists()
@@ -0,0 +1,104 @@
+import asyncio
+import json
+from decimal import Decimal
+
+from map_admin.application.dtos import ChangeOutputData
+from map_admin.presentation.changes import ChangeBroadcaster, ChangeMessage
+
+
+def make_output_data(node_id: int) -> ChangeOutputData:
+    return ChangeOutputData(
+        kind="node_updated",
+        node=ChangeOutputData.Node(
+            id=node_id,
+            name=f"Node {node_id}",
+            longitude=Decimal("127.0"),
+            latitude=Decimal("37.5"),
+            elevation=None,
+            version=2,
+        ),
+        edge=None,
+    )
+
+
+async def drain() -> None:
+    # let the callbacks scheduled by present() run
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_fan_out_shares_one_message() -> None:
+    async def scenario() -> None:
+        broadcaster = ChangeBroadcaster()
+        streams = [broadcaster.connect(last_event_id=None) for _ in range(3)]
+
+        broadcaster.present(make_output_data(1))
+        await drain()
+
+        messages = [await stream.get() for stream in streams]
+        assert messages[0] is messages[1] is messages[2]
+        assert isinstance(messages[0], ChangeMessage)
+        assert json.loads(messages[0].data) == {
+            "id": 1,
+            "type": "node_updated",
+            "node": {
+                "id": 1,
+                "name": "Node 1",
+                "longitude": 127.0,
+                "latitude": 37.5,
+                "elevation": None,
+                "version": 2,
+            },
+            "edge": None,
+        }
+        assert messages[0].event_stream_frame.startswith(
+            "id: 1\nevent: node_updated\ndata: {"
+        )
+
+    asyncio.run(scenario())
+
+
+def test_reconnect_replays_missed_messages_or_resets() -> None:
+    async def scenario() -> None:
+        broadcaster = ChangeBroadcaster(client_queue_size=4, replay_size=3)
+        for node_id in range(1, 6):
+            broadcaster.present(make_output_data(node_id))
+
+        resumed = broadcaster.connect(last_event_id=3)
+        replayed = [await resumed.get() for _ in range(2)]
+        assert [message.id for message in replayed if message] == [4, 5]
+
+        # 2 has already left the replay buffer
+        too_old = broadcaster.connect(last_event_id=1)
+        reset = await too_old.get()
+        assert reset is not None and (reset.type, reset.id) == ("reset", 5)
+
+        # ids from before a restart
+        unknown = broadcaster.connect(last_event_id=42)
+        reset = await unknown.get()
+        assert reset is not None and reset.type == "reset"
+
+    asyncio.run(scenario())
+
+
+def test_lagging_client_is_cut_off_alone() -> None:
+    async def scenario() -> None:
+        broadcaster = ChangeBroadcaster(client_queue_size=2)
+        slow = broadcaster.connect(last_event_id=None)
+        fast = broadcaster.connect(last_event_id=None)
+
+        for node_id in range(1, 4):
+            broadcaster.present(make_output_data(node_id))
+            await drain()
+            message = await fast.get()
+            assert message is not None and message.id == node_id
+
+        assert await slow.get() is None
+        assert broadcaster.client_count == 1
+
+        broadcaster.close()
+        await drain()
+        assert await fast.get() is None
+        assert broadcaster.client_count == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,42 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from map_admin.infrastructure.metrics import MetricsRegistry
+from map_admin.presentation.metrics import MetricsMiddleware
+
+
+def test_metrics_middleware_labels_route_templates() -> None:
+    # Given
+    metrics = MetricsRegistry()
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/nodes/{node_id}")
+    async def get_node(node_id: int) -> int:
+        return node_id
+
+    client = TestClient(app)
+
+    # When
+    client.get("/nodes/1")
+    client.get("/nodes/2")
+    client.get("/nodes/not-a-number")
+    client.get("/unknown")
+
+    # Then
+    rendered: str = metrics.render()
+    assert (
+        "http_request_duration_seconds_count"
+        '{method="GET",route="/nodes/{node_id}",status="200"} 2.0'
+        in rendered
+    )
+    assert (
+        "http_request_duration_seconds_count"
+        '{method="GET",route="/nodes/{node_id}",status="422"} 1.0'
+        in rendered
+    )
+    assert (
+        "http_request_duration_seconds_count"
+        '{method="GET",route="unmatched",status="404"} 1.0'
+        in rendered
+    )
@@ -0,0 +1,82 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from map_admin.presentation.profiling import ProfilerMiddleware
+
+
+def slow_part() -> int:
+    return sum(range(10_000))
+
+
+def test_profiler_middleware(tmp_path: Path) -> None:
+    # Given
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, directory=tmp_path / "profiles")
+
+    @app.patch("/edges/{node_id_1}/{node_id_2}")
+    async def partial_update_edge(node_id_1: int, node_id_2: int) -> int:
+        return slow_part()
+
+    client = TestClient(app)
+
+    # When
+    plain_response = client.patch("/edges/1/2")
+    profiled_response = client.patch("/edges/1/2", headers={"X-Profile": "1"})
+
+    # Then
+    assert "X-Profile-File" not in plain_response.headers
+    assert profiled_response.json() == plain_response.json()
+    file_name: str = profiled_response.headers["X-Profile-File"]
+    assert file_name.endswith("-PATCH-edges_1_2.collapsed")
+    assert [path.name for path in (tmp_path / "profiles").iterdir()] == [file_name]
+    lines: list[str] = (tmp_path / "profiles" / file_name).read_text().splitlines()
+    assert any(
+        "partial_update_edge:" in line and line.split(" ")[0].endswith("builtins:sum")
+        for line in lines
+    )
+
+
+def other_part() -> int:
+    return sum(range(10_000))
+
+
+def test_profiler_middleware_leaves_concurrent_requests_out(tmp_path: Path) -> None:
+    # Given
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, directory=tmp_path)
+    other_done = asyncio.Event()
+
+    @app.get("/profiled")
+    async def profiled() -> int:
+        # the other request runs while this one waits
+        await other_done.wait()
+        return slow_part()
+
+    @app.get("/other")
+    async def other() -> int:
+        result: int = other_part()
+        other_done.set()
+        return result
+
+    async def scenario() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            profiled_response, _ = await asyncio.gather(
+                client.get("/profiled", headers={"X-Profile": "1"}),
+                client.get("/other"),
+            )
+        return profiled_response
+
+    # When
+    response: httpx.Response = asyncio.run(scenario())
+
+    # Then
+    text: str = (tmp_path / response.headers["X-Profile-File"]).read_text()
+    assert "test_profiler_middleware:slow_part" in text
+    assert "other_part" not in text
@@ -1,18 +1,33 @@
+import struct
 from decimal import Decimal
 
 from map_admin.application.dtos import (
+    ComputeRouteMatrixOutputData,
     CreateNodeOutputData,
+    GetReachabilityOutputData,
     ListEdgesOutputData,
     ListNodesOutputData,
+    RecomputeEdgeDistancesOutputData,
+    SampleNodeElevationsOutputData,
 )
 from map_admin.presentation.presenters import (
+    ComputeRouteMatrixBinaryPresenter,
+    ComputeRouteMatrixPydanticPresenter,
+    ComputeRouteMatrixPydanticViewModel,
     CreateNodePydanticPresenter,
     CreateNodePydanticViewModel,
     EdgeNodePydanticViewModel,
     EdgePydanticViewModel,
+    GetReachabilityPydanticPresenter,
+    GetReachabilityPydanticViewModel,
     ListEdgesPydanticPresenter,
     ListNodesPydanticPresenter,
     NodePydanticViewModel,
+    ReachableNodePydanticViewModel,
+    RecomputeEdgeDistancesPydanticPresenter,
+    RecomputeEdgeDistancesPydanticViewModel,
+    SampleNodeElevationsPydanticPresenter,
+    SampleNodeElevationsPydanticViewModel,
 )
 
 
@@ -23,12 +38,16 @@ def test_present_list_nodes() -> None:
             name="Node 1",
             longitude=Decimal("1.0"),
             latitude=Decimal("2.0"),
+            elevation=None,
+            version=1,
         ),
         ListNodesOutputData(
             id=2,
             name="Node 2",
             longitude=Decimal("3.0"),
             latitude=Decimal("4.0"),
+            elevation=Decimal("30.5"),
+            version=3,
         ),
     ]
 
@@ -41,12 +60,16 @@ def test_present_list_nodes() -> None:
             name="Node 1",
             longitude=1.0,
             latitude=2.0,
+            elevation=None,
+            version=1,
         ),
         NodePydanticViewModel(
             id=2,
             name="Node 2",
             longitude=3.0,
             latitude=4.0,
+            elevation=30.5,
+            version=3,
         ),
     ]
 
@@ -72,6 +95,7 @@ def test_present_list_edges() -> None:
             is_stair=False,
             is_step=False,
             quality="상",
+            version=1,
         ),
         ListEdgesOutputData(
             nodes=(
@@ -83,6 +107,7 @@ def test_present_list_edges() -> None:
             is_stair=False,
             is_step=False,
             quality="상",
+            version=2,
         ),
     ]
 
@@ -100,6 +125,7 @@ def test_present_list_edges() -> None:
             is_stair=False,
             is_step=False,
             quality="상",
+            version=1,
         ),
         EdgePydanticViewModel(
             nodes=(
@@ -111,5 +137,91 @@ def test_present_list_edges() -> None:
             is_stair=False,
             is_step=False,
             quality="상",
+            version=2,
         ),
     ]
+
+
+def test_present_recompute_edge_distances() -> None:
+    output_data = RecomputeEdgeDistancesOutputData(updated_count=3)
+
+    presenter = RecomputeEdgeDistancesPydanticPresenter()
+    presenter.present(output_data=output_data)
+
+    assert presenter.get_view_model() == RecomputeEdgeDistancesPydanticViewModel(
+        updated_count=3,
+    )
+
+
+def test_present_sample_node_elevations() -> None:
+    output_data = SampleNodeElevationsOutputData(
+        updated_node_count=2,
+        updated_edge_count=1,
+    )
+
+    presenter = SampleNodeElevationsPydanticPresenter()
+    presenter.present(output_data=output_data)
+
+    assert presenter.get_view_model() == SampleNodeElevationsPydanticViewModel(
+        updated_node_count=2,
+        updated_edge_count=1,
+    )
+
+
+def test_present_get_reachability() -> None:
+    output_data = GetReachabilityOutputData(
+        nodes=[
+            GetReachabilityOutputData.Node(id=1, cost=Decimal("0.00")),
+            GetReachabilityOutputData.Node(id=2, cost=Decimal("12.50")),
+        ],
+        hull=[
+            GetReachabilityOutputData.Coordinate(
+                longitude=Decimal("127.0"),
+                latitude=Decimal("37.0"),
+            ),
+        ],
+    )
+
+    presenter = GetReachabilityPydanticPresenter()
+    presenter.present(output_data=output_data)
+
+    assert presenter.get_view_model() == GetReachabilityPydanticViewModel(
+        nodes=[
+            ReachableNodePydanticViewModel(id=1, cost=0.0),
+            ReachableNodePydanticViewModel(id=2, cost=12.5),
+        ],
+        hull=[(127.0, 37.0)],
+    )
+
+
+def test_present_compute_route_matrix() -> None:
+    output_data = ComputeRouteMatrixOutputData(
+        source_ids=[1, 2],
+        target_ids=[3],
+        costs=[[12.345], [float("inf")]],
+    )
+
+    presenter = ComputeRouteMatrixPydanticPresenter()
+    presenter.present(output_data=output_data)
+
+    assert presenter.get_view_model() == ComputeRouteMatrixPydanticViewModel(
+        sources=[1, 2],
+        targets=[3],
+        costs=[[12.35], [None]],
+    )
+
+
+def test_present_compute_route_matrix_as_binary() -> None:
+    output_data = ComputeRouteMatrixOutputData(
+        source_ids=[1, 2],
+        target_ids=[3, 4],
+        costs=[[0.0, 1.5], [float("inf"), 2.25]],
+    )
+
+    presenter = ComputeRouteMatrixBinaryPresenter()
+    presenter.present(output_data=output_data)
+
+    assert presenter.get_shape() == (2, 2)
+    assert presenter.get_view_model() == struct.pack(
+        "<4d", 0.0, 1.5, float("inf"), 2.25
+    )
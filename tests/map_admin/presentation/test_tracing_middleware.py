@@ -0,0 +1,46 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from map_admin.infrastructure.tracing import Span, SpanExporter, Tracer
+from map_admin.presentation.tracing import TracingMiddleware
+
+
+class MemorySpanExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.traces: list[list[Span]] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.traces.append(spans)
+
+
+def test_tracing_middleware_opens_root_span() -> None:
+    # Given
+    exporter = MemorySpanExporter()
+    tracer = Tracer(exporter=exporter)
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
+    @app.patch("/edges/{node_id_1}/{node_id_2}")
+    async def partial_update_edge(node_id_1: int, node_id_2: int) -> None:
+        with tracer.span("PartialUpdateEdgeUseCase.execute"):
+            pass
+
+    client = TestClient(app)
+
+    # When
+    client.patch("/edges/1/2")
+    client.get("/unknown")
+
+    # Then
+    (root, use_case), (unmatched,) = exporter.traces
+    assert root.name == "PATCH /edges/{node_id_1}/{node_id_2}"
+    assert root.attributes == {
+        "http.method": "PATCH",
+        "http.target": "/edges/1/2",
+        "http.route": "/edges/{node_id_1}/{node_id_2}",
+        "http.status_code": 200,
+    }
+    assert use_case.parent_span_id == root.span_id
+    assert unmatched.name == "GET unmatched"
+    assert unmatched.attributes["http.status_code"] == 404
+    assert not unmatched.error